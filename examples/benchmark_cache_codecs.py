@@ -0,0 +1,154 @@
+"""Benchmark persistent-cache codecs: write/read latency and on-disk size.
+
+This script writes synthetic tool results (JSON-like search responses of
+configurable size) into a fresh SQLite PersistentCache for every available
+serializer/compression combination, then reads them back with get_many and
+reports throughput together with the resulting database size. Legacy pickle
+storage (no compression) is included as the baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+# Allow running directly from the repo without installing the package
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+if SRC_ROOT.exists():
+    sys.path.insert(0, str(SRC_ROOT))
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse.cache.codecs import COMPRESSORS, SERIALIZERS, CacheCodec
+from tooluniverse.cache.sqlite_backend import PersistentCache
+
+WORDS = (
+    "protein kinase inhibitor binding domain receptor expression pathway "
+    "clinical trial adverse event gene variant phenotype tissue compound"
+).split()
+
+
+def _make_payload(rng: random.Random, records: int) -> dict:
+    """Create a response shaped like a typical REST search result."""
+    return {
+        "query": " ".join(rng.choices(WORDS, k=3)),
+        "total": records,
+        "results": [
+            {
+                "id": f"ID{rng.randrange(10**8):08d}",
+                "title": " ".join(rng.choices(WORDS, k=12)),
+                "score": rng.random(),
+                "year": rng.randrange(1990, 2025),
+                "authors": [" ".join(rng.choices(WORDS, k=2)) for _ in range(4)],
+                "open_access": rng.random() < 0.5,
+            }
+            for _ in range(records)
+        ],
+    }
+
+
+def _db_size(path: str) -> int:
+    return sum(
+        os.path.getsize(path + suffix)
+        for suffix in ("", "-wal")
+        if os.path.exists(path + suffix)
+    )
+
+
+def _run(codec: CacheCodec, payloads: List[dict], repeats: int) -> dict:
+    write_times, read_times = [], []
+    size = 0
+    for _ in range(repeats):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite")
+            cache = PersistentCache(path, codec=codec)
+            entries = [
+                {
+                    "cache_key": f"key{i}",
+                    "value": value,
+                    "namespace": "bench",
+                    "version": "v1",
+                    "ttl": None,
+                }
+                for i, value in enumerate(payloads)
+            ]
+            start = time.perf_counter()
+            cache.set_many(entries)
+            write_times.append(time.perf_counter() - start)
+
+            keys = [entry["cache_key"] for entry in entries]
+            start = time.perf_counter()
+            found = cache.get_many(keys)
+            read_times.append(time.perf_counter() - start)
+            assert len(found) == len(keys)
+
+            cache._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            size = _db_size(path)
+            cache.close()
+    return {
+        "write": statistics.median(write_times),
+        "read": statistics.median(read_times),
+        "size": size,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--entries", type=int, default=500, help="Number of cached results"
+    )
+    parser.add_argument(
+        "--records", type=int, default=50, help="Records per synthetic result"
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Timed runs per codec (median reported)"
+    )
+    parser.add_argument(
+        "--threshold", type=int, default=4096, help="Compression threshold in bytes"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Random seed for payload generation"
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    payloads = [_make_payload(rng, args.records) for _ in range(args.entries)]
+
+    print("=== Persistent Cache Codec Benchmark ===")
+    print(
+        f"entries={args.entries}, records={args.records}, threshold={args.threshold}, "
+        f"serializers={sorted(SERIALIZERS)}, compressors={sorted(COMPRESSORS)}"
+    )
+
+    configurations = [("pickle", "none")]
+    for serializer in ("orjson", "msgpack", "json"):
+        if serializer in SERIALIZERS:
+            configurations.append((serializer, "none"))
+    for compression in ("zstd", "lz4", "zlib"):
+        if compression in COMPRESSORS:
+            configurations.append((CacheCodec().serializer, compression))
+
+    baseline = None
+    print(
+        f"{'codec':<20}{'write (s)':>12}{'read (s)':>12}{'size (KB)':>12}{'size ratio':>12}"
+    )
+    for serializer, compression in configurations:
+        codec = CacheCodec(serializer, compression, compress_threshold=args.threshold)
+        result = _run(codec, payloads, args.repeats)
+        baseline = baseline or result
+        label = serializer if compression == "none" else f"{serializer}+{compression}"
+        print(
+            f"{label:<20}{result['write']:>12.4f}{result['read']:>12.4f}"
+            f"{result['size'] / 1024:>12.1f}{result['size'] / baseline['size']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
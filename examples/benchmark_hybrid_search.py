@@ -0,0 +1,155 @@
+"""Benchmark keyword, embedding and hybrid search: relevance and latency.
+
+Indexes a small labelled corpus (by default the fixture next to the datastore
+tutorial example) into a throwaway datastore, then reports for every search
+method and hybrid fusion mode the recall@k and MRR over the labelled queries and
+the query latency. Hybrid search is timed both with its two legs run in parallel
+and sequentially (--workers 1) to show what the concurrency buys.
+
+Embeddings come from a local character-trigram hashing embedder, so the script
+runs offline; pass --provider/--model to use a real embedding model instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Allow running directly from the repo without installing the package
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+if SRC_ROOT.exists():
+    sys.path.insert(0, str(SRC_ROOT))
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse.database_setup.embedder import Embedder  # noqa: E402
+from tooluniverse.database_setup.search import (  # noqa: E402
+    BENCHMARK_CONFIGS,
+    FUSION_METHODS,
+    SearchEngine,
+    benchmark_search,
+)
+from tooluniverse.database_setup.sqlite_store import SQLiteStore  # noqa: E402
+from tooluniverse.database_setup.vector_store import VectorStore  # noqa: E402
+
+FIXTURE = (
+    Path(__file__).resolve().parent
+    / "make_your_data_agent_searchable_example"
+    / "hybrid_search_fixture.json"
+)
+
+
+class TrigramEmbedder:
+    """Hashes character trigrams into a fixed-size vector; no model download needed."""
+
+    model = "char-trigram-hash"
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+
+    def embed(self, texts):
+        out = np.zeros((len(texts), self.dim), dtype="float32")
+        for row, text in enumerate(texts):
+            padded = f"  {text.lower()}  "
+            for i in range(len(padded) - 2):
+                digest = hashlib.md5(padded[i : i + 3].encode()).digest()
+                out[row, int.from_bytes(digest[:4], "little") % self.dim] += 1.0
+        return out / (np.linalg.norm(out, axis=1, keepdims=True) + 1e-12)
+
+
+def _build(db_path: str, collection: str, documents, embedder):
+    store = SQLiteStore(db_path)
+    store.insert_docs(
+        collection,
+        [(d["doc_key"], d["text"], d.get("metadata") or {}, None) for d in documents],
+    )
+    rows = store.fetch_docs(collection, limit=len(documents))
+    vectors = np.asarray(embedder.embed([r["text"] for r in rows]), dtype="float32")
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+    dim = vectors.shape[1]
+    store.upsert_collection(
+        collection, embedding_model=embedder.model, embedding_dimensions=dim
+    )
+    vs = VectorStore(db_path)
+    vs.load_index(collection, dim, reset=True)
+    vs.add_embeddings(collection, [r["id"] for r in rows], vectors)
+    store.close()
+    return dim
+
+
+def _engine(db_path, collection, dim, embedder, workers):
+    engine = SearchEngine(db_path=db_path, max_workers=workers)
+    # Matching model and loaded dimensions let the engine use this embedder as is
+    engine.embedder = embedder
+    engine.vectors.load_index(collection, dim)
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fixture", default=str(FIXTURE), help="Corpus JSON file")
+    parser.add_argument("--top-k", type=int, default=5, help="Results per query")
+    parser.add_argument("--alpha", type=float, default=0.5, help="Hybrid weight")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs/query")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Thread pool size (default: auto)"
+    )
+    parser.add_argument("--provider", help="Embedding provider (optional)")
+    parser.add_argument("--model", help="Embedding model (with --provider)")
+    args = parser.parse_args()
+
+    fixture = json.loads(Path(args.fixture).read_text())
+    if args.provider:
+        embedder = Embedder(provider=args.provider, model=args.model)
+    else:
+        embedder = TrigramEmbedder()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep the FAISS files out of the user's datastore cache
+        os.environ["TOOLUNIVERSE_TMPDIR"] = tmp
+        db_path = os.path.join(tmp, "bench.db")
+        collection = "bench"
+        dim = _build(db_path, collection, fixture["documents"], embedder)
+
+        print("=== Hybrid Search Benchmark ===")
+        print(
+            f"docs={len(fixture['documents'])}, queries={len(fixture['queries'])}, "
+            f"embedder={embedder.model}, top_k={args.top_k}, alpha={args.alpha}"
+        )
+        print(
+            f"{'method':<11}{'fusion':<10}{'workers':>8}{'recall':>9}{'MRR':>8}"
+            f"{'ms/query':>11}{'p95 ms':>9}"
+        )
+        runs = [
+            (args.workers, list(BENCHMARK_CONFIGS)),
+            (1, [("hybrid", fusion) for fusion in FUSION_METHODS]),
+        ]
+        for workers, configs in runs:
+            engine = _engine(db_path, collection, dim, embedder, workers)
+            rows = benchmark_search(
+                engine,
+                collection,
+                fixture["queries"],
+                top_k=args.top_k,
+                alpha=args.alpha,
+                repeats=args.repeats,
+                configs=configs,
+            )
+            for row in rows:
+                print(
+                    f"{row['method']:<11}{row['fusion'] or '-':<10}"
+                    f"{engine.max_workers:>8}{row['recall']:>9.3f}{row['mrr']:>8.3f}"
+                    f"{row['ms_per_query']:>11.2f}{row['p95_ms']:>9.2f}"
+                )
+            engine.close()
+
+
+if __name__ == "__main__":
+    main()
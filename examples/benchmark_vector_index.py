@@ -0,0 +1,129 @@
+"""Benchmark FAISS index types: recall@k and query latency against exact search.
+
+By default the vectors are synthetic (unit-normalised points drawn around
+random cluster centres, which is closer to real embeddings than uniform noise).
+Pass --db and --collection to benchmark the vectors of an existing datastore
+collection instead; queries are then a random sample of its own vectors.
+
+For every index type the script reports, per nprobe (IVF) or efSearch (HNSW)
+setting, the recall of the top-k results relative to IndexFlatIP and the mean
+latency per query.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import faiss
+import numpy as np
+
+# Allow running directly from the repo without installing the package
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+if SRC_ROOT.exists():
+    sys.path.insert(0, str(SRC_ROOT))
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse.database_setup.vector_store import (  # noqa: E402
+    INDEX_TYPES,
+    VectorStore,
+    benchmark_index_types,
+)
+
+
+def _synthetic(n: int, centres: np.ndarray, rng: np.random.Generator):
+    clusters, dim = centres.shape
+    labels = rng.integers(0, clusters, size=n)
+    vectors = centres[labels] + 0.5 * rng.standard_normal((n, dim)).astype("float32")
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _collection_vectors(db_path: str, collection: str):
+    path = VectorStore(db_path)._get_index_path(collection)
+    if not path.exists():
+        raise SystemExit(f"No FAISS index for '{collection}' at {path}")
+    index = faiss.read_index(str(path))
+    if index.ntotal == 0:
+        raise SystemExit(f"Collection '{collection}' has no vectors")
+    try:
+        return index.reconstruct_n(0, index.ntotal)
+    except RuntimeError as exc:
+        raise SystemExit(
+            f"Cannot read vectors back from the index of '{collection}' ({exc}); "
+            "benchmark a collection built with the default flat index"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db", help="Datastore path (with --collection)")
+    parser.add_argument("--collection", help="Collection whose vectors to use")
+    parser.add_argument(
+        "--vectors", type=int, default=100_000, help="Synthetic vectors to index"
+    )
+    parser.add_argument("--dim", type=int, default=384, help="Synthetic dimension")
+    parser.add_argument(
+        "--clusters", type=int, default=200, help="Synthetic cluster centres"
+    )
+    parser.add_argument("--queries", type=int, default=200, help="Queries to time")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    parser.add_argument(
+        "--index-types",
+        nargs="+",
+        default=["ivf_flat", "ivf_pq", "hnsw"],
+        help=f"Index types among {INDEX_TYPES[1:]} or FAISS factory strings",
+    )
+    parser.add_argument(
+        "--nprobe", type=int, nargs="+", default=[1, 4, 16, 64], help="IVF settings"
+    )
+    parser.add_argument(
+        "--ef-search", type=int, nargs="+", default=[16, 64, 256], help="HNSW settings"
+    )
+    parser.add_argument(
+        "--train-size", type=int, default=20000, help="Training sample for IVF/PQ"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    if args.db and args.collection:
+        vectors = _collection_vectors(args.db, args.collection)
+        source = f"{args.collection} ({args.db})"
+        queries = vectors[rng.choice(len(vectors), size=args.queries)]
+    else:
+        centres = rng.standard_normal((args.clusters, args.dim)).astype("float32")
+        vectors = _synthetic(args.vectors, centres, rng)
+        source = f"synthetic, {args.clusters} clusters"
+        queries = _synthetic(args.queries, centres, rng)
+
+    print("=== Vector Index Benchmark ===")
+    print(
+        f"source={source}, vectors={len(vectors)}, dim={vectors.shape[1]}, "
+        f"queries={len(queries)}, top_k={args.top_k}"
+    )
+
+    rows = benchmark_index_types(
+        vectors,
+        queries,
+        index_types=args.index_types,
+        top_k=args.top_k,
+        nprobe_values=args.nprobe,
+        ef_search_values=args.ef_search,
+        train_size=args.train_size,
+    )
+    print(
+        f"{'index':<22}{'setting':>14}{'recall':>10}{'ms/query':>12}{'build (s)':>12}"
+    )
+    for row in rows:
+        setting = f"{row['param']}={row['value']}" if row["param"] else "-"
+        print(
+            f"{row['index_type']:<22}{setting:>14}{row['recall']:>10.3f}"
+            f"{row['ms_per_query']:>12.3f}{row['build_seconds']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
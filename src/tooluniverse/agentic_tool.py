@@ -9,6 +9,7 @@ from .base_tool import BaseTool
 from .tool_registry import register_tool
 from .logging_config import get_logger
 from .llm_clients import AzureOpenAIClient, GeminiClient, OpenRouterClient, VLLMClient
+from .cache.llm_cache import get_llm_cache
 
 
 # Global default fallback configuration
@@ -117,6 +118,9 @@ class AgenticTool(BaseTool):
         self._retry_delay: int = get_config("retry_delay", 5)
         self.return_metadata: bool = get_config("return_metadata", True)
         self._validate_api_key: bool = get_config("validate_api_key", True)
+        # Opt-in response cache shared by all agentic tools (see cache.llm_cache)
+        self._llm_cache_enabled: bool = bool(get_config("llm_cache", False))
+        self._llm_cache_ttl: Optional[int] = get_config("llm_cache_ttl", None)
 
         # API fallback configuration
         self._fallback_api_type: Optional[str] = get_config("fallback_api_type", None)
@@ -329,175 +333,353 @@ class AgenticTool(BaseTool):
 
         # Check if tool is available before attempting to run
         if not self._is_available:
-            error_msg = f"Tool '{self.name}' is not available due to initialization error: {self._initialization_error}"
-            self.logger.error(error_msg)
-            if self.return_metadata:
-                return {
-                    "success": False,
-                    "error": error_msg,
-                    "error_type": "ToolUnavailable",
-                    "metadata": {
-                        "prompt_used": "Tool unavailable",
-                        "input_arguments": {
-                            arg: arguments.get(arg) for arg in self._input_arguments
-                        },
-                        "model_info": {
-                            "api_type": self._api_type,
-                            "model_id": self._model_id,
-                        },
-                        "execution_time_seconds": 0,
-                        "timestamp": start_time.isoformat(),
-                    },
-                }
-            else:
-                return f"error: {error_msg} error_type: ToolUnavailable"
+            return self._unavailable_result(arguments, start_time)
 
+        formatted_prompt = None
         try:
-            # Validate required args
-            missing_required_args = [
-                arg for arg in self._required_arguments if arg not in arguments
-            ]
-            if missing_required_args:
-                raise ValueError(
-                    f"Missing required input arguments: {missing_required_args}"
+            formatted_prompt, messages, custom_format = self._prepare_request(arguments)
+            streaming_permitted = (
+                streaming_requested and not self._return_json and custom_format is None
+            )
+
+            if self._llm_cache_enabled:
+                response, cache_hit = get_llm_cache().get_or_call(
+                    self._llm_cache_key(formatted_prompt, custom_format),
+                    lambda: self._generate(
+                        messages,
+                        custom_format,
+                        streaming_requested,
+                        streaming_permitted,
+                        stream_callback,
+                    ),
+                    prompt_chars=len(formatted_prompt),
+                    ttl=self._llm_cache_ttl,
+                )
+                if cache_hit and streaming_requested and response:
+                    for chunk in self._iter_chunks(response):
+                        self._emit_stream_chunk(chunk, stream_callback)
+            else:
+                cache_hit = False
+                response = self._generate(
+                    messages,
+                    custom_format,
+                    streaming_requested,
+                    streaming_permitted,
+                    stream_callback,
                 )
 
-            # Fill defaults for optional args
-            for arg in self._input_arguments:
-                if arg not in arguments:
-                    arguments[arg] = self._argument_defaults.get(arg, "")
+            return self._success_result(
+                response, formatted_prompt, arguments, start_time, cache_hit
+            )
+
+        except Exception as e:  # noqa: BLE001
+            return self._error_result(e, formatted_prompt, arguments, start_time)
+
+    async def arun(
+        self,
+        arguments: Dict[str, Any],
+        stream_callback: Optional[Callable[[str], None]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Asynchronous :meth:`run` using the client's ``ainfer``/``ainfer_stream``.
 
-            self._validate_arguments(arguments)
-            formatted_prompt = self._format_prompt(arguments)
+        Many agentic calls can then share one event loop instead of holding
+        a worker thread each while waiting for the model.
+        """
+        start_time = datetime.now()
 
-            messages = [{"role": "user", "content": formatted_prompt}]
-            custom_format = arguments.get("response_format", None)
+        arguments = dict(arguments or {})
+        stream_flag = bool(arguments.pop("_tooluniverse_stream", False))
+        streaming_requested = stream_flag or stream_callback is not None
 
-            # Delegate to client; client handles provider-specific logic
-            response = None
+        if not self._is_available:
+            return self._unavailable_result(arguments, start_time)
 
+        formatted_prompt = None
+        try:
+            formatted_prompt, messages, custom_format = self._prepare_request(arguments)
             streaming_permitted = (
                 streaming_requested and not self._return_json and custom_format is None
             )
 
-            if streaming_permitted and hasattr(self._llm_client, "infer_stream"):
-                try:
-                    chunks_collected: List[str] = []
-                    stream_iter = self._llm_client.infer_stream(
-                        messages=messages,
-                        temperature=self._temperature,
-                        max_tokens=None,
-                        return_json=self._return_json,
-                        custom_format=custom_format,
-                        max_retries=self._max_retries,
-                        retry_delay=self._retry_delay,
-                    )
-                    for chunk in stream_iter:
-                        if not chunk:
-                            continue
-                        chunks_collected.append(chunk)
+            if self._llm_cache_enabled:
+                response, cache_hit = await get_llm_cache().aget_or_call(
+                    self._llm_cache_key(formatted_prompt, custom_format),
+                    lambda: self._agenerate(
+                        messages,
+                        custom_format,
+                        streaming_requested,
+                        streaming_permitted,
+                        stream_callback,
+                    ),
+                    prompt_chars=len(formatted_prompt),
+                    ttl=self._llm_cache_ttl,
+                )
+                if cache_hit and streaming_requested and response:
+                    for chunk in self._iter_chunks(response):
                         self._emit_stream_chunk(chunk, stream_callback)
-                    if chunks_collected:
-                        response = "".join(chunks_collected)
-                except Exception as stream_error:  # noqa: BLE001
-                    self.logger.warning(
-                        f"Streaming failed for tool '{self.name}': {stream_error}. Falling back to buffered response."
-                    )
-                    response = None
+            else:
+                cache_hit = False
+                response = await self._agenerate(
+                    messages,
+                    custom_format,
+                    streaming_requested,
+                    streaming_permitted,
+                    stream_callback,
+                )
+
+            return self._success_result(
+                response, formatted_prompt, arguments, start_time, cache_hit
+            )
+
+        except Exception as e:  # noqa: BLE001
+            return self._error_result(e, formatted_prompt, arguments, start_time)
+
+    def _prepare_request(self, arguments: Dict[str, Any]):
+        """Validate ``arguments`` (filling defaults in place) and build the messages.
+
+        Returns:
+            ``(formatted_prompt, messages, custom_format)``
+        """
+        # Validate required args
+        missing_required_args = [
+            arg for arg in self._required_arguments if arg not in arguments
+        ]
+        if missing_required_args:
+            raise ValueError(
+                f"Missing required input arguments: {missing_required_args}"
+            )
+
+        # Fill defaults for optional args
+        for arg in self._input_arguments:
+            if arg not in arguments:
+                arguments[arg] = self._argument_defaults.get(arg, "")
+
+        self._validate_arguments(arguments)
+        formatted_prompt = self._format_prompt(arguments)
+
+        messages = [{"role": "user", "content": formatted_prompt}]
+        custom_format = arguments.get("response_format", None)
+        return formatted_prompt, messages, custom_format
+
+    def _llm_cache_key(self, formatted_prompt: str, custom_format: Any) -> str:
+        return get_llm_cache().make_key(
+            self._current_model_id or self._model_id,
+            self._temperature,
+            formatted_prompt,
+            custom_format,
+            self._return_json,
+        )
+
+    def _unavailable_result(self, arguments: Dict[str, Any], start_time: datetime):
+        error_msg = f"Tool '{self.name}' is not available due to initialization error: {self._initialization_error}"
+        self.logger.error(error_msg)
+        if self.return_metadata:
+            return {
+                "success": False,
+                "error": error_msg,
+                "error_type": "ToolUnavailable",
+                "metadata": {
+                    "prompt_used": "Tool unavailable",
+                    "input_arguments": {
+                        arg: arguments.get(arg) for arg in self._input_arguments
+                    },
+                    "model_info": {
+                        "api_type": self._api_type,
+                        "model_id": self._model_id,
+                    },
+                    "execution_time_seconds": 0,
+                    "timestamp": start_time.isoformat(),
+                },
+            }
+        else:
+            return f"error: {error_msg} error_type: ToolUnavailable"
+
+    def _success_result(
+        self,
+        response: Any,
+        formatted_prompt: str,
+        arguments: Dict[str, Any],
+        start_time: datetime,
+        cache_hit: bool,
+    ):
+        end_time = datetime.now()
+        execution_time = (end_time - start_time).total_seconds()
+
+        if self.return_metadata:
+            metadata = {
+                "prompt_used": (
+                    formatted_prompt
+                    if len(formatted_prompt) < 1000
+                    else f"{formatted_prompt[:1000]}..."
+                ),
+                "input_arguments": {
+                    arg: arguments.get(arg) for arg in self._input_arguments
+                },
+                "model_info": {
+                    "api_type": self._api_type,
+                    "model_id": self._model_id,
+                    "temperature": self._temperature,
+                },
+                "execution_time_seconds": execution_time,
+                "timestamp": start_time.isoformat(),
+            }
+            if self._llm_cache_enabled:
+                metadata["llm_cache_hit"] = cache_hit
+            return {"success": True, "result": response, "metadata": metadata}
+        else:
+            return response
 
-            if response is None:
-                response = self._llm_client.infer(
+    def _error_result(
+        self,
+        e: Exception,
+        formatted_prompt: Optional[str],
+        arguments: Dict[str, Any],
+        start_time: datetime,
+    ):
+        end_time = datetime.now()
+        execution_time = (end_time - start_time).total_seconds()
+        self.logger.error(f"Error executing {self.name}: {str(e)}")
+        metadata = {
+            "prompt_used": (
+                formatted_prompt
+                if formatted_prompt is not None
+                else "Failed to format prompt"
+            ),
+            "input_arguments": {
+                arg: arguments.get(arg) for arg in self._input_arguments
+            },
+            "model_info": {
+                "api_type": self._api_type,
+                "model_id": self._model_id,
+                "temperature": self._temperature,
+            },
+            "execution_time_seconds": execution_time,
+        }
+        if self.return_metadata:
+            metadata["timestamp"] = start_time.isoformat()
+            return {
+                "success": False,
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "metadata": metadata,
+            }
+        else:
+            from .utils import format_error_response
+
+            return format_error_response(e, self.name, metadata)
+
+    def _generate(
+        self,
+        messages: List[Dict[str, str]],
+        custom_format: Any,
+        streaming_requested: bool,
+        streaming_permitted: bool,
+        stream_callback: Optional[Callable[[str], None]],
+    ) -> Any:
+        """Query the LLM client, streaming chunks to the callback if requested."""
+        # Delegate to client; client handles provider-specific logic
+        response = None
+
+        if streaming_permitted and hasattr(self._llm_client, "infer_stream"):
+            try:
+                chunks_collected: List[str] = []
+                stream_iter = self._llm_client.infer_stream(
                     messages=messages,
                     temperature=self._temperature,
-                    max_tokens=None,  # client resolves per-model defaults/env
+                    max_tokens=None,
                     return_json=self._return_json,
                     custom_format=custom_format,
                     max_retries=self._max_retries,
                     retry_delay=self._retry_delay,
                 )
+                for chunk in stream_iter:
+                    if not chunk:
+                        continue
+                    chunks_collected.append(chunk)
+                    self._emit_stream_chunk(chunk, stream_callback)
+                if chunks_collected:
+                    response = "".join(chunks_collected)
+            except Exception as stream_error:  # noqa: BLE001
+                self.logger.warning(
+                    f"Streaming failed for tool '{self.name}': {stream_error}. Falling back to buffered response."
+                )
+                response = None
+
+        if response is None:
+            response = self._llm_client.infer(
+                messages=messages,
+                temperature=self._temperature,
+                max_tokens=None,  # client resolves per-model defaults/env
+                return_json=self._return_json,
+                custom_format=custom_format,
+                max_retries=self._max_retries,
+                retry_delay=self._retry_delay,
+            )
 
-                if streaming_requested and response:
-                    for chunk in self._iter_chunks(response):
-                        self._emit_stream_chunk(chunk, stream_callback)
+            if streaming_requested and response:
+                for chunk in self._iter_chunks(response):
+                    self._emit_stream_chunk(chunk, stream_callback)
 
-            end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds()
-
-            if self.return_metadata:
-                return {
-                    "success": True,
-                    "result": response,
-                    "metadata": {
-                        "prompt_used": (
-                            formatted_prompt
-                            if len(formatted_prompt) < 1000
-                            else f"{formatted_prompt[:1000]}..."
-                        ),
-                        "input_arguments": {
-                            arg: arguments.get(arg) for arg in self._input_arguments
-                        },
-                        "model_info": {
-                            "api_type": self._api_type,
-                            "model_id": self._model_id,
-                            "temperature": self._temperature,
-                        },
-                        "execution_time_seconds": execution_time,
-                        "timestamp": start_time.isoformat(),
-                    },
-                }
-            else:
-                return response
+        return response
 
-        except Exception as e:  # noqa: BLE001
-            end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds()
-            self.logger.error(f"Error executing {self.name}: {str(e)}")
-            if self.return_metadata:
-                return {
-                    "success": False,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                    "metadata": {
-                        "prompt_used": (
-                            formatted_prompt
-                            if "formatted_prompt" in locals()
-                            else "Failed to format prompt"
-                        ),
-                        "input_arguments": {
-                            arg: arguments.get(arg) for arg in self._input_arguments
-                        },
-                        "model_info": {
-                            "api_type": self._api_type,
-                            "model_id": self._model_id,
-                            "temperature": self._temperature,
-                        },
-                        "execution_time_seconds": execution_time,
-                        "timestamp": start_time.isoformat(),
-                    },
-                }
-            else:
-                from .utils import format_error_response
-
-                return format_error_response(
-                    e,
-                    self.name,
-                    {
-                        "prompt_used": (
-                            formatted_prompt
-                            if "formatted_prompt" in locals()
-                            else "Failed to format prompt"
-                        ),
-                        "input_arguments": {
-                            arg: arguments.get(arg) for arg in self._input_arguments
-                        },
-                        "model_info": {
-                            "api_type": self._api_type,
-                            "model_id": self._model_id,
-                            "temperature": self._temperature,
-                        },
-                        "execution_time_seconds": execution_time,
-                    },
+    async def _agenerate(
+        self,
+        messages: List[Dict[str, str]],
+        custom_format: Any,
+        streaming_requested: bool,
+        streaming_permitted: bool,
+        stream_callback: Optional[Callable[[str], None]],
+    ) -> Any:
+        """Asynchronous :meth:`_generate`."""
+        response = None
+
+        if streaming_permitted:
+            try:
+                chunks_collected: List[str] = []
+                async for chunk in self._llm_client.ainfer_stream(
+                    messages=messages,
+                    temperature=self._temperature,
+                    max_tokens=None,
+                    return_json=self._return_json,
+                    custom_format=custom_format,
+                    max_retries=self._max_retries,
+                    retry_delay=self._retry_delay,
+                ):
+                    if not chunk:
+                        continue
+                    chunks_collected.append(chunk)
+                    self._emit_stream_chunk(chunk, stream_callback)
+                if chunks_collected:
+                    response = "".join(chunks_collected)
+            except Exception as stream_error:  # noqa: BLE001
+                self.logger.warning(
+                    f"Streaming failed for tool '{self.name}': {stream_error}. Falling back to buffered response."
                 )
+                response = None
+
+        if response is None:
+            response = await self._llm_client.ainfer(
+                messages=messages,
+                temperature=self._temperature,
+                max_tokens=None,
+                return_json=self._return_json,
+                custom_format=custom_format,
+                max_retries=self._max_retries,
+                retry_delay=self._retry_delay,
+            )
+
+            if streaming_requested and response:
+                for chunk in self._iter_chunks(response):
+                    self._emit_stream_chunk(chunk, stream_callback)
+
+        return response
+
+    @staticmethod
+    def get_llm_cache_stats() -> Dict[str, Any]:
+        """Hit rate and estimated token savings of the shared LLM response cache."""
+        cache = get_llm_cache(create=False)
+        return cache.stats() if cache else {"enabled": False}
 
     @staticmethod
     def _iter_chunks(text: str, size: int = 800):
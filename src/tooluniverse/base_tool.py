@@ -1,4 +1,10 @@
 from .utils import extract_function_call_json, evaluate_function_call
+from .schema_validation import (
+    CompiledSchema,
+    get_compiled_schema,
+    record_validation,
+    schema_fingerprint,
+)
 from .exceptions import (
     ToolError,
     ToolValidationError,
@@ -12,8 +18,11 @@ from .exceptions import (
 import json
 from pathlib import Path
 from typing import no_type_check, Optional, Dict, Any
+import asyncio
+import functools
 import hashlib
 import inspect
+import time
 
 
 class BaseTool:
@@ -143,6 +152,61 @@ class BaseTool:
             will still work - they will only receive the arguments parameter.
         """
 
+    async def arun(
+        self, arguments=None, stream_callback=None, use_cache=False, validate=True
+    ):
+        """Execute the tool asynchronously.
+
+        The default implementation runs :meth:`run` in the event loop's default
+        executor, forwarding only the optional parameters ``run`` accepts.
+        I/O-bound tools can override this coroutine with a native
+        implementation so that calls share a single event loop instead of
+        occupying a thread each; see :meth:`supports_native_async`.
+
+        Args:
+            arguments (dict, optional): Tool-specific arguments
+            stream_callback (callable, optional): Callback for streaming responses
+            use_cache (bool, optional): Whether result caching is enabled
+            validate (bool, optional): Whether parameter validation was performed
+        """
+        kwargs = {}
+        try:
+            params = inspect.signature(self.run).parameters
+            if stream_callback is not None and "stream_callback" in params:
+                kwargs["stream_callback"] = stream_callback
+            if "use_cache" in params:
+                kwargs["use_cache"] = use_cache
+            if "validate" in params:
+                kwargs["validate"] = validate
+        except (ValueError, TypeError):
+            pass
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.run, arguments, **kwargs)
+        )
+
+    def supports_native_async(self) -> bool:
+        """
+        Check if this tool provides a native ``arun`` coroutine.
+
+        A native implementation only counts when it is defined at least as
+        deep in the class hierarchy as ``run``; otherwise a subclass that
+        customises ``run`` would be bypassed by an inherited ``arun``.
+
+        Returns
+            True if ``arun`` can be awaited without a worker thread
+        """
+        run_owner = arun_owner = None
+        for klass in type(self).__mro__:
+            if run_owner is None and "run" in klass.__dict__:
+                run_owner = klass
+            if arun_owner is None and "arun" in klass.__dict__:
+                arun_owner = klass
+        if arun_owner is None or arun_owner is BaseTool:
+            return False
+        return run_owner is None or issubclass(arun_owner, run_owner)
+
     def check_function_call(self, function_call_json):
         if isinstance(function_call_json, str):
             function_call_json = extract_function_call_json(function_call_json)
@@ -180,6 +244,8 @@ class BaseTool:
         if not schema:
             return None  # No schema to validate against
 
+        started = time.perf_counter()
+        fast_path = False
         try:
             import jsonschema
 
@@ -191,10 +257,10 @@ class BaseTool:
                 k: v for k, v in arguments.items() if k not in internal_params
             }
 
-            jsonschema.validate(filtered_arguments, schema)
-            return None
+            fast_path = self._get_compiled_schema(schema).validate(filtered_arguments)
+            error = None
         except jsonschema.ValidationError as e:
-            return ToolValidationError(
+            error = ToolValidationError(
                 f"Parameter validation failed: {e.message}",
                 details={
                     "validation_error": str(e),
@@ -203,7 +269,31 @@ class BaseTool:
                 },
             )
         except Exception as e:
-            return ToolValidationError(f"Validation error: {str(e)}")
+            error = ToolValidationError(f"Validation error: {str(e)}")
+
+        record_validation(
+            self.tool_config.get("name", self.__class__.__name__),
+            time.perf_counter() - started,
+            fast_path,
+            error is not None,
+        )
+        return error
+
+    def get_schema_fingerprint(self) -> str:
+        """Return a stable fingerprint of this tool's parameter schema."""
+        schema = self.tool_config.get("parameter", {})
+        cached = getattr(self, "_schema_fingerprint", None)
+        if cached is None or cached[0] is not schema:
+            cached = self._schema_fingerprint = (schema, schema_fingerprint(schema))
+        return cached[1]
+
+    def _get_compiled_schema(self, schema: Dict[str, Any]) -> CompiledSchema:
+        """Return the shared compiled validator for this tool's schema."""
+        compiled = getattr(self, "_compiled_schema", None)
+        fingerprint = self.get_schema_fingerprint()
+        if compiled is None or compiled.fingerprint != fingerprint:
+            compiled = self._compiled_schema = get_compiled_schema(schema, fingerprint)
+        return compiled
 
     def handle_error(self, exception: Exception) -> ToolError:
         """
@@ -298,6 +388,43 @@ class BaseTool:
         """
         return self.tool_config.get("cacheable", True)
 
+    def get_http_session(self, headers: Optional[Dict[str, str]] = None):
+        """
+        Return a ``requests`` session backed by the shared HTTP connection pool.
+
+        The session keeps its own headers and cookies while reusing pooled,
+        keep-alive connections with every other tool in the process. Its
+        requests are admitted by the per-host rate limiter using
+        :meth:`get_rate_limit`.
+
+        Args:
+            headers: Optional default headers for the session
+
+        Returns
+            requests.Session bound to the process-wide HTTP transport
+        """
+        from .http_transport import get_http_transport
+
+        return get_http_transport().new_session(
+            headers=headers,
+            owner=self.tool_config.get("name", self.__class__.__name__),
+            rate_limit=self.get_rate_limit(),
+        )
+
+    def get_rate_limit(self) -> Optional[Dict[str, Any]]:
+        """
+        Return this tool's upstream rate limit from the ``rate_limit`` config.
+
+        The limit is shared process-wide per upstream host; see
+        :mod:`tooluniverse.rate_limiter` for the accepted formats.
+
+        Returns
+            Normalized limit dict, or None when the tool declares no limit
+        """
+        from .rate_limiter import parse_rate_limit
+
+        return parse_rate_limit(self.tool_config.get("rate_limit"))
+
     def get_batch_concurrency_limit(self) -> int:
         """Return maximum concurrent executions allowed during batch runs (0 = unlimited)."""
         limit = self.tool_config.get("batch_max_concurrency")
@@ -0,0 +1,110 @@
+"""
+Interface shared by the persistent cache backends.
+
+:class:`~tooluniverse.cache.result_cache_manager.ResultCacheManager` keeps
+recent results in memory and delegates everything else to a backend: the
+local SQLite file (:class:`~tooluniverse.cache.sqlite_backend.PersistentCache`)
+or a shared Redis server
+(:class:`~tooluniverse.cache.redis_backend.RedisCache`).
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+
+@dataclass
+class CacheEntry:
+    key: str
+    value: Any
+    namespace: str
+    version: str
+    ttl: Optional[int]
+    created_at: float
+    last_accessed: float
+    hit_count: int
+
+
+class CacheBackend(ABC):
+    """Storage behind the in-memory tier.
+
+    Keys are the composed ``namespace::version::cache_key`` strings built by
+    the manager. Backends shared between processes can also set
+    ``supports_locking`` and implement :meth:`acquire_lock` and
+    :meth:`release_lock`, which the manager uses to collapse duplicate cache
+    misses across processes.
+    """
+
+    supports_locking = False
+
+    @abstractmethod
+    def get(self, cache_key: str) -> Optional[CacheEntry]:
+        """Return the live entry stored under ``cache_key``, if any."""
+
+    @abstractmethod
+    def get_many(self, cache_keys: Sequence[str]) -> Dict[str, CacheEntry]:
+        """Return a mapping of cache key to entry for the keys that were found."""
+
+    @abstractmethod
+    def set(
+        self,
+        cache_key: str,
+        value: Any,
+        *,
+        namespace: str,
+        version: str,
+        ttl: Optional[int],
+    ):
+        """Store one entry, replacing any previous value."""
+
+    @abstractmethod
+    def set_many(self, entries: Sequence[Dict[str, Any]]):
+        """Store several entries.
+
+        Args:
+            entries: Dicts with ``cache_key``, ``value``, ``namespace``,
+                ``version`` and ``ttl``.
+        """
+
+    @abstractmethod
+    def delete(self, cache_key: str):
+        """Remove one entry."""
+
+    @abstractmethod
+    def clear(self, namespace: Optional[str] = None):
+        """Remove every entry of ``namespace``, or all entries."""
+
+    @abstractmethod
+    def iter_entries(self, namespace: Optional[str] = None) -> Iterator[CacheEntry]:
+        """Iterate over the stored entries of ``namespace``, or all entries."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Return backend statistics."""
+
+    def close(self):
+        """Release connections held by the backend."""
+
+    def acquire_lock(self, name: str) -> Optional[str]:
+        """Take the shared lock ``name``; return its token, or None on timeout."""
+        return None
+
+    def release_lock(self, name: str, token: str):
+        """Release a lock taken with :meth:`acquire_lock`."""
+
+    @contextmanager
+    def lock(self, name: str):
+        """Hold the shared lock ``name`` for the duration of the block.
+
+        Yields True when the lock was taken and False when waiting for it
+        timed out, in which case the block runs anyway.
+        """
+        token = self.acquire_lock(name)
+        try:
+            yield token is not None
+        finally:
+            if token is not None:
+                self.release_lock(name, token)
@@ -0,0 +1,211 @@
+"""
+Serialization codecs for the persistent result cache.
+
+Results are stored as ``(payload, codec tag)`` pairs. JSON-compatible
+values are encoded with ``orjson`` or ``msgpack`` when installed, which is
+faster and more compact than pickle for the large JSON documents most tools
+return; everything else falls back to pickle. Payloads above a size
+threshold are compressed with ``zstandard``, ``lz4`` or, when neither is
+installed, ``zlib``.
+
+The tag (for example ``"orjson+zstd"``) is stored next to each row so that
+entries written with another configuration, including rows from before
+codecs existed (no tag, plain pickle), keep loading.
+
+Environment variables (read by :meth:`CacheCodec.from_env`):
+
+- ``TOOLUNIVERSE_CACHE_SERIALIZER``: ``auto`` (default), ``orjson``,
+  ``msgpack``, ``json`` or ``pickle``
+- ``TOOLUNIVERSE_CACHE_COMPRESSION``: ``auto`` (default), ``zstd``, ``lz4``,
+  ``zlib`` or ``none``
+- ``TOOLUNIVERSE_CACHE_COMPRESS_THRESHOLD``: minimum payload size in bytes
+  before compressing (4096)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple
+
+PICKLE = "pickle"
+
+_INT_MIN = -(2**63)
+_INT_MAX = 2**64 - 1
+
+
+class CodecError(ValueError):
+    """Raised when a payload cannot be decoded with the available codecs."""
+
+
+def is_json_compatible(value: Any) -> bool:
+    """Return True if ``value`` survives a JSON round trip unchanged.
+
+    Only exact built-in types qualify (no tuples, subclasses or non-string
+    keys) so that decoding returns an equal object of the same types.
+    """
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        kind = type(current)
+        if kind is str or kind is bool or current is None:
+            continue
+        if kind is int:
+            if not _INT_MIN <= current <= _INT_MAX:
+                return False
+        elif kind is float:
+            if current != current or current in (float("inf"), float("-inf")):
+                return False
+        elif kind is list:
+            stack.extend(current)
+        elif kind is dict:
+            for key in current:
+                if type(key) is not str:
+                    return False
+            stack.extend(current.values())
+        else:
+            return False
+    return True
+
+
+def _load_serializers() -> Dict[str, Tuple[Callable[[Any], bytes], Callable]]:
+    serializers = {
+        PICKLE: (
+            lambda value: pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+            pickle.loads,
+        ),
+        "json": (
+            lambda value: json.dumps(value, separators=(",", ":")).encode("utf-8"),
+            json.loads,
+        ),
+    }
+    try:
+        import orjson
+
+        serializers["orjson"] = (orjson.dumps, orjson.loads)
+    except ImportError:
+        pass
+    try:
+        import msgpack
+
+        serializers["msgpack"] = (
+            lambda value: msgpack.packb(value, use_bin_type=True),
+            lambda payload: msgpack.unpackb(payload, raw=False),
+        )
+    except ImportError:
+        pass
+    return serializers
+
+
+def _load_compressors() -> Dict[
+    str, Tuple[Callable[[bytes, Optional[int]], bytes], Callable]
+]:
+    compressors = {
+        "zlib": (
+            lambda data, level: zlib.compress(data, 1 if level is None else level),
+            zlib.decompress,
+        ),
+    }
+    try:
+        import zstandard
+
+        compressors["zstd"] = (
+            lambda data, level: zstandard.ZstdCompressor(
+                level=3 if level is None else level
+            ).compress(data),
+            lambda data: zstandard.ZstdDecompressor().decompress(data),
+        )
+    except ImportError:
+        pass
+    try:
+        import lz4.frame
+
+        compressors["lz4"] = (
+            lambda data, level: lz4.frame.compress(
+                data, compression_level=0 if level is None else level
+            ),
+            lz4.frame.decompress,
+        )
+    except ImportError:
+        pass
+    return compressors
+
+
+SERIALIZERS = _load_serializers()
+COMPRESSORS = _load_compressors()
+
+
+class CacheCodec:
+    """Encode cache values to tagged payloads and decode them back."""
+
+    def __init__(
+        self,
+        serializer: str = "auto",
+        compression: str = "auto",
+        compress_threshold: int = 4096,
+        compression_level: Optional[int] = None,
+    ):
+        serializer = (serializer or "auto").lower()
+        if serializer == "auto":
+            serializer = next(
+                (name for name in ("orjson", "msgpack") if name in SERIALIZERS),
+                PICKLE,
+            )
+        if serializer not in SERIALIZERS:
+            raise CodecError(f"Serializer {serializer!r} is not available")
+
+        compression = (compression or "auto").lower()
+        if compression == "auto":
+            compression = next(
+                name for name in ("zstd", "lz4", "zlib") if name in COMPRESSORS
+            )
+        if compression == "none":
+            compression = None
+        elif compression not in COMPRESSORS:
+            raise CodecError(f"Compression {compression!r} is not available")
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compress_threshold = max(0, int(compress_threshold))
+        self.compression_level = compression_level
+
+    @classmethod
+    def from_env(cls) -> "CacheCodec":
+        return cls(
+            serializer=os.getenv("TOOLUNIVERSE_CACHE_SERIALIZER", "auto"),
+            compression=os.getenv("TOOLUNIVERSE_CACHE_COMPRESSION", "auto"),
+            compress_threshold=int(
+                os.getenv("TOOLUNIVERSE_CACHE_COMPRESS_THRESHOLD", "4096")
+            ),
+        )
+
+    def encode(self, value: Any) -> Tuple[bytes, str]:
+        """Serialize (and maybe compress) ``value``; return payload and tag."""
+        name = self.serializer
+        if name != PICKLE and not is_json_compatible(value):
+            name = PICKLE
+        try:
+            payload = SERIALIZERS[name][0](value)
+        except (TypeError, ValueError, OverflowError):
+            name = PICKLE
+            payload = SERIALIZERS[PICKLE][0](value)
+
+        if self.compression and len(payload) >= self.compress_threshold:
+            compressed = COMPRESSORS[self.compression][0](
+                payload, self.compression_level
+            )
+            if len(compressed) < len(payload):
+                return compressed, f"{name}+{self.compression}"
+        return payload, name
+
+    @staticmethod
+    def decode(payload: bytes, tag: Optional[str]) -> Any:
+        """Decode a payload written under ``tag`` (``None`` means pickle)."""
+        name, _, compression = (tag or PICKLE).partition("+")
+        if name not in SERIALIZERS or (compression and compression not in COMPRESSORS):
+            raise CodecError(f"Cache entry uses codec {tag!r}, which is not installed")
+        if compression:
+            payload = COMPRESSORS[compression][1](payload)
+        return SERIALIZERS[name][1](payload)
@@ -0,0 +1,214 @@
+"""
+Response cache for the LLM calls made by agentic tools.
+
+Entries are keyed by everything that determines a completion (model,
+temperature, formatted prompt, response format) and stored through a
+:class:`ResultCacheManager`, so they live in the same SQLite file as tool
+results and survive restarts. Concurrent identical requests are collapsed
+with singleflight: one caller queries the model, the others wait and reuse
+its response.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .result_cache_manager import ResultCacheManager
+
+
+class LLMResponseCache:
+    """Memoize LLM responses with singleflight and hit/savings counters.
+
+    Token savings are estimated like
+    :meth:`AgenticTool.estimate_token_usage`, at four characters per token of
+    prompt plus response.
+    """
+
+    NAMESPACE = "llm_responses"
+    VERSION = "1"
+
+    def __init__(self, manager: ResultCacheManager):
+        self.manager = manager
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.deduplicated = 0
+        self.tokens_saved = 0
+
+    @staticmethod
+    def make_key(
+        model_id: str,
+        temperature: Optional[float],
+        prompt: Any,
+        response_format: Any = None,
+        return_json: bool = False,
+    ) -> str:
+        payload = json.dumps(
+            [model_id, temperature, prompt, response_format, return_json],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _lookup(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        entry = self.manager.get(
+            namespace=self.NAMESPACE, version=self.VERSION, cache_key=cache_key
+        )
+        return entry if isinstance(entry, dict) and "response" in entry else None
+
+    def _hit(self, entry: Dict[str, Any], deduplicated: bool = False) -> Any:
+        with self._lock:
+            self.hits += 1
+            self.deduplicated += int(deduplicated)
+            self.tokens_saved += entry.get("estimated_tokens", 0)
+        return entry["response"]
+
+    def _store(
+        self, cache_key: str, response: Any, prompt_chars: int, ttl: Optional[int]
+    ):
+        self.manager.set(
+            namespace=self.NAMESPACE,
+            version=self.VERSION,
+            cache_key=cache_key,
+            value={
+                "response": response,
+                "estimated_tokens": (prompt_chars + len(str(response))) // 4,
+            },
+            ttl=ttl,
+        )
+
+    def get_or_call(
+        self,
+        cache_key: str,
+        call: Callable[[], Any],
+        *,
+        prompt_chars: int = 0,
+        ttl: Optional[int] = None,
+    ) -> Tuple[Any, bool]:
+        """Return ``(response, cached)``, calling ``call`` only on a miss.
+
+        Empty responses are returned but not cached.
+        """
+        entry = self._lookup(cache_key)
+        if entry is not None:
+            return self._hit(entry), True
+
+        composed = self.manager.compose_key(self.NAMESPACE, self.VERSION, cache_key)
+        with self.manager.singleflight_guard(composed):
+            # Another caller may have produced the response while we waited
+            entry = self._lookup(cache_key)
+            if entry is not None:
+                return self._hit(entry, deduplicated=True), True
+
+            with self._lock:
+                self.misses += 1
+            response = call()
+            if response:
+                self._store(cache_key, response, prompt_chars, ttl)
+            return response, False
+
+    async def aget_or_call(
+        self,
+        cache_key: str,
+        call: Callable[[], Awaitable[Any]],
+        *,
+        prompt_chars: int = 0,
+        ttl: Optional[int] = None,
+    ) -> Tuple[Any, bool]:
+        """Coroutine version of :meth:`get_or_call` for ``async`` callers."""
+        entry = self._lookup(cache_key)
+        if entry is not None:
+            return self._hit(entry), True
+
+        composed = self.manager.compose_key(self.NAMESPACE, self.VERSION, cache_key)
+        async with self.manager.async_singleflight_guard(composed):
+            entry = self._lookup(cache_key)
+            if entry is not None:
+                return self._hit(entry, deduplicated=True), True
+
+            with self._lock:
+                self.misses += 1
+            response = await call()
+            if response:
+                self._store(cache_key, response, prompt_chars, ttl)
+            return response, False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "deduplicated": self.deduplicated,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "estimated_tokens_saved": self.tokens_saved,
+                "storage": self.manager.stats(),
+            }
+
+    def clear(self):
+        self.manager.clear(namespace=self.NAMESPACE)
+        with self._lock:
+            self.hits = self.misses = self.deduplicated = self.tokens_saved = 0
+
+    def close(self):
+        self.manager.close()
+
+
+_shared_cache: Optional[LLMResponseCache] = None
+_shared_lock = threading.Lock()
+
+
+def _default_cache_path() -> Optional[str]:
+    """Resolve the SQLite file like :class:`ToolUniverse` does for tool results."""
+    if os.getenv("TOOLUNIVERSE_CACHE_PERSIST", "true").lower() not in (
+        "true",
+        "1",
+        "yes",
+    ):
+        return None
+    path = os.getenv("TOOLUNIVERSE_LLM_CACHE_PATH") or os.getenv(
+        "TOOLUNIVERSE_CACHE_PATH"
+    )
+    if path:
+        return path
+    base_dir = os.getenv("TOOLUNIVERSE_CACHE_DIR") or os.path.join(
+        str(Path.home()), ".tooluniverse"
+    )
+    return os.path.join(base_dir, "cache.sqlite")
+
+
+def get_llm_cache(create: bool = True) -> Optional[LLMResponseCache]:
+    """Return the process-wide LLM response cache.
+
+    With ``create=False`` the cache is only returned if some tool already
+    opened it.
+    """
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None and create:
+            path = _default_cache_path()
+            _shared_cache = LLMResponseCache(
+                ResultCacheManager(
+                    memory_size=int(
+                        os.getenv("TOOLUNIVERSE_LLM_CACHE_MEMORY_SIZE", "256")
+                    ),
+                    persistent_path=path,
+                    persistence_enabled=path is not None,
+                )
+            )
+        return _shared_cache
+
+
+def reset_llm_cache():
+    """Close and drop the process-wide cache (mainly for tests)."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is not None:
+            _shared_cache.close()
+        _shared_cache = None
@@ -1,17 +1,21 @@
 """
 In-memory cache utilities for ToolUniverse.
 
-Provides a lightweight, thread-safe LRU cache with optional singleflight
-deduplication for expensive misses.
+Provides a lightweight, thread-safe LRU cache, a size- and TTL-aware cache
+with pluggable eviction policies, and singleflight deduplication for
+expensive misses.
 """
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import sys
 import threading
 import time
 from collections import OrderedDict
-from contextlib import contextmanager
-from typing import Any, Dict, Iterator, Optional, Tuple
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 
 class LRUCache:
@@ -75,6 +79,413 @@ class LRUCache:
                 yield key, value
 
 
+def approx_size(obj: Any, max_objects: int = 20000) -> int:
+    """Approximate the memory footprint of ``obj`` in bytes.
+
+    Walks containers and object attributes, counting each object once. Past
+    ``max_objects`` the remaining objects are assumed to have the average
+    size seen so far, which keeps the cost bounded for very large results.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    visited = 0
+    while stack and visited < max_objects:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        visited += 1
+        try:
+            total += sys.getsizeof(current)
+        except TypeError:
+            continue
+        if isinstance(current, (str, bytes, bytearray, int, float, bool)):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, "__dict__"):
+            stack.append(vars(current))
+    if stack and visited:
+        total += len(stack) * total // visited
+    return total
+
+
+class _LRUPolicy:
+    """Plain least-recently-used ordering."""
+
+    name = "lru"
+
+    def __init__(self, max_entries: int):
+        self._order: "OrderedDict[str, None]" = OrderedDict()
+
+    def add(self, key: str):
+        self._order[key] = None
+
+    def access(self, key: str):
+        self._order.move_to_end(key)
+
+    def remove(self, key: str):
+        self._order.pop(key, None)
+
+    def victim(self) -> Optional[str]:
+        return next(iter(self._order), None)
+
+    def clear(self):
+        self._order.clear()
+
+
+class _SLRUPolicy:
+    """Segmented LRU: a second hit promotes an entry to a protected segment.
+
+    One-off results (e.g. a large batch that is never repeated) only pass
+    through the probationary segment and cannot flush frequently used
+    entries.
+    """
+
+    name = "slru"
+    PROTECTED_RATIO = 0.8
+
+    def __init__(self, max_entries: int):
+        self.protected_cap = max(1, int(max_entries * self.PROTECTED_RATIO))
+        self.probation: "OrderedDict[str, None]" = OrderedDict()
+        self.protected: "OrderedDict[str, None]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.probation) + len(self.protected)
+
+    def add(self, key: str):
+        self.probation[key] = None
+
+    def access(self, key: str):
+        if key in self.protected:
+            self.protected.move_to_end(key)
+            return
+        self.probation.pop(key, None)
+        self.protected[key] = None
+        if len(self.protected) > self.protected_cap:
+            demoted, _ = self.protected.popitem(last=False)
+            self.probation[demoted] = None
+
+    def remove(self, key: str):
+        self.probation.pop(key, None)
+        self.protected.pop(key, None)
+
+    def victim(self) -> Optional[str]:
+        if self.probation:
+            return next(iter(self.probation))
+        return next(iter(self.protected), None)
+
+    def clear(self):
+        self.probation.clear()
+        self.protected.clear()
+
+
+class _FrequencySketch:
+    """Count-min sketch with periodic halving (the TinyLFU history)."""
+
+    DEPTH = 4
+    MAX_COUNT = 15
+
+    def __init__(self, max_entries: int):
+        width = 16
+        while width < max_entries * 4 and width < 1 << 16:
+            width *= 2
+        self._mask = width - 1
+        self._rows = [[0] * width for _ in range(self.DEPTH)]
+        self._sample_size = max(10 * max_entries, 64)
+        self._additions = 0
+
+    def _slots(self, key: str):
+        # One 64-bit hash split into independent 16-bit row indexes
+        digest = hash(key)
+        for row in self._rows:
+            yield row, digest & self._mask
+            digest >>= 16
+
+    def increment(self, key: str):
+        for row, slot in self._slots(key):
+            if row[slot] < self.MAX_COUNT:
+                row[slot] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            # Age the history so that past popularity fades
+            self._additions //= 2
+            for row in self._rows:
+                for i, count in enumerate(row):
+                    row[i] = count >> 1
+
+    def frequency(self, key: str) -> int:
+        return min(row[slot] for row, slot in self._slots(key))
+
+
+class _TinyLFUPolicy:
+    """W-TinyLFU: a small LRU window in front of a segmented-LRU main area.
+
+    New entries land in the window; an entry leaving the window only
+    displaces a main-area entry if it has been requested more often,
+    according to an aging frequency sketch.
+    """
+
+    name = "tinylfu"
+    WINDOW_RATIO = 0.01
+
+    def __init__(self, max_entries: int):
+        self.window_cap = max(1, int(max_entries * self.WINDOW_RATIO))
+        self.main_cap = max(1, max_entries - self.window_cap)
+        self.window: "OrderedDict[str, None]" = OrderedDict()
+        self.main = _SLRUPolicy(self.main_cap)
+        self.sketch = _FrequencySketch(max_entries)
+
+    def add(self, key: str):
+        self.sketch.increment(key)
+        self.window[key] = None
+        while len(self.window) > self.window_cap and len(self.main) < self.main_cap:
+            promoted, _ = self.window.popitem(last=False)
+            self.main.add(promoted)
+
+    def access(self, key: str):
+        self.sketch.increment(key)
+        if key in self.window:
+            self.window.move_to_end(key)
+        else:
+            self.main.access(key)
+
+    def remove(self, key: str):
+        self.window.pop(key, None)
+        self.main.remove(key)
+
+    def victim(self) -> Optional[str]:
+        main_victim = self.main.victim()
+        if len(self.window) <= self.window_cap or main_victim is None:
+            return main_victim or next(iter(self.window), None)
+
+        candidate = next(iter(self.window))
+        if self.sketch.frequency(candidate) > self.sketch.frequency(main_victim):
+            # Admit the window's candidate in place of the main victim
+            self.window.pop(candidate)
+            self.main.add(candidate)
+            return main_victim
+        return candidate
+
+    def clear(self):
+        self.window.clear()
+        self.main.clear()
+
+
+EVICTION_POLICIES = {
+    policy.name: policy for policy in (_LRUPolicy, _SLRUPolicy, _TinyLFUPolicy)
+}
+
+
+class _SizedEntry:
+    __slots__ = ("value", "size", "namespace", "expires_at")
+
+    def __init__(self, value, size, namespace, expires_at):
+        self.value = value
+        self.size = size
+        self.namespace = namespace
+        self.expires_at = expires_at
+
+
+class SizedCache:
+    """Thread-safe memory cache bounded by entry count and approximate bytes.
+
+    Entries carry an optional namespace and expiry time. Expired entries are
+    dropped proactively (a heap of expiry times is checked on every write),
+    so TTL'd results do not occupy the budget until they are next read.
+    Which entry to evict is decided by a pluggable policy: ``"lru"``,
+    ``"slru"`` (segmented LRU) or ``"tinylfu"`` (W-TinyLFU).
+
+    The read/write API mirrors :class:`LRUCache`.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        max_bytes: Optional[int] = None,
+        policy: str = "lru",
+        size_of: Callable[[Any], int] = approx_size,
+    ):
+        policy = (policy or "lru").lower()
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown eviction policy {policy!r}; "
+                f"expected one of {sorted(EVICTION_POLICIES)}"
+            )
+        self.max_size = max(1, int(max_size))
+        self.max_bytes = int(max_bytes) if max_bytes else None
+        self.size_of = size_of
+        self._policy = EVICTION_POLICIES[policy](self.max_size)
+        self._data: Dict[str, _SizedEntry] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._lock = threading.RLock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejected = 0
+        self._namespace_stats: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def policy(self) -> str:
+        return self._policy.name
+
+    def _ns_stats(self, namespace: Optional[str]) -> Dict[str, int]:
+        name = namespace or ""
+        stats = self._namespace_stats.get(name)
+        if stats is None:
+            stats = self._namespace_stats[name] = {
+                "hits": 0,
+                "misses": 0,
+                "evictions": 0,
+                "expirations": 0,
+                "entries": 0,
+                "bytes": 0,
+            }
+        return stats
+
+    def get(self, key: str, namespace: Optional[str] = None) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry.expires_at is not None:
+                if entry.expires_at <= time.time():
+                    self._remove(key, "expirations")
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                self._ns_stats(namespace)["misses"] += 1
+                return None
+
+            self._policy.access(key)
+            self.hits += 1
+            self._ns_stats(entry.namespace)["hits"] += 1
+            return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        namespace: Optional[str] = None,
+        expires_at: Optional[float] = None,
+    ):
+        size = self.size_of(value) if self.max_bytes else 0
+        with self._lock:
+            if self.max_bytes and size > self.max_bytes:
+                # Larger than the whole budget: keep it out of memory
+                if key in self._data:
+                    self._remove(key)
+                self.rejected += 1
+                return
+            if key in self._data:
+                # Overwrites keep the entry's standing with the policy
+                self._remove(key, keep_policy=True)
+                self._policy.access(key)
+            else:
+                self._policy.add(key)
+            self._data[key] = _SizedEntry(value, size, namespace, expires_at)
+            self.current_bytes += size
+            ns_stats = self._ns_stats(namespace)
+            ns_stats["entries"] += 1
+            ns_stats["bytes"] += size
+            if expires_at is not None:
+                heapq.heappush(self._expiry_heap, (expires_at, key))
+            self._purge_expired()
+            self._evict_if_needed()
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._policy.clear()
+            self._expiry_heap.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+            self.rejected = 0
+            self._namespace_stats.clear()
+
+    def _remove(
+        self, key: str, reason: Optional[str] = None, keep_policy: bool = False
+    ):
+        # Caller holds self._lock
+        entry = self._data.pop(key)
+        if not keep_policy:
+            self._policy.remove(key)
+        self.current_bytes -= entry.size
+        ns_stats = self._ns_stats(entry.namespace)
+        ns_stats["entries"] -= 1
+        ns_stats["bytes"] -= entry.size
+        if reason:
+            setattr(self, reason, getattr(self, reason) + 1)
+            ns_stats[reason] += 1
+
+    def _purge_expired(self):
+        now = time.time()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._data.get(key)
+            # Skip heap items left behind by overwritten or deleted entries
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key, "expirations")
+        if len(heap) > 2 * len(self._data) + 64:
+            self._expiry_heap = [
+                (entry.expires_at, key)
+                for key, entry in self._data.items()
+                if entry.expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _evict_if_needed(self):
+        while self._data and (
+            len(self._data) > self.max_size
+            or (self.max_bytes and self.current_bytes > self.max_bytes)
+        ):
+            victim = self._policy.victim()
+            if victim is None:
+                break
+            self._remove(victim, "evictions")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_size": self.max_size,
+                "current_size": len(self._data),
+                "hits": self.hits,
+                "misses": self.misses,
+                "policy": self.policy,
+                "max_bytes": self.max_bytes,
+                "current_bytes": self.current_bytes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "rejected": self.rejected,
+                "namespaces": {
+                    name: dict(stats) for name, stats in self._namespace_stats.items()
+                },
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        with self._lock:
+            for key, entry in list(self._data.items()):
+                yield key, entry.value
+
+
 class SingleFlight:
     """Per-key lock manager to collapse duplicate cache misses."""
 
@@ -97,3 +508,35 @@ class SingleFlight:
             with self._global:
                 if not lock.locked():
                     self._locks.pop(key, None)
+
+
+class AsyncSingleFlight:
+    """Per-key ``asyncio.Lock`` manager for coroutine callers.
+
+    Locks are scoped to the running event loop so the same manager can be
+    shared by several loops (e.g. one per worker thread).
+    """
+
+    def __init__(self):
+        self._locks: Dict[Tuple[int, str], asyncio.Lock] = {}
+        self._waiters: Dict[Tuple[int, str], int] = {}
+        self._global = threading.Lock()
+
+    @asynccontextmanager
+    async def acquire(self, key: str):
+        slot = (id(asyncio.get_running_loop()), key)
+        with self._global:
+            lock = self._locks.get(slot)
+            if lock is None:
+                lock = asyncio.Lock()
+                self._locks[slot] = lock
+            self._waiters[slot] = self._waiters.get(slot, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            with self._global:
+                self._waiters[slot] -= 1
+                if not self._waiters[slot]:
+                    self._waiters.pop(slot, None)
+                    self._locks.pop(slot, None)
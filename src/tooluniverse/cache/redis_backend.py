@@ -0,0 +1,326 @@
+"""
+Redis-backed cache layer shared by several processes or hosts.
+
+Workers that each keep their own SQLite file recompute every result once per
+worker. Pointing them at one Redis (or Redis-protocol) server lets a result
+computed by any of them be reused by all:
+
+- values are encoded with :class:`~tooluniverse.cache.codecs.CacheCodec` and
+  expire through Redis' own TTLs,
+- bulk reads are one ``MGET`` per chunk of keys and bulk writes one
+  pipelined round-trip,
+- every namespace keeps an index of its keys, scored by expiry time, so one
+  tool's entries can be invalidated without touching the rest; members whose
+  entry has expired are pruned on every write and read of the index,
+- short-lived ``SET NX PX`` locks let the first process that misses compute
+  a result while the others wait for it.
+
+Requires the ``redis`` package (``pip install "tooluniverse[cache]"``).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .backend import CacheBackend, CacheEntry
+from .codecs import CacheCodec, CodecError
+
+logger = logging.getLogger(__name__)
+
+# Keys per MGET / DEL round-trip
+_BATCH_SIZE = 500
+# Separates the JSON header of a stored value from the encoded payload
+_HEADER_END = b"\0"
+
+
+def _escape_glob(text: str) -> str:
+    return "".join("\\" + ch if ch in "*?[]\\" else ch for ch in text)
+
+
+class RedisCache(CacheBackend):
+    """Cache layer stored on a Redis server.
+
+    Args:
+        client: A ``redis.Redis`` (or compatible) client. It must return
+            bytes, i.e. not use ``decode_responses=True``.
+        prefix: Prefix of every key written, so several caches can share one
+            database.
+        codec: Value codec; defaults to :meth:`CacheCodec.from_env`.
+        lock_ttl: Seconds after which an abandoned singleflight lock expires.
+        lock_wait: Seconds to wait for another process' lock before computing
+            the result anyway (defaults to ``lock_ttl``).
+        lock_poll_interval: Seconds between attempts to take a held lock.
+    """
+
+    supports_locking = True
+
+    def __init__(
+        self,
+        client,
+        *,
+        prefix: str = "tooluniverse:cache",
+        codec: Optional[CacheCodec] = None,
+        lock_ttl: float = 60.0,
+        lock_wait: Optional[float] = None,
+        lock_poll_interval: float = 0.05,
+        owns_client: bool = False,
+    ):
+        self.enabled = True
+        self.client = client
+        self.prefix = prefix
+        self.codec = codec or CacheCodec.from_env()
+        self.lock_ttl = lock_ttl
+        self.lock_wait = lock_ttl if lock_wait is None else lock_wait
+        self.lock_poll_interval = lock_poll_interval
+        self._owns_client = owns_client
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisCache":
+        """Connect to ``url`` (e.g. ``redis://localhost:6379/0``)."""
+        try:
+            import redis
+        except ImportError as exc:
+            raise ImportError(
+                "The Redis cache backend requires the 'redis' package; "
+                'install it with: pip install "tooluniverse[cache]"'
+            ) from exc
+        client = redis.Redis.from_url(url)
+        client.ping()
+        return cls(client, owns_client=True, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Key layout
+    # ------------------------------------------------------------------
+    def _entry_key(self, cache_key: str) -> str:
+        return f"{self.prefix}:entry:{cache_key}"
+
+    def _namespace_key(self, namespace: str) -> str:
+        return f"{self.prefix}:idx:{namespace}"
+
+    def _namespaces_key(self) -> str:
+        return f"{self.prefix}:namespaces"
+
+    def _lock_key(self, name: str) -> str:
+        return f"{self.prefix}:lock:{name}"
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+    def _pack(self, entry: Dict[str, Any], now: float) -> bytes:
+        payload, codec = self.codec.encode(entry["value"])
+        header = {
+            "namespace": entry["namespace"],
+            "version": entry["version"],
+            "ttl": entry["ttl"],
+            "created_at": now,
+            "codec": codec,
+        }
+        return json.dumps(header).encode("utf-8") + _HEADER_END + payload
+
+    def _unpack(self, cache_key: str, raw: Optional[bytes]) -> Optional[CacheEntry]:
+        if raw is None:
+            return None
+        try:
+            header_bytes, _, payload = raw.partition(_HEADER_END)
+            header = json.loads(header_bytes)
+            value = self.codec.decode(payload, header["codec"])
+        except (CodecError, ValueError, KeyError) as exc:
+            # Written by a process with an optional codec we lack: a miss
+            logger.debug("Skipping cache entry %s: %s", cache_key, exc)
+            return None
+        return CacheEntry(
+            key=cache_key,
+            value=value,
+            namespace=header["namespace"],
+            version=header["version"] or "",
+            ttl=header["ttl"],
+            created_at=header["created_at"],
+            last_accessed=header["created_at"],
+            hit_count=0,
+        )
+
+    # ------------------------------------------------------------------
+    # CacheBackend API
+    # ------------------------------------------------------------------
+    def get(self, cache_key: str) -> Optional[CacheEntry]:
+        return self._unpack(cache_key, self.client.get(self._entry_key(cache_key)))
+
+    def get_many(self, cache_keys: Sequence[str]) -> Dict[str, CacheEntry]:
+        """Fetch several entries with one ``MGET`` per chunk of keys."""
+        keys = list(dict.fromkeys(cache_keys))
+        found: Dict[str, CacheEntry] = {}
+        for start in range(0, len(keys), _BATCH_SIZE):
+            chunk = keys[start : start + _BATCH_SIZE]
+            values = self.client.mget([self._entry_key(key) for key in chunk])
+            for key, raw in zip(chunk, values):
+                entry = self._unpack(key, raw)
+                if entry is not None:
+                    found[key] = entry
+        return found
+
+    def set(
+        self,
+        cache_key: str,
+        value: Any,
+        *,
+        namespace: str,
+        version: str,
+        ttl: Optional[int],
+    ):
+        self.set_many(
+            [
+                {
+                    "cache_key": cache_key,
+                    "value": value,
+                    "namespace": namespace,
+                    "version": version,
+                    "ttl": ttl,
+                }
+            ]
+        )
+
+    def set_many(self, entries: Sequence[Dict[str, Any]]):
+        """Write several entries and their namespace index in one round-trip."""
+        if not entries:
+            return
+        now = time.time()
+        pipe = self.client.pipeline(transaction=False)
+        namespaces = set()
+        for entry in entries:
+            pipe.set(
+                self._entry_key(entry["cache_key"]),
+                self._pack(entry, now),
+                ex=entry["ttl"] or None,
+            )
+            expires_at = now + entry["ttl"] if entry["ttl"] else float("inf")
+            pipe.zadd(
+                self._namespace_key(entry["namespace"]),
+                {entry["cache_key"]: expires_at},
+            )
+            namespaces.add(entry["namespace"])
+        for namespace in namespaces:
+            self._prune_index(pipe, namespace, now)
+        pipe.sadd(self._namespaces_key(), *namespaces)
+        pipe.execute()
+
+    def _prune_index(self, pipe, namespace: str, now: float):
+        """Queue the removal of index members whose entry has expired."""
+        pipe.zremrangebyscore(self._namespace_key(namespace), "-inf", now)
+
+    def delete(self, cache_key: str):
+        # A stale index member is dropped by the next clear() or iteration
+        self.client.delete(self._entry_key(cache_key))
+
+    def clear(self, namespace: Optional[str] = None):
+        """Delete the entries of ``namespace`` (all entries if None)."""
+        if namespace:
+            index = self._namespace_key(namespace)
+            self._delete_in_batches(
+                self._entry_key(key.decode("utf-8"))
+                for key, _ in self.client.zscan_iter(index, count=_BATCH_SIZE)
+            )
+            self.client.delete(index)
+            self.client.srem(self._namespaces_key(), namespace)
+            return
+        for kind in ("entry", "idx"):
+            pattern = f"{_escape_glob(self.prefix)}:{kind}:*"
+            self._delete_in_batches(
+                self.client.scan_iter(match=pattern, count=_BATCH_SIZE)
+            )
+        self.client.delete(self._namespaces_key())
+
+    def _delete_in_batches(self, keys: Iterable):
+        batch: List = []
+        for key in keys:
+            batch.append(key)
+            if len(batch) >= _BATCH_SIZE:
+                self.client.delete(*batch)
+                batch = []
+        if batch:
+            self.client.delete(*batch)
+
+    def _namespaces(self) -> List[str]:
+        return sorted(
+            name.decode("utf-8")
+            for name in self.client.smembers(self._namespaces_key())
+        )
+
+    def iter_entries(self, namespace: Optional[str] = None) -> Iterator[CacheEntry]:
+        namespaces = [namespace] if namespace else self._namespaces()
+        for name in namespaces:
+            index = self._namespace_key(name)
+            self.client.zremrangebyscore(index, "-inf", time.time())
+            keys = [
+                key.decode("utf-8")
+                for key, _ in self.client.zscan_iter(index, count=_BATCH_SIZE)
+            ]
+            found = self.get_many(keys)
+            gone = [key for key in keys if key not in found]
+            if gone:
+                # Deleted (or unreadable) since they were indexed
+                self.client.zrem(index, *gone)
+            yield from (found[key] for key in keys if key in found)
+
+    def stats(self) -> Dict[str, Any]:
+        namespaces = self._namespaces()
+        now = time.time()
+        pipe = self.client.pipeline(transaction=False)
+        for name in namespaces:
+            self._prune_index(pipe, name, now)
+            pipe.zcard(self._namespace_key(name))
+        # Every namespace queued a prune and a count; keep the counts
+        counts = pipe.execute()[1::2] if namespaces else []
+        return {
+            "enabled": True,
+            "backend": "redis",
+            "prefix": self.prefix,
+            # Index sizes; may include entries deleted since they were indexed
+            "entries": sum(counts),
+            "namespaces": dict(zip(namespaces, counts)),
+        }
+
+    def close(self):
+        if self._owns_client:
+            self.client.close()
+
+    # ------------------------------------------------------------------
+    # Cross-process singleflight
+    # ------------------------------------------------------------------
+    def acquire_lock(self, name: str) -> Optional[str]:
+        """Take lock ``name``, waiting up to ``lock_wait`` seconds for it.
+
+        The lock expires after ``lock_ttl`` seconds, so a crashed holder
+        cannot block other processes for longer than that.
+        """
+        key = self._lock_key(name)
+        token = uuid.uuid4().hex
+        ttl_ms = max(1, int(self.lock_ttl * 1000))
+        deadline = time.monotonic() + self.lock_wait
+        while True:
+            if self.client.set(key, token, nx=True, px=ttl_ms):
+                return token
+            if time.monotonic() >= deadline:
+                logger.debug("Timed out waiting for cache lock %s", name)
+                return None
+            time.sleep(self.lock_poll_interval)
+
+    def release_lock(self, name: str, token: str):
+        """Release lock ``name`` only if it is still held with ``token``."""
+        key = self._lock_key(name)
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                if pipe.get(key) != token.encode("utf-8"):
+                    # Expired and taken over by another process
+                    pipe.unwatch()
+                    return
+                pipe.multi()
+                pipe.delete(key)
+                pipe.execute()
+            except Exception as exc:
+                # Another client touched the key; it expires on its own
+                logger.debug("Could not release cache lock %s: %s", name, exc)
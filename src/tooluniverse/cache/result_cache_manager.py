@@ -4,16 +4,19 @@ Result cache manager that coordinates in-memory and persistent storage.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import queue
 import threading
 import time
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, Optional, Sequence
+from typing import Any, Dict, Iterator, Optional, Sequence, Set
 
-from .memory_cache import LRUCache, SingleFlight
-from .sqlite_backend import CacheEntry, PersistentCache
+from .backend import CacheBackend, CacheEntry
+from .memory_cache import AsyncSingleFlight, SingleFlight, SizedCache
+from .sqlite_backend import PersistentCache
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +30,21 @@ class CacheRecord:
 
 
 class ResultCacheManager:
-    """Facade around memory + persistent cache layers."""
+    """Facade around memory + persistent cache layers.
+
+    The memory tier holds at most ``memory_size`` entries and, when
+    ``memory_max_bytes`` is set, at most that many (approximate) bytes of
+    results. ``memory_policy`` selects its eviction policy: ``"lru"``
+    (default), ``"slru"`` or ``"tinylfu"``.
+
+    The persistent tier is ``backend`` when given. Otherwise it is a Redis
+    server when ``TOOLUNIVERSE_CACHE_REDIS_URL`` is set, and the SQLite file
+    at ``persistent_path`` if not. With a backend that supports locking,
+    singleflight also collapses duplicate misses across processes.
+    """
+
+    # Maximum number of queued writes persisted in one transaction
+    ASYNC_BATCH_SIZE = 256
 
     def __init__(
         self,
@@ -40,18 +57,31 @@ class ResultCacheManager:
         default_ttl: Optional[int] = None,
         async_persist: Optional[bool] = None,
         async_queue_size: int = 10000,
+        memory_max_bytes: Optional[int] = None,
+        memory_policy: str = "lru",
+        backend: Optional[CacheBackend] = None,
     ):
         self.enabled = enabled
         self.default_ttl = default_ttl
 
-        self.memory = LRUCache(max_size=memory_size)
+        try:
+            self.memory = SizedCache(
+                max_size=memory_size, max_bytes=memory_max_bytes, policy=memory_policy
+            )
+        except ValueError as exc:
+            logger.warning("%s; falling back to LRU eviction", exc)
+            self.memory = SizedCache(max_size=memory_size, max_bytes=memory_max_bytes)
         persistence_path = persistent_path
         if persistence_path is None:
             cache_dir = os.environ.get("TOOLUNIVERSE_CACHE_DIR")
             if cache_dir:
                 persistence_path = os.path.join(cache_dir, "tooluniverse_cache.sqlite")
-        self.persistent = None
-        if persistence_enabled and persistence_path:
+        self.persistent: Optional[CacheBackend] = None
+        if backend is None and persistence_enabled:
+            backend = self._backend_from_env()
+        if backend is not None:
+            self.persistent = backend
+        elif persistence_enabled and persistence_path:
             try:
                 self.persistent = PersistentCache(persistence_path, enable=True)
             except Exception as exc:
@@ -59,6 +89,9 @@ class ResultCacheManager:
                 self.persistent = None
 
         self.singleflight = SingleFlight() if singleflight else None
+        self.async_singleflight = AsyncSingleFlight() if singleflight else None
+        # Keys whose cross-process lock this process holds
+        self._shared_locked: Set[str] = set()
         self._init_async_persistence(async_persist, async_queue_size)
 
     # ------------------------------------------------------------------
@@ -68,12 +101,52 @@ class ResultCacheManager:
     def compose_key(namespace: str, version: str, cache_key: str) -> str:
         return f"{namespace}::{version}::{cache_key}"
 
+    @staticmethod
+    def _backend_from_env() -> Optional[CacheBackend]:
+        url = os.getenv("TOOLUNIVERSE_CACHE_REDIS_URL")
+        if not url:
+            return None
+        from .redis_backend import RedisCache
+
+        try:
+            return RedisCache.from_url(
+                url,
+                prefix=os.getenv(
+                    "TOOLUNIVERSE_CACHE_REDIS_PREFIX", "tooluniverse:cache"
+                ),
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to connect to Redis cache; using SQLite instead: %s", exc
+            )
+            return None
+
     def _now(self) -> float:
         return time.time()
 
     def _ttl_or_default(self, ttl: Optional[int]) -> Optional[int]:
         return ttl if ttl is not None else self.default_ttl
 
+    def _remember(
+        self,
+        composed: str,
+        value: Any,
+        expires_at: Optional[float],
+        namespace: str,
+        version: str,
+    ):
+        self.memory.set(
+            composed,
+            CacheRecord(
+                value=value,
+                expires_at=expires_at,
+                namespace=namespace,
+                version=version,
+            ),
+            namespace=namespace,
+            expires_at=expires_at,
+        )
+
     def _init_async_persistence(
         self, async_persist: Optional[bool], async_queue_size: int
     ) -> None:
@@ -109,7 +182,7 @@ class ResultCacheManager:
             return None
 
         composed = self.compose_key(namespace, version, cache_key)
-        record = self.memory.get(composed)
+        record = self.memory.get(composed, namespace=namespace)
         if record:
             if record.expires_at and record.expires_at <= self._now():
                 self.memory.delete(composed)
@@ -119,15 +192,7 @@ class ResultCacheManager:
         entry = self._get_from_persistent(composed)
         if entry:
             expires_at = entry.created_at + entry.ttl if entry.ttl else None
-            self.memory.set(
-                composed,
-                CacheRecord(
-                    value=entry.value,
-                    expires_at=expires_at,
-                    namespace=namespace,
-                    version=version,
-                ),
-            )
+            self._remember(composed, entry.value, expires_at, namespace, version)
             return entry.value
         return None
 
@@ -147,15 +212,7 @@ class ResultCacheManager:
         expires_at = self._now() + effective_ttl if effective_ttl else None
         composed = self.compose_key(namespace, version, cache_key)
 
-        self.memory.set(
-            composed,
-            CacheRecord(
-                value=value,
-                expires_at=expires_at,
-                namespace=namespace,
-                version=version,
-            ),
-        )
+        self._remember(composed, value, expires_at, namespace, version)
 
         if self.persistent:
             payload = {
@@ -165,7 +222,11 @@ class ResultCacheManager:
                 "version": version,
                 "ttl": effective_ttl,
             }
-            if not self._schedule_persist("set", payload):
+            # Other processes waiting on the shared lock read the backend as
+            # soon as it is released, so that write cannot wait in the queue
+            if composed in self._shared_locked or not self._schedule_persist(
+                "set", payload
+            ):
                 self._perform_persist_set(**payload)
 
     def delete(self, *, namespace: str, version: str, cache_key: str):
@@ -211,18 +272,39 @@ class ResultCacheManager:
             return {}
 
         hits: Dict[str, Any] = {}
+        misses: Dict[str, Dict[str, str]] = {}
+        now = self._now()
         for request in requests:
             namespace = request["namespace"]
             version = request["version"]
-            cache_key = request["cache_key"]
-            value = self.get(
-                namespace=namespace,
-                version=version,
-                cache_key=cache_key,
+            composed = self.compose_key(namespace, version, request["cache_key"])
+            if composed in hits or composed in misses:
+                continue
+            record = self.memory.get(composed, namespace=namespace)
+            if record:
+                if record.expires_at and record.expires_at <= now:
+                    self.memory.delete(composed)
+                else:
+                    hits[composed] = record.value
+                    continue
+            misses[composed] = request
+
+        if not misses:
+            return hits
+
+        # One round-trip per chunk instead of one SELECT + UPDATE per key
+        for composed, entry in self._get_many_from_persistent(list(misses)).items():
+            request = misses[composed]
+            expires_at = entry.created_at + entry.ttl if entry.ttl else None
+            self._remember(
+                composed,
+                entry.value,
+                expires_at,
+                request["namespace"],
+                request["version"],
             )
-            if value is not None:
-                composed = self.compose_key(namespace, version, cache_key)
-                hits[composed] = value
+            if entry.value is not None:
+                hits[composed] = entry.value
 
         return hits
 
@@ -269,6 +351,18 @@ class ResultCacheManager:
             self.persistent = None
             return None
 
+    def _get_many_from_persistent(
+        self, composed_keys: Sequence[str]
+    ) -> Dict[str, CacheEntry]:
+        if not self.persistent:
+            return {}
+        try:
+            return self.persistent.get_many(composed_keys)
+        except Exception as exc:
+            logger.warning("Persistent cache read failed: %s", exc)
+            self.persistent = None
+            return {}
+
     def _iter_persistent(self, namespace: Optional[str]):
         if not self.persistent:
             return iter([])
@@ -283,9 +377,68 @@ class ResultCacheManager:
     # ------------------------------------------------------------------
     def singleflight_guard(self, composed_key: str):
         if self.singleflight:
+            if self._shared_locks():
+                return self._shared_singleflight(composed_key)
             return self.singleflight.acquire(composed_key)
         return _DummyContext()
 
+    def async_singleflight_guard(self, composed_key: str):
+        if self.async_singleflight:
+            if self._shared_locks():
+                return self._async_shared_singleflight(composed_key)
+            return self.async_singleflight.acquire(composed_key)
+        return _DummyContext()
+
+    def _shared_locks(self) -> bool:
+        return self.persistent is not None and self.persistent.supports_locking
+
+    @contextmanager
+    def _shared_singleflight(self, composed_key: str):
+        # Threads of this process queue on the local lock, so only one of
+        # them at a time contends for the backend's lock
+        with self.singleflight.acquire(composed_key):
+            backend = self.persistent
+            token = self._acquire_shared_lock(backend, composed_key)
+            self._shared_locked.add(composed_key)
+            try:
+                yield
+            finally:
+                self._shared_locked.discard(composed_key)
+                if token is not None:
+                    self._release_shared_lock(backend, composed_key, token)
+
+    @asynccontextmanager
+    async def _async_shared_singleflight(self, composed_key: str):
+        async with self.async_singleflight.acquire(composed_key):
+            backend = self.persistent
+            token = await asyncio.to_thread(
+                self._acquire_shared_lock, backend, composed_key
+            )
+            self._shared_locked.add(composed_key)
+            try:
+                yield
+            finally:
+                self._shared_locked.discard(composed_key)
+                if token is not None:
+                    await asyncio.to_thread(
+                        self._release_shared_lock, backend, composed_key, token
+                    )
+
+    @staticmethod
+    def _acquire_shared_lock(backend: CacheBackend, composed_key: str):
+        try:
+            return backend.acquire_lock(composed_key)
+        except Exception as exc:
+            logger.warning("Shared cache lock failed: %s", exc)
+            return None
+
+    @staticmethod
+    def _release_shared_lock(backend: CacheBackend, composed_key: str, token: str):
+        try:
+            backend.release_lock(composed_key, token)
+        except Exception as exc:
+            logger.warning("Shared cache lock release failed: %s", exc)
+
     def close(self):
         self.flush()
         self._shutdown_async_worker()
@@ -320,27 +473,39 @@ class ResultCacheManager:
         if queue_ref is None:
             return
 
-        while True:
+        stop = False
+        while not stop:
             try:
-                op, payload = queue_ref.get()
+                batch = [queue_ref.get()]
             except Exception:
                 continue
 
-            if op == "__STOP__":
-                queue_ref.task_done()
-                break
-
-            try:
-                if op == "set":
-                    self._perform_persist_set(**payload)
+            # Drain whatever else is queued so writes share one transaction
+            while len(batch) < self.ASYNC_BATCH_SIZE:
+                try:
+                    batch.append(queue_ref.get_nowait())
+                except queue.Empty:
+                    break
+
+            writes = []
+            for op, payload in batch:
+                if op == "__STOP__":
+                    stop = True
+                elif op == "set":
+                    writes.append(payload)
                 else:
                     logger.warning("Unknown async cache operation: %s", op)
+
+            try:
+                if writes:
+                    self._perform_persist_set_many(writes)
             except Exception as exc:
                 logger.warning("Async cache write failed: %s", exc)
                 # Disable async persistence to avoid repeated failures
                 self.async_persist = False
             finally:
-                queue_ref.task_done()
+                for _ in batch:
+                    queue_ref.task_done()
 
     def _perform_persist_set(
         self,
@@ -366,6 +531,27 @@ class ResultCacheManager:
             self.persistent = None
             raise
 
+    def _perform_persist_set_many(self, payloads: Sequence[Dict[str, Any]]):
+        if not self.persistent:
+            return
+        try:
+            self.persistent.set_many(
+                [
+                    {
+                        "cache_key": payload["composed"],
+                        "value": payload["value"],
+                        "namespace": payload["namespace"],
+                        "version": payload["version"],
+                        "ttl": payload["ttl"],
+                    }
+                    for payload in payloads
+                ]
+            )
+        except Exception as exc:
+            logger.warning("Persistent cache write failed: %s", exc)
+            self.persistent = None
+            raise
+
     def _shutdown_async_worker(self) -> None:
         if not self.async_persist or self._persist_queue is None:
             return
@@ -388,3 +574,9 @@ class _DummyContext:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         return False
+
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
@@ -3,39 +3,72 @@ SQLite-backed persistent cache for ToolUniverse.
 
 The cache stores serialized tool results with TTL and version metadata.
 Designed to be a drop-in persistent layer behind the in-memory cache.
+Values are encoded by :class:`~tooluniverse.cache.codecs.CacheCodec`; the
+codec tag stored with each row lets entries written by older versions or
+other configurations load unchanged.
 """
 
 from __future__ import annotations
 
+import logging
 import os
-import pickle
 import sqlite3
 import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, Iterator, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from .backend import CacheBackend, CacheEntry
+from .codecs import CacheCodec, CodecError
 
-@dataclass
-class CacheEntry:
-    key: str
-    value: Any
-    namespace: str
-    version: str
-    ttl: Optional[int]
-    created_at: float
-    last_accessed: float
-    hit_count: int
+logger = logging.getLogger(__name__)
 
+# SQLite's default limit on host parameters is 999 on older builds
+_IN_CHUNK_SIZE = 500
+# Pending hit-count updates are written once this many keys have been read
+_HIT_FLUSH_THRESHOLD = 1000
+
+_SELECT_COLUMNS = """
+    SELECT cache_key, namespace, version, value, ttl, created_at,
+           last_accessed, expires_at, hit_count, codec
+    FROM cache_entries
+"""
+
+_UPSERT_SQL = """
+    INSERT INTO cache_entries(cache_key, namespace, version, value, ttl,
+                              created_at, last_accessed, expires_at, hit_count,
+                              codec)
+    VALUES(?, ?, ?, ?, ?, ?, ?, ?, 0, ?)
+    ON CONFLICT(cache_key) DO UPDATE SET
+        namespace=excluded.namespace,
+        version=excluded.version,
+        value=excluded.value,
+        ttl=excluded.ttl,
+        created_at=excluded.created_at,
+        last_accessed=excluded.last_accessed,
+        expires_at=excluded.expires_at,
+        hit_count=excluded.hit_count,
+        codec=excluded.codec
+"""
 
-class PersistentCache:
-    """SQLite-backed cache layer with TTL support."""
 
-    def __init__(self, path: str, *, enable: bool = True):
+class PersistentCache(CacheBackend):
+    """SQLite-backed cache layer with TTL support.
+
+    Reads do not update ``hit_count``/``last_accessed`` row by row: hits are
+    accumulated in memory and written in one batch (see :meth:`flush_hits`).
+    """
+
+    def __init__(
+        self, path: str, *, enable: bool = True, codec: Optional[CacheCodec] = None
+    ):
         self.enabled = enable
         self.path = path
+        self.codec = codec or CacheCodec.from_env()
         self._lock = threading.RLock()
         self._conn: Optional[sqlite3.Connection] = None
+        # cache_key -> (pending hits, last access time)
+        self._pending_hits: Dict[str, Tuple[int, float]] = {}
 
         if self.enabled:
             self._init_storage()
@@ -69,10 +102,17 @@ class PersistentCache:
                 created_at REAL NOT NULL,
                 last_accessed REAL NOT NULL,
                 expires_at REAL,
-                hit_count INTEGER NOT NULL DEFAULT 0
+                hit_count INTEGER NOT NULL DEFAULT 0,
+                codec TEXT
             )
             """
         )
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(cache_entries)")
+        }
+        if "codec" not in columns:
+            # Databases created before codecs: existing rows stay pickle (NULL)
+            self._conn.execute("ALTER TABLE cache_entries ADD COLUMN codec TEXT")
         self._conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_cache_namespace ON cache_entries(namespace)"
         )
@@ -80,16 +120,79 @@ class PersistentCache:
             "CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache_entries(expires_at)"
         )
 
-    def _serialize(self, value: Any) -> bytes:
-        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    def _serialize(self, value: Any) -> Tuple[bytes, str]:
+        return self.codec.encode(value)
+
+    def _deserialize(self, payload: bytes, codec: Optional[str] = None) -> Any:
+        return self.codec.decode(payload, codec)
+
+    def _row_to_entry(self, row) -> Optional[CacheEntry]:
+        try:
+            value = self._deserialize(row[3], row[9])
+        except CodecError as exc:
+            # Written by a process with an optional codec we lack: a miss
+            logger.debug("Skipping cache entry %s: %s", row[0], exc)
+            return None
+        return CacheEntry(
+            key=row[0],
+            namespace=row[1],
+            version=row[2] or "",
+            value=value,
+            ttl=row[4],
+            created_at=row[5],
+            last_accessed=row[6],
+            hit_count=row[8],
+        )
+
+    def _record_hits(self, keys: Iterable[str], now: float):
+        # Caller holds self._lock
+        for key in keys:
+            count, _ = self._pending_hits.get(key, (0, now))
+            self._pending_hits[key] = (count + 1, now)
+        if len(self._pending_hits) >= _HIT_FLUSH_THRESHOLD:
+            self.flush_hits()
+
+    @contextmanager
+    def _transaction(self):
+        # Caller holds self._lock; the connection runs in autocommit mode
+        assert self._conn is not None
+        self._conn.execute("BEGIN")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        else:
+            self._conn.execute("COMMIT")
 
-    def _deserialize(self, payload: bytes) -> Any:
-        return pickle.loads(payload)
+    def flush_hits(self):
+        """Write accumulated hit counts and access times in one transaction."""
+        if not self.enabled or not self._conn:
+            return
+        with self._lock:
+            if not self._pending_hits:
+                return
+            pending, self._pending_hits = self._pending_hits, {}
+            with self._transaction() as conn:
+                conn.executemany(
+                    """
+                    UPDATE cache_entries
+                    SET last_accessed = ?, hit_count = hit_count + ?
+                    WHERE cache_key = ?
+                    """,
+                    [
+                        (accessed, count, key)
+                        for key, (count, accessed) in pending.items()
+                    ],
+                )
 
     def close(self):
         if self._conn:
-            self._conn.close()
-            self._conn = None
+            try:
+                self.flush_hits()
+            finally:
+                self._conn.close()
+                self._conn = None
 
     def cleanup_expired(self):
         if not self.enabled or not self._conn:
@@ -106,45 +209,64 @@ class PersistentCache:
             return None
         with self._lock:
             cur = self._conn.execute(
-                """
-                SELECT cache_key, namespace, version, value, ttl, created_at,
-                       last_accessed, expires_at, hit_count
-                FROM cache_entries WHERE cache_key = ?
-                """,
-                (cache_key,),
+                _SELECT_COLUMNS + " WHERE cache_key = ?", (cache_key,)
             )
             row = cur.fetchone()
             if not row:
                 return None
 
+            now = time.time()
             expires_at = row[7]
-            if expires_at is not None and expires_at <= time.time():
+            if expires_at is not None and expires_at <= now:
                 self._conn.execute(
                     "DELETE FROM cache_entries WHERE cache_key = ?", (cache_key,)
                 )
                 return None
 
-            entry = CacheEntry(
-                key=row[0],
-                namespace=row[1],
-                version=row[2] or "",
-                value=self._deserialize(row[3]),
-                ttl=row[4],
-                created_at=row[5],
-                last_accessed=row[6],
-                hit_count=row[8],
-            )
-
-            self._conn.execute(
-                """
-                UPDATE cache_entries
-                SET last_accessed = ?, hit_count = hit_count + 1
-                WHERE cache_key = ?
-                """,
-                (time.time(), cache_key),
-            )
+            entry = self._row_to_entry(row)
+            if entry is not None:
+                self._record_hits((cache_key,), now)
             return entry
 
+    def get_many(self, cache_keys: Sequence[str]) -> Dict[str, CacheEntry]:
+        """Fetch several entries with one ``SELECT ... IN`` per chunk of keys.
+
+        Expired rows are deleted in a single batch; hit counts are deferred
+        like in :meth:`get`.
+
+        Returns:
+            Mapping of cache key to entry for the keys that were found.
+        """
+        if not self.enabled or not self._conn:
+            return {}
+        keys = list(dict.fromkeys(cache_keys))
+        found: Dict[str, CacheEntry] = {}
+        expired: List[Tuple[str]] = []
+        with self._lock:
+            now = time.time()
+            for start in range(0, len(keys), _IN_CHUNK_SIZE):
+                chunk = keys[start : start + _IN_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cur = self._conn.execute(
+                    _SELECT_COLUMNS + f" WHERE cache_key IN ({placeholders})",
+                    chunk,
+                )
+                for row in cur.fetchall():
+                    if row[7] is not None and row[7] <= now:
+                        expired.append((row[0],))
+                    else:
+                        entry = self._row_to_entry(row)
+                        if entry is not None:
+                            found[row[0]] = entry
+
+            if expired:
+                with self._transaction() as conn:
+                    conn.executemany(
+                        "DELETE FROM cache_entries WHERE cache_key = ?", expired
+                    )
+            self._record_hits(found, now)
+        return found
+
     def set(
         self,
         cache_key: str,
@@ -154,38 +276,53 @@ class PersistentCache:
         version: str,
         ttl: Optional[int],
     ):
-        if not self.enabled or not self._conn:
+        self.set_many(
+            [
+                {
+                    "cache_key": cache_key,
+                    "value": value,
+                    "namespace": namespace,
+                    "version": version,
+                    "ttl": ttl,
+                }
+            ]
+        )
+
+    def set_many(self, entries: Sequence[Dict[str, Any]]):
+        """Upsert several entries with ``executemany`` in one transaction.
+
+        Args:
+            entries: Dicts with ``cache_key``, ``value``, ``namespace``,
+                ``version`` and ``ttl``.
+        """
+        if not self.enabled or not self._conn or not entries:
             return
-        with self._lock:
-            now = time.time()
-            expires_at = now + ttl if ttl else None
-            payload = self._serialize(value)
-            self._conn.execute(
-                """
-                INSERT INTO cache_entries(cache_key, namespace, version, value, ttl,
-                                          created_at, last_accessed, expires_at, hit_count)
-                VALUES(?, ?, ?, ?, ?, ?, ?, ?, 0)
-                ON CONFLICT(cache_key) DO UPDATE SET
-                    namespace=excluded.namespace,
-                    version=excluded.version,
-                    value=excluded.value,
-                    ttl=excluded.ttl,
-                    created_at=excluded.created_at,
-                    last_accessed=excluded.last_accessed,
-                    expires_at=excluded.expires_at,
-                    hit_count=excluded.hit_count
-                """,
+        now = time.time()
+        rows = []
+        for entry in entries:
+            payload, codec = self._serialize(entry["value"])
+            rows.append(
                 (
-                    cache_key,
-                    namespace,
-                    version,
+                    entry["cache_key"],
+                    entry["namespace"],
+                    entry["version"],
                     payload,
-                    ttl,
+                    entry["ttl"],
                     now,
                     now,
-                    expires_at,
-                ),
+                    now + entry["ttl"] if entry["ttl"] else None,
+                    codec,
+                )
             )
+        with self._lock:
+            for row in rows:
+                # A rewritten entry starts counting hits from zero
+                self._pending_hits.pop(row[0], None)
+            if len(rows) == 1:
+                self._conn.execute(_UPSERT_SQL, rows[0])
+                return
+            with self._transaction() as conn:
+                conn.executemany(_UPSERT_SQL, rows)
 
     def delete(self, cache_key: str):
         if not self.enabled or not self._conn:
@@ -210,36 +347,19 @@ class PersistentCache:
         if not self.enabled or not self._conn:
             return iter([])
         with self._lock:
+            self.flush_hits()
             if namespace:
                 cur = self._conn.execute(
-                    """
-                    SELECT cache_key, namespace, version, value, ttl,
-                           created_at, last_accessed, hit_count
-                    FROM cache_entries WHERE namespace = ?
-                    """,
-                    (namespace,),
+                    _SELECT_COLUMNS + " WHERE namespace = ?", (namespace,)
                 )
             else:
-                cur = self._conn.execute(
-                    """
-                    SELECT cache_key, namespace, version, value, ttl,
-                           created_at, last_accessed, hit_count
-                    FROM cache_entries
-                    """
-                )
+                cur = self._conn.execute(_SELECT_COLUMNS)
             rows = cur.fetchall()
 
         for row in rows:
-            yield CacheEntry(
-                key=row[0],
-                namespace=row[1],
-                version=row[2] or "",
-                value=self._deserialize(row[3]),
-                ttl=row[4],
-                created_at=row[5],
-                last_accessed=row[6],
-                hit_count=row[7],
-            )
+            entry = self._row_to_entry(row)
+            if entry is not None:
+                yield entry
 
     def stats(self) -> Dict[str, Any]:
         if not self.enabled or not self._conn:
@@ -249,9 +369,17 @@ class PersistentCache:
                 "SELECT COUNT(*), SUM(LENGTH(value)) FROM cache_entries"
             )
             count, total_bytes = cur.fetchone()
+            codecs = {
+                tag or "pickle": {"entries": entries, "bytes": size or 0}
+                for tag, entries, size in self._conn.execute(
+                    "SELECT codec, COUNT(*), SUM(LENGTH(value)) "
+                    "FROM cache_entries GROUP BY codec"
+                )
+            }
             return {
                 "enabled": True,
                 "entries": count or 0,
                 "approx_bytes": total_bytes or 0,
                 "path": self.path,
+                "codecs": codecs,
             }
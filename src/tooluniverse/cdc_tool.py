@@ -1,4 +1,5 @@
 import requests
+from .http_transport import http_get
 from typing import Dict, Any, Optional
 from urllib.parse import urlencode
 from .base_tool import BaseTool
@@ -70,7 +71,7 @@ class CDCRESTTool(BaseTool):
             return {"error": str(e)}
         
         try:
-            resp = requests.get(url, timeout=30)
+            resp = http_get(url, timeout=30)
             resp.raise_for_status()
             data = resp.json()
             
@@ -1,6 +1,7 @@
 import os
 import re
 import requests
+from .http_transport import http_get
 from typing import Any, Dict, List, Tuple
 from difflib import SequenceMatcher
 
@@ -38,7 +39,7 @@ class CellosaurusSearchTool(BaseTool):
 
             url = f"{self.base_url}/search/cell-line"
             headers = {"Accept": "application/json"}
-            resp = requests.get(
+            resp = http_get(
                 url,
                 params=params,
                 headers=headers,
@@ -1262,7 +1263,7 @@ class CellosaurusGetCellLineInfoTool(BaseTool):
             url = f"{self.base_url}/cell-line/{accession}"
             headers = {"Accept": f"application/{format_type}"}
 
-            resp = requests.get(
+            resp = http_get(
                 url,
                 params=params,
                 headers=headers,
@@ -6,95 +6,69 @@ disease associations, and clinical significance data.
 """
 
 import requests
-import time
 from typing import Dict, Any, Optional
-from .base_tool import BaseTool
+from .logging_config import get_logger
+from .ncbi_eutils_tool import NCBIEUtilsTool
 from .tool_registry import register_tool
 
+_logger = get_logger(__name__)
 
-class ClinVarRESTTool(BaseTool):
-    """Base class for ClinVar REST API tools."""
 
-    def __init__(self, tool_config):
-        super().__init__(tool_config)
-        self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"Accept": "application/json", "User-Agent": "ToolUniverse/1.0"}
-        )
-        self.timeout = 30
+class ClinVarRESTTool(NCBIEUtilsTool):
+    """Base class for ClinVar REST API tools."""
 
     def _make_request(
-        self, endpoint: str, params: Optional[Dict] = None, max_retries: int = 3
+        self, endpoint: str, params: Optional[Dict] = None
     ) -> Dict[str, Any]:
-        """Make a request to the ClinVar API with automatic retry for rate limiting."""
+        """Make a request to the ClinVar API.
+
+        ClinVar is served by NCBI E-utilities, so requests share NCBI's
+        per-host budget; the shared session retries 429 responses after their
+        ``Retry-After`` delay before one reaches this method.
+        """
         url = f"{self.base_url}{endpoint}"
 
-        for attempt in range(max_retries + 1):
-            try:
-                response = self.session.get(url, params=params, timeout=self.timeout)
-
-                # Handle rate limiting (429 error)
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    if retry_after:
-                        wait_time = int(retry_after)
-                    else:
-                        # Default exponential backoff: 1, 2, 4 seconds
-                        wait_time = 2**attempt
-
-                    if attempt < max_retries:
-                        print(
-                            f"Rate limited (429). Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}..."
-                        )
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        return {
-                            "status": "error",
-                            "error": f"Rate limited after {max_retries} retries. Please wait before making more requests.",
-                            "url": url,
-                            "retry_after": retry_after,
-                        }
-
-                response.raise_for_status()
-
-                # ClinVar API returns XML by default, but we can request JSON
-                if params and params.get("retmode") == "json":
-                    data = response.json()
-                else:
-                    # Parse XML response
-                    data = response.text
+        try:
+            response = self.session.get(url, params=params, timeout=self.timeout)
 
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After")
+                _logger.warning(
+                    f"ClinVar request still rate limited (429) after retries: {url}"
+                )
                 return {
-                    "status": "success",
-                    "data": data,
+                    "status": "error",
+                    "error": "Rate limited by NCBI. Please wait before making more requests.",
                     "url": url,
-                    "content_type": response.headers.get(
-                        "content-type", "application/xml"
-                    ),
-                    "rate_limit_info": {
-                        "limit": response.headers.get("X-RateLimit-Limit"),
-                        "remaining": response.headers.get("X-RateLimit-Remaining"),
-                    },
+                    "retry_after": retry_after,
                 }
 
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries:
-                    wait_time = 2**attempt
-                    print(
-                        f"Request failed: {str(e)}. Retrying in {wait_time} seconds..."
-                    )
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    return {
-                        "status": "error",
-                        "error": f"ClinVar API request failed after {max_retries} retries: {str(e)}",
-                        "url": url,
-                    }
-
-        return {"status": "error", "error": "Maximum retries exceeded", "url": url}
+            response.raise_for_status()
+
+            # ClinVar API returns XML by default, but we can request JSON
+            if params and params.get("retmode") == "json":
+                data = response.json()
+            else:
+                # Parse XML response
+                data = response.text
+
+            return {
+                "status": "success",
+                "data": data,
+                "url": url,
+                "content_type": response.headers.get("content-type", "application/xml"),
+                "rate_limit_info": {
+                    "limit": response.headers.get("X-RateLimit-Limit"),
+                    "remaining": response.headers.get("X-RateLimit-Remaining"),
+                },
+            }
+
+        except requests.exceptions.RequestException as e:
+            return {
+                "status": "error",
+                "error": f"ClinVar API request failed: {str(e)}",
+                "url": url,
+            }
 
     def run(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the tool with given arguments."""
@@ -9,22 +9,42 @@ This script handles the intelligent summarization of tool outputs by:
 The script leverages ToolUniverse's AgenticTool infrastructure to provide
 intelligent, context-aware summarization that focuses on information
 relevant to the original query.
+
+Chunks are summarized concurrently (map) and the summaries are merged in a
+tree of bounded fan-in (reduce), so long outputs take roughly
+``log(chunks)`` rounds of LLM latency instead of one call per chunk. Chunk
+summaries are cached by content hash on the ToolUniverse instance, and each
+one is streamed as a ``chunk_summarized`` event as soon as it is ready.
 """
 
+import hashlib
+import json
 import logging
-from typing import Dict, Any, List
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+from tooluniverse.cache.memory_cache import SizedCache
 
 # Set up logger for this module
 logger = logging.getLogger("tooluniverse.output_summarizer")
 
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("TOOLUNIVERSE_SUMMARY_CONCURRENCY", "4"))
+DEFAULT_MERGE_FAN_IN = 8
+
+# Used when there is no ToolUniverse instance to keep the cache on
+_FALLBACK_SUMMARY_CACHE = SizedCache(max_size=512, max_bytes=16 * 1024 * 1024)
 
-def compose(arguments: Dict[str, Any], tooluniverse, call_tool) -> Dict[str, Any]:
+
+def compose(
+    arguments: Dict[str, Any], tooluniverse, call_tool, emit_event=None
+) -> Dict[str, Any]:
     """
     Main composition function for output summarization.
 
     This function orchestrates the complete summarization workflow:
     - Chunks the input text into manageable pieces
-    - Summarizes each chunk using AI
+    - Summarizes the chunks concurrently using AI
     - Merges the summaries into a final coherent result
 
     Args:
@@ -36,8 +56,14 @@ def compose(arguments: Dict[str, Any], tooluniverse, call_tool) -> Dict[str, Any
             - focus_areas (str, optional): Areas to focus on in summarization
             - max_summary_length (int, optional): Maximum length of final
               summary
+            - max_concurrency (int, optional): Summarizer calls in flight at
+              once (default: TOOLUNIVERSE_SUMMARY_CONCURRENCY or 4)
+            - merge_fan_in (int, optional): Summaries merged per call when
+              they are too long to concatenate (default 8)
         tooluniverse: ToolUniverse instance for tool execution
         call_tool: Function to call other tools within the composition
+        emit_event: Optional callback streaming partial summaries as
+            ``chunk_summarized`` and ``merge_level`` events
 
     Returns
         Dict[str, Any]: Dictionary containing:
@@ -57,6 +83,8 @@ def compose(arguments: Dict[str, Any], tooluniverse, call_tool) -> Dict[str, Any
         chunk_size = arguments.get("chunk_size", 32000)
         focus_areas = arguments.get("focus_areas", "key_findings_and_results")
         max_summary_length = arguments.get("max_summary_length", 3000)
+        max_concurrency = arguments.get("max_concurrency") or DEFAULT_MAX_CONCURRENCY
+        merge_fan_in = arguments.get("merge_fan_in") or DEFAULT_MERGE_FAN_IN
 
         # Validate required arguments
         if not tool_output:
@@ -88,18 +116,18 @@ def compose(arguments: Dict[str, Any], tooluniverse, call_tool) -> Dict[str, Any
         chunks = _chunk_output(tool_output, chunk_size)
         logger.info(f"📝 Split into {len(chunks)} chunks")
 
-        # Step 2: Summarize each chunk
-        chunk_summaries = []
-        for i, chunk in enumerate(chunks):
-            logger.info(f"🤖 Processing chunk {i + 1}/{len(chunks)}")
-            summary = _summarize_chunk(
-                chunk, query_context, tool_name, focus_areas, call_tool
-            )
-            if summary:
-                chunk_summaries.append(summary)
-                logger.info(f"✅ Chunk {i + 1} summarized successfully")
-            else:
-                logger.warning(f"❌ Chunk {i + 1} summarization failed")
+        # Step 2: Summarize the chunks concurrently
+        summaries = _summarize_chunks(
+            chunks,
+            query_context,
+            tool_name,
+            focus_areas,
+            call_tool,
+            max_concurrency=max_concurrency,
+            cache=_get_summary_cache(tooluniverse),
+            emit_event=emit_event,
+        )
+        chunk_summaries = [summary for summary in summaries if summary]
 
         # Step 3: Merge summaries (or gracefully fall back)
         if chunk_summaries:
@@ -109,6 +137,9 @@ def compose(arguments: Dict[str, Any], tooluniverse, call_tool) -> Dict[str, Any
                 tool_name,
                 max_summary_length,
                 call_tool,
+                max_concurrency=max_concurrency,
+                merge_fan_in=merge_fan_in,
+                emit_event=emit_event,
             )
             logger.info(
                 f"✅ Summarization completed. Final length: "
@@ -195,6 +226,124 @@ def _chunk_output(text: str, chunk_size: int) -> List[str]:
     return chunks
 
 
+def _get_summary_cache(tooluniverse) -> SizedCache:
+    """Return the chunk summary cache kept on the ToolUniverse instance.
+
+    This script is re-executed for every composition, so the cache cannot
+    live in a module global.
+    """
+    cache = getattr(tooluniverse, "_chunk_summary_cache", None)
+    if isinstance(cache, SizedCache):
+        return cache
+    cache = SizedCache(max_size=512, max_bytes=16 * 1024 * 1024)
+    try:
+        tooluniverse._chunk_summary_cache = cache
+    except AttributeError:
+        return _FALLBACK_SUMMARY_CACHE
+    return cache
+
+
+def _summary_cache_key(
+    chunk: str, query_context: str, tool_name: str, focus_areas: str
+) -> str:
+    payload = json.dumps([chunk, query_context, tool_name, focus_areas])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _run_concurrently(
+    func: Callable[[Any], Any],
+    items: List[Any],
+    max_concurrency: int,
+    on_done: Optional[Callable[[int, Any], None]] = None,
+) -> List[Any]:
+    """Apply ``func`` to every item with bounded concurrency, keeping order.
+
+    ``on_done(index, result)`` is called as each item completes.
+    """
+    results: List[Any] = [None] * len(items)
+    if max_concurrency <= 1 or len(items) <= 1:
+        for i, item in enumerate(items):
+            results[i] = func(item)
+            if on_done:
+                on_done(i, results[i])
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as pool:
+        futures = {pool.submit(func, item): i for i, item in enumerate(items)}
+        for future in as_completed(futures):
+            i = futures[future]
+            results[i] = future.result()
+            if on_done:
+                on_done(i, results[i])
+    return results
+
+
+def _summarize_chunks(
+    chunks: List[str],
+    query_context: str,
+    tool_name: str,
+    focus_areas: str,
+    call_tool,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    cache: Optional[SizedCache] = None,
+    emit_event=None,
+) -> List[str]:
+    """
+    Summarize chunks concurrently, reusing cached chunk summaries.
+
+    Returns one summary per chunk, in chunk order, with an empty string for
+    chunks whose summarization failed.
+    """
+    summaries: List[str] = [""] * len(chunks)
+    keys = [
+        _summary_cache_key(chunk, query_context, tool_name, focus_areas)
+        for chunk in chunks
+    ]
+
+    def report(i: int, summary: str, cached: bool):
+        if summary:
+            logger.info(f"✅ Chunk {i + 1} summarized successfully")
+        else:
+            logger.warning(f"❌ Chunk {i + 1} summarization failed")
+        if emit_event and summary:
+            emit_event(
+                "chunk_summarized",
+                {
+                    "index": i,
+                    "total": len(chunks),
+                    "cached": cached,
+                    "summary": summary,
+                },
+            )
+
+    pending = []
+    for i, key in enumerate(keys):
+        cached = cache.get(key) if cache is not None else None
+        if cached:
+            summaries[i] = cached
+            report(i, cached, cached=True)
+        else:
+            pending.append(i)
+    if len(pending) < len(chunks):
+        logger.info(f"♻️ Reused {len(chunks) - len(pending)} cached chunk summaries")
+
+    def summarize(i: int) -> str:
+        logger.info(f"🤖 Processing chunk {i + 1}/{len(chunks)}")
+        return _summarize_chunk(
+            chunks[i], query_context, tool_name, focus_areas, call_tool
+        )
+
+    def on_done(position: int, summary: str):
+        i = pending[position]
+        summaries[i] = summary
+        if summary and cache is not None:
+            cache.set(keys[i], summary)
+        report(i, summary, cached=False)
+
+    _run_concurrently(summarize, pending, max_concurrency, on_done)
+    return summaries
+
+
 def _summarize_chunk(
     chunk: str, query_context: str, tool_name: str, focus_areas: str, call_tool
 ) -> str:
@@ -281,12 +430,17 @@ def _merge_summaries(
     tool_name: str,
     max_length: int,
     call_tool,
+    max_concurrency: int = 1,
+    merge_fan_in: Optional[int] = None,
+    emit_event=None,
 ) -> str:
     """
     Merge chunk summaries into a final coherent summary.
 
     If the combined summaries exceed the maximum length, they are further
-    summarized to create a concise final result.
+    summarized to create a concise final result. With ``merge_fan_in``, more
+    summaries than that are first merged in groups (concurrently), level by
+    level, so no single merge call receives all summaries at once.
 
     Args:
         chunk_summaries (List[str]): List of summarized chunks
@@ -294,6 +448,9 @@ def _merge_summaries(
         tool_name (str): Name of the tool that generated the output
         max_length (int): Maximum length of final summary
         call_tool: Function to call the summarizer tool
+        max_concurrency (int): Group merges in flight at once
+        merge_fan_in (int, optional): Summaries merged per call
+        emit_event: Optional callback for ``merge_level`` events
 
     Returns
         str: Final merged summary
@@ -305,14 +462,57 @@ def _merge_summaries(
     if len(chunk_summaries) == 1:
         return chunk_summaries[0]
 
+    summaries = list(chunk_summaries)
+
     # Combine all chunk summaries
-    combined_summaries = "\n\n".join(chunk_summaries)
+    combined_summaries = "\n\n".join(summaries)
+
+    def merge_group(group: List[str]) -> str:
+        if len(group) == 1:
+            return group[0]
+        return _consolidate(
+            "\n\n".join(group), query_context, tool_name, max_length, call_tool
+        )
+
+    # Merge groups of summaries until a single merge call can take them all
+    fan_in = max(2, int(merge_fan_in)) if merge_fan_in else None
+    level = 0
+    while fan_in and len(summaries) > fan_in and len(combined_summaries) > max_length:
+        level += 1
+        groups = [summaries[i : i + fan_in] for i in range(0, len(summaries), fan_in)]
+        logger.info(
+            f"🌲 Merge level {level}: {len(summaries)} summaries in "
+            f"{len(groups)} groups"
+        )
+        summaries = _run_concurrently(merge_group, groups, max_concurrency)
+        combined_summaries = "\n\n".join(summaries)
+        if emit_event:
+            emit_event(
+                "merge_level",
+                {"level": level, "summaries": len(summaries)},
+            )
+
+    if len(summaries) == 1:
+        return summaries[0]
 
     # If combined length is within limit, return as is
     if len(combined_summaries) <= max_length:
         return combined_summaries
 
     # Otherwise, summarize the combined summaries
+    return _consolidate(
+        combined_summaries, query_context, tool_name, max_length, call_tool
+    )
+
+
+def _consolidate(
+    combined_summaries: str,
+    query_context: str,
+    tool_name: str,
+    max_length: int,
+    call_tool,
+) -> str:
+    """Summarize joined summaries, falling back to the joined text."""
     try:
         result = call_tool(
             "ToolOutputSummarizer",
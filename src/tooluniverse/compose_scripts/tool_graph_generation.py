@@ -1,22 +1,37 @@
 """Tool Graph Generation Compose Script
 
-Efficiently evaluates directional data-flow relationships between all unique pairs
-of provided tool configs using one agentic tool:
+Efficiently evaluates directional data-flow relationships between pairs of
+provided tool configs using one agentic tool:
   - ToolRelationshipDetector
 
 Outputs a graph structure with edges representing valid directional relationships.
 Each edge stores: source, target, rationale.
 
 Performance considerations:
-  - Iterates i<j once (O(N^2/2) pairs)
-  - Lightweight JSON serialization of minimal fields
-  - Optional batching hook (currently sequential because call_tool likely remote)
+  - Candidate pairs are pre-filtered before any LLM call: a pair is kept if
+    the tools' descriptions are similar (embedding cosine similarity, top-k
+    neighbours per tool) or if one tool's outputs mention the other's input
+    parameters. With hundreds of tools this removes most of the N^2/2 pairs.
+  - Each detector call compares one tool against a batch of candidates, and
+    batches run concurrently.
+  - Every tool's minimal config is fingerprinted in the output graph. When
+    the output file exists, only pairs involving new or changed tools are
+    evaluated and the other edges are reused.
 
 Arguments:
   tool_configs (list[dict]) REQUIRED
   max_tools (int) optional limit for debugging
   output_path (str) path to write resulting graph JSON (default './tool_relationship_graph.json')
   save_intermediate_every (int) checkpoint frequency (default 5000 pairs processed)
+  prefilter (bool) prune candidate pairs before calling the detector (default True)
+  similarity_threshold (float) keep pairs at least this similar (default 0.35)
+  top_k_neighbors (int) always keep each tool's k most similar tools (default 15)
+  embedding_model (str) optional sentence-transformers model for description
+    embeddings (default: TF-IDF vectors, no extra dependencies)
+  batch_size (int) candidate tools per detector call (default 100)
+  max_concurrency (int) detector calls in flight at once (default 4)
+  start_after_tool (str) optional tool name; tools up to and including it are
+    skipped as the primary tool (debugging aid)
 
 Return:
   dict with keys: nodes, edges, stats
@@ -24,14 +39,87 @@ Return:
 
 from __future__ import annotations
 
+import hashlib
 import json
+import math
 import os
+import re
 import time
-from typing import Any, Dict, List
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
 
 
 DETECTOR_NAME = "ToolRelationshipDetector"
 
+# Parameter names too generic to signal that one tool feeds another
+_GENERIC_PARAMETERS = {
+    "query",
+    "limit",
+    "offset",
+    "page",
+    "page_size",
+    "size",
+    "format",
+    "fields",
+    "sort",
+    "order",
+    "max_results",
+    "api_key",
+    "email",
+    "text",
+    "input",
+    "output",
+    "name",
+    "type",
+    "id",
+    "ids",
+    "version",
+    "verbose",
+    "timeout",
+    "skip",
+    "top_k",
+    "return_format",
+}
+
+_STOP_WORDS = {
+    "a",
+    "an",
+    "and",
+    "are",
+    "as",
+    "at",
+    "be",
+    "by",
+    "for",
+    "from",
+    "in",
+    "is",
+    "it",
+    "of",
+    "on",
+    "or",
+    "that",
+    "the",
+    "this",
+    "to",
+    "with",
+    "using",
+    "use",
+    "given",
+    "based",
+    "tool",
+    "returns",
+    "return",
+    "get",
+    "retrieve",
+    "provides",
+    "information",
+    "data",
+}
+
 
 def compose(arguments, tooluniverse, call_tool):  # noqa: D401
     tool_configs: List[dict] = arguments.get("tool_configs") or []
@@ -44,10 +132,16 @@ def compose(arguments, tooluniverse, call_tool):  # noqa: D401
 
     output_path = arguments.get("output_path", "./tool_relationship_graph.json")
     checkpoint_every = int(arguments.get("save_intermediate_every", 5000))
+    prefilter = arguments.get("prefilter") is not False
+    similarity_threshold = _number(arguments.get("similarity_threshold"), 0.35)
+    top_k_neighbors = int(_number(arguments.get("top_k_neighbors"), 15))
+    batch_size = max(1, int(arguments.get("batch_size") or 100))
+    max_concurrency = max(1, int(arguments.get("max_concurrency") or 4))
 
     # Prepare nodes list (unique tool names)
     nodes = []
     minimal_tool_map: Dict[str, dict] = {}
+    return_schemas: Dict[str, Any] = {}
     for cfg in tool_configs:
         name = cfg.get("name")
         if not name:
@@ -61,17 +155,25 @@ def compose(arguments, tooluniverse, call_tool):  # noqa: D401
             "type": cfg.get("type", cfg.get("toolType", "unknown")),
         }
         minimal_tool_map[name] = minimal_tool
+        return_schemas[name] = cfg.get("return_schema")
         nodes.append({"id": name, "name": name, "type": minimal_tool["type"]})
 
     names = list(minimal_tool_map.keys())
     n = len(names)
     total_pairs = n * (n - 1) // 2
+    fingerprints = {
+        name: _fingerprint(minimal_tool_map[name], return_schemas[name])
+        for name in names
+    }
 
     edges: List[dict] = []
     processed_pairs = 0
     llm_calls = 0
     start_time = time.time()
-    batch_size = 100
+    # Unchanged tools from a previous run; their pairs with each other are
+    # already in `edges` when either tool was completed in that run
+    reused_tools: Set[str] = set()
+    completed_tools: Set[str] = set()
 
     # --- Resume from checkpoint ---
     checkpoint_path = output_path + ".checkpoint.json"
@@ -89,113 +191,149 @@ def compose(arguments, tooluniverse, call_tool):  # noqa: D401
             with open(load_path, "r", encoding="utf-8") as f:
                 existing_graph = json.load(f)
 
-            # Re-hydrate edges and find processed source tools
-            if "edges" in existing_graph and isinstance(existing_graph["edges"], list):
-                edges = existing_graph["edges"]
-
-            # Align the 'names' list order with the loaded graph to ensure correct loop continuation
-            if "nodes" in existing_graph and isinstance(existing_graph["nodes"], list):
-                loaded_node_order = [
-                    node.get("name") for node in existing_graph.get("nodes", [])
-                ]
-                if names == loaded_node_order:
-                    print("Current tool order matches the loaded graph.")
-                else:
-                    print(
-                        "Reordering tools to match the loaded graph for correct resume."
+            previous_fingerprints = existing_graph.get("tool_fingerprints")
+            if isinstance(previous_fingerprints, dict):
+                # Incremental regeneration: keep edges among unchanged tools
+                reused_tools = {
+                    name
+                    for name in names
+                    if previous_fingerprints.get(name) == fingerprints[name]
+                }
+                # Checkpoints list the tools whose pairs were all evaluated;
+                # in a finished graph that is every tool
+                completed_tools = reused_tools.intersection(
+                    existing_graph.get("completed_tools", previous_fingerprints)
+                )
+                edges = [
+                    edge
+                    for edge in existing_graph.get("edges", [])
+                    if _is_reused_pair(
+                        edge.get("source"),
+                        edge.get("target"),
+                        reused_tools,
+                        completed_tools,
                     )
-                    # Create a map for quick lookup of current tool positions
-                    current_name_pos = {name: i for i, name in enumerate(names)}
-                    # Build the new 'names' list and 'minimal_tool_map' based on the loaded order
-                    new_names = [
-                        name for name in loaded_node_order if name in current_name_pos
-                    ]
-                    # Find any new tools not in the original graph and append them
-                    new_tools_from_config = [
-                        name for name in names if name not in loaded_node_order
-                    ]
-                    if new_tools_from_config:
-                        print(
-                            f"Appending {len(new_tools_from_config)} new tools to the list."
-                        )
-                        new_names.extend(new_tools_from_config)
-
-                    names = new_names
-                    assert n == len(names)  # n should remain the same
-                    print("Tool order successfully realigned.")
+                ]
+                print(
+                    f"Reusing {len(edges)} edges among {len(reused_tools)} unchanged "
+                    f"tools; {n - len(reused_tools)} tools are new or changed."
+                )
+            else:
+                # Re-hydrate edges and find processed source tools
+                if "edges" in existing_graph and isinstance(
+                    existing_graph["edges"], list
+                ):
+                    edges = existing_graph["edges"]
+
+                # Align the 'names' list order with the loaded graph to ensure correct loop continuation
+                if "nodes" in existing_graph and isinstance(
+                    existing_graph["nodes"], list
+                ):
+                    names = _align_with_loaded_order(names, existing_graph["nodes"])
 
         except Exception as e:
             print(
                 f"Warning: Could not load or parse existing graph at {load_path}. Starting fresh. Error: {e}"
             )
             edges = []  # Reset edges if loading failed
-
-    # Core loop over unique unordered pairs (i<j). We'll batch the 'j' tools.
+            reused_tools = set()
+            completed_tools = set()
+
+    # --- Candidate pairs ---
+    if prefilter and n > 1:
+        candidates = _candidate_pairs(
+            names,
+            minimal_tool_map,
+            return_schemas,
+            similarity_threshold=similarity_threshold,
+            top_k=top_k_neighbors,
+            embedding_model=arguments.get("embedding_model"),
+        )
+    else:
+        candidates = None
+
+    start_after = arguments.get("start_after_tool")
+    start_index = names.index(start_after) if start_after in names else -1
+
+    # One job per (tool A, batch of later tools it may relate to)
+    jobs: List[Tuple[str, List[str]]] = []
+    candidate_pairs = 0
     for i in range(n):
-        tool_a = minimal_tool_map[names[i]]
-        a_json = json.dumps(tool_a, ensure_ascii=False)
-        # This logic is to skip all tools until a specific one is found,
-        # skip that one, and then process all subsequent tools.
-        # This is useful for debugging or resuming from a specific point.
-        start_processing_flag_name = "get_em_3d_fitting_and_reconstruction_details"
-
-        # Find the index of the tool to start after
-        try:
-            start_index = names.index(start_processing_flag_name)
-        except ValueError:
-            start_index = -1  # Flag tool not found, process all
-
-        if start_index != -1 and i <= start_index:
+        if i <= start_index:
             print(
-                f"Skipping tool {tool_a['name']} with index {i} (target index is {start_index})."
+                f"Skipping tool {names[i]} with index {i} (target index is {start_index})."
             )
             continue
-
-        # Batch the remaining tools to compare against tool_a
-        for j_batch_start in range(i + 1, n, batch_size):
-            j_batch_end = min(j_batch_start + batch_size, n)
-            other_tools_batch_names = names[j_batch_start:j_batch_end]
-
-            if not other_tools_batch_names:
-                continue
-
-            other_tools_list = [
-                minimal_tool_map[name] for name in other_tools_batch_names
-            ]
-            other_tools_json = json.dumps(other_tools_list, ensure_ascii=False)
-
-            # Call detector with the batch
-            detector_args = {"tool_a": a_json, "other_tools": other_tools_json}
-            detector_res = {}
-            for _ in range(5):  # Retry up to 5 times
-                detector_raw = call_tool(DETECTOR_NAME, detector_args)
-                llm_calls += 1
-                detector_res = _parse_json(detector_raw)
-                if detector_res and "relationships" in detector_res:
-                    break
-
-            processed_pairs += len(other_tools_list)
+        others = [
+            names[j]
+            for j in range(i + 1, n)
+            if (candidates is None or (names[i], names[j]) in candidates)
+            and not _is_reused_pair(names[i], names[j], reused_tools, completed_tools)
+        ]
+        candidate_pairs += len(others)
+        for j_batch_start in range(0, len(others), batch_size):
+            jobs.append((names[i], others[j_batch_start : j_batch_start + batch_size]))
+
+    print(
+        f"Evaluating {candidate_pairs} of {total_pairs} tool pairs in {len(jobs)} "
+        f"detector batches (max_concurrency={max_concurrency})"
+    )
+
+    def run_job(job: Tuple[str, List[str]]) -> Tuple[dict, int]:
+        tool_a_name, other_tools_batch_names = job
+        tool_a = minimal_tool_map[tool_a_name]
+        other_tools_list = [minimal_tool_map[name] for name in other_tools_batch_names]
+
+        # Call detector with the batch
+        detector_args = {
+            "tool_a": json.dumps(tool_a, ensure_ascii=False),
+            "other_tools": json.dumps(other_tools_list, ensure_ascii=False),
+        }
+        detector_res = {}
+        calls = 0
+        for _ in range(5):  # Retry up to 5 times
+            detector_raw = call_tool(DETECTOR_NAME, detector_args)
+            calls += 1
+            detector_res = _parse_json(detector_raw)
+            if detector_res and "relationships" in detector_res:
+                break
+        return detector_res, calls
+
+    positions = {name: i for i, name in enumerate(names)}
+    last_jobs = {tool_a_name: j for j, (tool_a_name, _) in enumerate(jobs)}
+    changed_tools = set(names) - reused_tools
+
+    # Results are consumed in submission order so the output is deterministic
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        results = executor.map(run_job, jobs)
+        for job_index, (job, (detector_res, calls)) in enumerate(zip(jobs, results)):
+            tool_a_name, other_tools_batch_names = job
+            llm_calls += calls
+            processed_pairs += len(other_tools_batch_names)
+            batch_names = set(other_tools_batch_names)
 
             relationships = detector_res.get("relationships", [])
             if not isinstance(relationships, list):
                 relationships = []
 
             print(
-                f"Tool A: {tool_a['name']} vs {len(other_tools_list)} others => Found {len(relationships)} relationships"
+                f"Tool A: {tool_a_name} vs {len(other_tools_batch_names)} others => Found {len(relationships)} relationships"
             )
 
             for rel in relationships:
+                if not isinstance(rel, dict):
+                    continue
                 tool_b_name = rel.get("tool_b_name")
                 direction = rel.get("direction")
                 rationale = rel.get("rationale")
 
-                if not tool_b_name or tool_b_name not in minimal_tool_map:
+                if not tool_b_name or tool_b_name not in batch_names:
                     continue
 
                 if direction in ("A->B", "both"):
                     edges.append(
                         {
-                            "source": tool_a["name"],
+                            "source": tool_a_name,
                             "target": tool_b_name,
                             "rationale": rationale,
                         }
@@ -204,32 +342,52 @@ def compose(arguments, tooluniverse, call_tool):  # noqa: D401
                     edges.append(
                         {
                             "source": tool_b_name,
-                            "target": tool_a["name"],
+                            "target": tool_a_name,
                             "rationale": rationale,
                         }
                     )
 
             # Progress reporting and checkpointing
             if processed_pairs % 1000 < len(
-                other_tools_list
+                other_tools_batch_names
             ):  # Heuristic to report near the thousand marks
                 elapsed = time.time() - start_time
                 rate = processed_pairs / elapsed if elapsed > 0 else 0
                 print(
-                    f"[progress] pairs={processed_pairs}/{total_pairs} edges={len(edges)} llm_calls={llm_calls} rate={rate:.2f} pairs/s"
+                    f"[progress] pairs={processed_pairs}/{candidate_pairs} edges={len(edges)} llm_calls={llm_calls} rate={rate:.2f} pairs/s"
                 )
             if (
                 processed_pairs // checkpoint_every
-                > (processed_pairs - len(other_tools_list)) // checkpoint_every
+                > (processed_pairs - len(other_tools_batch_names)) // checkpoint_every
             ):
-                _maybe_checkpoint(output_path, nodes, edges)
+                # Jobs finish in order: every pair of the tools before tool A
+                # (and of tool A after its last batch) has been evaluated.
+                # Tools completed earlier stay so once their pairs with the
+                # new or changed tools are done.
+                finished = positions[tool_a_name] + (
+                    last_jobs[tool_a_name] == job_index
+                )
+                done = set(names[:finished])
+                if changed_tools <= done:
+                    done |= completed_tools
+                _maybe_checkpoint(
+                    output_path,
+                    nodes,
+                    edges,
+                    fingerprints,
+                    [name for name in names if name in done],
+                )
 
     graph = {
         "nodes": nodes,
         "edges": edges,
+        "tool_fingerprints": fingerprints,
         "stats": {
             "tools": n,
+            "total_pairs": total_pairs,
+            "candidate_pairs": candidate_pairs,
             "pairs_evaluated": processed_pairs,
+            "tools_reused": len(reused_tools),
             "edges": len(edges),
             "llm_calls": llm_calls,
             "runtime_sec": round(time.time() - start_time, 2),
@@ -250,11 +408,211 @@ def compose(arguments, tooluniverse, call_tool):  # noqa: D401
     return {"status": "success", "output_file": output_path, "graph": graph}
 
 
-def _maybe_checkpoint(base_path: str, nodes: List[dict], edges: List[dict]):
+def _align_with_loaded_order(names: List[str], loaded_nodes: List[dict]) -> List[str]:
+    """Reorder ``names`` to follow a previously saved graph's node order."""
+    loaded_node_order = [node.get("name") for node in loaded_nodes]
+    if names == loaded_node_order:
+        print("Current tool order matches the loaded graph.")
+        return names
+
+    print("Reordering tools to match the loaded graph for correct resume.")
+    # Create a map for quick lookup of current tool positions
+    current_name_pos = {name: i for i, name in enumerate(names)}
+    # Build the new 'names' list based on the loaded order
+    new_names = [name for name in loaded_node_order if name in current_name_pos]
+    # Find any new tools not in the original graph and append them
+    new_tools_from_config = [name for name in names if name not in loaded_node_order]
+    if new_tools_from_config:
+        print(f"Appending {len(new_tools_from_config)} new tools to the list.")
+        new_names.extend(new_tools_from_config)
+
+    assert len(names) == len(new_names)  # n should remain the same
+    print("Tool order successfully realigned.")
+    return new_names
+
+
+def _is_reused_pair(
+    tool_a: Any, tool_b: Any, reused_tools: Set[str], completed_tools: Set[str]
+) -> bool:
+    """Whether the pair's edges can be taken from the previous run."""
+    return (
+        tool_a in reused_tools
+        and tool_b in reused_tools
+        and (tool_a in completed_tools or tool_b in completed_tools)
+    )
+
+
+def _number(value: Any, default: float) -> float:
+    return default if value is None else float(value)
+
+
+def _fingerprint(minimal_tool: dict, return_schema: Any) -> str:
+    payload = json.dumps(
+        [minimal_tool, return_schema], sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+# --- Candidate pre-filter ---
+
+
+def _candidate_pairs(
+    names: List[str],
+    tool_map: Dict[str, dict],
+    return_schemas: Dict[str, Any],
+    similarity_threshold: float = 0.35,
+    top_k: int = 15,
+    embedding_model: Optional[str] = None,
+) -> Set[Tuple[str, str]]:
+    """Return the tool pairs worth asking the detector about.
+
+    Pairs are keyed both ways, ``(a, b)`` and ``(b, a)``. A pair is kept if
+    the description similarity is at least ``similarity_threshold``, if
+    either tool is among the other's ``top_k`` most similar tools, or if
+    the schemas are compatible in either direction.
+    """
+    texts = [_tool_text(tool_map[name]) for name in names]
+    vectors = _embed(texts, embedding_model)
+    similarity = vectors @ vectors.T
+    np.fill_diagonal(similarity, -1.0)
+
+    n = len(names)
+    keep = similarity >= similarity_threshold
+    if top_k > 0 and n > 1:
+        k = min(top_k, n - 1)
+        neighbors = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+        rows = np.repeat(np.arange(n), k)
+        keep[rows, neighbors.ravel()] = True
+    keep |= keep.T
+
+    pairs: Set[Tuple[str, str]] = set()
+    for i, j in zip(*np.nonzero(keep)):
+        if i != j:
+            pairs.add((names[i], names[j]))
+
+    # Outputs of one tool naming an input parameter of another
+    inputs = {name: _input_terms(tool_map[name]) for name in names}
+    outputs = {
+        name: _output_text(tool_map[name], return_schemas.get(name)) for name in names
+    }
+    for producer in names:
+        produced = outputs[producer]
+        for consumer in names:
+            if consumer == producer or (producer, consumer) in pairs:
+                continue
+            if any(f" {term} " in produced for term in inputs[consumer]):
+                pairs.add((producer, consumer))
+                pairs.add((consumer, producer))
+    return pairs
+
+
+def _tool_text(tool: dict) -> str:
+    parameters = (tool.get("parameter") or {}).get("properties") or {}
+    parameter_text = " ".join(
+        f"{name} {spec.get('description', '') if isinstance(spec, dict) else ''}"
+        for name, spec in parameters.items()
+    )
+    return f"{tool['name']} {tool.get('description', '')} {parameter_text}"
+
+
+def _tokens(text: str) -> List[str]:
+    words = re.findall(r"[a-z0-9]+", _split_identifier(text).lower())
+    return [word for word in words if len(word) > 1 and word not in _STOP_WORDS]
+
+
+def _split_identifier(text: str) -> str:
+    """Split snake_case and CamelCase identifiers into words."""
+    text = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", str(text))
+    return text.replace("_", " ").replace("-", " ")
+
+
+def _embed(texts: List[str], embedding_model: Optional[str] = None) -> np.ndarray:
+    """L2-normalized description vectors (one row per text)."""
+    if embedding_model:
+        try:
+            from sentence_transformers import SentenceTransformer
+
+            model = SentenceTransformer(embedding_model)
+            return np.asarray(
+                model.encode(texts, normalize_embeddings=True), dtype=np.float32
+            )
+        except Exception as e:
+            print(f"Embedding model unavailable ({e}); using TF-IDF vectors")
+
+    # TF-IDF over description tokens
+    documents = [Counter(_tokens(text)) for text in texts]
+    vocabulary: Dict[str, int] = {}
+    document_frequency: Counter = Counter()
+    for counts in documents:
+        document_frequency.update(counts.keys())
+        for term in counts:
+            vocabulary.setdefault(term, len(vocabulary))
+
+    vectors = np.zeros((len(texts), max(1, len(vocabulary))), dtype=np.float32)
+    for row, counts in enumerate(documents):
+        for term, count in counts.items():
+            idf = math.log((1 + len(texts)) / (1 + document_frequency[term])) + 1
+            vectors[row, vocabulary[term]] = (1 + math.log(count)) * idf
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _input_terms(tool: dict) -> List[str]:
+    """Distinctive input parameter names, as space-separated words.
+
+    Words are split like :func:`_output_text` so a term matches only whole
+    words of the padded output text.
+    """
+    parameters = (tool.get("parameter") or {}).get("properties") or {}
+    terms = []
+    for name in parameters:
+        if name.lower() in _GENERIC_PARAMETERS or len(name) <= 2:
+            continue
+        words = re.findall(r"[a-z0-9]+", _split_identifier(name).lower())
+        if words:
+            terms.append(" ".join(words))
+    return terms
+
+
+def _output_text(tool: dict, return_schema: Any) -> str:
+    """Words describing what a tool returns, padded for whole-word matching."""
+    parts = [tool.get("description", "")]
+    parts.extend(_schema_keys(return_schema))
+    words = _split_identifier(" ".join(parts)).lower()
+    return " " + " ".join(re.findall(r"[a-z0-9]+", words)) + " "
+
+
+def _schema_keys(schema: Any) -> Iterable[str]:
+    """Property names found anywhere in a JSON schema."""
+    stack = [schema]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            properties = current.get("properties")
+            if isinstance(properties, dict):
+                yield from properties.keys()
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
+def _maybe_checkpoint(
+    base_path: str,
+    nodes: List[dict],
+    edges: List[dict],
+    tool_fingerprints: Optional[Dict[str, str]] = None,
+    completed_tools: Optional[List[str]] = None,
+):
+    """Save progress; ``completed_tools`` have had all their pairs evaluated."""
     ck_path = base_path + ".checkpoint_new.json"
+    checkpoint = {"nodes": nodes, "edges": edges}
+    if tool_fingerprints is not None:
+        checkpoint["tool_fingerprints"] = tool_fingerprints
+        checkpoint["completed_tools"] = completed_tools or []
     try:
         with open(ck_path, "w", encoding="utf-8") as f:
-            json.dump({"nodes": nodes, "edges": edges}, f)
+            json.dump(checkpoint, f)
         print(f"[checkpoint] saved {ck_path} nodes={len(nodes)} edges={len(edges)}")
     except Exception as e:
         print(f"[checkpoint] failed: {e}")
@@ -20,7 +20,7 @@ class CoreTool(BaseTool):
     def __init__(self, tool_config=None):
         super().__init__(tool_config)
         self.base_url = "https://api.core.ac.uk/v3"
-        self.session = requests.Session()
+        self.session = self.get_http_session()
         self.session.headers.update(
             {"User-Agent": "ToolUniverse/1.0", "Accept": "application/json"}
         )
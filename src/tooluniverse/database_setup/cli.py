@@ -110,6 +110,16 @@ def main():
     b.add_argument(
         "--overwrite", action="store_true", help="Rebuild FAISS index if exists"
     )
+    b.add_argument(
+        "--index-type",
+        help="FAISS index: flat (exact, default), ivf_flat, ivf_pq, hnsw, or a factory string",
+    )
+    b.add_argument(
+        "--index-metadata",
+        nargs="+",
+        metavar="KEY",
+        help="Metadata keys to index for filtered search (others are scanned)",
+    )
 
     # --------------------------------------------------------------------------
     # quickbuild
@@ -126,6 +136,10 @@ def main():
     qb.add_argument(
         "--overwrite", action="store_true", help="Rebuild FAISS index if exists"
     )
+    qb.add_argument(
+        "--index-type",
+        help="FAISS index: flat (exact, default), ivf_flat, ivf_pq, hnsw, or a factory string",
+    )
 
     # --------------------------------------------------------------------------
     # search
@@ -142,8 +156,22 @@ def main():
     )
     s.add_argument("--top-k", default=10, type=int, help="Number of results")
     s.add_argument("--alpha", default=0.5, type=float, help="Hybrid mix weight")
+    s.add_argument(
+        "--fusion",
+        default="weighted",
+        choices=["weighted", "rrf", "minmax", "zscore"],
+        help="How hybrid merges keyword and embedding results",
+    )
     s.add_argument("--provider", help="Embedding provider (optional)")
     s.add_argument("--model", help="Embedding model (optional)")
+    s.add_argument(
+        "--nprobe", type=int, help="IVF lists to scan (higher = better recall, slower)"
+    )
+    s.add_argument(
+        "--ef-search",
+        type=int,
+        help="HNSW candidate list size (higher = better recall, slower)",
+    )
 
     # --------------------------------------------------------------------------
     # sync-hf
@@ -232,6 +260,8 @@ def main():
             embed_provider=provider,
             embed_model=model,
             overwrite=args.overwrite,
+            index_type=args.index_type,
+            metadata_index_fields=args.index_metadata,
         )
         print(f"[INFO] Collection '{args.collection}' written to {db_path}")
 
@@ -250,6 +280,7 @@ def main():
             embed_provider=provider,
             embed_model=model,
             overwrite=args.overwrite,
+            index_type=args.index_type,
         )
         print(
             f"[INFO] Built collection '{args.name}' with {len(docs)} docs at {db_path}"
@@ -271,6 +302,9 @@ def main():
             alpha=args.alpha,
             embed_provider=provider,
             embed_model=model,
+            nprobe=args.nprobe,
+            ef_search=args.ef_search,
+            fusion=args.fusion,
         )
         print(json.dumps(res, indent=2))
 
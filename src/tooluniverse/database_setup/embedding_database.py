@@ -9,7 +9,7 @@ from ..tool_registry import register_tool
 from ..logging_config import get_logger
 
 from tooluniverse.database_setup.sqlite_store import SQLiteStore
-from tooluniverse.database_setup.vector_store import VectorStore
+from tooluniverse.database_setup.vector_store import VectorStore, resolve_index_spec
 from tooluniverse.database_setup.embedder import Embedder
 from tooluniverse.utils import get_user_cache_dir
 
@@ -71,38 +71,6 @@ def _l2_normalize(mat: np.ndarray) -> np.ndarray:
     return mat / (norms + 1e-12)
 
 
-def _matches_filters(metadata: Dict, filters: Dict) -> bool:
-    if not filters:
-        return True
-    for key, filter_value in filters.items():
-        if key not in metadata:
-            return False
-        meta_value = metadata[key]
-        if isinstance(filter_value, dict):
-            if "$gte" in filter_value and meta_value < filter_value["$gte"]:
-                return False
-            if "$gt" in filter_value and meta_value <= filter_value["$gt"]:
-                return False
-            if "$lte" in filter_value and meta_value > filter_value["$lte"]:
-                return False
-            if "$lt" in filter_value and meta_value >= filter_value["$lt"]:
-                return False
-            if "$in" in filter_value and meta_value not in filter_value["$in"]:
-                return False
-            if "$contains" in filter_value:
-                needle = filter_value["$contains"]
-                if isinstance(meta_value, list):
-                    if needle not in meta_value:
-                        return False
-                else:
-                    if needle not in str(meta_value):
-                        return False
-        else:
-            if meta_value != filter_value:
-                return False
-    return True
-
-
 # ---------------------------
 # Tool
 # ---------------------------
@@ -128,7 +96,14 @@ class EmbeddingDatabase(BaseTool):
                 "data_dir", os.path.join(get_user_cache_dir(), "embeddings")
             )
         )
+        # "IndexFlatIP" (exact), "ivf_flat", "ivf_pq", "hnsw" or a FAISS factory string
         self.faiss_index_type = storage_config.get("faiss_index_type", "IndexFlatIP")
+        # Query-time recall/latency knobs for IVF (nprobe) and HNSW (ef_search) indexes
+        self.nprobe = storage_config.get("nprobe")
+        self.ef_search = storage_config.get("ef_search")
+        # Metadata keys indexed when documents are written; search filters on
+        # other keys scan the collection
+        self.metadata_index_fields = storage_config.get("metadata_index_fields", [])
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
     # ---------- infra helpers (per collection) ----------
@@ -233,16 +208,22 @@ class EmbeddingDatabase(BaseTool):
             index_type=self.faiss_index_type,
         )
         sqlite_store.insert_docs(name, rows)
+        sqlite_store.index_metadata_fields(self.metadata_index_fields)
 
         # Map keys -> ids
         inserted = sqlite_store.fetch_docs(name, doc_keys=doc_keys, limit=len(rows))
-        doc_ids = [r["id"] for r in inserted]
+        # fetch_docs does not keep input order; align ids with the embedded texts
+        key_to_id = {r["doc_key"]: r["id"] for r in inserted}
+        doc_ids = [key_to_id[k] for k in doc_keys]
 
         # Embed + add to FAISS
         vecs = self._embedder(provider, model).embed(docs)
         vecs = _l2_normalize(np.asarray(vecs, dtype="float32"))
 
-        vector_store.load_index(name, dim=vecs.shape[1])
+        index_spec = resolve_index_spec(
+            self.faiss_index_type, int(vecs.shape[1]), len(doc_ids)
+        )
+        vector_store.load_index(name, dim=vecs.shape[1], index_type=index_spec)
         vector_store.add_embeddings(name, doc_ids, vecs)
 
         # Update collection with the real model + dimension
@@ -251,7 +232,7 @@ class EmbeddingDatabase(BaseTool):
             description=description,
             embedding_model=model,
             embedding_dimensions=int(vecs.shape[1]),
-            index_type=self.faiss_index_type,
+            index_type=index_spec,
         )
 
         self.logger.info(f"Created collection '{name}' with {len(docs)} docs")
@@ -311,6 +292,7 @@ class EmbeddingDatabase(BaseTool):
 
         # Insert (duplicates ignored by UNIQUE constraints)
         sqlite_store.insert_docs(name, rows)
+        sqlite_store.index_metadata_fields(self.metadata_index_fields)
 
         # Map keys -> ids
         inserted = sqlite_store.fetch_docs(name, doc_keys=doc_keys, limit=len(rows))
@@ -356,8 +338,13 @@ class EmbeddingDatabase(BaseTool):
         }
 
     def _search(self, args: Dict[str, Any]):
+        """Search with `query`, or with a list of `queries` embedded and searched as one batch.
+
+        A `queries` batch returns one result list (and total) per query, in order.
+        """
         name = args.get("database_name")
         query = args.get("query")
+        queries = args.get("queries")
         top_k = int(args.get("top_k", 5))
         filters = args.get("filters", args.get("metadata_filter", {}))
         provider = _resolve_provider(args.get("provider"))
@@ -365,8 +352,13 @@ class EmbeddingDatabase(BaseTool):
 
         if not name:
             return {"error": "database_name is required"}
-        if not query:
+        if not query and not queries:
             return {"error": "query is required"}
+        if queries is not None and (
+            not isinstance(queries, list)
+            or not all(isinstance(q, str) and q for q in queries)
+        ):
+            return {"error": "queries must be a list of non-empty strings"}
 
         sqlite_store, vector_store, db_path, index_path = self._stores(name)
         if not index_path.exists() or not db_path.exists():
@@ -379,37 +371,57 @@ class EmbeddingDatabase(BaseTool):
         ) or _resolve_model(provider, None)
         emb = self._embedder(provider, model)
 
-        # Embed query
-        q = emb.embed([query])
+        # Embed queries
+        q = emb.embed(queries or [query])
         q = _l2_normalize(np.asarray(q, dtype="float32"))
         qdim = int(q.shape[1])
         if col_dim and col_dim != qdim:
             return {"error": f"Embedding dimension mismatch: {col_dim} vs {qdim}"}
 
+        # Pre-filter: search only among the docs whose metadata matches
+        candidates = sqlite_store.filter_doc_ids(name, filters) if filters else None
+
         # Search
         vector_store.load_index(name, dim=col_dim or qdim)
-        results = vector_store.search_embeddings(name, q[0], top_k=top_k)
+        batches = vector_store.search_embeddings_batch(
+            name,
+            q,
+            top_k=top_k,
+            nprobe=self.nprobe,
+            ef_search=self.ef_search,
+            doc_ids=candidates,
+        )
 
-        # Hydrate + filter
-        doc_ids = [doc_id for doc_id, _ in results]
+        # Hydrate
+        doc_ids = list({doc_id for results in batches for doc_id, _ in results})
         docs = sqlite_store.fetch_docs_by_ids(name, doc_ids)
         doc_map = {d["id"]: d for d in docs}
 
-        out = []
-        for doc_id, score in results:
-            d = doc_map.get(doc_id)
-            if not d:
-                continue
-            md = d.get("metadata") or {}
-            if _matches_filters(md, filters):
+        hits_per_query = []
+        for results in batches:
+            out = []
+            for doc_id, score in results:
+                d = doc_map.get(doc_id)
+                if not d:
+                    continue
                 out.append(
                     {
                         "text": d["text"],
-                        "metadata": md,
+                        "metadata": d.get("metadata") or {},
                         "similarity_score": float(score),
                     }
                 )
+            hits_per_query.append(out)
 
+        if queries:
+            return {
+                "status": "success",
+                "database_name": name,
+                "queries": queries,
+                "results": [out[:top_k] for out in hits_per_query],
+                "total_found": [len(out) for out in hits_per_query],
+            }
+        out = hits_per_query[0]
         return {
             "status": "success",
             "database_name": name,
@@ -31,6 +31,12 @@ class EmbeddingCollectionSearchTool(BaseTool):
         Number of results to return.
     alpha  : float = 0.5
         Balance for hybrid search (0=keyword only, 1=embedding only).
+    fusion : str = "weighted"
+        How hybrid merges the two result lists: "weighted" (raw scores),
+        "rrf" (reciprocal rank fusion), "minmax" or "zscore" (normalized scores).
+    filters : dict (optional)
+        Metadata filters, e.g. {"country": "de"} or {"year": {"$gte": 2020}};
+        only matching documents are searched.
 
     Returns
     -------
@@ -56,6 +62,8 @@ class EmbeddingCollectionSearchTool(BaseTool):
         method = arguments.get("method", "hybrid")
         top_k = int(arguments.get("top_k", 10))
         alpha = float(arguments.get("alpha", 0.5))
+        filters = arguments.get("filters") or None
+        fusion = arguments.get("fusion", "weighted")
 
         # Allow explicit db path; default to user cache dir ~/Library/Caches/.../embeddings/<collection>.db
         if fields.get("db_path"):
@@ -66,7 +74,15 @@ class EmbeddingCollectionSearchTool(BaseTool):
         se = getattr(self, "_se", None) or SearchEngine(db_path=db_path)
 
         try:
-            res = se.search_collection(coll, q, method=method, top_k=top_k, alpha=alpha)
+            res = se.search_collection(
+                coll,
+                q,
+                method=method,
+                top_k=top_k,
+                alpha=alpha,
+                filters=filters,
+                fusion=fusion,
+            )
             for r in res:
                 r["snippet"] = (r.get("text") or "")[:280]
             return res
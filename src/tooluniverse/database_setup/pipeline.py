@@ -3,9 +3,10 @@ High-level helpers for building and querying collections.
 
 Exposes
 -------
-build_collection(db_path, collection, docs, embed_provider, embed_model, overwrite=False)
-    Create or extend a collection, insert documents with de-dup, embed texts, and persist a FAISS index.
-search(db_path, collection, query, method="hybrid", top_k=10, alpha=0.5, embed_provider=None, embed_model=None)
+build_collection(db_path, collection, docs, embed_provider, embed_model, overwrite=False, batch_size=256, index_type=None)
+    Create or extend a collection, insert documents with de-dup, embed the texts that have no
+    vector yet, and persist a FAISS index (exact or IVF/PQ/HNSW). Returns throughput metrics.
+search(db_path, collection, query, method="hybrid", top_k=10, alpha=0.5, embed_provider=None, embed_model=None, nprobe=None, ef_search=None)
     Keyword/embedding/hybrid search over an existing collection.
 
 Notes
@@ -16,18 +17,23 @@ Notes
 """
 
 from __future__ import annotations
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 import numpy as np
 import sqlite3
+import time
 
 from .sqlite_store import SQLiteStore
-from .vector_store import VectorStore
+from .vector_store import (
+    VectorStore,
+    describe_index,
+    index_kind,
+    resolve_index_spec,
+)
 from .embedder import Embedder
 from tooluniverse.database_setup.provider_resolver import (
     resolve_provider,
     resolve_model,
 )
-from tooluniverse.database_setup.embed_utils import get_model_dim
 
 
 def _l2norm(x: np.ndarray) -> np.ndarray:
@@ -47,6 +53,14 @@ def _get_collection_meta(
     return (row[0], row[1]) if row else (None, None)
 
 
+def _get_collection_index_type(conn: sqlite3.Connection, name: str) -> Optional[str]:
+    """Return the index type recorded for a collection, or None."""
+    row = conn.execute(
+        "SELECT index_type FROM collections WHERE name=? LIMIT 1", (name,)
+    ).fetchone()
+    return row[0] if row else None
+
+
 def build_collection(
     db_path: str,
     collection: str,
@@ -54,62 +68,177 @@ def build_collection(
     embed_provider: str,
     embed_model: str,
     overwrite: bool = False,
-) -> None:
-    """Create/extend a collection, embed docs, and populate FAISS.
+    batch_size: int = 256,
+    checkpoint_every: int = 10000,
+    index_type: Optional[str] = None,
+    train_size: int = 20000,
+    metadata_index_fields: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """Create/extend a collection, embed new docs, and populate FAISS.
 
     Inserts/merges documents (dedupe by (collection, doc_key) and by (collection, text_hash) when present),
-    computes embeddings with the requested provider/model, L2-normalizes them,
-    and appends to <collection>.faiss via VectorStore.
+    then streams the docs that have no row in `vectors` (or whose text_hash changed since they were
+    embedded) from SQLite to the embedder to FAISS in batches of `batch_size`, L2-normalizing each batch.
+    Only one batch of texts and vectors is held in memory at a time, except while the first
+    `train_size` vectors are collected to train an IVF/PQ index.
+
+    Index types
+    -----------
+    `index_type` selects the FAISS index of a new (or overwritten) collection: "flat" (exact
+    IndexFlatIP, the default), "ivf_flat", "ivf_pq", "hnsw", or a FAISS factory string such as
+    "IVF4096,PQ64". Named types are sized from the number of docs being embedded. When omitted,
+    the type recorded for the collection is kept. Changing the type of an existing index
+    requires overwrite=True. Tune recall/latency at query time with search(nprobe=..., ef_search=...).
+
+    Metadata filters
+    ----------------
+    `metadata_index_fields` lists the top-level metadata keys that searches will filter on;
+    each gets a SQLite index (see SQLiteStore.index_metadata_fields). Filters on other keys
+    still work but scan the collection.
 
     Idempotency
     -----------
-    Re-running is safe: existing (doc_key) are ignored; content duplicates (text_hash) are skipped.
+    Re-running is safe and incremental: existing (doc_key) are ignored, content duplicates (text_hash)
+    are skipped, and docs that already have a vector are not embedded again. With overwrite=True the
+    FAISS index and its mappings are rebuilt from scratch.
+
+    Resumability
+    ------------
+    The index and the (doc_id ↔ faiss_idx) mappings are written together every `checkpoint_every`
+    embedded docs and at the end. If a build is interrupted, re-running it embeds only the docs
+    that were not checkpointed.
 
     Side effects
     ------------
-    - Records the true embedding model and dimension in the `collections` table.
+    - Records the true embedding model, dimension and index type in the `collections` table.
 
+    Returns
+    -------
+    dict
+        {docs_embedded, batches, seconds, docs_per_sec, tokens_per_sec}. Tokens are
+        approximated by whitespace-separated words.
     """
-    print(f" Detecting embedding dimension for {embed_provider}:{embed_model} ...")
-    try:
-        embed_dim = get_model_dim(embed_provider, embed_model)
-        print(f" Detected embedding dimension: {embed_dim}")
-    except Exception as e:
-        raise RuntimeError(f"Failed to detect embedding dimension: {e}")
+    store = SQLiteStore(db_path)
+    emb = Embedder(provider=embed_provider, model=embed_model)
 
-    # os.makedirs(os.path.dirname(os.path.expanduser(db_path)), exist_ok=True)
+    model_from_db, dim_from_db = _get_collection_meta(store.conn, collection)
+    if model_from_db == embed_model and dim_from_db:
+        embed_dim = int(dim_from_db)
+    else:
+        print(f" Detecting embedding dimension for {embed_provider}:{embed_model} ...")
+        try:
+            embed_dim = int(emb.embed(["_dim_probe_"]).shape[1])
+            print(f" Detected embedding dimension: {embed_dim}")
+        except Exception as e:
+            raise RuntimeError(f"Failed to detect embedding dimension: {e}")
 
-    store = SQLiteStore(db_path)
+    # Insert/merge docs (dedupe by (collection, doc_key); optional text_hash dedupe if index exists)
+    store.insert_docs(collection, docs)
+    if metadata_index_fields:
+        store.index_metadata_fields(metadata_index_fields)
 
-    # Upsert collection metadata (safe to call repeatedly)
+    requested = index_type or index_kind(
+        _get_collection_index_type(store.conn, collection)
+    )
+    if overwrite:
+        to_index = store.count_docs(collection)
+    else:
+        to_index = store.count_docs_to_embed(collection)
+    spec = resolve_index_spec(requested, embed_dim, min(train_size, to_index))
+
+    vs = VectorStore(db_path)
+    # Optionally reset existing FAISS index (and its mappings) if overwrite=True
+    index = vs.load_index(collection, dim=embed_dim, reset=overwrite, index_type=spec)
+    if index_type and index_kind(describe_index(index)) != index_kind(index_type):
+        raise ValueError(
+            f"Collection '{collection}' already has a {describe_index(index)} index; "
+            f"pass overwrite=True to rebuild it as {index_type}"
+        )
+    # Mappings whose vectors never reached the index file must be embedded again
+    vs.drop_stale_mappings(collection)
 
+    # Upsert collection metadata (safe to call repeatedly)
     store.upsert_collection(
         collection,
         description=f"Datastore for {collection}",
         embedding_model=embed_model,
         embedding_dimensions=embed_dim,
+        index_type=describe_index(index),
     )
 
-    # Insert/merge docs (dedupe by (collection, doc_key); optional text_hash dedupe if index exists)
-    store.insert_docs(collection, docs)
-
-    # Fetch back to embed
-    rows = store.fetch_docs(collection, limit=100000)
-    if not rows:
-        return
-
-    texts = [r["text"] for r in rows]
-    doc_ids = [r["id"] for r in rows]
-
-    emb = Embedder(provider=embed_provider, model=embed_model)
-    vecs = emb.embed(texts).astype("float32")
-    vecs = _l2norm(vecs)
-    print(f"Embedded {len(vecs)} docs with shape {vecs.shape}")
+    pending = store.count_docs_to_embed(collection)
+    metrics = {
+        "docs_embedded": 0,
+        "batches": 0,
+        "seconds": 0.0,
+        "docs_per_sec": 0.0,
+        "tokens_per_sec": 0.0,
+    }
+    if not pending:
+        print(f"No new docs to embed for '{collection}'")
+        return metrics
+
+    tokens = 0
+    since_checkpoint = 0
+    # Embedded batches not yet added, while an IVF/PQ index waits for its training sample
+    buffer: List[Tuple[List[int], np.ndarray, List[str]]] = []
+    buffered = 0
+    train_target = min(train_size, pending)
+
+    def _add_buffered():
+        # The first add trains an untrained index on everything buffered
+        vs.add_embeddings(
+            collection,
+            [doc_id for ids, _, _ in buffer for doc_id in ids],
+            np.vstack([v for _, v, _ in buffer]),
+            dim=embed_dim,
+            text_hashes=[h for _, _, hashes in buffer for h in hashes],
+            persist=False,
+        )
+        metrics["docs_embedded"] += buffered
 
-    vs = VectorStore(db_path)
-    # Optionally reset existing FAISS index if overwrite=True
-    vs.load_index(collection, dim=embed_dim, reset=overwrite)
-    vs.add_embeddings(collection, doc_ids, vecs, dim=embed_dim)
+    started = time.perf_counter()
+    try:
+        for batch in store.iter_docs_to_embed(collection, batch_size=batch_size):
+            texts = [r["text"] for r in batch]
+            vecs = _l2norm(emb.embed(texts).astype("float32"))
+            buffer.append(
+                ([r["id"] for r in batch], vecs, [r["text_hash"] for r in batch])
+            )
+            buffered += len(batch)
+            metrics["batches"] += 1
+            tokens += sum(len(t.split()) for t in texts)
+            if not index.is_trained and buffered < train_target:
+                continue
+
+            _add_buffered()
+            since_checkpoint += buffered
+            buffer, buffered = [], 0
+            if since_checkpoint >= checkpoint_every:
+                vs.checkpoint(collection)
+                since_checkpoint = 0
+                elapsed = time.perf_counter() - started
+                print(
+                    f"Embedded {metrics['docs_embedded']}/{pending} docs "
+                    f"({metrics['docs_embedded'] / elapsed:.1f} docs/s)"
+                )
+        if buffer:
+            _add_buffered()
+        vs.checkpoint(collection)
+    except BaseException:
+        # Keep the last checkpoint; the next run resumes from there
+        vs.db.rollback()
+        raise
+
+    elapsed = time.perf_counter() - started
+    metrics["seconds"] = elapsed
+    metrics["docs_per_sec"] = metrics["docs_embedded"] / elapsed if elapsed else 0.0
+    metrics["tokens_per_sec"] = tokens / elapsed if elapsed else 0.0
+    print(
+        f"Embedded {metrics['docs_embedded']} docs in {elapsed:.1f}s "
+        f"({metrics['docs_per_sec']:.1f} docs/s, {metrics['tokens_per_sec']:.1f} tokens/s)"
+    )
+    return metrics
 
 
 # replace the beginning of search(...)
@@ -122,6 +251,9 @@ def search(
     alpha: float = 0.5,
     embed_provider: Optional[str] = None,
     embed_model: Optional[str] = None,
+    nprobe: Optional[int] = None,
+    ef_search: Optional[int] = None,
+    fusion: str = "weighted",
 ) -> List[Dict[str, Any]]:
     """Search a collection using keyword, embedding, or hybrid.
 
@@ -129,8 +261,12 @@ def search(
     ----------
     method : {"keyword", "embedding", "hybrid"}
         Search strategy. Hybrid mixes scores via `alpha * emb + (1 - alpha) * kw`.
+    fusion : {"weighted", "rrf", "minmax", "zscore"}
+        How hybrid turns each leg's results into emb/kw (see search.fuse_results).
     embed_provider, embed_model : Optional[str]
         Required if the collection’s embedding_model is "precomputed".
+    nprobe, ef_search : Optional[int]
+        Recall/latency knobs for IVF and HNSW indexes (ignored by flat indexes).
 
     Returns
     -------
@@ -182,7 +318,11 @@ def search(
     vs.load_index(collection, dim_from_db)
 
     hits = vs.search_embeddings(
-        collection, qvec, top_k=top_k * (2 if method == "hybrid" else 1)
+        collection,
+        qvec,
+        top_k=top_k * (2 if method == "hybrid" else 1),
+        nprobe=nprobe,
+        ef_search=ef_search,
     )
 
     doc_ids = [doc_id for doc_id, _ in hits]
@@ -206,30 +346,21 @@ def search(
     if method == "embedding":
         return emb_results[:top_k]
 
-    # Hybrid combine
-    kw_rows = store.search_keyword(collection, query, limit=top_k * 2)
-    by_id: Dict[int, Dict[str, Any]] = {r["doc_id"]: r for r in emb_results}
-    for r in kw_rows:
-        if r["id"] in by_id:
-            by_id[r["id"]]["kw_score"] = 1.0
-        else:
-            by_id[r["id"]] = {
-                "doc_id": r["id"],
-                "doc_key": r["doc_key"],
-                "text": r["text"],
-                "metadata": r["metadata"],
-                "emb_score": 0.0,
-                "kw_score": 1.0,
-                "score": 0.0,
-            }
+    # Hybrid combine (imported here: importing .search while the package
+    # initialises would rebind database_setup.search from the module to search())
+    from .search import fuse_results
 
-    # Fill missing emb_score and compute final score
-    out = []
-    for v in by_id.values():
-        emb_s = v.get("score", v.get("emb_score", 0.0))
-        kw_s = v.get("kw_score", 0.0)
-        v["score"] = alpha * float(emb_s) + (1 - alpha) * float(kw_s)
-        out.append(v)
-
-    out.sort(key=lambda x: x["score"], reverse=True)
+    kw_rows = store.search_keyword(collection, query, limit=top_k * 2)
+    kw_results = [
+        {
+            "doc_id": r["id"],
+            "doc_key": r["doc_key"],
+            "text": r["text"],
+            "metadata": r["metadata"],
+            "score": 1.0,
+            "bm25": r["bm25"],
+        }
+        for r in kw_rows
+    ]
+    out = fuse_results(kw_results, emb_results, alpha=alpha, fusion=fusion)
     return out[:top_k]
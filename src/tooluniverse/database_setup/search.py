@@ -4,27 +4,54 @@ SearchEngine: unified keyword / embedding / hybrid search over a SQLite+FAISS da
 Composes:
 - SQLiteStore.search_keyword(...)
 - Embedder for query-time vectors
-- VectorStore.search_embeddings(...)
-- A simple hybrid combiner to mix keyword and embedding scores
+- VectorStore.search_embeddings(...) / search_embeddings_batch(...)
+- fuse_results(...) to merge keyword and embedding rankings
 
 Scoring
 -------
-- Keyword scores are alway 1.0.
+- Keyword scores are alway 1.0; hits come best-first by FTS5 rank, which is also
+  returned as `bm25` (more negative = more relevant).
 - Embedding scores are FAISS IP (assume vectors are L2-normalized upstream).
-- Hybrid: score = alpha * embed_score + (1 - alpha) * keyword_score  (alpha in [0,1]).
+  For IVF/HNSW collections, nprobe/ef_search trade recall for latency per call.
+- Hybrid fuses both legs with score = alpha * emb + (1 - alpha) * kw (alpha in [0,1]),
+  where emb/kw depend on `fusion`:
+    "weighted" (default)  raw scores, i.e. cosine similarity and the fixed 1.0
+    "rrf"                 reciprocal rank 1 / (rrf_k + rank), rank starting at 1
+    "minmax" / "zscore"   scores normalized within each leg (bm25 for keywords)
+  BM25 and cosine similarity live on different scales, so "rrf" or a normalized
+  mode is usually the better choice; "weighted" is kept for compatibility.
+
+Concurrency
+-----------
+The keyword and embedding legs of a hybrid search run concurrently, and
+multi_collection_search queries its collections in parallel, on a thread pool owned
+by the engine (`max_workers`; 1 runs everything in the calling thread). Each thread
+gets its own SQLite connection; call close() to release the pool and connections.
+
+Filtering
+---------
+`filters` (see SQLiteStore.filter_doc_ids) select the matching docs first; keyword and
+embedding searches then only rank those, so selective filters still return top_k hits.
 
 Return shape
 ------------
 Each API returns a list of dicts:
 { "doc_id", "doc_key", "text", "metadata", "score" }
 
+benchmark_search(...) measures recall@k, MRR and latency of each method/fusion over
+labelled queries (see examples/benchmark_hybrid_search.py).
+
 See also
 --------
 - pipeline.py for high-level build & search helpers
 - cli.py for command-line usage
 """
 
-from typing import List, Dict, Any, Optional
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from tooluniverse.database_setup.sqlite_store import SQLiteStore
 from tooluniverse.database_setup.vector_store import VectorStore
@@ -36,6 +63,89 @@ from tooluniverse.database_setup.provider_resolver import (
 
 import numpy as np
 
+FUSION_METHODS = ("weighted", "rrf", "minmax", "zscore")
+RRF_K = 60
+
+
+def _normalize(scores: List[float], fusion: str) -> List[float]:
+    """Min-max (to [0, 1]) or z-score normalize one leg's scores."""
+    arr = np.asarray(scores, dtype="float64")
+    if fusion == "minmax":
+        span = arr.max() - arr.min()
+        return ((arr - arr.min()) / span).tolist() if span > 0 else [1.0] * len(arr)
+    std = arr.std()
+    return ((arr - arr.mean()) / std).tolist() if std > 0 else [0.0] * len(arr)
+
+
+def _leg_scores(
+    hits: List[Dict[str, Any]],
+    fusion: str,
+    rrf_k: int,
+    relevance: Callable[[Dict[str, Any]], float],
+) -> Tuple[Dict[int, float], float]:
+    """Per-doc contribution of one ranked leg, plus the value for docs it missed."""
+    if fusion == "weighted":
+        return {h["doc_id"]: h["score"] for h in reversed(hits)}, 0.0
+    if fusion == "rrf":
+        ranks = {}
+        for rank, h in enumerate(hits, 1):
+            ranks.setdefault(h["doc_id"], 1.0 / (rrf_k + rank))
+        return ranks, 0.0
+    if not hits:
+        return {}, 0.0
+    values = _normalize([relevance(h) for h in hits], fusion)
+    scores = {h["doc_id"]: v for h, v in zip(reversed(hits), reversed(values))}
+    return scores, min(values)
+
+
+def _keyword_relevance(hit: Dict[str, Any]) -> float:
+    bm25 = hit.get("bm25")
+    return -bm25 if bm25 is not None else hit["score"]
+
+
+def fuse_results(
+    keyword_hits: List[Dict[str, Any]],
+    embedding_hits: List[Dict[str, Any]],
+    alpha: float = 0.5,
+    fusion: str = "weighted",
+    rrf_k: int = RRF_K,
+) -> List[Dict[str, Any]]:
+    """Merge keyword and embedding hit lists (each best-first) into one ranked list.
+
+    score = alpha * emb + (1 - alpha) * kw, with emb/kw given by `fusion` (see the
+    module docstring). A doc missing from one leg gets nothing from it under
+    "weighted" and "rrf", and that leg's lowest normalized score otherwise.
+    Each hit keeps its raw `kw_score` and `emb_score` (0.0 when missing).
+    """
+    if fusion not in FUSION_METHODS:
+        raise ValueError(f"Unknown fusion: {fusion} (expected one of {FUSION_METHODS})")
+    kw, kw_missing = _leg_scores(keyword_hits, fusion, rrf_k, _keyword_relevance)
+    emb, emb_missing = _leg_scores(
+        embedding_hits, fusion, rrf_k, lambda h: float(h["score"])
+    )
+    kw_hits = {h["doc_id"]: h for h in reversed(keyword_hits)}
+    emb_hits = {h["doc_id"]: h for h in reversed(embedding_hits)}
+
+    combined = []
+    # Best-first order, so the stable sort breaks ties by embedding then keyword rank
+    for doc_id in dict.fromkeys(h["doc_id"] for h in embedding_hits + keyword_hits):
+        kw_hit = kw_hits.get(doc_id)
+        emb_hit = emb_hits.get(doc_id)
+        score = alpha * emb.get(doc_id, emb_missing) + (1 - alpha) * kw.get(
+            doc_id, kw_missing
+        )
+        combined.append(
+            {
+                **(emb_hit or kw_hit),
+                "kw_score": kw_hit["score"] if kw_hit else 0.0,
+                "emb_score": emb_hit["score"] if emb_hit else 0.0,
+                "score": score,
+            }
+        )
+
+    combined.sort(key=lambda x: x["score"], reverse=True)
+    return combined
+
 
 class SearchEngine:
     """
@@ -49,22 +159,77 @@ class SearchEngine:
         Default embedder provider. May be overridden per-call.
     model : Optional[str]
         Default embedding model. May be overridden per-call.
+    max_workers : Optional[int]
+        Size of the thread pool used for concurrent hybrid legs and collections
+        (default: min(8, cpu_count + 4)); 1 disables concurrency.
 
     Use
     ---
     Provides consistent records ``{doc_id, doc_key, text, metadata, score}``.
-    Keyword results get a fixed ``score=1.0``; hybrid combines embedding/keyword scores as ``alpha*emb + (1-alpha)*kw``.
+    Keyword results get a fixed ``score=1.0``; hybrid fuses both legs as described by `fusion`.
 
     Notes
     -----
     - If a collection's `embedding_model` is "precomputed", you MUST pass (provider, model)
       when calling `embedding_search` or `hybrid_search`.
     """
-    def __init__(self, db_path: str = "embeddings.db"):
-        self.sqlite = SQLiteStore(db_path)
+    def __init__(
+        self, db_path: str = "embeddings.db", max_workers: Optional[int] = None
+    ):
+        self.db_path = db_path
+        # SQLite connections are bound to their thread: one store per thread
+        self._local = threading.local()
+        self._local.sqlite = SQLiteStore(db_path)
         self.vectors = VectorStore(db_path)
         # Lazy embedder, only created if/when user actually does embedding.
         self.embedder: Optional[Embedder] = None
+        self._embedder_lock = threading.Lock()
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 1) + 4)
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def sqlite(self) -> SQLiteStore:
+        """The SQLiteStore of the current thread (created on first use)."""
+        store = getattr(self._local, "sqlite", None)
+        if store is None:
+            store = self._local.sqlite = SQLiteStore(self.db_path)
+        return store
+
+    def _submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Run `fn` on the pool; inline when concurrency is off or already on a worker.
+
+        Workers never wait on tasks queued behind them, so nested calls (a hybrid
+        search inside multi_collection_search) cannot deadlock the pool.
+        """
+        if self.max_workers <= 1 or getattr(self._local, "in_pool", False):
+            future: Future = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="search"
+            )
+        return self._pool.submit(self._run_in_pool, fn, *args, **kwargs)
+
+    def _run_in_pool(self, fn: Callable, *args, **kwargs):
+        self._local.in_pool = True
+        return fn(*args, **kwargs)
+
+    def close(self):
+        """Shut down the worker pool and close this thread's SQLite connection.
+
+        Worker threads' connections are released when the pool's threads exit.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        store = getattr(self._local, "sqlite", None)
+        if store is not None:
+            store.close()
+            self._local.sqlite = None
 
     def _get_default_embedder(self) -> Embedder:
         """Return a lazily constructed default Embedder.
@@ -72,12 +237,11 @@ class SearchEngine:
         This avoids importing sentence_transformers (for provider=='local')
         unless we *actually* perform an embedding or hybrid search.
         """
-        if self.embedder is not None:
-            return self.embedder
-
-        prov = resolve_provider()
-        mdl = resolve_model(prov)
-        self.embedder = Embedder(provider=prov, model=mdl)
+        with self._embedder_lock:
+            if self.embedder is None:
+                prov = resolve_provider()
+                mdl = resolve_model(prov)
+                self.embedder = Embedder(provider=prov, model=mdl)
         return self.embedder
 
     def _get_collection_meta(self, collection: str):
@@ -90,26 +254,71 @@ class SearchEngine:
 
     # ---- Keyword search ----
     def keyword_search(
-        self, collection: str, query: str, top_k: int = 5
+        self,
+        collection: str,
+        query: str,
+        top_k: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        """FTS5 keyword search (normalized text). Returns fixed score=1.0 hits."""
-        rows = self.sqlite.search_keyword(collection, query, limit=top_k)
+        """FTS5 keyword search (normalized text), best match first.
+
+        Hits carry a fixed score=1.0 and their FTS5 rank as `bm25`.
+        """
+        rows = self.sqlite.search_keyword(
+            collection, query, limit=top_k, filters=filters
+        )
         return [
             {
                 "doc_id": r["id"],
                 "doc_key": r["doc_key"],
                 "text": r["text"],
                 "metadata": r["metadata"],
-                "score": 1.0,  # fixed score (FTS5 doesn’t give ranking)
+                "score": 1.0,  # fixed score; the FTS5 rank is kept as bm25
+                "bm25": r["bm25"],
             }
             for r in rows
         ]
 
     # ---- Embedding search ----
     def embedding_search(
-        self, collection: str, query: str, top_k: int = 5
+        self,
+        collection: str,
+        query: str,
+        top_k: int = 5,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        """Vector search using FAISS (IndexFlatIP with L2-normalized vectors)."""
+        """Vector search using FAISS (L2-normalized vectors; exact or IVF/PQ/HNSW index).
+
+        `nprobe` (IVF) and `ef_search` (HNSW) override the index's query-time defaults.
+        `filters` restrict the search to docs whose metadata matches.
+        """
+        return self.embedding_search_batch(
+            collection,
+            [query],
+            top_k=top_k,
+            nprobe=nprobe,
+            ef_search=ef_search,
+            filters=filters,
+        )[0]
+
+    def embedding_search_batch(
+        self,
+        collection: str,
+        queries: List[str],
+        top_k: int = 5,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Vector search for several queries at once; returns one hit list per query.
+
+        Queries are embedded in one call, searched with one FAISS call, and all hits
+        are hydrated with a single SQLite lookup.
+        """
+        if not queries:
+            return []
         col_model, col_dim = self._get_collection_meta(collection)
         prov = resolve_provider()
         # if the collection records a model (and it's not the placeholder), prefer it
@@ -128,33 +337,46 @@ class SearchEngine:
             # collection was built with a different model – use a fresh embedder
             emb = Embedder(provider=prov, model=model)
 
-        q = emb.embed([query])[0]
-        q = q / (np.linalg.norm(q, keepdims=True) + 1e-12)
-        self.vectors.load_index(collection, col_dim or len(q))
+        q = np.asarray(emb.embed(list(queries)), dtype="float32")
+        q = q / (np.linalg.norm(q, axis=1, keepdims=True) + 1e-12)
+        self.vectors.load_index(collection, col_dim or q.shape[1])
 
-        if col_dim and col_dim != len(q):
+        if col_dim and col_dim != q.shape[1]:
             raise ValueError(
-                f"Embedding dimension mismatch: index={col_dim}, query={len(q)} (model={model})"
+                f"Embedding dimension mismatch: index={col_dim}, query={q.shape[1]} (model={model})"
             )
 
-        results = self.vectors.search_embeddings(collection, q, top_k=top_k)
-        doc_ids = [doc_id for doc_id, _ in results]
+        candidates = (
+            self.sqlite.filter_doc_ids(collection, filters) if filters else None
+        )
+        batches = self.vectors.search_embeddings_batch(
+            collection,
+            q,
+            top_k=top_k,
+            nprobe=nprobe,
+            ef_search=ef_search,
+            doc_ids=candidates,
+        )
+        doc_ids = list({doc_id for results in batches for doc_id, _ in results})
         docs = self.sqlite.fetch_docs_by_ids(collection, doc_ids)
         doc_map = {d["id"]: d for d in docs}
 
         out = []
-        for doc_id, score in results:
-            d = doc_map.get(doc_id)
-            if d:
-                out.append(
-                    {
-                        "doc_id": d["id"],
-                        "doc_key": d["doc_key"],
-                        "text": d["text"],
-                        "metadata": d["metadata"],
-                        "score": float(score),
-                    }
-                )
+        for results in batches:
+            hits = []
+            for doc_id, score in results:
+                d = doc_map.get(doc_id)
+                if d:
+                    hits.append(
+                        {
+                            "doc_id": d["id"],
+                            "doc_key": d["doc_key"],
+                            "text": d["text"],
+                            "metadata": d["metadata"],
+                            "score": float(score),
+                        }
+                    )
+            out.append(hits)
         return out
 
     # ---- Hybrid search ---- (embedding + keyword)
@@ -164,28 +386,37 @@ class SearchEngine:
         query: str,
         top_k: int = 5,
         alpha: float = 0.5,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        fusion: str = "weighted",
+        rrf_k: int = RRF_K,
     ) -> List[Dict[str, Any]]:
-        """Blend keyword and embedding results with score = alpha*emb + (1-alpha)*kw."""
-        kws = self.keyword_search(collection, query, top_k=top_k * 2)
-        embs = self.embedding_search(collection, query, top_k=top_k * 2)
-
-        kw_scores = {r["doc_id"]: r for r in kws}
-        emb_scores = {r["doc_id"]: r for r in embs}
-        all_ids = set(kw_scores) | set(emb_scores)
-
-        combined = []
-        for doc_id in all_ids:
-            kw = kw_scores.get(doc_id, {"score": 0.0})
-            emb = emb_scores.get(doc_id, {"score": 0.0})
-            kw_score = kw["score"]
-            emb_score = emb["score"]
-            score = alpha * emb_score + (1 - alpha) * kw_score
-            doc = emb if doc_id in emb_scores else kw
-            combined.append(
-                {**doc, "kw_score": kw_score, "emb_score": emb_score, "score": score}
+        """Fuse keyword and embedding results with score = alpha*emb + (1-alpha)*kw.
+
+        Both legs fetch 2*top_k candidates concurrently; `fusion` ("weighted", "rrf",
+        "minmax" or "zscore") decides how each leg's ranking becomes emb/kw, see
+        fuse_results().
+        """
+        if fusion not in FUSION_METHODS:
+            raise ValueError(
+                f"Unknown fusion: {fusion} (expected one of {FUSION_METHODS})"
             )
+        # FTS5 runs on a worker while this thread embeds the query and searches FAISS
+        kw_future = self._submit(
+            self.keyword_search, collection, query, top_k=top_k * 2, filters=filters
+        )
+        embs = self.embedding_search(
+            collection,
+            query,
+            top_k=top_k * 2,
+            nprobe=nprobe,
+            ef_search=ef_search,
+            filters=filters,
+        )
+        kws = kw_future.result()
 
-        combined.sort(key=lambda x: x["score"], reverse=True)
+        combined = fuse_results(kws, embs, alpha=alpha, fusion=fusion, rrf_k=rrf_k)
         return combined[:top_k]
 
     # ---- Collection + Doc Access ----
@@ -210,34 +441,75 @@ class SearchEngine:
         method: str = "hybrid",
         top_k: int = 5,
         alpha: float = 0.5,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        fusion: str = "weighted",
     ):
         """Dispatch to keyword/embedding/hybrid search for a single collection."""
         if method == "keyword":
-            return self.keyword_search(collection, query, top_k=top_k)
+            return self.keyword_search(collection, query, top_k=top_k, filters=filters)
         elif method == "embedding":
-            return self.embedding_search(collection, query, top_k=top_k)
+            return self.embedding_search(
+                collection,
+                query,
+                top_k=top_k,
+                nprobe=nprobe,
+                ef_search=ef_search,
+                filters=filters,
+            )
         elif method == "hybrid":
-            return self.hybrid_search(collection, query, top_k=top_k, alpha=alpha)
+            return self.hybrid_search(
+                collection,
+                query,
+                top_k=top_k,
+                alpha=alpha,
+                nprobe=nprobe,
+                ef_search=ef_search,
+                filters=filters,
+                fusion=fusion,
+            )
         else:
             raise ValueError(f"Unknown method: {method}")
 
     def multi_collection_search(
-        self, query: str, method: str = "hybrid", top_k: int = 5, alpha: float = 0.5
+        self,
+        query: str,
+        method: str = "hybrid",
+        top_k: int = 5,
+        alpha: float = 0.5,
+        fusion: str = "weighted",
+        collections: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Run the same query across all collections and return top-k by score.
+        """Run the same query across collections in parallel and return top-k by score.
 
         Notes
         -----
+        - Searches `collections` (default: all registered ones).
         - Attaches a 'collection' field to each hit.
         - Silently warns and skips collections that fail to search.
         """
-        collections = self.list_collections()
+        if collections is None:
+            collections = self.list_collections()
+        futures = [
+            (
+                coll,
+                self._submit(
+                    self.search_collection,
+                    coll,
+                    query,
+                    method=method,
+                    top_k=top_k,
+                    alpha=alpha,
+                    fusion=fusion,
+                ),
+            )
+            for coll in collections
+        ]
         all_results = []
-        for coll in collections:
+        for coll, future in futures:
             try:
-                results = self.search_collection(
-                    coll, query, method=method, top_k=top_k, alpha=alpha
-                )
+                results = future.result()
                 for r in results:
                     r["collection"] = coll
                 all_results.extend(results)
@@ -245,3 +517,55 @@ class SearchEngine:
                 print(f"[WARN] Failed on {coll}: {e}")
         all_results.sort(key=lambda x: x["score"], reverse=True)
         return all_results[:top_k]
+
+
+BENCHMARK_CONFIGS = (("keyword", None), ("embedding", None)) + tuple(
+    ("hybrid", fusion) for fusion in FUSION_METHODS
+)
+
+
+def benchmark_search(
+    engine: SearchEngine,
+    collection: str,
+    cases: List[Dict[str, Any]],
+    top_k: int = 10,
+    alpha: float = 0.5,
+    repeats: int = 3,
+    configs: Optional[List[Tuple[str, Optional[str]]]] = None,
+) -> List[Dict[str, Any]]:
+    """Relevance and latency of search configurations over labelled queries.
+
+    `cases` are ``{"query": str, "relevant": [doc_key, ...]}``. For every
+    (method, fusion) in `configs` (default: keyword, embedding and hybrid with each
+    fusion) returns ``{method, fusion, recall, mrr, ms_per_query, p95_ms}``: mean
+    recall@top_k and reciprocal rank of the first relevant hit over the cases, and
+    latency over `repeats` timed runs per query (after one untimed warm-up run).
+    """
+    rows = []
+    for method, fusion in configs or BENCHMARK_CONFIGS:
+        kwargs = {"method": method, "top_k": top_k, "alpha": alpha}
+        if fusion:
+            kwargs["fusion"] = fusion
+        recalls, ranks, timings = [], [], []
+        for case in cases:
+            relevant = set(case["relevant"])
+            hits = engine.search_collection(collection, case["query"], **kwargs)
+            keys = [h["doc_key"] for h in hits]
+            recalls.append(len(relevant.intersection(keys)) / max(len(relevant), 1))
+            first = next((i for i, k in enumerate(keys, 1) if k in relevant), None)
+            ranks.append(1.0 / first if first else 0.0)
+            for _ in range(repeats):
+                start = time.perf_counter()
+                engine.search_collection(collection, case["query"], **kwargs)
+                timings.append((time.perf_counter() - start) * 1000)
+        rows.append(
+            {
+                "method": method,
+                "fusion": fusion,
+                "recall": float(np.mean(recalls)) if recalls else 0.0,
+                "mrr": float(np.mean(ranks)) if ranks else 0.0,
+                "ms_per_query": float(np.mean(timings)) if timings else 0.0,
+                "p95_ms": float(np.percentile(timings, 95)) if timings else 0.0,
+            }
+        )
+    return rows
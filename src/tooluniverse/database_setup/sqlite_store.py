@@ -5,7 +5,7 @@ This module implements the relational half of the datastore:
 - Tables:
   - collections(name TEXT PRIMARY KEY, description TEXT, embedding_model TEXT, embedding_dimensions INT)
   - docs(id INTEGER PRIMARY KEY, collection TEXT, doc_key TEXT, text TEXT, text_norm TEXT, metadata JSON, text_hash TEXT)
-  - vectors(doc_id INT, collection TEXT, have_vector INT DEFAULT 0)
+  - vectors(doc_id INT, collection TEXT, faiss_idx INT, text_hash TEXT)
 - Virtual table:
   - docs_fts(text_norm) -> FTS5 mirror of docs.text_norm for keyword search
 
@@ -21,7 +21,11 @@ Typical flow
 - upsert_collection(...) once
 - insert_docs(...): accepts (doc_key, text, metadata, [text_hash]) tuples (hash auto-computed if missing)
 - fetch_docs(...): returns rows for embedding/indexing or inspection
+- iter_docs_to_embed(...): streams docs that have no (current) vector yet
 - search_keyword(...): keyword search via FTS5 (accent/case tolerant)
+- index_metadata_fields(...): index metadata keys that will be filtered on (at build time)
+- filter_doc_ids(...): ids of docs whose metadata matches a filter; indexed keys use
+  their index, other keys are scanned
 - A separate VectorStore persists FAISS vectors; SearchEngine orchestrates hybrid search.
 
 See also
@@ -37,7 +41,7 @@ import time
 import unicodedata
 import hashlib
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 SCHEMA = """
 PRAGMA foreign_keys = ON;
@@ -69,6 +73,7 @@ CREATE TABLE IF NOT EXISTS vectors (
     doc_id INTEGER UNIQUE,
     collection TEXT NOT NULL,
     faiss_idx INTEGER,
+    text_hash TEXT,
     FOREIGN KEY(doc_id) REFERENCES docs(id) ON DELETE CASCADE
 );
 
@@ -116,6 +121,156 @@ def safe_for_fts(query: str) -> str:
     q = q.strip('"').strip("'")
     return q.strip()
 
+
+def matches_filters(metadata: Dict, filters: Dict) -> bool:
+    """Return True if `metadata` satisfies every condition in `filters`.
+
+    Each filter key names a top-level metadata field. A plain value must equal the
+    field; a dict may combine "$gte", "$gt", "$lte", "$lt", "$in" and "$contains"
+    (list membership, or substring of the field's string form). Values of
+    incomparable types do not match.
+    """
+    if not filters:
+        return True
+    try:
+        return _matches_all(metadata, filters)
+    except TypeError:
+        return False
+
+
+def _matches_all(metadata: Dict, filters: Dict) -> bool:
+    for key, filter_value in filters.items():
+        if key not in metadata:
+            return False
+        meta_value = metadata[key]
+        if isinstance(filter_value, dict):
+            if "$gte" in filter_value and meta_value < filter_value["$gte"]:
+                return False
+            if "$gt" in filter_value and meta_value <= filter_value["$gt"]:
+                return False
+            if "$lte" in filter_value and meta_value > filter_value["$lte"]:
+                return False
+            if "$lt" in filter_value and meta_value >= filter_value["$lt"]:
+                return False
+            if "$in" in filter_value and meta_value not in filter_value["$in"]:
+                return False
+            if "$contains" in filter_value:
+                needle = filter_value["$contains"]
+                if isinstance(meta_value, list):
+                    if needle not in meta_value:
+                        return False
+                else:
+                    if needle not in str(meta_value):
+                        return False
+        else:
+            if meta_value != filter_value:
+                return False
+    return True
+
+
+def normalize_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize string filter values like insert_docs() normalizes stored metadata."""
+
+    def norm(value):
+        return normalize_text(value) if isinstance(value, str) else value
+
+    out: Dict[str, Any] = {}
+    for key, cond in filters.items():
+        if isinstance(cond, dict):
+            out[key] = {
+                op: [norm(v) for v in value]
+                if op == "$in" and isinstance(value, (list, tuple))
+                else norm(value)
+                for op, value in cond.items()
+            }
+        else:
+            out[key] = norm(cond)
+    return out
+
+
+_SCALARS = (str, int, float)
+_RANGE_OPS = {"$gte": ">=", "$gt": ">", "$lte": "<=", "$lt": "<"}
+
+
+def _metadata_path(key: str) -> str:
+    """SQL literal of the JSON path to top-level metadata key `key`."""
+    return "'%s'" % ('$."%s"' % key).replace("'", "''")
+
+
+def _metadata_filter_sql(filters: Dict[str, Any]) -> Tuple[str, List[Any], bool]:
+    """Translate `filters` (see matches_filters) into a WHERE fragment on `docs d`.
+
+    Returns (sql, params, exact). When `exact` is False the fragment selects a
+    superset of the matching docs and rows must be re-checked with matches_filters.
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+    exact = True
+    for key, cond in filters.items():
+        if '"' in key:
+            # Not expressible as a JSON path; matched in Python only
+            exact = False
+            continue
+        path = _metadata_path(key)
+        # Same expression as the metadata indexes, so the planner can use them
+        expr = f"json_extract(d.metadata_json, {path})"
+        kind = f"json_type(d.metadata_json, {path})"
+        clauses.append(f"{kind} IS NOT NULL")
+        if not isinstance(cond, dict):
+            if cond is None:
+                clauses.append(f"{kind} = 'null'")
+            elif isinstance(cond, _SCALARS):
+                # JSON arrays/objects come back as text and must not equal a string
+                clauses.append(f"{kind} NOT IN ('array', 'object') AND {expr} = ?")
+                params.append(cond)
+            else:
+                exact = False
+            continue
+        for op, sql_op in _RANGE_OPS.items():
+            if op not in cond:
+                continue
+            bound = cond[op]
+            if isinstance(bound, str):
+                clauses.append(f"{kind} = 'text' AND {expr} {sql_op} ?")
+            elif isinstance(bound, _SCALARS):
+                clauses.append(
+                    f"{kind} IN ('integer', 'real', 'true', 'false') AND {expr} {sql_op} ?"
+                )
+            else:
+                exact = False
+                continue
+            params.append(bound)
+        if "$in" in cond:
+            values = cond["$in"]
+            if isinstance(values, (list, tuple)) and all(
+                v is None or isinstance(v, _SCALARS) for v in values
+            ):
+                scalars = [v for v in values if v is not None]
+                options = [f"{kind} = 'null'"] if len(scalars) < len(values) else []
+                if scalars:
+                    options.append(
+                        f"({kind} NOT IN ('array', 'object') AND {expr} IN "
+                        f"({','.join('?' for _ in scalars)}))"
+                    )
+                    params.extend(scalars)
+                clauses.append("(" + (" OR ".join(options) or "0") + ")")
+            else:
+                exact = False
+        if "$contains" in cond:
+            needle = cond["$contains"]
+            if isinstance(needle, _SCALARS):
+                # Arrays and strings are matched here; other types in Python
+                clauses.append(
+                    f"CASE {kind} "
+                    f"WHEN 'array' THEN EXISTS (SELECT 1 FROM json_each(d.metadata_json, {path}) WHERE value = ?) "
+                    f"WHEN 'text' THEN instr({expr}, ?) > 0 "
+                    "ELSE 1 END"
+                )
+                params.extend([needle, str(needle)])
+            exact = False
+    return " AND ".join(clauses) or "1", params, exact
+
+
 def _ensure_fts5(conn):
     """
     Ensure that the current sqlite3 build supports FTS5.
@@ -156,6 +311,7 @@ class SQLiteStore:
         self.conn.execute("PRAGMA journal_mode=WAL;")
         self.conn.execute("PRAGMA synchronous=NORMAL;")
         self.conn.executescript(SCHEMA)
+        self._indexed_fields = set()
         # Try to create the dedupe index, but ignore errors if existing data violates it
         try:
             self.conn.execute(
@@ -167,6 +323,10 @@ class SQLiteStore:
         except sqlite3.IntegrityError:
             # Existing DB may contain duplicates; keep working, just skip enforcing
             pass
+        # Databases built before vectors recorded the hash of the embedded text
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(vectors)")}
+        if "text_hash" not in columns:
+            self.conn.execute("ALTER TABLE vectors ADD COLUMN text_hash TEXT")
         self.conn.commit()
 
     # ---- Collections ----
@@ -284,6 +444,106 @@ class SQLiteStore:
             )
         return results
 
+    # Docs with no vector, or whose text changed since it was embedded. Rows
+    # written before vectors.text_hash existed (NULL) count as up to date.
+    _TO_EMBED_SQL = """
+        FROM docs d
+        LEFT JOIN vectors v ON v.doc_id = d.id
+        WHERE d.collection = ?
+          AND (v.doc_id IS NULL
+               OR (v.text_hash IS NOT NULL AND v.text_hash IS NOT d.text_hash))
+    """
+
+    def count_docs(self, collection: str) -> int:
+        """Number of docs in `collection`."""
+        cur = self.conn.execute(
+            "SELECT COUNT(*) FROM docs WHERE collection=?", (collection,)
+        )
+        return cur.fetchone()[0]
+
+    def count_docs_to_embed(self, collection: str) -> int:
+        """Number of docs in `collection` that iter_docs_to_embed() would yield."""
+        cur = self.conn.execute("SELECT COUNT(*) " + self._TO_EMBED_SQL, (collection,))
+        return cur.fetchone()[0]
+
+    def iter_docs_to_embed(
+        self, collection: str, batch_size: int = 256
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield batches of docs that still need an embedding, in id order.
+
+        Pages by id (keyset pagination), so each batch is one indexed query and
+        docs embedded meanwhile through another connection are not re-read.
+
+        Yields
+        ------
+        List[dict]
+            Each with {id, text, text_hash}.
+        """
+
+        last_id = 0
+        while True:
+            cur = self.conn.execute(
+                "SELECT d.id, d.text, d.text_hash "
+                + self._TO_EMBED_SQL
+                + " AND d.id > ? ORDER BY d.id LIMIT ?",
+                (collection, last_id, batch_size),
+            )
+            rows = cur.fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [
+                {"id": doc_id, "text": text, "text_hash": text_hash}
+                for doc_id, text, text_hash in rows
+            ]
+
+    def index_metadata_fields(self, fields: Iterable[str]):
+        """Index top-level metadata keys so filters on them avoid a full scan.
+
+        Called when a datastore is built (see build_collection's
+        `metadata_index_fields`), never from the query path: filters on other keys
+        scan the collection. Indexes are shared by all collections of the database
+        and persist with it; creating one that exists is a no-op. Failures (e.g. a
+        read-only database) only cost speed, so they are ignored.
+        """
+        for key in fields:
+            if '"' in key or key in self._indexed_fields:
+                continue
+            name = "idx_docs_meta_" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+            try:
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {name} "
+                    f"ON docs(collection, json_extract(metadata_json, {_metadata_path(key)}))"
+                )
+                self.conn.commit()
+            except sqlite3.OperationalError:
+                pass
+            self._indexed_fields.add(key)
+
+    def filter_doc_ids(self, collection: str, filters: Dict[str, Any]) -> List[int]:
+        """Ids of the docs in `collection` whose metadata matches `filters`.
+
+        Filters use the syntax of matches_filters(); string values are compared in
+        normalized form, like the stored metadata. They run as SQL, using the
+        indexes of keys passed to index_metadata_fields and scanning otherwise;
+        conditions SQL cannot decide exactly are re-checked in Python on the
+        remaining candidates. Nothing is written to the database.
+        """
+        filters = normalize_filters(filters)
+        where, params, exact = _metadata_filter_sql(filters)
+        cur = self.conn.execute(
+            f"SELECT d.id, {'NULL' if exact else 'd.metadata_json'} FROM docs d "
+            f"WHERE d.collection=? AND {where}",
+            [collection, *params],
+        )
+        if exact:
+            return [doc_id for doc_id, _ in cur]
+        return [
+            doc_id
+            for doc_id, meta_json in cur
+            if matches_filters(json.loads(meta_json) if meta_json else {}, filters)
+        ]
+
     def fetch_random_docs(self, collection: str, n: int = 5):
         """Return `n` random docs from a collection for sampling/demo."""
         cur = self.conn.execute(
@@ -300,7 +560,12 @@ class SQLiteStore:
         return results
 
     def search_keyword(
-        self, collection: str, query: str, limit: int = 5, use_norm: bool = True
+        self,
+        collection: str,
+        query: str,
+        limit: int = 5,
+        use_norm: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
     ):
         """FTS5 keyword search on `text_norm` (or `text` if use_norm=False).
 
@@ -310,11 +575,14 @@ class SQLiteStore:
             Free-text query; sanitized for FTS via safe_for_fts().
         limit : int
             Max rows to return.
+        filters : dict, optional
+            Metadata filters (see filter_doc_ids) applied before the limit.
 
         Returns
         -------
         List[dict]
-            Each with {id, doc_key, text, metadata}.
+            Each with {id, doc_key, text, metadata, bm25}, best match first. `bm25` is
+            the FTS5 rank of the row (more negative = more relevant).
         """
 
         safe_query = safe_for_fts(query)
@@ -322,25 +590,45 @@ class SQLiteStore:
             return []
         field = "text_norm" if use_norm else "text"
         fts_query = f'{field}:"{safe_query}"'
+        where, params, exact = "1", [], True
+        if filters:
+            filters = normalize_filters(filters)
+            where, params, exact = _metadata_filter_sql(filters)
 
         with self.conn:
             cur = self.conn.execute(
-                """
-                SELECT d.id, d.doc_key, d.text, d.metadata_json
+                f"""
+                SELECT d.id, d.doc_key, d.text, d.metadata_json, docs_fts.rank
                 FROM docs_fts
                 JOIN docs d ON d.id = docs_fts.rowid
-                WHERE docs_fts MATCH ?
-                LIMIT ?
+                WHERE docs_fts MATCH ? AND d.collection = ? AND {where}
+                ORDER BY docs_fts.rank
+                {"LIMIT ?" if exact else ""}
                 """,
-                (fts_query, limit),
+                [fts_query, collection, *params] + ([limit] if exact else []),
             )
-            rows = cur.fetchall()
+            if exact:
+                rows = cur.fetchall()
+            else:
+                rows = []
+                for row in cur:
+                    meta = json.loads(row[3]) if row[3] else {}
+                    if matches_filters(meta, filters):
+                        rows.append(row)
+                        if len(rows) >= limit:
+                            break
 
         results = []
-        for doc_id, doc_key, text, meta_json in rows:
+        for doc_id, doc_key, text, meta_json, rank in rows:
             meta = json.loads(meta_json) if meta_json else {}
             results.append(
-                {"id": doc_id, "doc_key": doc_key, "text": text, "metadata": meta}
+                {
+                    "id": doc_id,
+                    "doc_key": doc_key,
+                    "text": text,
+                    "metadata": meta,
+                    "bm25": rank,
+                }
             )
         return results
 
@@ -3,15 +3,20 @@ VectorStore: FAISS index management for per-collection embeddings.
 
 This module encapsulates a single FAISS index per collection:
 - Path convention: <user_cache_dir>/embeddings/<collection>.faiss (same base path as the SQLite file)
-- Similarity: IndexFlatIP (inner product). With L2-normalized embeddings, IP ≈ cosine similarity.
+- Similarity: inner product. With L2-normalized embeddings, IP ≈ cosine similarity.
+- Index types: exact IndexFlatIP (default) or approximate IVF-Flat, IVF-PQ and HNSW indexes
+  (see resolve_index_spec). Approximate indexes trade recall for speed on large collections;
+  nprobe (IVF) and efSearch (HNSW) tune that trade-off per query.
 - Mapping: you pass (doc_ids, vectors) in the same order; FAISS IDs are aligned to doc_ids internally.
 
 Responsibilities
 ---------------
 - Create/load a FAISS index with the correct dimensionality.
-- Add new embeddings (append-only).
-- Query nearest neighbors given a query vector.
+- Add new embeddings (append-only), optionally deferring disk writes to checkpoint().
+- Query nearest neighbors given a query vector, optionally restricted to a set of doc_ids
+  (metadata pre-filtering).
 - Persist the index to disk.
+- Measure recall/latency of approximate indexes against the exact one (benchmark_index_types).
 
 See also
 --------
@@ -21,19 +26,170 @@ See also
 """
 
 import faiss
+import math
 import numpy as np
 import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict
+from typing import Any, List, Tuple, Optional, Dict, Sequence
 from tooluniverse.utils import get_user_cache_dir
 import os
 
+# Recorded in the `collections` table for exact (brute-force) indexes
+FLAT_INDEX_TYPE = "IndexFlatIP"
+INDEX_TYPES = ("flat", "ivf_flat", "ivf_pq", "hnsw")
+
+# Query-time defaults written into new approximate indexes
+DEFAULT_NPROBE = 16
+DEFAULT_EF_SEARCH = 64
+DEFAULT_HNSW_M = 32
+
+# Filtered searches with at most this many candidates score them exactly
+EXACT_FILTER_MAX = 4096
+
+
+def _ivf_nlist(n_train: int) -> int:
+    # ~4*sqrt(N) lists, with the 39 training points per list FAISS asks for
+    return max(1, min(int(4 * math.sqrt(max(n_train, 1))), n_train // 39))
+
+
+def _pq_subquantizers(dim: int) -> int:
+    # Largest divisor of dim giving sub-vectors of at least 4 dims, capped at 64 bytes/code
+    target = max(1, min(64, dim // 4))
+    return next(m for m in range(target, 0, -1) if dim % m == 0)
+
+
+def _pq_nbits(n_train: int) -> int:
+    # Up to 8 bits per sub-quantizer, keeping 39 training points per centroid
+    return max(1, min(8, int(math.log2(max(n_train // 39, 2)))))
+
+
+def resolve_index_spec(index_type: Optional[str], dim: int, n_train: int) -> str:
+    """Turn an index type name into a FAISS factory string sized for the data.
+
+    Parameters
+    ----------
+    index_type : {"flat", "ivf_flat", "ivf_pq", "hnsw"} or a factory string
+        Names are sized from `n_train` (the number of vectors available for
+        training); factory strings such as "IVF1024,PQ32" and
+        "IndexFlatIP" are returned unchanged.
+    dim : int
+        Embedding dimension.
+    n_train : int
+        Number of training vectors (IVF lists and PQ codebooks need enough of them).
+    """
+    if not index_type or index_type in ("flat", FLAT_INDEX_TYPE, "Flat"):
+        return FLAT_INDEX_TYPE
+    if index_type == "ivf_flat":
+        return f"IVF{_ivf_nlist(n_train)},Flat"
+    if index_type == "ivf_pq":
+        return (
+            f"IVF{_ivf_nlist(n_train)},PQ{_pq_subquantizers(dim)}x{_pq_nbits(n_train)}"
+        )
+    if index_type == "hnsw":
+        return f"HNSW{DEFAULT_HNSW_M}"
+    if index_type.startswith(("IVF", "HNSW", "PQ", "OPQ")):
+        return index_type
+    raise ValueError(
+        f"Unknown index type '{index_type}'; expected one of {INDEX_TYPES} or a FAISS factory string"
+    )
+
+
+def index_kind(spec: Optional[str]) -> str:
+    """Coarse family ("flat", "ivf_flat", "ivf_pq", "hnsw") of an index type or factory string."""
+    if not spec or spec in INDEX_TYPES:
+        return spec or "flat"
+    if spec.startswith("IVF"):
+        return "ivf_pq" if ",PQ" in spec else "ivf_flat"
+    if spec.startswith("HNSW"):
+        return "hnsw"
+    return "flat"
+
+
+def describe_index(index: faiss.Index) -> str:
+    """Factory-style description of a FAISS index, as recorded in `collections.index_type`."""
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        ivf = faiss.downcast_index(ivf)
+        if isinstance(ivf, faiss.IndexIVFPQ):
+            return f"IVF{ivf.nlist},PQ{ivf.pq.M}x{ivf.pq.nbits}"
+        return f"IVF{ivf.nlist},Flat"
+    if isinstance(index, faiss.IndexHNSW):
+        return f"HNSW{index.hnsw.nb_neighbors(1)}"
+    if isinstance(index, faiss.IndexFlatIP):
+        return FLAT_INDEX_TYPE
+    return type(index).__name__
+
+
+def create_index(spec: str, dim: int) -> faiss.Index:
+    """Create an empty inner-product index from a factory string (see resolve_index_spec)."""
+    if spec == FLAT_INDEX_TYPE:
+        return faiss.IndexFlatIP(dim)
+    index = faiss.index_factory(dim, spec, faiss.METRIC_INNER_PRODUCT)
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        ivf.nprobe = min(DEFAULT_NPROBE, ivf.nlist)
+        ivf = faiss.downcast_index(ivf)
+    for pq_index in (ivf, faiss.downcast_index(index)):
+        if isinstance(pq_index, (faiss.IndexIVFPQ, faiss.IndexPQ)):
+            # Polysemous codes only serve Hamming-distance filtering, which
+            # searches never use, and make training orders of magnitude slower
+            pq_index.do_polysemous_training = False
+    if isinstance(index, faiss.IndexHNSW):
+        index.hnsw.efSearch = DEFAULT_EF_SEARCH
+    return index
+
+
+def _search_params(
+    index: faiss.Index,
+    nprobe: Optional[int],
+    ef_search: Optional[int],
+    selector: Optional[Any] = None,
+    selectivity: float = 1.0,
+) -> Optional[Any]:
+    # Per-call parameters, so concurrent searches with different settings do not interfere.
+    # A selector hides most of the index, so probe proportionally more of it.
+    extra = {"sel": selector} if selector is not None else {}
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None and (nprobe or selector is not None):
+        probe = math.ceil((nprobe or ivf.nprobe) / selectivity)
+        return faiss.SearchParametersIVF(nprobe=int(min(ivf.nlist, probe)), **extra)
+    if isinstance(index, faiss.IndexHNSW) and (ef_search or selector is not None):
+        ef = ef_search or index.hnsw.efSearch
+        ef = max(ef, min(math.ceil(ef / selectivity), index.ntotal))
+        return faiss.SearchParametersHNSW(efSearch=int(ef), **extra)
+    if selector is not None:
+        return faiss.SearchParameters(**extra)
+    return None
+
+
+def _exact_search(
+    index: faiss.Index, queries: np.ndarray, positions: np.ndarray, top_k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Score `queries` against the vectors stored at `positions` only.
+
+    PQ indexes reconstruct approximate vectors, so their scores stay approximate.
+    """
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None and ivf.direct_map.type == faiss.DirectMap.NoMap:
+        # IVF lists must be able to locate a vector by position to reconstruct it
+        ivf.make_direct_map()
+    scores = queries @ index.reconstruct_batch(positions).T
+    order = np.argsort(-scores, axis=1, kind="stable")[:, :top_k]
+    return np.take_along_axis(scores, order, axis=1), positions[order]
+
 
 class VectorStore:
-    """Manage FAISS indices per collection, persisted under the user cache dir (<user_cache_dir>/embeddings)."""
+    """Manage FAISS indices per collection, persisted under the user cache dir (<user_cache_dir>/embeddings).
+
+    Searches may run from several threads at once (see SearchEngine); the shared
+    connection and the in-memory caches are guarded by a lock.
+    """
 
     def __init__(self, db_path: str, data_dir: str | None = None):
-        self.db = sqlite3.connect(db_path)
+        self.db = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.RLock()
         if data_dir is None:
             data_dir = os.path.join(get_user_cache_dir(), "embeddings")
         self.data_dir = Path(data_dir)
@@ -41,29 +197,47 @@ class VectorStore:
         # keep active indexes in memory
         self.indexes: Dict[str, faiss.Index] = {}
         self.dimensions: Dict[str, int] = {}
+        # faiss_idx -> doc_id (-1 where unmapped), read once per collection
+        self.doc_ids: Dict[str, np.ndarray] = {}
 
     def _get_index_path(self, collection: str) -> Path:
         return self.data_dir / f"{collection}.faiss"
 
-    def load_index(self, collection: str, dim: int, reset: bool = False) -> faiss.Index:
+    def load_index(
+        self,
+        collection: str,
+        dim: int,
+        reset: bool = False,
+        index_type: str = FLAT_INDEX_TYPE,
+    ) -> faiss.Index:
         """
-        Load or create a FAISS IndexFlatIP for the collection, asserting dimension consistency.
-        If reset=True, always create a fresh index and overwrite any existing file.
+        Load or create a FAISS index for the collection, asserting dimension consistency.
+        New indexes are built from `index_type` (a factory string from resolve_index_spec;
+        IndexFlatIP by default); an existing index file keeps its own type.
+        If reset=True, always create a fresh index and overwrite any existing file; the
+        collection's (doc_id ↔ faiss_idx) rows are dropped with it.
         """
         path = self._get_index_path(collection)
 
-        if reset or not path.exists():
-            index = faiss.IndexFlatIP(dim)
-            faiss.write_index(index, str(path))
-        else:
-            index = faiss.read_index(str(path))
-            # in load_index(...)
-            if index.d != dim:
-                raise ValueError(
-                    f"Existing FAISS index dim={index.d} does not match requested dim={dim} for collection '{collection}'"
-                )
-        self.indexes[collection] = index
-        self.dimensions[collection] = dim
+        with self._lock:
+            if reset or not path.exists():
+                index = create_index(index_type, dim)
+                faiss.write_index(index, str(path))
+                if reset:
+                    self.db.execute(
+                        "DELETE FROM vectors WHERE collection=?", (collection,)
+                    )
+                    self.db.commit()
+                    self.doc_ids.pop(collection, None)
+            else:
+                index = faiss.read_index(str(path))
+                # in load_index(...)
+                if index.d != dim:
+                    raise ValueError(
+                        f"Existing FAISS index dim={index.d} does not match requested dim={dim} for collection '{collection}'"
+                    )
+            self.indexes[collection] = index
+            self.dimensions[collection] = dim
         return index
 
     # def save_index(self, collection: str):
@@ -81,16 +255,45 @@ class VectorStore:
             raise ValueError(f"No index loaded for {collection}")
         faiss.write_index(self.indexes[collection], str(path))
 
+    def checkpoint(self, collection: str):
+        """Write the index, then commit the mappings added since the last checkpoint.
+
+        In this order an interruption can leave vectors without a mapping (never
+        returned by searches) but never a mapping without its vector.
+        """
+        self.save_index(collection)
+        self.db.commit()
+
+    def drop_stale_mappings(self, collection: str) -> int:
+        """Delete mappings that point past the end of the index on disk.
+
+        They are left behind when an index file is removed or replaced by an
+        older copy. Returns the number of rows deleted.
+        """
+        index = self.indexes[collection]
+        cur = self.db.execute(
+            "DELETE FROM vectors WHERE collection=? AND faiss_idx >= ?",
+            (collection, index.ntotal),
+        )
+        self.db.commit()
+        self.doc_ids.pop(collection, None)
+        return cur.rowcount
+
     def add_embeddings(
         self,
         collection: str,
         doc_ids: List[int],
         embeddings: np.ndarray,
         dim: Optional[int] = None,
+        text_hashes: Optional[List[str]] = None,
+        persist: bool = True,
     ):
         """Append embeddings to a collection index and record (doc_id ↔ faiss_idx) in SQLite.
 
         Expects embeddings to be float32 and L2-normalized (caller responsibility).
+        `text_hashes` records which version of each doc was embedded. With
+        persist=False nothing is written until checkpoint() is called, so bulk
+        loads do not rewrite the whole index file for every batch.
         """
 
         if dim is None:
@@ -104,59 +307,236 @@ class VectorStore:
             )
 
         start_id = index.ntotal
+        # Replaced rows orphan the docs' previous positions; re-read on next search
+        self.doc_ids.pop(collection, None)
+        if not index.is_trained:
+            # IVF/PQ indexes learn their partitions from the first vectors added
+            index.train(embeddings.astype("float32"))
         index.add(embeddings.astype("float32"))
-        self.save_index(collection)
 
         # record mapping in SQLite
-        cur = self.db.cursor()
-        for i, doc_id in enumerate(doc_ids):
-            faiss_idx = start_id + i
-            cur.execute(
+        if text_hashes is None:
+            self.db.executemany(
                 """
                 INSERT OR REPLACE INTO vectors (doc_id, collection, faiss_idx)
                 VALUES (?, ?, ?)
                 """,
-                (doc_id, collection, faiss_idx),
+                [
+                    (doc_id, collection, start_id + i)
+                    for i, doc_id in enumerate(doc_ids)
+                ],
             )
-        self.db.commit()
+        else:
+            self.db.executemany(
+                """
+                INSERT OR REPLACE INTO vectors (doc_id, collection, faiss_idx, text_hash)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (doc_id, collection, start_id + i, text_hash)
+                    for i, (doc_id, text_hash) in enumerate(zip(doc_ids, text_hashes))
+                ],
+            )
+        if persist:
+            self.checkpoint(collection)
+
+    def _doc_id_map(self, collection: str, ntotal: int) -> np.ndarray:
+        """Array mapping every faiss_idx of the collection to its doc_id (-1 if none).
+
+        Loaded with one query and kept until the collection's mappings change; an
+        index that grew on disk (e.g. rebuilt by another process) triggers a reload.
+        """
+        with self._lock:
+            doc_ids = self.doc_ids.get(collection)
+            if doc_ids is None or len(doc_ids) != ntotal:
+                rows = self.db.execute(
+                    "SELECT faiss_idx, doc_id FROM vectors WHERE collection=? AND faiss_idx < ?",
+                    (collection, ntotal),
+                ).fetchall()
+                doc_ids = np.full(ntotal, -1, dtype=np.int64)
+                if rows:
+                    positions, ids = np.asarray(rows, dtype=np.int64).T
+                    doc_ids[positions] = ids
+                self.doc_ids[collection] = doc_ids
+        return doc_ids
 
     def search_embeddings(
         self,
         collection: str,
         query_vector: np.ndarray,
         top_k: int = 10,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        doc_ids: Optional[Sequence[int]] = None,
     ) -> List[Tuple[int, float]]:
         """Nearest-neighbor search; returns [(doc_id, score), ...] in descending score order.
 
-        Requires load_index() to have been called for the collection.
+        Requires load_index() to have been called for the collection. `nprobe` (IVF
+        indexes) and `ef_search` (HNSW) override the index's defaults for this call;
+        higher values raise recall and latency. They are ignored by flat indexes.
+        `doc_ids` restricts the search to those documents (e.g. the ids matching a
+        metadata filter, see SQLiteStore.filter_doc_ids).
+        """
+        query_vector = np.asarray(query_vector)
+        if query_vector.ndim == 1:
+            query_vector = query_vector[np.newaxis, :]
+        return self.search_embeddings_batch(
+            collection,
+            query_vector[:1],
+            top_k=top_k,
+            nprobe=nprobe,
+            ef_search=ef_search,
+            doc_ids=doc_ids,
+        )[0]
+
+    def search_embeddings_batch(
+        self,
+        collection: str,
+        query_vectors: np.ndarray,
+        top_k: int = 10,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        doc_ids: Optional[Sequence[int]] = None,
+    ) -> List[List[Tuple[int, float]]]:
+        """Search several queries (shape (Q, D)) with one FAISS call.
+
+        Returns one [(doc_id, score), ...] list per query, in query order. See
+        search_embeddings() for `nprobe`, `ef_search` and `doc_ids`.
+
+        With `doc_ids`, up to EXACT_FILTER_MAX candidates are scored exactly;
+        larger candidate sets are searched through a FAISS ID selector, with
+        nprobe/efSearch raised in proportion to the fraction of the index excluded.
         """
 
         # auto-load index if present on disk
-        if collection not in self.indexes:
-            path = self._get_index_path(collection)
-            if path.exists():
-                index = faiss.read_index(str(path))
-                self.indexes[collection] = index
-                self.dimensions[collection] = index.d
+        with self._lock:
+            if collection not in self.indexes:
+                path = self._get_index_path(collection)
+                if path.exists():
+                    index = faiss.read_index(str(path))
+                    self.indexes[collection] = index
+                    self.dimensions[collection] = index.d
+                else:
+                    raise ValueError(
+                        f"Index not loaded for {collection}. Call load_index() first."
+                    )
+            index = self.indexes[collection]
+
+        queries = np.ascontiguousarray(np.atleast_2d(query_vectors), dtype="float32")
+        if index.ntotal == 0:
+            return [[] for _ in range(len(queries))]
+        id_map = self._doc_id_map(collection, index.ntotal)
+        if doc_ids is None:
+            params = _search_params(index, nprobe, ef_search)
+            scores, ids = index.search(queries, top_k, params=params)
+        else:
+            positions = np.flatnonzero(np.isin(id_map, np.asarray(doc_ids, "int64")))
+            if len(positions) == 0:
+                return [[] for _ in range(len(queries))]
+            if len(positions) <= EXACT_FILTER_MAX:
+                # may build the IVF direct map, which mutates the index
+                with self._lock:
+                    scores, ids = _exact_search(index, queries, positions, top_k)
             else:
-                raise ValueError(
-                    f"Index not loaded for {collection}. Call load_index() first."
+                selector = faiss.IDSelectorBatch(positions)
+                params = _search_params(
+                    index, nprobe, ef_search, selector, len(positions) / index.ntotal
                 )
+                scores, ids = index.search(queries, top_k, params=params)
+        # Map faiss_idx back to doc_id (FAISS pads missing neighbors with -1)
+        hits = np.where(ids >= 0, id_map[ids], -1)
+        return [
+            [
+                (doc_id, score)
+                for doc_id, score in zip(row_ids.tolist(), row_scores.tolist())
+                if doc_id >= 0
+            ]
+            for row_ids, row_scores in zip(hits, scores)
+        ]
 
-        index = self.indexes[collection]
-        if query_vector.ndim == 1:
-            query_vector = query_vector[np.newaxis, :]
-        scores, ids = index.search(query_vector.astype("float32"), top_k)
-        # Map faiss_idx back to doc_id
-        cur = self.db.cursor()
-        results: List[Tuple[int, float]] = []
-        for faiss_idx, score in zip(ids[0], scores[0]):
-            if faiss_idx == -1:
-                continue
-            row = cur.execute(
-                "SELECT doc_id FROM vectors WHERE collection=? AND faiss_idx=?",
-                (collection, int(faiss_idx)),
-            ).fetchone()
-            if row:
-                results.append((row[0], float(score)))
-        return results
+
+def benchmark_index_types(
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    index_types: Sequence[str] = ("ivf_flat", "ivf_pq", "hnsw"),
+    top_k: int = 10,
+    nprobe_values: Sequence[int] = (1, 4, 16, 64),
+    ef_search_values: Sequence[int] = (16, 64, 256),
+    train_size: int = 20000,
+) -> List[Dict[str, Any]]:
+    """Compare approximate indexes with the exact IndexFlatIP on the same vectors.
+
+    Builds each index in memory (training on up to `train_size` vectors), then
+    measures recall@top_k against the flat index's results and the mean
+    latency per query for every nprobe (IVF) or efSearch (HNSW) setting.
+
+    Returns
+    -------
+    List[dict]
+        One row per setting: {index_type, param, value, recall, ms_per_query, build_seconds}.
+        The first row is the flat baseline (recall 1.0).
+    """
+    vectors = np.ascontiguousarray(vectors, dtype="float32")
+    queries = np.ascontiguousarray(queries, dtype="float32")
+    dim = vectors.shape[1]
+
+    def _timed_search(index, params):
+        started = time.perf_counter()
+        _, ids = index.search(queries, top_k, params=params)
+        return ids, (time.perf_counter() - started) * 1000 / len(queries)
+
+    started = time.perf_counter()
+    flat = create_index(FLAT_INDEX_TYPE, dim)
+    flat.add(vectors)
+    flat_build = time.perf_counter() - started
+    truth, flat_ms = _timed_search(flat, None)
+    truth_sets = [set(row[row >= 0]) for row in truth]
+    rows: List[Dict[str, Any]] = [
+        {
+            "index_type": FLAT_INDEX_TYPE,
+            "param": None,
+            "value": None,
+            "recall": 1.0,
+            "ms_per_query": flat_ms,
+            "build_seconds": flat_build,
+        }
+    ]
+
+    rng = np.random.default_rng(0)
+    for index_type in index_types:
+        n_train = min(train_size, len(vectors))
+        spec = resolve_index_spec(index_type, dim, n_train)
+        started = time.perf_counter()
+        index = create_index(spec, dim)
+        if not index.is_trained:
+            sample = rng.choice(len(vectors), size=n_train, replace=False)
+            index.train(vectors[np.sort(sample)])
+        index.add(vectors)
+        build_seconds = time.perf_counter() - started
+
+        if faiss.try_extract_index_ivf(index) is not None:
+            param, values = "nprobe", nprobe_values
+        else:
+            param, values = "efSearch", ef_search_values
+        for value in values:
+            params = _search_params(
+                index,
+                value if param == "nprobe" else None,
+                value if param == "efSearch" else None,
+            )
+            ids, ms = _timed_search(index, params)
+            hits = sum(
+                len(truth_sets[i] & set(row[row >= 0])) for i, row in enumerate(ids)
+            )
+            total = sum(len(t) for t in truth_sets) or 1
+            rows.append(
+                {
+                    "index_type": spec,
+                    "param": param,
+                    "value": value,
+                    "recall": hits / total,
+                    "ms_per_query": ms,
+                    "build_seconds": build_seconds,
+                }
+            )
+    return rows
@@ -1,21 +1,188 @@
 import pandas as pd
+import numpy as np
 import os
+import re
+import threading
 from copy import deepcopy
 from .base_tool import BaseTool
+from .text_index import TextIndex
 from .utils import download_from_hf
 from .tool_registry import register_tool
 
+_REGEX_META = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+_TEXT_READERS = {
+    ".csv": pd.read_csv,
+    ".tsv": lambda path: pd.read_csv(path, sep="\t"),
+    ".txt": lambda path: pd.read_table(path, sep="\t"),
+    ".xlsx": pd.read_excel,
+}
+
+# Datasets shared by every DatasetTool in the process, keyed by source
+_DATASET_CACHE = {}
+_DATASET_CACHE_LOCK = threading.Lock()
+
+
+def _resolve_local_path(dataset_path):
+    # If relative path, make it relative to the project root
+    if not os.path.isabs(dataset_path):
+        # Go up from src/tooluniverse to project root
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        dataset_path = os.path.join(project_root, dataset_path)
+    return dataset_path
+
+
+def _dataset_source_key(tool_config):
+    """Identify the dataset a tool config points to (None if it has none)."""
+    if "hf_dataset_path" in tool_config:
+        hf = tool_config["hf_dataset_path"] or {}
+        return (
+            "hf",
+            hf.get("repo_id"),
+            hf.get("path_in_repo"),
+            hf.get("save_to_local_dir"),
+        )
+    if "local_dataset_path" in tool_config:
+        path = _resolve_local_path(tool_config["local_dataset_path"])
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return ("local", path, None, None)
+        return ("local", path, stat.st_mtime_ns, stat.st_size)
+    return None
+
+
+def _has_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _read_table(dataset_path):
+    """Read a dataset file, preferring memory-mapped Parquet/Arrow data.
+
+    Text and Excel files are converted once to a ``<file>.parquet`` sidecar
+    (when pyarrow is installed) that later loads read instead of re-parsing
+    the source. Set ``TOOLUNIVERSE_DATASET_PARQUET_CACHE=false`` to disable.
+    """
+    ext = os.path.splitext(dataset_path)[1].lower()
+    if ext == ".parquet":
+        if _has_pyarrow():
+            return pd.read_parquet(dataset_path, memory_map=True)
+        return pd.read_parquet(dataset_path)
+    if ext in (".feather", ".arrow"):
+        from pyarrow import feather
+
+        return feather.read_table(dataset_path, memory_map=True).to_pandas()
+    if ext == ".pkl":
+        return pd.read_pickle(dataset_path)
+    if ext not in _TEXT_READERS:
+        raise ValueError(f"Unsupported dataset format: {dataset_path}")
+
+    sidecar = dataset_path + ".parquet"
+    use_sidecar = (
+        os.getenv("TOOLUNIVERSE_DATASET_PARQUET_CACHE", "true").lower()
+        in ("true", "1", "yes")
+        and _has_pyarrow()
+    )
+    if (
+        use_sidecar
+        and os.path.exists(sidecar)
+        and os.path.getmtime(sidecar) >= os.path.getmtime(dataset_path)
+    ):
+        try:
+            return pd.read_parquet(sidecar, memory_map=True)
+        except Exception as e:
+            print(f"Ignoring unreadable dataset cache {sidecar}: {e}")
+
+    dataset = _TEXT_READERS[ext](dataset_path)
+    if use_sidecar:
+        tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+        try:
+            dataset.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, sidecar)
+        except Exception:
+            # Mixed-type columns or a read-only directory: keep the CSV path
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return dataset
+
+
+class _FieldIndex(TextIndex):
+    """Text index of one column, plus what the column holds."""
+
+    def __init__(self, name, column):
+        raw = column.tolist()
+        super().__init__([str(value) for value in raw])
+        self.is_text = all(type(value) is str for value in raw)
+        self.split_synonyms = name.lower() == "synonyms"
+
+
+class IndexedDataset:
+    """A loaded dataset shared between tools, with per-field search indexes."""
+
+    def __init__(self, frame):
+        self.frame = frame
+        self._fields = {}
+        self._lock = threading.Lock()
+
+    def field(self, name):
+        index = self._fields.get(name)
+        if index is None:
+            with self._lock:
+                index = self._fields.get(name)
+                if index is None:
+                    index = self._fields[name] = _FieldIndex(name, self.frame[name])
+        return index
+
+    def match(self, field, query, case_sensitive, exact_match):
+        """Return the set of rows matching ``query`` the way search does.
+
+        ``query`` must already be lowercased when ``case_sensitive`` is
+        False. Exact matches against a ``synonyms`` column compare each
+        ``|``-separated synonym.
+        """
+        index = self.field(field)
+        if exact_match:
+            exact = index.exact(case_sensitive, index.split_synonyms)
+            return set(exact.get(query, ()))
+        return set(index.substring(query, case_sensitive))
+
+    def contains(self, field, value):
+        """Rows whose text contains ``value`` ignoring case.
+
+        Returns None when the index cannot answer the same way as
+        ``Series.str.contains`` (regex patterns, non-text columns).
+        """
+        index = self.field(field)
+        if not index.is_text or _REGEX_META.search(value):
+            return None
+        return index.substring(value.lower(), case_sensitive=False)
+
+    def equals(self, field, value):
+        """Rows whose value equals ``value`` (None for non-text columns)."""
+        index = self.field(field)
+        if not index.is_text:
+            return None
+        return index.exact(True, False).get(value, [])
+
 
 @register_tool("DatasetTool")
 class DatasetTool(BaseTool):
     """
     Tool to search and filter the DrugBank vocabulary dataset.
     Provides functionality to search drugs by name, ID, synonyms and filter by various criteria.
+
+    Tools configured with the same dataset share one loaded copy and its
+    search indexes (see :class:`IndexedDataset`).
     """
 
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.dataset = None
+        self._index = None
         self.query_schema = tool_config[
             "query_schema"
         ]  # TODO: Move query_schema to BaseTool
@@ -25,7 +192,27 @@ class DatasetTool(BaseTool):
         self._load_dataset()
 
     def _load_dataset(self):
-        """Load the drugbank vocabulary CSV dataset."""
+        """Load the dataset, reusing a copy already loaded by another tool."""
+        source = _dataset_source_key(self.tool_config)
+        if source is None:
+            print("No dataset path provided in tool configuration")
+            self.dataset = pd.DataFrame()
+            return
+
+        with _DATASET_CACHE_LOCK:
+            shared = _DATASET_CACHE.get(source)
+            if shared is None:
+                dataset = self._read_dataset()
+                if dataset is None or dataset.empty:
+                    self.dataset = pd.DataFrame() if dataset is None else dataset
+                    return
+                shared = _DATASET_CACHE[source] = IndexedDataset(dataset)
+                print(f"Loaded dataset with {len(dataset)} records")
+        self._index = shared
+        self.dataset = shared.frame
+
+    def _read_dataset(self):
+        """Read the configured dataset file into a cleaned DataFrame."""
         try:
             if "hf_dataset_path" in self.tool_config:
                 # Download dataset from Hugging Face Hub
@@ -33,53 +220,27 @@ class DatasetTool(BaseTool):
 
                 if not result.get("success", False):
                     print(f"Failed to download dataset: {result.get('error')}")
-                    self.dataset = pd.DataFrame()
-                    return
+                    return None
 
                 # Load the downloaded CSV
                 dataset_path = result["local_path"]
 
-            elif "local_dataset_path" in self.tool_config:
-                dataset_path = self.tool_config["local_dataset_path"]
-
-                # If relative path, make it relative to the project root
-                if not os.path.isabs(dataset_path):
-                    # Go up from src/tooluniverse to project root
-                    project_root = os.path.dirname(
-                        os.path.dirname(os.path.dirname(__file__))
-                    )
-                    dataset_path = os.path.join(project_root, dataset_path)
-
             else:
-                print("No dataset path provided in tool configuration")
-                self.dataset = pd.DataFrame()
-                return
-
-            # Load the CSV file
-            if dataset_path.endswith(".csv"):
-                self.dataset = pd.read_csv(dataset_path)
-            elif dataset_path.endswith(".tsv"):
-                self.dataset = pd.read_csv(dataset_path, sep="\t")
-            elif dataset_path.endswith(".txt"):
-                self.dataset = pd.read_table(dataset_path, sep="\t")
-            elif dataset_path.endswith(".xlsx"):
-                self.dataset = pd.read_excel(dataset_path)
-            elif dataset_path.endswith(".pkl"):
-                self.dataset = pd.read_pickle(dataset_path)
-            elif dataset_path.endswith(".parquet"):
-                self.dataset = pd.read_parquet(dataset_path)
+                dataset_path = _resolve_local_path(
+                    self.tool_config["local_dataset_path"]
+                )
+
+            dataset = _read_table(dataset_path)
 
             # Clean column names
-            self.dataset.columns = self.dataset.columns.str.strip()
+            dataset.columns = dataset.columns.str.strip()
 
             # Fill NaN values with empty strings for better searching
-            self.dataset = self.dataset.fillna("")
-
-            print(f"Loaded dataset with {len(self.dataset)} records")
+            return dataset.fillna("")
 
         except Exception as e:
             print(f"Error loading dataset: {e}")
-            self.dataset = pd.DataFrame()
+            return None
 
     def run(self, arguments):
         """Main entry point for the tool."""
@@ -139,44 +300,16 @@ class DatasetTool(BaseTool):
         if not case_sensitive:
             query = query.lower()
 
-        results = []
-
-        for _, row in self.dataset.iterrows():
-            match_found = False
-            matched_fields = []
-
-            for field in search_fields:
-                if field not in self.dataset.columns:
-                    continue
-
-                field_value = str(row[field])
-                if not case_sensitive:
-                    field_value = field_value.lower()
-
-                if exact_match:
-                    # For synonyms, check each synonym separately
-                    if (
-                        field.lower() == "synonyms" and "|" in field_value
-                    ):  # TODO: rename correpsonding columns in each dataset to `synonyms` and use `|` to separate keywords
-                        synonyms = [s.strip() for s in field_value.split("|")]
-                        if query in synonyms:
-                            match_found = True
-                            matched_fields.append(field)
-                    elif query == field_value:
-                        match_found = True
-                        matched_fields.append(field)
-                else:
-                    if query in field_value:
-                        match_found = True
-                        matched_fields.append(field)
-
-            if match_found:
-                result_row = row.to_dict()
-                result_row["matched_fields"] = matched_fields
-                results.append(result_row)
-
-                if len(results) >= limit:
-                    break
+        fields = [f for f in search_fields or [] if f in self.dataset.columns]
+        matches = {
+            field: self._index.match(field, query, case_sensitive, exact_match)
+            for field in dict.fromkeys(fields)
+        }
+        rows = sorted(set().union(*matches.values()))[:limit]
+
+        results = self.dataset.iloc[rows].to_dict("records")
+        for row, result_row in zip(rows, results):
+            result_row["matched_fields"] = [f for f in fields if row in matches[f]]
 
         return {
             "query": arguments.get("query"),
@@ -230,28 +363,34 @@ class DatasetTool(BaseTool):
                 "error": f"'value' parameter is required for condition '{condition}'"
             }
 
-        filtered_data = self.dataset.copy()
+        column = self.dataset[field]
         applied_filter = ""
 
         try:
             if condition == "contains":
-                mask = filtered_data[field].str.contains(value, case=False, na=False)
+                rows = self._index.contains(field, value)
+                mask = (
+                    None
+                    if rows is not None
+                    else column.str.contains(value, case=False, na=False)
+                )
                 applied_filter = f"{field} contains '{value}'"
 
             elif condition == "starts_with":
-                mask = filtered_data[field].str.startswith(value, na=False)
+                mask = column.str.startswith(value, na=False)
                 applied_filter = f"{field} starts with '{value}'"
 
             elif condition == "ends_with":
-                mask = filtered_data[field].str.endswith(value, na=False)
+                mask = column.str.endswith(value, na=False)
                 applied_filter = f"{field} ends with '{value}'"
 
             elif condition == "exact":
-                mask = filtered_data[field] == value
+                rows = self._index.equals(field, value)
+                mask = None if rows is not None else column == value
                 applied_filter = f"{field} equals '{value}'"
 
             elif condition == "not_empty":
-                mask = (filtered_data[field] != "") & (filtered_data[field].notna())
+                mask = (column != "") & (column.notna())
                 applied_filter = f"{field} is not empty"
 
             else:
@@ -259,16 +398,17 @@ class DatasetTool(BaseTool):
                     "error": f"Unknown condition '{condition}'. Supported: contains, starts_with, ends_with, exact, not_empty"
                 }
 
-            filtered_data = filtered_data[mask]
+            if mask is not None:
+                rows = np.flatnonzero(mask.to_numpy(dtype=bool))
 
         except Exception as e:
             return {"error": f"Error applying filter: {str(e)}"}
 
         # Apply limit
-        results = filtered_data.head(limit).to_dict("records")
+        results = self.dataset.iloc[rows[:limit]].to_dict("records")
 
         return {
-            "total_matches": len(filtered_data),
+            "total_matches": len(rows),
             "returned_results": len(results),
             "results": results,
             "applied_filter": applied_filter,
@@ -7,6 +7,7 @@ it available as linked data. No API key is required.
 """
 
 import requests
+from .http_transport import http_get
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -46,7 +47,7 @@ class DBpediaSPARQLTool(BaseTool):
             "User-Agent": "ToolUniverse/1.0 (https://github.com)",
         }
         try:
-            resp = requests.get(
+            resp = http_get(
                 self.endpoint,
                 params={"query": sparql, "format": "json"},
                 headers=headers,
@@ -18,7 +18,7 @@ class EnsemblRESTTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://rest.ensembl.org"
-        self.session = requests.Session()
+        self.session = self.get_http_session()
         self.session.headers.update(
             {
                 "Accept": "application/json",
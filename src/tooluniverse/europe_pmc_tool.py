@@ -1,4 +1,4 @@
-import requests
+from .http_transport import http_get
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -32,7 +32,7 @@ class EuropePMCTool(BaseTool):
             "pageSize": limit,
             "format": "json",
         }
-        core_response = requests.get(self.base_url, params=core_params, timeout=20)
+        core_response = http_get(self.base_url, params=core_params, timeout=20)
 
         # Then try lite mode to get journal information
         lite_params = {
@@ -41,7 +41,7 @@ class EuropePMCTool(BaseTool):
             "pageSize": limit,
             "format": "json",
         }
-        lite_response = requests.get(self.base_url, params=lite_params, timeout=20)
+        lite_response = http_get(self.base_url, params=lite_params, timeout=20)
 
         if core_response.status_code != 200:
             return {
@@ -24,7 +24,9 @@ Constants:
     tool_type_mappings: Mapping of tool type strings to their implementation classes
 """
 
+import asyncio
 import copy
+import functools
 import inspect
 import json
 import random
@@ -64,7 +66,11 @@ from .logging_config import (
     set_log_level,
 )
 from .cache.result_cache_manager import ResultCacheManager
+from .cache.llm_cache import get_llm_cache
 from .output_hook import HookManager
+from .http_transport import aclose_async_http_session
+from .rate_limiter import get_rate_limiter, rate_limit_context
+from .schema_validation import get_validation_stats
 from .default_config import default_tool_files, get_default_hook_config
 
 # Determine the directory where the current file is located
@@ -276,6 +282,9 @@ class ToolUniverse:
 
         # Initialize any necessary attributes here FIRST
         self.all_tools: List[Dict[str, Any]] = []
+        # Bumped whenever tools are loaded or registered; lets indexes built
+        # over ``all_tools`` (e.g. ToolFinderKeyword) skip re-syncing
+        self._tools_revision = 0
         self.all_tool_dict: Dict[str, Dict[str, Any]] = {}
         self.tool_category_dicts: Dict[str, List[Dict[str, Any]]] = {}
         self.tool_finder = None
@@ -327,6 +336,9 @@ class ToolUniverse:
             "TOOLUNIVERSE_CACHE_PERSIST", "true"
         ).lower() in ("true", "1", "yes")
         memory_size = int(os.getenv("TOOLUNIVERSE_CACHE_MEMORY_SIZE", "256"))
+        memory_max_bytes_env = os.getenv("TOOLUNIVERSE_CACHE_MEMORY_MAX_BYTES")
+        memory_max_bytes = int(memory_max_bytes_env) if memory_max_bytes_env else None
+        memory_policy = os.getenv("TOOLUNIVERSE_CACHE_MEMORY_POLICY", "lru")
         default_ttl_env = os.getenv("TOOLUNIVERSE_CACHE_DEFAULT_TTL")
         default_ttl = int(default_ttl_env) if default_ttl_env else None
         singleflight_enabled = os.getenv(
@@ -348,6 +360,8 @@ class ToolUniverse:
             persistence_enabled=persistence_enabled,
             singleflight=singleflight_enabled,
             default_ttl=default_ttl,
+            memory_max_bytes=memory_max_bytes,
+            memory_policy=memory_policy,
         )
 
         self._strict_validation = os.getenv(
@@ -419,6 +433,7 @@ class ToolUniverse:
                 tool_config["type"] = name
 
             self.all_tools.append(tool_config)
+            self._tools_revision += 1
             tool_name_in_config = tool_config.get("name", name)
             self.all_tool_dict[tool_name_in_config] = tool_config
 
@@ -970,6 +985,7 @@ class ToolUniverse:
                 )
 
         self.all_tools = dedup_all_tools
+        self._tools_revision += 1
         self.refresh_tool_name_desc()
 
         info(f"Number of tools after load tools: {len(self.all_tools)}")
@@ -1005,6 +1021,7 @@ class ToolUniverse:
                     if isinstance(tool, dict)
                 ]:
                     self.all_tools.append(config)
+                    self._tools_revision += 1
                     self.logger.debug(f"Added auto-discovered config: {config['name']}")
 
     def _process_mcp_auto_loaders(self):
@@ -2156,28 +2173,11 @@ class ToolUniverse:
                     )
                     return cached_value
 
-            # Coerce types if lenient coercion is enabled
-            if self.lenient_type_coercion:
-                arguments = self._coerce_arguments_to_schema(function_name, arguments)
-                # Update the original dict so coerced arguments are used
-                function_call_json["arguments"] = arguments
-
-            # Validate parameters if requested
-            if validate:
-                validation_error = self._validate_parameters(function_name, arguments)
-                if validation_error:
-                    return self._create_dual_format_error(validation_error)
-            else:
-                # When validate=False, perform lightweight checks:
-                # 1. Verify tool exists in all_tool_dict
-                # 2. No parameter validation (for performance)
-                if function_name not in self.all_tool_dict:
-                    return self._create_dual_format_error(
-                        ToolValidationError(
-                            f"Tool '{function_name}' not found",
-                            details={"tool_name": function_name},
-                        )
-                    )
+            arguments, prepare_error = self._prepare_call_arguments(
+                function_call_json, function_name, arguments, validate
+            )
+            if prepare_error is not None:
+                return prepare_error
 
             # Execute the tool
             tool_arguments = arguments
@@ -2233,43 +2233,118 @@ class ToolUniverse:
 
             # Apply output hooks if enabled
             if self.hook_manager:
-                context = {
-                    "tool_name": function_name,
-                    "tool_type": (
-                        tool_instance.__class__.__name__
-                        if tool_instance is not None
-                        else "unknown"
-                    ),
-                    "execution_time": time.time(),
-                    "arguments": tool_arguments,
-                }
-                result = self.hook_manager.apply_hooks(
-                    result, function_name, tool_arguments, context
+                result = self._apply_output_hooks(
+                    function_name,
+                    tool_instance,
+                    tool_arguments,
+                    result,
+                    stream_callback,
                 )
 
             # Cache result if enabled
-            if (
-                cache_enabled
-                and tool_instance
-                and getattr(tool_instance, "supports_caching", lambda: True)()
-            ):
-                if cache_key is None:
-                    cache_key = self._make_cache_key(function_name, arguments)
-                if cache_namespace is None:
-                    cache_namespace = tool_instance.get_cache_namespace()
-                if cache_version is None:
-                    cache_version = tool_instance.get_cache_version()
-                ttl = tool_instance.get_cache_ttl(result)
-                self.cache_manager.set(
-                    namespace=cache_namespace,
-                    version=cache_version,
-                    cache_key=cache_key,
-                    value=result,
-                    ttl=ttl,
+            if cache_enabled:
+                self._store_cached_result(
+                    function_name,
+                    arguments,
+                    tool_instance,
+                    result,
+                    _BatchCacheInfo(
+                        namespace=cache_namespace,
+                        version=cache_version,
+                        cache_key=cache_key,
+                    ),
                 )
 
             return result
 
+    def _prepare_call_arguments(
+        self, function_call_json, function_name, arguments, validate
+    ):
+        """Coerce and validate call arguments.
+
+        Returns:
+            tuple: ``(arguments, error_result)`` where ``error_result`` is a dual-format
+            error dict when the call must not be executed, otherwise ``None``.
+        """
+        # Coerce types if lenient coercion is enabled
+        if self.lenient_type_coercion:
+            arguments = self._coerce_arguments_to_schema(function_name, arguments)
+            # Update the original dict so coerced arguments are used
+            function_call_json["arguments"] = arguments
+
+        # Validate parameters if requested
+        if validate:
+            validation_error = self._validate_parameters(function_name, arguments)
+            if validation_error:
+                return arguments, self._create_dual_format_error(validation_error)
+        else:
+            # When validate=False, perform lightweight checks:
+            # 1. Verify tool exists in all_tool_dict
+            # 2. No parameter validation (for performance)
+            if function_name not in self.all_tool_dict:
+                return arguments, self._create_dual_format_error(
+                    ToolValidationError(
+                        f"Tool '{function_name}' not found",
+                        details={"tool_name": function_name},
+                    )
+                )
+
+        return arguments, None
+
+    def _apply_output_hooks(
+        self, function_name, tool_instance, tool_arguments, result, stream_callback=None
+    ):
+        """Run the configured output hooks over a tool result."""
+        context = {
+            "tool_name": function_name,
+            "tool_type": (
+                tool_instance.__class__.__name__
+                if tool_instance is not None
+                else "unknown"
+            ),
+            "execution_time": time.time(),
+            "arguments": tool_arguments,
+        }
+        if stream_callback is not None:
+            # Lets hooks stream partial output (e.g. chunk summaries)
+            context["stream_callback"] = stream_callback
+        return self.hook_manager.apply_hooks(
+            result, function_name, tool_arguments, context
+        )
+
+    def _store_cached_result(
+        self,
+        function_name,
+        arguments,
+        tool_instance,
+        result,
+        cache_info: _BatchCacheInfo,
+    ) -> None:
+        """Persist a tool result in the result cache when the tool allows it."""
+        if not (
+            tool_instance
+            and getattr(tool_instance, "supports_caching", lambda: True)()
+        ):
+            return
+
+        cache_key = cache_info.cache_key
+        if cache_key is None:
+            cache_key = self._make_cache_key(function_name, arguments)
+        cache_namespace = cache_info.namespace
+        if cache_namespace is None:
+            cache_namespace = tool_instance.get_cache_namespace()
+        cache_version = cache_info.version
+        if cache_version is None:
+            cache_version = tool_instance.get_cache_version()
+        ttl = tool_instance.get_cache_ttl(result)
+        self.cache_manager.set(
+            namespace=cache_namespace,
+            version=cache_version,
+            cache_key=cache_key,
+            value=result,
+            ttl=ttl,
+        )
+
     def _execute_tool_with_stream(
         self, tool_instance, arguments, stream_callback, use_cache=False, validate=True
     ):
@@ -2291,29 +2366,428 @@ class ToolUniverse:
                 tool_arguments[stream_flag_key] = True
 
         # Try to pass all available parameters to the tool
-        try:
-            signature = inspect.signature(tool_instance.run)
-            params = signature.parameters
+        with self._rate_limit_context(tool_instance):
+            try:
+                kwargs = self._build_run_kwargs(
+                    tool_instance.run, stream_callback, use_cache, validate
+                )
+
+                # Call with all supported parameters
+                return tool_instance.run(tool_arguments, **kwargs), tool_arguments
+
+            except (ValueError, TypeError) as e:
+                # If inspection fails or tool doesn't accept extra params,
+                # fall back to simple execution with just arguments
+                self.logger.debug(f"Falling back to simple run() call: {e}")
+                return tool_instance.run(tool_arguments), tool_arguments
+
+    @staticmethod
+    def _rate_limit_context(tool_instance):
+        """Attribute outbound HTTP requests made by a tool call to that tool."""
+        tool_config = getattr(tool_instance, "tool_config", None)
+        tool_name = tool_config.get("name") if isinstance(tool_config, dict) else None
+        get_rate_limit = getattr(tool_instance, "get_rate_limit", None)
+        rate_limit = get_rate_limit() if callable(get_rate_limit) else None
+        return rate_limit_context(tool_name, rate_limit)
+
+    @staticmethod
+    def _build_run_kwargs(method, stream_callback, use_cache, validate):
+        """Select the optional execution parameters ``method`` accepts.
+
+        Raises:
+            ValueError, TypeError: If the signature cannot be inspected.
+        """
+        params = inspect.signature(method).parameters
+
+        # Arguments are always passed as the first positional argument
+        kwargs = {}
+        if stream_callback is not None and "stream_callback" in params:
+            kwargs["stream_callback"] = stream_callback
+        if "use_cache" in params:
+            kwargs["use_cache"] = use_cache
+        if "validate" in params:
+            kwargs["validate"] = validate
+        return kwargs
+
+    # ------------------------------------------------------------------
+    # Asynchronous execution
+    # ------------------------------------------------------------------
+    async def arun(
+        self,
+        fcall_str,
+        return_message=False,
+        verbose=True,
+        format="llama",
+        stream_callback=None,
+        use_cache: bool = False,
+        max_concurrency: Optional[int] = None,
+        executor=None,
+    ):
+        """
+        Asynchronous counterpart of :meth:`run`.
+
+        Batches are fanned out on the running event loop instead of a thread
+        pool: tools that implement a native ``arun`` coroutine are awaited
+        directly, while synchronous tools are dispatched to ``executor`` (the
+        loop's default executor when ``None``).
+
+        Args:
+            fcall_str: Input string or data containing function call information.
+            return_message (bool, optional): Whether to return formatted messages. Defaults to False.
+            verbose (bool, optional): Whether to enable verbose output. Defaults to True.
+            format (str, optional): Format type for parsing. Defaults to 'llama'.
+            stream_callback (callable, optional): Callback for streaming responses.
+            use_cache (bool, optional): Whether to use result caching. Defaults to False.
+            max_concurrency (int, optional): Maximum number of in-flight calls for a
+                batch; ``None`` or values <= 0 mean unlimited.
+            executor (concurrent.futures.Executor, optional): Executor used for
+                synchronous tools.
+
+        Returns:
+            Same shapes as :meth:`run`.
+        """
+        if return_message:
+            function_call_json, message = self.extract_function_call_json(
+                fcall_str, return_message=return_message, verbose=verbose, format=format
+            )
+        else:
+            function_call_json = self.extract_function_call_json(
+                fcall_str, return_message=return_message, verbose=verbose, format=format
+            )
+            message = ""
+        if function_call_json is None:
+            error("Not a function call")
+            return None
+
+        if not isinstance(function_call_json, list):
+            return await self.arun_one_function(
+                function_call_json,
+                stream_callback=stream_callback,
+                use_cache=use_cache,
+                executor=executor,
+            )
+
+        batch_results = await self._aexecute_function_call_list(
+            function_call_json,
+            stream_callback=stream_callback,
+            use_cache=use_cache,
+            max_concurrency=max_concurrency,
+            executor=executor,
+        )
+
+        call_results = []
+        for idx, call_result in enumerate(batch_results):
+            call_id = self.call_id_gen()
+            function_call_json[idx]["call_id"] = call_id
+            call_results.append(
+                {
+                    "role": "tool",
+                    "content": json.dumps({"content": call_result, "call_id": call_id}),
+                }
+            )
+        return [
+            {
+                "role": "assistant",
+                "content": message,
+                "tool_calls": json.dumps(function_call_json),
+            }
+        ] + call_results
+
+    async def _aexecute_function_call_list(
+        self,
+        function_calls: List[Dict[str, Any]],
+        stream_callback=None,
+        use_cache: bool = False,
+        max_concurrency: Optional[int] = None,
+        executor=None,
+    ) -> List[Any]:
+        """Execute a list of function calls concurrently on the running loop.
 
-            # Build kwargs based on what the tool accepts
-            kwargs = {}
+        Duplicate calls are collapsed, cache hits are resolved up front and
+        per-tool ``batch_max_concurrency`` limits are honoured, mirroring
+        :meth:`_execute_function_call_list`.
+        """
+        if not function_calls:
+            return []
 
-            # Always include arguments as first positional argument
-            if stream_callback is not None and "stream_callback" in params:
-                kwargs["stream_callback"] = stream_callback
-            if "use_cache" in params:
-                kwargs["use_cache"] = use_cache
-            if "validate" in params:
-                kwargs["validate"] = validate
+        loop = asyncio.get_running_loop()
+        jobs = self._build_batch_jobs(function_calls)
+        results: List[Any] = [None] * len(function_calls)
+
+        # Cache priming may hit SQLite, keep it off the event loop
+        jobs_to_run = await loop.run_in_executor(
+            executor, self._prime_batch_cache, jobs, use_cache, results
+        )
+        if not jobs_to_run:
+            return results
+
+        global_semaphore = (
+            asyncio.Semaphore(max_concurrency)
+            if max_concurrency and max_concurrency > 0
+            else None
+        )
+        tool_semaphores: Dict[str, Optional[asyncio.Semaphore]] = {}
+
+        async def run_job(job: _BatchJob):
+            semaphore = self._get_async_tool_semaphore(job, tool_semaphores)
+            async with semaphore or nullcontext():
+                async with global_semaphore or nullcontext():
+                    result = await self.arun_one_function(
+                        job.call,
+                        stream_callback=stream_callback,
+                        use_cache=use_cache,
+                        executor=executor,
+                    )
+            for idx in job.indices:
+                results[idx] = result
 
-            # Call with all supported parameters
-            return tool_instance.run(tool_arguments, **kwargs), tool_arguments
+        await asyncio.gather(*(run_job(job) for job in jobs_to_run))
+        return results
 
-        except (ValueError, TypeError) as e:
-            # If inspection fails or tool doesn't accept extra params,
-            # fall back to simple execution with just arguments
-            self.logger.debug(f"Falling back to simple run() call: {e}")
-            return tool_instance.run(tool_arguments), tool_arguments
+    def _get_async_tool_semaphore(
+        self,
+        job: _BatchJob,
+        tool_semaphores: Dict[str, Optional[asyncio.Semaphore]],
+    ) -> Optional[asyncio.Semaphore]:
+        if job.function_name not in tool_semaphores:
+            tool_instance = self._ensure_tool_instance(job)
+            limit = (
+                tool_instance.get_batch_concurrency_limit()
+                if tool_instance is not None
+                else 0
+            )
+            self.logger.debug("Batch concurrency for %s: %s", job.function_name, limit)
+            tool_semaphores[job.function_name] = (
+                asyncio.Semaphore(limit) if limit and limit > 0 else None
+            )
+
+        return tool_semaphores[job.function_name]
+
+    async def arun_one_function(
+        self,
+        function_call_json,
+        stream_callback=None,
+        use_cache=False,
+        validate=True,
+        executor=None,
+    ):
+        """
+        Asynchronous counterpart of :meth:`run_one_function`.
+
+        Tools overriding :meth:`BaseTool.arun` with a coroutine are awaited on
+        the running loop; synchronous tools run in ``executor`` (the loop's
+        default executor when ``None``), as do tool instantiation and result
+        cache reads and writes, which may touch disk or the network. Caching,
+        validation, error classification and output hooks behave exactly as in
+        the sync path.
+
+        Args:
+            function_call_json (dict): Dictionary containing function name and arguments.
+            stream_callback (callable, optional): Callback for streaming responses.
+            use_cache (bool, optional): Whether to use result caching. Defaults to False.
+            validate (bool, optional): Whether to validate parameters against schema. Defaults to True.
+            executor (concurrent.futures.Executor, optional): Executor used for
+                synchronous tools and blocking hooks.
+
+        Returns:
+            str or dict: Result from the tool execution, or error message if validation fails.
+        """
+        function_name = function_call_json.get("name", "")
+        arguments = function_call_json.get("arguments", {})
+
+        if not function_name:
+            return {"error": "Missing or empty function name"}
+
+        if not isinstance(arguments, dict):
+            return {
+                "error": f"Arguments must be a dictionary, got {type(arguments).__name__}"
+            }
+
+        loop = asyncio.get_running_loop()
+        tool_instance = None
+        cache_info = _BatchCacheInfo(namespace=None, version=None, cache_key=None)
+        cache_guard = nullcontext()
+
+        cache_enabled = (
+            use_cache and self.cache_manager is not None and self.cache_manager.enabled
+        )
+
+        if cache_enabled:
+            tool_instance = await self._aget_tool_instance(function_name, executor)
+            if (
+                tool_instance
+                and getattr(tool_instance, "supports_caching", lambda: True)()
+            ):
+                cache_info = _BatchCacheInfo(
+                    namespace=tool_instance.get_cache_namespace(),
+                    version=tool_instance.get_cache_version(),
+                    cache_key=self._make_cache_key(function_name, arguments),
+                )
+                cached_value = await self._acache_get(cache_info, executor)
+                if cached_value is not None:
+                    self.logger.debug(f"Cache hit for {function_name}")
+                    return cached_value
+                cache_guard = self.cache_manager.async_singleflight_guard(
+                    self.cache_manager.compose_key(
+                        cache_info.namespace, cache_info.version, cache_info.cache_key
+                    )
+                )
+            else:
+                cache_enabled = False
+
+        async with cache_guard:
+            if cache_enabled:
+                cached_value = await self._acache_get(cache_info, executor)
+                if cached_value is not None:
+                    self.logger.debug(
+                        f"Cache hit for {function_name} (after singleflight wait)"
+                    )
+                    return cached_value
+
+            arguments, prepare_error = self._prepare_call_arguments(
+                function_call_json, function_name, arguments, validate
+            )
+            if prepare_error is not None:
+                return prepare_error
+
+            tool_arguments = arguments
+            try:
+                if tool_instance is None:
+                    tool_instance = await self._aget_tool_instance(
+                        function_name, executor
+                    )
+
+                if tool_instance is None:
+                    loaded = await loop.run_in_executor(
+                        executor, self._auto_load_tools_if_empty, function_name
+                    )
+                    if not loaded:
+                        return self._create_dual_format_error(
+                            ToolUnavailableError(
+                                "Failed to auto-load tools",
+                                next_steps=[
+                                    "Manually run tu.load_tools()",
+                                    "Check tool configuration",
+                                ],
+                            )
+                        )
+                    tool_instance = await self._aget_tool_instance(
+                        function_name, executor
+                    )
+                    if tool_instance is None:
+                        return self._create_dual_format_error(
+                            ToolUnavailableError(
+                                f"Tool '{function_name}' not found even after loading tools",
+                                next_steps=[
+                                    "Check tool name spelling",
+                                    "Verify tool is available in loaded categories",
+                                ],
+                            )
+                        )
+
+                result, tool_arguments = await self._aexecute_tool_with_stream(
+                    tool_instance,
+                    arguments,
+                    stream_callback,
+                    use_cache,
+                    validate,
+                    executor=executor,
+                )
+            except Exception as e:
+                classified_error = self._classify_exception(e, function_name, arguments)
+                return self._create_dual_format_error(classified_error)
+
+            # Hooks may call out to LLMs, keep them off the event loop
+            if self.hook_manager:
+                result = await loop.run_in_executor(
+                    executor,
+                    self._apply_output_hooks,
+                    function_name,
+                    tool_instance,
+                    tool_arguments,
+                    result,
+                    stream_callback,
+                )
+
+            if cache_enabled:
+                await loop.run_in_executor(
+                    executor,
+                    self._store_cached_result,
+                    function_name,
+                    arguments,
+                    tool_instance,
+                    result,
+                    cache_info,
+                )
+
+            return result
+
+    async def _aget_tool_instance(self, function_name: str, executor=None):
+        """:meth:`_get_tool_instance` that builds new instances in ``executor``."""
+        if function_name in self.callable_functions:
+            return self.callable_functions[function_name]
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            functools.partial(self._get_tool_instance, function_name, cache=True),
+        )
+
+    async def _acache_get(self, cache_info: _BatchCacheInfo, executor=None):
+        """Read the result cache in ``executor`` (it may hit SQLite or Redis)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            functools.partial(
+                self.cache_manager.get,
+                namespace=cache_info.namespace,
+                version=cache_info.version,
+                cache_key=cache_info.cache_key,
+            ),
+        )
+
+    async def _aexecute_tool_with_stream(
+        self,
+        tool_instance,
+        arguments,
+        stream_callback,
+        use_cache=False,
+        validate=True,
+        executor=None,
+    ):
+        """Await a tool's native coroutine or run a sync tool in ``executor``."""
+        supports_native_async = getattr(
+            tool_instance, "supports_native_async", lambda: False
+        )
+        if not supports_native_async():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                executor,
+                functools.partial(
+                    self._execute_tool_with_stream,
+                    tool_instance,
+                    arguments,
+                    stream_callback,
+                    use_cache,
+                    validate,
+                ),
+            )
+
+        tool_arguments = arguments
+        if isinstance(arguments, dict):
+            tool_arguments = dict(arguments)
+            stream_flag_key = (
+                getattr(tool_instance, "STREAM_FLAG_KEY", None)
+                if stream_callback
+                else None
+            )
+            if stream_flag_key and stream_flag_key not in tool_arguments:
+                tool_arguments[stream_flag_key] = True
+
+        kwargs = self._build_run_kwargs(
+            tool_instance.arun, stream_callback, use_cache, validate
+        )
+        with self._rate_limit_context(tool_instance):
+            return await tool_instance.arun(tool_arguments, **kwargs), tool_arguments
 
     def toggle_hooks(self, enabled: bool):
         """
@@ -2741,7 +3215,15 @@ class ToolUniverse:
         """Return cache statistics."""
         if not self.cache_manager:
             return {"enabled": False}
-        return self.cache_manager.stats()
+        stats = self.cache_manager.stats()
+        llm_cache = get_llm_cache(create=False)
+        if llm_cache is not None:
+            stats["llm_responses"] = llm_cache.stats()
+        return stats
+
+    def get_validation_stats(self, tool_name: Optional[str] = None) -> Dict[str, Any]:
+        """Return parameter-validation counters and time (seconds) per tool."""
+        return get_validation_stats(tool_name)
 
     def dump_cache(self, namespace: Optional[str] = None):
         """Iterate over cached entries (persistent layer only)."""
@@ -2754,6 +3236,11 @@ class ToolUniverse:
         if self.cache_manager:
             self.cache_manager.close()
 
+    async def aclose(self):
+        """Release resources, including the running loop's shared HTTP session."""
+        self.close()
+        await aclose_async_http_session()
+
     def __del__(self):
         try:
             self.close()
@@ -2768,7 +3255,11 @@ class ToolUniverse:
             if tool_name in tool_errors:
                 return tool_errors[tool_name]
             elif tool_name in self.all_tool_dict:
-                return {"available": True}
+                health = {"available": True}
+                rate_limits = get_rate_limiter().stats(tool_name)
+                if rate_limits:
+                    health["rate_limits"] = rate_limits
+                return health
             return {"available": False, "error": "Not found"}
 
         # Summary for all tools
@@ -2778,6 +3269,7 @@ class ToolUniverse:
             "unavailable": len(tool_errors),
             "unavailable_list": list(tool_errors.keys()),
             "details": tool_errors,
+            "rate_limits": get_rate_limiter().stats(),
         }
 
     def check_function_call(self, fcall_str, function_config=None, format="llama"):
@@ -3214,6 +3706,7 @@ class ToolUniverse:
         )
         if clear_existing:
             self.all_tools = []
+            self._tools_revision += 1
             self.all_tool_dict = {}
             self.tool_category_dicts = {}
 
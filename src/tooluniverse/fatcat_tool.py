@@ -1,4 +1,5 @@
 import requests
+from .http_transport import http_get
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -30,7 +31,7 @@ class FatcatScholarTool(BaseTool):
             "size": max(1, min(max_results, 100)),
         }
         try:
-            resp = requests.get(self.base_url, params=params, timeout=20)
+            resp = http_get(self.base_url, params=params, timeout=20)
             resp.raise_for_status()
             data = resp.json()
         except requests.RequestException as e:
@@ -13,7 +13,7 @@ class GWASGeneSearch(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.ebi.ac.uk/gwas/rest/api"
-        self.session = requests.Session()
+        self.session = self.get_http_session()
         self.session.headers.update(
             {"Accept": "application/json", "Content-Type": "application/json"}
         )
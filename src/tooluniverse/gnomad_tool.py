@@ -5,7 +5,6 @@ This tool provides access to the gnomAD (Genome Aggregation Database) for
 population genetics data, variant frequencies, and gene constraint metrics using GraphQL.
 """
 
-import requests
 from typing import Dict, Any
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -19,7 +18,7 @@ class gnomADGraphQLTool(BaseTool):
         super().__init__(tool_config)
         self.endpoint_url = "https://gnomad.broadinstitute.org/api"
         self.query_schema = tool_config.get("query_schema", "")
-        self.session = requests.Session()
+        self.session = self.get_http_session()
         self.session.headers.update(
             {
                 "Accept": "application/json",
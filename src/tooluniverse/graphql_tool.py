@@ -4,6 +4,7 @@ from graphql.validation import validate
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 import requests
+from .http_transport import http_post
 import copy
 
 
@@ -47,9 +48,7 @@ def remove_none_and_empty_values(json_obj):
 
 
 def execute_query(endpoint_url, query, variables=None):
-    response = requests.post(
-        endpoint_url, json={"query": query, "variables": variables}
-    )
+    response = http_post(endpoint_url, json={"query": query, "variables": variables})
     try:
         result = response.json()
         # result = json.dumps(result, ensure_ascii=False)
@@ -1,6 +1,7 @@
 # hpa_tool.py
 
 import requests
+from .http_transport import http_get
 import xml.etree.ElementTree as ET
 from typing import Dict, Any, List
 from .base_tool import BaseTool
@@ -38,7 +39,7 @@ class HPASearchApiTool(BaseTool):
         }
 
         try:
-            resp = requests.get(self.base_url, params=params, timeout=self.timeout)
+            resp = http_get(self.base_url, params=params, timeout=self.timeout)
             if resp.status_code == 404:
                 return {"error": f"No data found for gene '{search_term}'"}
             if resp.status_code != 200:
@@ -81,7 +82,7 @@ class HPAJsonApiTool(BaseTool):
         """Make HPA JSON API request for a specific gene"""
         url = self.base_url_template.format(ensembl_id=ensembl_id)
         try:
-            resp = requests.get(url, timeout=self.timeout)
+            resp = http_get(url, timeout=self.timeout)
             if resp.status_code == 404:
                 return {"error": f"No data found for Ensembl ID '{ensembl_id}'"}
             if resp.status_code != 200:
@@ -117,7 +118,7 @@ class HPAXmlApiTool(BaseTool):
         """Make HPA XML API request for a specific gene"""
         url = self.base_url_template.format(ensembl_id=ensembl_id)
         try:
-            resp = requests.get(url, timeout=self.timeout)
+            resp = http_get(url, timeout=self.timeout)
             if resp.status_code == 404:
                 raise Exception(f"No XML data found for Ensembl ID '{ensembl_id}'")
             if resp.status_code != 200:
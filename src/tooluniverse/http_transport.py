@@ -0,0 +1,293 @@
+"""
+Shared HTTP transport for REST-based tools.
+
+Every tool call used to open its own connection (``requests.get`` builds a
+throwaway session), paying DNS, TCP and TLS setup on each request. This
+module keeps one process-wide :class:`HTTPTransport` whose adapter holds a
+urllib3 pool manager: connections are pooled per host and reused through
+HTTP keep-alive by every tool.
+
+Tools obtain a session through :meth:`BaseTool.get_http_session` (their own
+headers and cookies, shared connections) or use the stateless helpers
+:func:`http_get`, :func:`http_post` and :func:`http_request` in place of the
+corresponding ``requests`` functions.
+
+Configuration (environment variables, read when the default transport is
+first created):
+
+- ``TOOLUNIVERSE_HTTP_POOL_CONNECTIONS``: number of per-host pools kept (32)
+- ``TOOLUNIVERSE_HTTP_POOL_MAXSIZE``: connections kept per host (32)
+- ``TOOLUNIVERSE_HTTP_RETRIES``: retries for connection failures (2)
+- ``TOOLUNIVERSE_HTTP_BACKOFF``: retry backoff factor in seconds (0.3)
+- ``TOOLUNIVERSE_HTTP_TIMEOUT``: default timeout in seconds for requests
+  that do not pass one (unset = no default, matching ``requests``)
+
+Coroutines use :func:`get_async_http_session`: one ``aiohttp`` session per
+event loop, sized like the sync pools and bounded by the same timeout (or
+aiohttp's own 5 minute default when ``TOOLUNIVERSE_HTTP_TIMEOUT`` is unset).
+Close it with :func:`aclose_async_http_session` before the loop shuts down;
+sessions still open at interpreter exit are closed by an ``atexit`` hook.
+
+Requests are admitted by the per-host limiter in
+:mod:`tooluniverse.rate_limiter`; 429/503 responses are retried after their
+``Retry-After`` delay (see ``TOOLUNIVERSE_RATE_LIMIT_*`` there).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import os
+import threading
+import weakref
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .rate_limiter import get_rate_limiter, host_of
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that fills in the transport's default timeout."""
+
+    def __init__(self, *args, default_timeout: Optional[float] = None, **kwargs):
+        self.default_timeout = default_timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None and self.default_timeout is not None:
+            kwargs["timeout"] = self.default_timeout
+        return super().send(request, **kwargs)
+
+
+class PooledSession(requests.Session):
+    """A ``requests.Session`` whose adapters belong to an :class:`HTTPTransport`.
+
+    Headers, auth and cookies stay per session; connections are shared.
+    Closing the session therefore leaves the shared pools untouched.
+
+    Every request is admitted by the process-wide per-host rate limiter;
+    ``owner`` and ``rate_limit`` attribute the session's traffic to a tool
+    and supply its configured limit for hosts that have none yet.
+    """
+
+    def __init__(
+        self,
+        transport: "HTTPTransport",
+        owner: Optional[str] = None,
+        rate_limit: Any = None,
+    ):
+        super().__init__()
+        self.transport = transport
+        self.owner = owner
+        self.rate_limit = rate_limit
+        self.mount("https://", transport.adapter)
+        self.mount("http://", transport.adapter)
+
+    def send(self, request, **kwargs):
+        limiter = get_rate_limiter()
+        host = host_of(request.url)
+        retries = self.transport.rate_limit_retries
+        while True:
+            limiter.acquire(host, self.rate_limit, self.owner)
+            response = super().send(request, **kwargs)
+            delay = limiter.observe(
+                host, response.status_code, response.headers.get("Retry-After")
+            )
+            if (
+                delay is None
+                or retries <= 0
+                or delay > self.transport.max_retry_after
+                or not isinstance(request.body, (type(None), bytes, str))
+            ):
+                return response
+            retries -= 1
+            limiter.record_retry(host)
+            response.close()
+
+    def close(self):
+        pass
+
+
+class HTTPTransport:
+    """Process-wide pooled HTTP transport."""
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = 32,
+        pool_maxsize: int = 32,
+        max_retries: int = 2,
+        backoff_factor: float = 0.3,
+        timeout: Optional[float] = None,
+        rate_limit_retries: int = 2,
+        max_retry_after: float = 30.0,
+    ):
+        self.pool_connections = max(1, int(pool_connections))
+        self.pool_maxsize = max(1, int(pool_maxsize))
+        self.timeout = timeout
+        self.rate_limit_retries = max(0, int(rate_limit_retries))
+        self.max_retry_after = max_retry_after
+        # Only connection errors are retried: reads and statuses are left to
+        # the tools so non-idempotent calls are never replayed after the
+        # server has seen them.
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=backoff_factor,
+            raise_on_status=False,
+        )
+        self.adapter = _PooledHTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry,
+            default_timeout=timeout,
+        )
+        self._stateless = PooledSession(self)
+        # Stateless helpers must not carry cookies from one tool to another
+        self._stateless.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+    @classmethod
+    def from_env(cls) -> "HTTPTransport":
+        timeout = os.getenv("TOOLUNIVERSE_HTTP_TIMEOUT")
+        return cls(
+            pool_connections=int(os.getenv("TOOLUNIVERSE_HTTP_POOL_CONNECTIONS", "32")),
+            pool_maxsize=int(os.getenv("TOOLUNIVERSE_HTTP_POOL_MAXSIZE", "32")),
+            max_retries=int(os.getenv("TOOLUNIVERSE_HTTP_RETRIES", "2")),
+            backoff_factor=float(os.getenv("TOOLUNIVERSE_HTTP_BACKOFF", "0.3")),
+            timeout=float(timeout) if timeout else None,
+            rate_limit_retries=int(os.getenv("TOOLUNIVERSE_RATE_LIMIT_RETRIES", "2")),
+            max_retry_after=float(os.getenv("TOOLUNIVERSE_RATE_LIMIT_MAX_WAIT", "30")),
+        )
+
+    def new_session(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        owner: Optional[str] = None,
+        rate_limit: Any = None,
+    ) -> PooledSession:
+        """Create a session with its own headers/cookies on the shared pools."""
+        session = PooledSession(self, owner=owner, rate_limit=rate_limit)
+        if headers:
+            session.headers.update(headers)
+        return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return self._stateless.request(method, url, **kwargs)
+
+    def stats(self) -> Dict[str, Any]:
+        pools = self.adapter.poolmanager.pools
+        return {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "timeout": self.timeout,
+            "hosts": sorted(
+                f"{key.key_scheme}://{key.key_host}:{key.key_port}"
+                for key in pools.keys()
+            ),
+        }
+
+    def close(self):
+        self.adapter.close()
+
+
+_default_transport: Optional[HTTPTransport] = None
+_default_lock = threading.Lock()
+
+
+def get_http_transport() -> HTTPTransport:
+    """Return the process-wide transport, creating it from the environment."""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HTTPTransport.from_env()
+        return _default_transport
+
+
+def configure_http_transport(**kwargs: Any) -> HTTPTransport:
+    """Replace the process-wide transport with one built from ``kwargs``.
+
+    Sessions created earlier keep using the previous transport's pools.
+    """
+    global _default_transport
+    transport = HTTPTransport(**kwargs)
+    with _default_lock:
+        previous, _default_transport = _default_transport, transport
+    if previous is not None:
+        previous.close()
+    return transport
+
+
+# aiohttp's own default; used when TOOLUNIVERSE_HTTP_TIMEOUT is unset
+DEFAULT_ASYNC_TIMEOUT = 300.0
+
+# aiohttp sessions are bound to the loop that created them
+_async_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_lock = threading.Lock()
+
+
+def get_async_http_session():
+    """Return the ``aiohttp.ClientSession`` shared on the running event loop."""
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    with _async_lock:
+        session = _async_sessions.get(loop)
+        if session is None or session.closed:
+            transport = get_http_transport()
+            timeout = transport.timeout
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=transport.pool_connections * transport.pool_maxsize,
+                    limit_per_host=transport.pool_maxsize,
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=DEFAULT_ASYNC_TIMEOUT if timeout is None else timeout
+                ),
+            )
+            _async_sessions[loop] = session
+        return session
+
+
+async def aclose_async_http_session() -> None:
+    """Close the running loop's shared session, if one was opened."""
+    with _async_lock:
+        session = _async_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def _close_async_http_sessions() -> None:
+    with _async_lock:
+        sessions = list(_async_sessions.items())
+        _async_sessions.clear()
+    for loop, session in sessions:
+        # A closed loop has already torn down the session's transports
+        if not session.closed and not loop.is_closed() and not loop.is_running():
+            loop.run_until_complete(session.close())
+
+
+atexit.register(_close_async_http_sessions)
+
+
+def http_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Drop-in replacement for ``requests.request`` using pooled connections."""
+    return get_http_transport().request(method, url, **kwargs)
+
+
+def http_get(url: str, params=None, **kwargs: Any) -> requests.Response:
+    """Drop-in replacement for ``requests.get`` using pooled connections."""
+    return http_request("GET", url, params=params, **kwargs)
+
+
+def http_post(url: str, data=None, json=None, **kwargs: Any) -> requests.Response:
+    """Drop-in replacement for ``requests.post`` using pooled connections."""
+    return http_request("POST", url, data=data, json=json, **kwargs)
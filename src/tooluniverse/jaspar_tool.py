@@ -1,4 +1,3 @@
-import requests
 from typing import Any, Dict
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -9,7 +8,7 @@ class JASPARRESTTool(BaseTool):
     def __init__(self, tool_config: Dict):
         super().__init__(tool_config)
         self.base_url = "https://jaspar.elixir.no/api/v1"
-        self.session = requests.Session()
+        self.session = self.get_http_session()
         self.session.headers.update({"Accept": "application/json"})
         self.timeout = 30
 
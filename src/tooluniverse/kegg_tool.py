@@ -17,7 +17,7 @@ class KEGGRESTTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://rest.kegg.jp"
-        self.session = requests.Session()
+        self.session = self.get_http_session()
         self.session.headers.update(
             {"Accept": "text/plain, application/json", "User-Agent": "ToolUniverse/1.0"}
         )
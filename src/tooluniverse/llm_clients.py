@@ -1,10 +1,58 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+import asyncio
+import hashlib
 import os
+import threading
 import time
+import weakref
 import json as _json
 
 
+# SDK clients (and their connection pools) shared by every LLM client with the
+# same provider, endpoint and credentials. Async clients are bound to the event
+# loop they were created on, so they are registered per loop.
+_SHARED_CLIENTS: Dict[Tuple[Any, ...], Any] = {}
+# event loop -> {key: client}
+_SHARED_ASYNC_CLIENTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _credential_id(secret: Optional[str]) -> str:
+    """Identify an API key in registry keys without keeping the key itself."""
+    return hashlib.sha256((secret or "").encode("utf-8")).hexdigest()[:16]
+
+
+def shared_client(key: Tuple[Any, ...], factory: Callable[[], Any]) -> Any:
+    """Return the SDK client registered under ``key``, creating it on first use."""
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(key)
+        if client is None:
+            client = factory()
+            _SHARED_CLIENTS[key] = client
+        return client
+
+
+def shared_async_client(key: Tuple[Any, ...], factory: Callable[[], Any]) -> Any:
+    """Like :func:`shared_client`, for async SDK clients of the running loop."""
+    loop = asyncio.get_running_loop()
+    with _SHARED_CLIENTS_LOCK:
+        clients = _SHARED_ASYNC_CLIENTS.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client = factory()
+            clients[key] = client
+        return client
+
+
+def clear_shared_clients() -> None:
+    """Forget all shared SDK clients, e.g. after rotating credentials."""
+    with _SHARED_CLIENTS_LOCK:
+        _SHARED_CLIENTS.clear()
+        _SHARED_ASYNC_CLIENTS.clear()
+
+
 class BaseLLMClient:
     def test_api(self) -> None:
         raise NotImplementedError
@@ -44,6 +92,94 @@ class BaseLLMClient:
         if result is not None:
             yield result
 
+    async def ainfer(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        return_json: bool,
+        custom_format: Any = None,
+        max_retries: int = 5,
+        retry_delay: int = 5,
+    ) -> Optional[str]:
+        """Asynchronous :meth:`infer`; by default it runs in a worker thread."""
+        return await asyncio.to_thread(
+            self.infer,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            return_json=return_json,
+            custom_format=custom_format,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+        )
+
+    async def ainfer_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        return_json: bool,
+        custom_format: Any = None,
+        max_retries: int = 5,
+        retry_delay: int = 5,
+    ) -> AsyncIterator[str]:
+        """Default async streaming implementation falls back to :meth:`ainfer`."""
+        result = await self.ainfer(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            return_json=return_json,
+            custom_format=custom_format,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+        )
+        if result is not None:
+            yield result
+
+    @staticmethod
+    def _extract_text_from_chunk(chunk) -> Optional[str]:
+        """Text delta of an OpenAI-compatible streaming chunk."""
+        choices = getattr(chunk, "choices", None)
+        if not choices:
+            return None
+        delta = getattr(choices[0], "delta", None)
+        return getattr(delta, "content", None) if delta is not None else None
+
+    async def _astream_chat(
+        self,
+        client,
+        kwargs: Dict[str, Any],
+        max_retries: int,
+        retry_delay: int,
+        retry_errors: Tuple[type, ...] = (),
+    ) -> AsyncIterator[str]:
+        """Stream an OpenAI-compatible chat completion from an async client.
+
+        Requests failing with one of ``retry_errors`` are retried with a
+        linear backoff until the first chunk arrives; any other error is
+        raised to the caller.
+        """
+        retries = 0
+        while True:
+            streamed = False
+            try:
+                stream = await client.chat.completions.create(stream=True, **kwargs)
+                async for chunk in stream:
+                    text = self._extract_text_from_chunk(chunk)
+                    if text:
+                        streamed = True
+                        yield text
+                return
+            except retry_errors:
+                retries += 1
+                if streamed or retries >= max_retries:
+                    raise
+                self.logger.warning(
+                    f"Rate limit exceeded. Retrying in {retry_delay} seconds (streaming)..."
+                )
+                await asyncio.sleep(retry_delay * retries)
+
 
 class AzureOpenAIClient(BaseLLMClient):
     # Built-in defaults for model families (can be overridden by env)
@@ -89,8 +225,19 @@ class AzureOpenAIClient(BaseLLMClient):
         if not api_key:
             raise ValueError("AZURE_OPENAI_API_KEY not set")
         endpoint = os.getenv("AZURE_OPENAI_ENDPOINT", "https://azure-ai.hms.edu")
-        self.client = self._AzureOpenAI(
-            azure_endpoint=endpoint, api_key=api_key, api_version=resolved_version
+        self._client_args = {
+            "azure_endpoint": endpoint,
+            "api_key": api_key,
+            "api_version": resolved_version,
+        }
+        self._client_key = (
+            "azure",
+            endpoint,
+            _credential_id(api_key),
+            resolved_version,
+        )
+        self.client = shared_client(
+            self._client_key, lambda: self._AzureOpenAI(**self._client_args)
         )
         self.api_version = resolved_version
 
@@ -397,6 +544,153 @@ class AzureOpenAIClient(BaseLLMClient):
             retry_delay,
         )
 
+    def _async_client(self):
+        return shared_async_client(
+            self._client_key,
+            lambda: self._openai.AsyncAzureOpenAI(**self._client_args),
+        )
+
+    async def ainfer(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        return_json: bool,
+        custom_format: Any = None,
+        max_retries: int = 5,
+        retry_delay: int = 5,
+    ) -> Optional[str]:
+        retries = 0
+        client = self._async_client()
+        call_fn = (
+            client.chat.completions.parse
+            if custom_format is not None
+            else client.chat.completions.create
+        )
+        response_format = (
+            custom_format
+            if custom_format is not None
+            else ({"type": "json_object"} if return_json else None)
+        )
+        eff_temp = self._normalize_temperature(self.model_name, temperature)
+        eff_max = (
+            max_tokens
+            if max_tokens is not None
+            else self._resolve_default_max_tokens(self.model_name)
+        )
+        while retries < max_retries:
+            try:
+                kwargs: Dict[str, Any] = {
+                    "model": self.model_name,
+                    "messages": messages,
+                }
+                if response_format is not None:
+                    kwargs["response_format"] = response_format
+                if eff_temp is not None:
+                    kwargs["temperature"] = eff_temp
+                try:
+                    if eff_max is not None:
+                        resp = await call_fn(max_tokens=eff_max, **kwargs)
+                    else:
+                        resp = await call_fn(**kwargs)
+                except self._openai.BadRequestError as be:  # type: ignore[attr-defined]
+                    if eff_max is not None:
+                        resp = await call_fn(max_completion_tokens=eff_max, **kwargs)
+                    else:
+                        resp = await self._acall_with_token_fallback(
+                            call_fn, kwargs, be
+                        )
+                if custom_format is not None:
+                    return resp.choices[0].message.parsed.model_dump()
+                return resp.choices[0].message.content
+            except self._openai.RateLimitError:  # type: ignore[attr-defined]
+                self.logger.warning(
+                    f"Rate limit exceeded. Retrying in {retry_delay} seconds..."
+                )
+                retries += 1
+                await asyncio.sleep(retry_delay * retries)
+            except Exception as e:  # noqa: BLE001
+                self.logger.error(f"An error occurred: {e}")
+                break
+        self.logger.error("Max retries exceeded. Unable to complete the request.")
+        return None
+
+    async def _acall_with_token_fallback(self, call_fn, kwargs, error: Exception):
+        """Retry with decreasing output limits, as :meth:`infer` does."""
+        be_msg = str(error).lower()
+        if not any(
+            k in be_msg
+            for k in [
+                "max_tokens",
+                "output limit",
+                "finish the message",
+                "max_completion_tokens",
+            ]
+        ):
+            raise error
+        last_exc: Exception = error
+        for lim in [8192, 4096, 2048, 1024, 512, 256, 128, 64, 32]:
+            try:
+                return await call_fn(max_completion_tokens=lim, **kwargs)
+            except Exception as inner_e:  # noqa: BLE001
+                last_exc = inner_e
+            try:
+                return await call_fn(max_tokens=lim, **kwargs)
+            except Exception as inner2:  # noqa: BLE001
+                last_exc = inner2
+        raise last_exc
+
+    async def ainfer_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        return_json: bool,
+        custom_format: Any = None,
+        max_retries: int = 5,
+        retry_delay: int = 5,
+    ) -> AsyncIterator[str]:
+        if not return_json and custom_format is None:
+            eff_temp = self._normalize_temperature(self.model_name, temperature)
+            eff_max = (
+                max_tokens
+                if max_tokens is not None
+                else self._resolve_default_max_tokens(self.model_name)
+            )
+            kwargs: Dict[str, Any] = {"model": self.model_name, "messages": messages}
+            if eff_temp is not None:
+                kwargs["temperature"] = eff_temp
+            if eff_max is not None:
+                kwargs["max_tokens"] = eff_max
+            streamed = False
+            try:
+                async for text in self._astream_chat(
+                    self._async_client(),
+                    kwargs,
+                    max_retries,
+                    retry_delay,
+                    (self._openai.RateLimitError,),
+                ):
+                    streamed = True
+                    yield text
+                return
+            except Exception as e:  # noqa: BLE001
+                if streamed:
+                    raise
+                self.logger.error(f"Streaming error: {e}")
+
+        # JSON output, or fallback to non-streaming if streaming fails
+        async for text in super().ainfer_stream(
+            messages,
+            temperature,
+            max_tokens,
+            return_json,
+            custom_format,
+            max_retries,
+            retry_delay,
+        ):
+            yield text
+
 
 class GeminiClient(BaseLLMClient):
     def __init__(self, model_name: str, logger):
@@ -550,6 +844,94 @@ class GeminiClient(BaseLLMClient):
             retry_delay,
         )
 
+    async def ainfer(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        return_json: bool,
+        custom_format: Any = None,
+        max_retries: int = 5,
+        retry_delay: int = 5,
+    ) -> Optional[str]:
+        if return_json:
+            raise ValueError("Gemini JSON mode not supported here")
+        contents = ""
+        for m in messages:
+            if m["role"] in ("user", "system"):
+                contents += f"{m['content']}\n"
+        retries = 0
+        while retries < max_retries:
+            try:
+                gen_cfg: Dict[str, Any] = {
+                    "temperature": (temperature if temperature is not None else 0)
+                }
+                if max_tokens is not None:
+                    gen_cfg["max_output_tokens"] = max_tokens
+                model = self._build_model()
+                resp = await model.generate_content_async(
+                    contents, generation_config=gen_cfg
+                )
+                return getattr(resp, "text", None) or getattr(resp, "candidates", [{}])[
+                    0
+                ].get("content")
+            except Exception as e:  # noqa: BLE001
+                self.logger.error(f"Gemini error: {e}")
+                retries += 1
+                await asyncio.sleep(retry_delay * retries)
+        return None
+
+    async def ainfer_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        return_json: bool,
+        custom_format: Any = None,
+        max_retries: int = 5,
+        retry_delay: int = 5,
+    ) -> AsyncIterator[str]:
+        if return_json:
+            raise ValueError("Gemini JSON mode not supported here")
+
+        contents = ""
+        for m in messages:
+            if m["role"] in ("user", "system"):
+                contents += f"{m['content']}\n"
+        gen_cfg: Dict[str, Any] = {
+            "temperature": (temperature if temperature is not None else 0)
+        }
+        if max_tokens is not None:
+            gen_cfg["max_output_tokens"] = max_tokens
+
+        streamed = False
+        try:
+            model = self._build_model()
+            stream = await model.generate_content_async(
+                contents, generation_config=gen_cfg, stream=True
+            )
+            async for chunk in stream:
+                text = self._extract_text_from_stream_chunk(chunk)
+                if text:
+                    streamed = True
+                    yield text
+            return
+        except Exception as e:  # noqa: BLE001
+            if streamed:
+                raise
+            self.logger.error(f"Gemini streaming error: {e}")
+
+        async for text in super().ainfer_stream(
+            messages,
+            temperature,
+            max_tokens,
+            return_json,
+            custom_format,
+            max_retries,
+            retry_delay,
+        ):
+            yield text
+
 
 class OpenRouterClient(BaseLLMClient):
     """
@@ -592,10 +974,19 @@ class OpenRouterClient(BaseLLMClient):
         if site_name := os.getenv("OPENROUTER_SITE_NAME"):
             default_headers["X-Title"] = site_name
 
-        self.client = self._OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=api_key,
-            default_headers=default_headers if default_headers else None,
+        self._client_args = {
+            "base_url": "https://openrouter.ai/api/v1",
+            "api_key": api_key,
+            "default_headers": default_headers if default_headers else None,
+        }
+        self._client_key = (
+            "openrouter",
+            self._client_args["base_url"],
+            _credential_id(api_key),
+            tuple(sorted(default_headers.items())),
+        )
+        self.client = shared_client(
+            self._client_key, lambda: self._OpenAI(**self._client_args)
         )
 
         # Load env overrides for model limits
@@ -755,11 +1146,126 @@ class OpenRouterClient(BaseLLMClient):
         self.logger.error("Max retries exceeded. Unable to complete the request.")
         return None
 
+    def _async_client(self):
+        return shared_async_client(
+            self._client_key, lambda: self._openai.AsyncOpenAI(**self._client_args)
+        )
+
+    def _request_kwargs(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        response_format: Any = None,
+    ) -> Dict[str, Any]:
+        eff_max = (
+            max_tokens
+            if max_tokens is not None
+            else self._resolve_default_max_tokens(self.model_name)
+        )
+        kwargs: Dict[str, Any] = {"model": self.model_name, "messages": messages}
+        if response_format is not None:
+            kwargs["response_format"] = response_format
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        if eff_max is not None:
+            kwargs["max_tokens"] = eff_max
+        return kwargs
+
+    async def ainfer(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        return_json: bool,
+        custom_format: Any = None,
+        max_retries: int = 5,
+        retry_delay: int = 5,
+    ) -> Optional[str]:
+        """Execute inference using OpenRouter without blocking the event loop."""
+        retries = 0
+        client = self._async_client()
+        call_fn = (
+            client.chat.completions.parse
+            if custom_format is not None
+            else client.chat.completions.create
+        )
+        response_format = (
+            custom_format
+            if custom_format is not None
+            else ({"type": "json_object"} if return_json else None)
+        )
+        kwargs = self._request_kwargs(
+            messages, temperature, max_tokens, response_format
+        )
+
+        while retries < max_retries:
+            try:
+                resp = await call_fn(**kwargs)
+                if custom_format is not None:
+                    return resp.choices[0].message.parsed.model_dump()
+                return resp.choices[0].message.content
+            except self._openai.RateLimitError:  # type: ignore[attr-defined]
+                self.logger.warning(
+                    f"Rate limit exceeded. Retrying in {retry_delay} seconds..."
+                )
+                retries += 1
+                await asyncio.sleep(retry_delay * retries)
+            except Exception as e:  # noqa: BLE001
+                self.logger.error(f"OpenRouter error: {e}")
+                break
+
+        self.logger.error("Max retries exceeded. Unable to complete the request.")
+        return None
+
+    async def ainfer_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        return_json: bool,
+        custom_format: Any = None,
+        max_retries: int = 5,
+        retry_delay: int = 5,
+    ) -> AsyncIterator[str]:
+        if not return_json and custom_format is None:
+            streamed = False
+            try:
+                async for text in self._astream_chat(
+                    self._async_client(),
+                    self._request_kwargs(messages, temperature, max_tokens),
+                    max_retries,
+                    retry_delay,
+                    (self._openai.RateLimitError,),
+                ):
+                    streamed = True
+                    yield text
+                return
+            except Exception as e:  # noqa: BLE001
+                if streamed:
+                    raise
+                self.logger.error(f"OpenRouter streaming error: {e}")
+
+        async for text in super().ainfer_stream(
+            messages,
+            temperature,
+            max_tokens,
+            return_json,
+            custom_format,
+            max_retries,
+            retry_delay,
+        ):
+            yield text
+
 
 class VLLMClient(BaseLLMClient):
+    # Prompts sent per completions request by infer_batch (VLLM_MAX_BATCH_SIZE)
+    DEFAULT_MAX_BATCH_SIZE = 32
+
     def __init__(self, model_name: str, server_url: str, logger):
         try:
             from openai import OpenAI
+            import openai as _openai
         except Exception as e:
             raise RuntimeError("openai package not available for vLLM client") from e
 
@@ -772,10 +1278,18 @@ class VLLMClient(BaseLLMClient):
             server_url = server_url.rstrip("/") + "/v1"
         self.server_url = server_url
         self.logger = logger
+        self._openai = _openai
 
-        self.client = OpenAI(
-            api_key="EMPTY",
-            base_url=self.server_url,
+        self._client_key = ("vllm", self.server_url)
+        self.client = shared_client(
+            self._client_key,
+            lambda: OpenAI(
+                api_key="EMPTY",
+                base_url=self.server_url,
+            ),
+        )
+        self.max_batch_size = int(
+            os.getenv("VLLM_MAX_BATCH_SIZE", self.DEFAULT_MAX_BATCH_SIZE)
         )
 
     def test_api(self) -> None:
@@ -831,3 +1345,240 @@ class VLLMClient(BaseLLMClient):
 
         self.logger.error("Max retries exceeded for vLLM request")
         return None
+
+    def _async_client(self):
+        return shared_async_client(
+            self._client_key,
+            lambda: self._openai.AsyncOpenAI(api_key="EMPTY", base_url=self.server_url),
+        )
+
+    @staticmethod
+    def _request_kwargs(
+        model_name: str,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        return_json: bool,
+    ) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {"model": model_name}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
+        if return_json:
+            kwargs["response_format"] = {"type": "json_object"}
+        return kwargs
+
+    async def ainfer(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        return_json: bool,
+        custom_format: Any = None,
+        max_retries: int = 5,
+        retry_delay: int = 5,
+    ) -> Optional[str]:
+        if custom_format is not None:
+            self.logger.warning("vLLM does not support custom format, ignoring")
+
+        kwargs = self._request_kwargs(
+            self.model_name, temperature, max_tokens, return_json
+        )
+        retries = 0
+        while retries < max_retries:
+            try:
+                resp = await self._async_client().chat.completions.create(
+                    messages=messages, **kwargs
+                )
+                return resp.choices[0].message.content
+            except Exception as e:
+                self.logger.error(f"vLLM error: {e}")
+                retries += 1
+                if retries < max_retries:
+                    await asyncio.sleep(retry_delay * retries)
+
+        self.logger.error("Max retries exceeded for vLLM request")
+        return None
+
+    async def ainfer_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        return_json: bool,
+        custom_format: Any = None,
+        max_retries: int = 5,
+        retry_delay: int = 5,
+    ) -> AsyncIterator[str]:
+        if not return_json:
+            streamed = False
+            try:
+                async for text in self._astream_chat(
+                    self._async_client(),
+                    {
+                        "messages": messages,
+                        **self._request_kwargs(
+                            self.model_name, temperature, max_tokens, False
+                        ),
+                    },
+                    max_retries,
+                    retry_delay,
+                ):
+                    streamed = True
+                    yield text
+                return
+            except Exception as e:  # noqa: BLE001
+                if streamed:
+                    raise
+                self.logger.error(f"vLLM streaming error: {e}")
+
+        async for text in super().ainfer_stream(
+            messages,
+            temperature,
+            max_tokens,
+            return_json,
+            custom_format,
+            max_retries,
+            retry_delay,
+        ):
+            yield text
+
+    def infer_batch(
+        self,
+        prompts: List[Union[str, List[Dict[str, str]]]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        return_json: bool = False,
+        max_retries: int = 5,
+        retry_delay: int = 5,
+    ) -> List[Optional[str]]:
+        """Complete several prompts with as few requests as possible.
+
+        Plain-string prompts (already rendered with the model's chat template)
+        go to the completions endpoint, which takes a list of prompts, up to
+        ``max_batch_size`` per request. Chat message lists cannot share a
+        request; they are sent concurrently so the server batches them.
+        ``return_json`` applies to chat prompts only.
+
+        Returns:
+            One response per prompt, in order; ``None`` for failed prompts.
+        """
+        results: List[Optional[str]] = [None] * len(prompts)
+        text_indexes = [i for i, p in enumerate(prompts) if isinstance(p, str)]
+        chat_indexes = [i for i, p in enumerate(prompts) if not isinstance(p, str)]
+        kwargs = self._request_kwargs(self.model_name, temperature, max_tokens, False)
+
+        for start in range(0, len(text_indexes), self.max_batch_size):
+            batch = text_indexes[start : start + self.max_batch_size]
+            completions = self._retry(
+                lambda: self.client.completions.create(
+                    prompt=[prompts[i] for i in batch], **kwargs
+                ),
+                max_retries,
+                retry_delay,
+            )
+            for i, text in zip(batch, self._batch_texts(completions, len(batch))):
+                results[i] = text
+
+        if chat_indexes:
+            with ThreadPoolExecutor(
+                max_workers=min(len(chat_indexes), self.max_batch_size)
+            ) as executor:
+                responses = executor.map(
+                    lambda i: self.infer(
+                        prompts[i],
+                        temperature,
+                        max_tokens,
+                        return_json,
+                        max_retries=max_retries,
+                        retry_delay=retry_delay,
+                    ),
+                    chat_indexes,
+                )
+                for i, text in zip(chat_indexes, responses):
+                    results[i] = text
+        return results
+
+    async def ainfer_batch(
+        self,
+        prompts: List[Union[str, List[Dict[str, str]]]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        return_json: bool = False,
+        max_retries: int = 5,
+        retry_delay: int = 5,
+    ) -> List[Optional[str]]:
+        """Asynchronous :meth:`infer_batch`."""
+        results: List[Optional[str]] = [None] * len(prompts)
+        text_indexes = [i for i, p in enumerate(prompts) if isinstance(p, str)]
+        kwargs = self._request_kwargs(self.model_name, temperature, max_tokens, False)
+        client = self._async_client()
+
+        async def complete_texts(batch: List[int]):
+            completions = await self._aretry(
+                lambda: client.completions.create(
+                    prompt=[prompts[i] for i in batch], **kwargs
+                ),
+                max_retries,
+                retry_delay,
+            )
+            for i, text in zip(batch, self._batch_texts(completions, len(batch))):
+                results[i] = text
+
+        async def complete_chat(i: int):
+            results[i] = await self.ainfer(
+                prompts[i],
+                temperature,
+                max_tokens,
+                return_json,
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+            )
+
+        semaphore = asyncio.Semaphore(self.max_batch_size)
+
+        async def limited(job):
+            async with semaphore:
+                await job
+
+        jobs = [
+            complete_texts(text_indexes[start : start + self.max_batch_size])
+            for start in range(0, len(text_indexes), self.max_batch_size)
+        ]
+        jobs.extend(
+            complete_chat(i) for i, p in enumerate(prompts) if not isinstance(p, str)
+        )
+        await asyncio.gather(*(limited(job) for job in jobs))
+        return results
+
+    def _retry(self, call: Callable[[], Any], max_retries: int, retry_delay: int):
+        for attempt in range(1, max_retries + 1):
+            try:
+                return call()
+            except Exception as e:
+                self.logger.error(f"vLLM batch error: {e}")
+                if attempt < max_retries:
+                    time.sleep(retry_delay * attempt)
+        return None
+
+    async def _aretry(
+        self, call: Callable[[], Any], max_retries: int, retry_delay: int
+    ):
+        for attempt in range(1, max_retries + 1):
+            try:
+                return await call()
+            except Exception as e:
+                self.logger.error(f"vLLM batch error: {e}")
+                if attempt < max_retries:
+                    await asyncio.sleep(retry_delay * attempt)
+        return None
+
+    @staticmethod
+    def _batch_texts(completions, size: int) -> List[Optional[str]]:
+        """Order completion choices by prompt index."""
+        texts: List[Optional[str]] = [None] * size
+        for position, choice in enumerate(getattr(completions, "choices", None) or []):
+            index = getattr(choice, "index", position)
+            if 0 <= index < size:
+                texts[index] = choice.text
+        return texts
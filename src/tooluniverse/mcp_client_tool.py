@@ -7,10 +7,15 @@ supporting all MCP functionality including tools, resources, and prompts.
 
 import json
 import asyncio
+import atexit
+import threading
+import time
 import websockets
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin
 import warnings
+import anyio
+import httpx
 from mcp.client.session import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 from .base_tool import BaseTool
@@ -18,13 +23,412 @@ from .tool_registry import register_tool
 import os
 
 
+async def _dispatch_mcp_method(
+    session: ClientSession, method: str, params: Optional[Dict] = None
+) -> Dict[str, Any]:
+    """Issue one MCP method on an initialized session and return a JSON dict."""
+    if method == "ping":
+        result = await session.send_ping()
+    elif method == "tools/list":
+        result = await session.list_tools()
+    elif method == "tools/call":
+        if not params or "name" not in params:
+            raise ValueError("Missing tool name for tools/call")
+        result = await session.call_tool(params["name"], params.get("arguments") or {})
+    elif method == "resources/list":
+        result = await session.list_resources()
+    elif method == "resources/read":
+        if not params or "uri" not in params:
+            raise ValueError("Missing uri for resources/read")
+        result = await session.read_resource(params["uri"])
+    elif method == "prompts/list":
+        result = await session.list_prompts()
+    elif method == "prompts/get":
+        if not params or "name" not in params:
+            raise ValueError("Missing prompt name for prompts/get")
+        result = await session.get_prompt(params["name"], params.get("arguments"))
+    else:
+        raise ValueError(f"Unsupported MCP method: {method}")
+
+    if hasattr(result, "model_dump"):
+        return result.model_dump(mode="json")
+    return result
+
+
+# Errors meaning the underlying connection is gone and a new handshake is needed
+_RECONNECT_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+    httpx.TransportError,
+)
+
+# Of those, errors raised before the request left the client: the transport
+# streams were already closed or the server could not be reached
+_UNSENT_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    httpx.ConnectError,
+)
+
+# Methods without side effects, safe to replay on a new connection
+_READ_ONLY_METHODS = frozenset(
+    {
+        "ping",
+        "tools/list",
+        "resources/list",
+        "resources/read",
+        "prompts/list",
+        "prompts/get",
+    }
+)
+
+
+class MCPSessionMetrics:
+    """Counters separating handshake cost from per-call latency for one server."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.handshakes = 0
+        self.handshake_time = 0.0
+        self.calls = 0
+        self.call_time = 0.0
+        self.reconnects = 0
+        self.errors = 0
+
+    def record_handshake(self, elapsed: float):
+        with self._lock:
+            self.handshakes += 1
+            self.handshake_time += elapsed
+
+    def record_call(self, elapsed: float):
+        with self._lock:
+            self.calls += 1
+            self.call_time += elapsed
+
+    def record_reconnect(self):
+        with self._lock:
+            self.reconnects += 1
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "handshakes": self.handshakes,
+                "handshake_time_total": self.handshake_time,
+                "handshake_time_avg": (
+                    self.handshake_time / self.handshakes if self.handshakes else 0.0
+                ),
+                "calls": self.calls,
+                "call_time_total": self.call_time,
+                "call_time_avg": self.call_time / self.calls if self.calls else 0.0,
+                "reconnects": self.reconnects,
+                "errors": self.errors,
+            }
+
+
+class _PooledMCPSession:
+    """
+    A long-lived, initialized MCP session for one server endpoint.
+
+    The transport and ``ClientSession`` context managers are held open by a
+    keeper task on the pool's event loop (anyio requires them to be exited by
+    the task that entered them). The keeper also pings the server every
+    ``keepalive_interval`` seconds; when the connection drops the next request
+    performs a fresh handshake. A request that fails on a dropped connection
+    is retried once if its method is read-only or it never reached the server,
+    so ``tools/call`` is not run twice.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        timeout: float,
+        max_concurrency: int,
+        keepalive_interval: Optional[float],
+        metrics: Optional[MCPSessionMetrics] = None,
+    ):
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.keepalive_interval = keepalive_interval
+        self.metrics = metrics or MCPSessionMetrics()
+        self._session: Optional[ClientSession] = None
+        self._keeper: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+        # Created lazily so they bind to the pool loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._session is not None
+
+    async def request(
+        self, method: str, params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            for attempt in range(2):
+                session = await self._ensure_session()
+                start = time.perf_counter()
+                try:
+                    result = await asyncio.wait_for(
+                        _dispatch_mcp_method(session, method, params), self.timeout
+                    )
+                except _RECONNECT_ERRORS as exc:
+                    self.metrics.record_reconnect()
+                    await self._reset(session)
+                    retryable = method in _READ_ONLY_METHODS or isinstance(
+                        exc, _UNSENT_ERRORS
+                    )
+                    if attempt or not retryable:
+                        self.metrics.record_error()
+                        raise
+                    continue
+                except Exception:
+                    self.metrics.record_error()
+                    raise
+                self.metrics.record_call(time.perf_counter() - start)
+                return result
+
+    async def _ensure_session(self) -> ClientSession:
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            if self._session is not None:
+                return self._session
+
+            start = time.perf_counter()
+            ready = asyncio.get_running_loop().create_future()
+            self._stop = asyncio.Event()
+            self._keeper = asyncio.create_task(self._keep_session(ready, self._stop))
+            try:
+                session = await asyncio.wait_for(asyncio.shield(ready), self.timeout)
+            except BaseException:
+                self.metrics.record_error()
+                self._stop.set()
+                raise
+            self.metrics.record_handshake(time.perf_counter() - start)
+            return session
+
+    async def _keep_session(self, ready: asyncio.Future, stop: asyncio.Event):
+        try:
+            async with streamablehttp_client(self.endpoint, timeout=self.timeout) as (
+                read_stream,
+                write_stream,
+                _,
+            ):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    self._session = session
+                    ready.set_result(session)
+                    await self._keepalive(session, stop)
+        except Exception as exc:
+            if not ready.done():
+                ready.set_exception(exc)
+        finally:
+            if not ready.done():
+                ready.cancel()
+            if self._stop is stop:
+                self._session = None
+
+    async def _keepalive(self, session: ClientSession, stop: asyncio.Event):
+        while not stop.is_set():
+            if not self.keepalive_interval:
+                await stop.wait()
+                return
+            try:
+                await asyncio.wait_for(stop.wait(), self.keepalive_interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await asyncio.wait_for(session.send_ping(), self.timeout)
+            except Exception:
+                self.metrics.record_reconnect()
+                return
+
+    async def _reset(self, stale_session: Optional[ClientSession] = None):
+        """Tear down the current connection (if it is still ``stale_session``)."""
+        if stale_session is not None and self._session is not stale_session:
+            return
+        self._session = None
+        stop, keeper = self._stop, self._keeper
+        if stop is not None:
+            stop.set()
+        if keeper is not None:
+            try:
+                await asyncio.wait_for(keeper, self.timeout)
+            except Exception:
+                keeper.cancel()
+
+    async def close(self):
+        await self._reset()
+
+
+class MCPSessionPool:
+    """
+    Process-wide pool of persistent MCP sessions.
+
+    Sessions are keyed by server endpoint and session options (timeout,
+    concurrency, keepalive), so clients configured differently never inherit
+    each other's limits; metrics are aggregated per endpoint.
+
+    Sessions live on a dedicated background event loop so that synchronous
+    callers (each ``run`` call) and callers on any other event loop share the
+    same initialized connection instead of paying the ``initialize``
+    handshake on every request.
+    """
+
+    _default: Optional["MCPSessionPool"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: Dict[tuple, _PooledMCPSession] = {}
+        self._metrics: Dict[str, MCPSessionMetrics] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def get_default(cls) -> "MCPSessionPool":
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+                atexit.register(cls._default.close)
+            return cls._default
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="MCPSessionPool",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def get_session(
+        self,
+        endpoint: str,
+        *,
+        timeout: float = 30,
+        max_concurrency: int = 16,
+        keepalive_interval: Optional[float] = 30,
+    ) -> _PooledMCPSession:
+        key = (endpoint, timeout, max_concurrency, keepalive_interval)
+        with self._lock:
+            pooled = self._sessions.get(key)
+            if pooled is None:
+                metrics = self._metrics.setdefault(endpoint, MCPSessionMetrics())
+                pooled = _PooledMCPSession(
+                    endpoint,
+                    timeout=timeout,
+                    max_concurrency=max_concurrency,
+                    keepalive_interval=keepalive_interval,
+                    metrics=metrics,
+                )
+                self._sessions[key] = pooled
+            return pooled
+
+    async def request(
+        self,
+        endpoint: str,
+        method: str,
+        params: Optional[Dict] = None,
+        **session_options,
+    ) -> Dict[str, Any]:
+        """Run ``method`` on the pooled session, from any event loop."""
+        pooled = self.get_session(endpoint, **session_options)
+        loop = self.loop
+        if _running_loop() is loop:
+            return await pooled.request(method, params)
+        future = asyncio.run_coroutine_threadsafe(pooled.request(method, params), loop)
+        return await asyncio.wrap_future(future)
+
+    def run_sync(self, coro):
+        """Run ``coro`` on the pool loop and block until it completes."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            metrics = dict(self._metrics)
+        return {
+            endpoint: {
+                "connected": any(
+                    pooled.connected
+                    for pooled in sessions
+                    if pooled.endpoint == endpoint
+                ),
+                **endpoint_metrics.as_dict(),
+            }
+            for endpoint, endpoint_metrics in metrics.items()
+        }
+
+    def close(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._metrics.clear()
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+
+        async def _close_all():
+            await asyncio.gather(
+                *(pooled.close() for pooled in sessions), return_exceptions=True
+            )
+
+        try:
+            asyncio.run_coroutine_threadsafe(_close_all(), loop).result(timeout=10)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
 class BaseMCPClient:
     """
     Base MCP client with common functionality shared between MCPClientTool and MCPAutoLoaderTool.
     Provides session management, request handling, and async cleanup patterns.
+
+    With ``session_pool`` enabled, HTTP requests reuse a persistent session
+    from the process-wide :class:`MCPSessionPool` instead of opening a new
+    connection and re-running ``initialize`` for every call.
     """
 
-    def __init__(self, server_url: str, transport: str = "http", timeout: int = 30):
+    def __init__(
+        self,
+        server_url: str,
+        transport: str = "http",
+        timeout: int = 30,
+        session_pool: bool = False,
+        max_concurrency: int = 16,
+        keepalive_interval: Optional[float] = 30,
+    ):
         self.server_url = os.path.expandvars(server_url)
         # Normalize transport for backward compatibility: treat 'stdio' as HTTP
         normalized_transport = (
@@ -35,6 +439,9 @@ class BaseMCPClient:
         self.transport = normalized_transport
         self.timeout = timeout
         self.session = None
+        self.session_pool = bool(session_pool) and self.transport == "http"
+        self.max_concurrency = max_concurrency
+        self.keepalive_interval = keepalive_interval
 
         # Validate transport (accept 'stdio' via normalization above)
         supported_transports = ["http", "websocket"]
@@ -61,6 +468,16 @@ class BaseMCPClient:
         """Make an MCP JSON-RPC request"""
         if self.transport == "http":
             endpoint = self._get_mcp_endpoint("")
+            if self.session_pool:
+                return await MCPSessionPool.get_default().request(
+                    endpoint,
+                    method,
+                    params,
+                    timeout=self.timeout,
+                    max_concurrency=self.max_concurrency,
+                    keepalive_interval=self.keepalive_interval,
+                )
+
             async with streamablehttp_client(endpoint, timeout=self.timeout) as (
                 read_stream,
                 write_stream,
@@ -68,35 +485,7 @@ class BaseMCPClient:
             ):
                 async with ClientSession(read_stream, write_stream) as session:
                     await session.initialize()
-
-                    if method == "tools/list":
-                        result = await session.list_tools()
-                    elif method == "tools/call":
-                        if not params or "name" not in params:
-                            raise ValueError("Missing tool name for tools/call")
-                        result = await session.call_tool(
-                            params["name"], params.get("arguments") or {}
-                        )
-                    elif method == "resources/list":
-                        result = await session.list_resources()
-                    elif method == "resources/read":
-                        if not params or "uri" not in params:
-                            raise ValueError("Missing uri for resources/read")
-                        result = await session.read_resource(params["uri"])
-                    elif method == "prompts/list":
-                        result = await session.list_prompts()
-                    elif method == "prompts/get":
-                        if not params or "name" not in params:
-                            raise ValueError("Missing prompt name for prompts/get")
-                        result = await session.get_prompt(
-                            params["name"], params.get("arguments")
-                        )
-                    else:
-                        raise ValueError(f"Unsupported MCP method: {method}")
-
-                    if hasattr(result, "model_dump"):
-                        return result.model_dump(mode="json")
-                    return result
+                    return await _dispatch_mcp_method(session, method, params)
 
         elif self.transport == "websocket":
             async with websockets.connect(self.server_url) as websocket:
@@ -116,8 +505,21 @@ class BaseMCPClient:
         else:
             raise ValueError(f"Unsupported transport: {self.transport}")
 
+    def get_session_metrics(self) -> Dict[str, Any]:
+        """Return pooled-session metrics for this client's server endpoint."""
+        if not self.session_pool:
+            return {"pooled": False}
+        endpoint = self._get_mcp_endpoint("")
+        stats = MCPSessionPool.get_default().stats().get(endpoint, {})
+        return {"pooled": True, "endpoint": endpoint, **stats}
+
     def _run_with_cleanup(self, async_func):
         """Common async execution pattern with proper cleanup"""
+        if self.session_pool:
+            # Pooled sessions live on the pool loop; run there instead of
+            # building and tearing down a fresh event loop per call
+            return MCPSessionPool.get_default().run_sync(async_func())
+
         try:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -141,8 +543,13 @@ class MCPClientTool(BaseTool, BaseMCPClient):
     """
     A tool that acts as an MCP client to connect to existing MCP servers.
     Supports both HTTP and WebSocket transports.
+
+    Set ``session_pool`` in the tool config to share a persistent session per
+    server (tuned with ``mcp_max_concurrency`` and ``mcp_keepalive_interval``).
     """
 
+    SESSION_POOL_DEFAULT = False
+
     def __init__(self, tool_config):
         BaseTool.__init__(self, tool_config)
         BaseMCPClient.__init__(
@@ -150,6 +557,9 @@ class MCPClientTool(BaseTool, BaseMCPClient):
             server_url=tool_config.get("server_url", "http://localhost:8000"),
             transport=tool_config.get("transport", "http"),
             timeout=tool_config.get("timeout", 600),
+            session_pool=tool_config.get("session_pool", self.SESSION_POOL_DEFAULT),
+            max_concurrency=tool_config.get("mcp_max_concurrency", 16),
+            keepalive_interval=tool_config.get("mcp_keepalive_interval", 30),
         )
 
         # Debug logging for transport configuration
@@ -299,8 +709,13 @@ class MCPProxyTool(MCPClientTool):
     """
     A proxy tool that automatically forwards tool calls to an MCP server.
     This creates individual tools for each tool available on the MCP server.
+
+    Proxies use the shared session pool by default, so every proxy pointing
+    at the same server reuses one initialized session.
     """
 
+    SESSION_POOL_DEFAULT = True
+
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.target_tool_name = tool_config.get("target_tool_name")
@@ -322,6 +737,13 @@ class MCPProxyTool(MCPClientTool):
 
         return self._run_with_cleanup(_run_async)
 
+    async def arun(self, arguments=None, **kwargs):
+        """Forward the call on the caller's event loop without a worker thread"""
+        try:
+            return await self.call_tool(self.target_tool_name, arguments or {})
+        except Exception as e:
+            return {"error": str(e)}
+
 
 @register_tool("MCPServerDiscovery")
 class MCPServerDiscovery:
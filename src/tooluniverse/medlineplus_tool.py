@@ -1,6 +1,7 @@
 # medlineplus_tool.py
 
 import requests
+from .http_transport import http_get
 import xmltodict
 from typing import Optional, Dict, Any
 import re
@@ -256,7 +257,7 @@ class MedlinePlusRESTTool(BaseTool):
 
         # Make request
         try:
-            resp = requests.get(url, timeout=self.timeout)
+            resp = http_get(url, timeout=self.timeout)
             if resp.status_code != 200:
                 return {
                     "error": f"MedlinePlus returned non-200 status code: {resp.status_code}",
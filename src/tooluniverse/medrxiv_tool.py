@@ -1,4 +1,5 @@
 import requests
+from .http_transport import http_get
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -45,7 +46,7 @@ class MedRxivTool(BaseTool):
         )
 
         try:
-            resp = requests.get(url, timeout=20)
+            resp = http_get(url, timeout=20)
             resp.raise_for_status()
             data = resp.json()
         except requests.RequestException as e:
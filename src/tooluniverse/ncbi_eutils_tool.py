@@ -2,10 +2,11 @@
 NCBI E-utilities Tool with Rate Limiting
 
 This module provides a base class for NCBI E-utilities API tools with
-built-in rate limiting and retry logic to handle 429 errors.
+built-in rate limiting. Requests are paced by the process-wide per-host
+limiter, so every E-utilities tool shares NCBI's budget instead of throttling
+per instance; 429 responses are retried in one place, the shared session.
 """
 
-import time
 import requests
 from typing import Dict, Any, Optional
 from .base_tool import BaseTool
@@ -14,82 +15,70 @@ from .base_tool import BaseTool
 class NCBIEUtilsTool(BaseTool):
     """Base class for NCBI E-utilities tools with rate limiting."""
 
+    HOST = "eutils.ncbi.nlm.nih.gov"
+
     def __init__(self, tool_config):
         super().__init__(tool_config)
-        self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.last_request_time = 0
-        self.min_interval = 0.34  # ~3 requests/second (NCBI limit without API key)
-        self.max_retries = 3
-        self.initial_retry_delay = 1
-        self.session = requests.Session()
+        self.base_url = f"https://{self.HOST}/entrez/eutils"
+        self.session = self.get_http_session()
         self.session.headers.update(
             {"Accept": "application/json", "User-Agent": "ToolUniverse/1.0"}
         )
         self.timeout = 30
 
+    def get_rate_limit(self) -> Optional[Dict[str, Any]]:
+        """NCBI allows 3 requests/second per client without an API key."""
+        configured = super().get_rate_limit()
+        if configured:
+            return configured
+        return {"requests_per_second": 3, "burst": 1, "hosts": [self.HOST]}
+
     def _make_request(
         self, endpoint: str, params: Optional[Dict] = None
     ) -> Dict[str, Any]:
-        """Make request with rate limiting and retry logic."""
+        """Make a rate-limited request.
+
+        The shared session paces requests to NCBI and retries 429 responses
+        after their ``Retry-After`` delay, so a 429 that reaches this method
+        has already used up those retries and is reported as an error.
+        """
         url = f"{self.base_url}{endpoint}"
 
-        for attempt in range(self.max_retries):
-            # Rate limiting
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.min_interval:
-                time.sleep(self.min_interval - elapsed)
+        try:
+            response = self.session.get(url, params=params, timeout=self.timeout)
+            response.raise_for_status()
 
+            # Try to parse JSON response
             try:
-                response = self.session.get(url, params=params, timeout=self.timeout)
-                self.last_request_time = time.time()
-                response.raise_for_status()
-
-                # Try to parse JSON response
-                try:
-                    data = response.json()
-                except ValueError:
-                    # If not JSON, return text
-                    data = response.text
-
-                return {
-                    "status": "success",
-                    "data": data,
-                    "url": url,
-                    "content_type": response.headers.get(
-                        "content-type", "application/json"
-                    ),
-                }
+                data = response.json()
+            except ValueError:
+                # If not JSON, return text
+                data = response.text
 
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 429 and attempt < self.max_retries - 1:
-                    # Exponential backoff for rate limiting
-                    delay = self.initial_retry_delay * (2**attempt)
-                    print(
-                        f"Rate limited, retrying in {delay} seconds... (attempt {attempt + 1}/{self.max_retries})"
-                    )
-                    time.sleep(delay)
-                    continue
-                else:
-                    return {
-                        "status": "error",
-                        "error": f"NCBI E-utilities API request failed: {str(e)}",
-                        "url": url,
-                        "status_code": (
-                            e.response.status_code if hasattr(e, "response") else None
-                        ),
-                    }
-            except requests.exceptions.RequestException as e:
-                return {
-                    "status": "error",
-                    "error": f"NCBI E-utilities API request failed: {str(e)}",
-                    "url": url,
-                }
+            return {
+                "status": "success",
+                "data": data,
+                "url": url,
+                "content_type": response.headers.get(
+                    "content-type", "application/json"
+                ),
+            }
 
-        return {
-            "status": "error",
-            "error": f"NCBI E-utilities API request failed after {self.max_retries} attempts",
-            "url": url,
-        }
+        except requests.exceptions.HTTPError as e:
+            return {
+                "status": "error",
+                "error": f"NCBI E-utilities API request failed: {str(e)}",
+                "url": url,
+                "status_code": (
+                    e.response.status_code if hasattr(e, "response") else None
+                ),
+            }
+        except requests.exceptions.RequestException as e:
+            return {
+                "status": "error",
+                "error": f"NCBI E-utilities API request failed: {str(e)}",
+                "url": url,
+            }
 
     def run(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the tool with given arguments."""
@@ -133,7 +133,7 @@ class OLSTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = tool_config.get("base_url", OLS_BASE_URL).rstrip("/")
         self.timeout = tool_config.get("timeout", REQUEST_TIMEOUT)
-        self.session = requests.Session()
+        self.session = self.get_http_session()
 
     def __del__(self):
         try:
@@ -1,4 +1,5 @@
 import requests
+from .http_transport import http_get
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -39,7 +40,7 @@ class OpenAIRETool(BaseTool):
             "query": query,
         }
         try:
-            resp = requests.get(endpoint, params=params, timeout=20)
+            resp = http_get(endpoint, params=params, timeout=20)
             resp.raise_for_status()
             data = resp.json()
         except requests.RequestException as e:
@@ -1,4 +1,4 @@
-import requests
+from .http_transport import http_get, http_post
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 import copy
@@ -34,11 +34,9 @@ def _execute_opentargets_query(chembl_id):
         )
     except ImportError:
         # Fallback if graphql_tool not available
-        import requests
-
         query = _get_drug_names_query()
         variables = {"chemblId": chembl_id}
-        response = requests.post(
+        response = http_post(
             _OPENTARGETS_ENDPOINT, json={"query": query, "variables": variables}
         )
         try:
@@ -265,7 +263,7 @@ def search_openfda(
 
     print(full_url)
 
-    response = requests.get(full_url)
+    response = http_get(full_url)
 
     # Get the JSON response
     response_data = response.json()
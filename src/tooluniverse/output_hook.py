@@ -16,6 +16,9 @@ leveraging AgenticTool and ComposeTool for intelligent output processing.
 """
 
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 from pathlib import Path
@@ -23,6 +26,22 @@ from tooluniverse.logging_config import get_logger
 
 _logger = get_logger(__name__)
 
+# Runs summarization composers so a timed-out call returns immediately while
+# the composer finishes in the background
+_COMPOSER_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_COMPOSER_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_composer_executor() -> ThreadPoolExecutor:
+    global _COMPOSER_EXECUTOR
+    with _COMPOSER_EXECUTOR_LOCK:
+        if _COMPOSER_EXECUTOR is None:
+            _COMPOSER_EXECUTOR = ThreadPoolExecutor(
+                max_workers=int(os.getenv("TOOLUNIVERSE_SUMMARY_HOOK_WORKERS", "4")),
+                thread_name_prefix="tooluniverse-summarizer",
+            )
+        return _COMPOSER_EXECUTOR
+
 
 class HookRule:
     """
@@ -202,6 +221,8 @@ class SummarizationHookConfig:
     focus_areas: str = "key_findings_and_results"
     max_summary_length: int = 3000
     composer_timeout_sec: int = 60
+    max_concurrency: int = 4
+    merge_fan_in: int = 8
 
     def validate(self) -> "SummarizationHookConfig":
         # Validate numeric fields; clamp to sensible defaults if invalid
@@ -214,6 +235,10 @@ class SummarizationHookConfig:
             or self.composer_timeout_sec <= 0
         ):
             self.composer_timeout_sec = 60
+        if not isinstance(self.max_concurrency, int) or self.max_concurrency <= 0:
+            self.max_concurrency = 4
+        if not isinstance(self.merge_fan_in, int) or self.merge_fan_in < 2:
+            self.merge_fan_in = 8
         if not isinstance(self.composer_tool, str) or not self.composer_tool:
             self.composer_tool = "OutputSummarizationComposer"
         return self
@@ -237,6 +262,8 @@ class SummarizationHook(OutputHook):
         chunk_size (int): Size of chunks for processing large outputs
         focus_areas (str): Areas to focus on during summarization
         max_summary_length (int): Maximum length of final summary
+        max_concurrency (int): Chunk summaries generated concurrently
+        merge_fan_in (int): Summaries merged per call for very long outputs
     """
 
     def __init__(self, config: Dict[str, Any] | SummarizationHookConfig, tooluniverse):
@@ -261,6 +288,8 @@ class SummarizationHook(OutputHook):
                 focus_areas=raw.get("focus_areas", "key_findings_and_results"),
                 max_summary_length=raw.get("max_summary_length", 3000),
                 composer_timeout_sec=raw.get("composer_timeout_sec", 60),
+                max_concurrency=raw.get("max_concurrency", 4),
+                merge_fan_in=raw.get("merge_fan_in", 8),
             )
         self.config_obj = cfg.validate()
         self.composer_tool = self.config_obj.composer_tool
@@ -268,6 +297,8 @@ class SummarizationHook(OutputHook):
         self.focus_areas = self.config_obj.focus_areas
         self.max_summary_length = self.config_obj.max_summary_length
         self.composer_timeout_sec = self.config_obj.composer_timeout_sec
+        self.max_concurrency = self.config_obj.max_concurrency
+        self.merge_fan_in = self.config_obj.merge_fan_in
 
     def process(
         self,
@@ -337,7 +368,11 @@ class SummarizationHook(OutputHook):
                 "chunk_size": self.chunk_size,
                 "focus_areas": self.focus_areas,
                 "max_summary_length": self.max_summary_length,
+                "max_concurrency": self.max_concurrency,
+                "merge_fan_in": self.merge_fan_in,
             }
+            # Partial summaries are streamed to the caller's callback, if any
+            stream_callback = context.get("stream_callback")
 
             # Call Compose Summarizer Tool through ToolUniverse
             _logger.debug(
@@ -346,21 +381,17 @@ class SummarizationHook(OutputHook):
                 self.composer_timeout_sec,
             )
             # Run composer with timeout to avoid hangs
+            _future = _get_composer_executor().submit(
+                self.tooluniverse.run_one_function,
+                {"name": self.composer_tool, "arguments": composer_args},
+                stream_callback=stream_callback,
+            )
             try:
-                from concurrent.futures import (
-                    ThreadPoolExecutor,
-                )
-
-                def _call_composer():
-                    return self.tooluniverse.run_one_function(
-                        {"name": self.composer_tool, "arguments": composer_args}
-                    )
-
-                with ThreadPoolExecutor(max_workers=1) as _pool:
-                    _future = _pool.submit(_call_composer)
-                    composer_result = _future.result(timeout=self.composer_timeout_sec)
+                composer_result = _future.result(timeout=self.composer_timeout_sec)
             except Exception as _e_timeout:
-                # Timeout or execution error; log and fall back to original output
+                # Timeout or execution error; log and fall back to original
+                # output without waiting for the composer to finish
+                _future.cancel()
                 _logger.warning("Composer execution failed/timeout: %s", _e_timeout)
                 return result
             # Debug: show composer result meta
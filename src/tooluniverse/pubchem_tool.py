@@ -1,6 +1,7 @@
 # pubchem_tool.py
 
 import requests
+from .http_transport import http_get
 import re
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -110,7 +111,7 @@ class PubChemRESTTool(BaseTool):
                 else:
                     url += "?MaxRecords=10"
 
-            resp = requests.get(url, timeout=30)
+            resp = http_get(url, timeout=30)
         except requests.Timeout:
             return {
                 "error": "Request to PubChem PUG-REST timed out, try reducing query scope or retry later."
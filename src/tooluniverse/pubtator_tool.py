@@ -5,7 +5,7 @@ import re
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import requests
+from .http_transport import http_request
 
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -52,7 +52,7 @@ class PubTatorTool(BaseTool):
             url = f"{BASE_URL.rstrip('/')}/search/"
             data = None
             headers: Dict[str, str] = {}
-            response = requests.request(
+            response = http_request(
                 self._method,
                 url,
                 params=self._query_params(new_args),
@@ -94,7 +94,7 @@ class PubTatorTool(BaseTool):
                 headers["Content-Type"] = "application/json"
 
         # ---------- perform request ----------
-        response = requests.request(
+        response = http_request(
             self._method,
             url,
             params=self._query_params(args) if self._method != "POST" else {},
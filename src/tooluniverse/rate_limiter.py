@@ -0,0 +1,411 @@
+"""
+Process-wide, per-host rate limiting for outbound HTTP requests.
+
+Every request sent through :mod:`tooluniverse.http_transport` first takes a
+token from the bucket of its upstream host, so parallel batches and
+independent tool instances share one budget per API instead of each
+throttling (or not) on its own.
+
+Limits come from the ``rate_limit`` entry of a tool's JSON config::
+
+    "batch_max_concurrency": 4,
+    "rate_limit": {"requests_per_second": 3, "burst": 3,
+                   "hosts": ["eutils.ncbi.nlm.nih.gov"]}
+
+``rate_limit`` may also be a bare number (requests per second). Without
+``hosts`` the limit applies to whichever hosts the tool contacts. The first
+limit registered for a host wins; :meth:`HostRateLimiter.configure` can
+override it explicitly.
+
+Buckets adapt to the upstream: a 429/503 response halves the effective
+rate and blocks the host until ``Retry-After`` has passed, and successful
+responses recover the rate gradually. Hosts without a configured limit are
+unthrottled until they first answer 429/503.
+
+A block is never longer than ``TOOLUNIVERSE_RATE_LIMIT_MAX_WAIT``: while a
+host's longer ``Retry-After`` is still running, requests to it fail at once
+with :class:`RateLimitExceeded` instead of sleeping.
+
+Environment variables:
+
+- ``TOOLUNIVERSE_RATE_LIMIT_ENABLED``: set to ``false`` to disable limiting
+- ``TOOLUNIVERSE_RATE_LIMIT_ADAPTIVE_RPS``: starting rate for hosts that
+  start throttling without a configured limit (5)
+- ``TOOLUNIVERSE_RATE_LIMIT_RETRIES``: automatic retries of 429/503
+  responses (2)
+- ``TOOLUNIVERSE_RATE_LIMIT_MAX_WAIT``: longest ``Retry-After`` in seconds
+  that is waited out automatically (30); longer ones fail fast
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from .exceptions import ToolRateLimitError
+
+RATE_LIMITED_STATUSES = (429, 503)
+
+# (tool name, rate_limit config) of the tool currently executing
+_current_tool: contextvars.ContextVar[Tuple[Optional[str], Any]] = (
+    contextvars.ContextVar("tooluniverse_rate_limit_tool", default=(None, None))
+)
+
+
+class RateLimitExceeded(ToolRateLimitError, requests.exceptions.RequestException):
+    """A host asked for a longer ``Retry-After`` than the limiter waits out.
+
+    Also a ``RequestException``, so tools that already handle failed
+    requests report it like any other request error.
+    """
+
+    def __init__(self, host: str, retry_after: float):
+        ToolRateLimitError.__init__(
+            self,
+            f"Rate limit exceeded for {host}: retry after {retry_after:.0f}s",
+            details={"host": host, "retry_after": retry_after},
+        )
+        self.host = host
+        self.retry_after = retry_after
+        self.response = None
+        self.request = None
+
+
+def parse_rate_limit(config: Any) -> Optional[Dict[str, Any]]:
+    """Normalize a ``rate_limit`` tool-config entry.
+
+    Returns:
+        ``{"requests_per_second", "burst", "hosts"}`` or ``None`` when the
+        entry is missing or invalid.
+    """
+    if config is None or isinstance(config, bool):
+        return None
+    if isinstance(config, (int, float, str)):
+        config = {"requests_per_second": config}
+    if not isinstance(config, dict):
+        return None
+    try:
+        rate = float(config.get("requests_per_second"))
+    except (TypeError, ValueError):
+        return None
+    if rate <= 0:
+        return None
+    try:
+        burst = int(config.get("burst") or max(1, int(rate)))
+    except (TypeError, ValueError):
+        burst = max(1, int(rate))
+    hosts = config.get("hosts") or []
+    if isinstance(hosts, str):
+        hosts = [hosts]
+    return {
+        "requests_per_second": rate,
+        "burst": max(1, burst),
+        "hosts": [str(host).lower() for host in hosts],
+    }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def host_of(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+@contextmanager
+def rate_limit_context(tool_name: Optional[str], rate_limit: Any = None):
+    """Attribute requests made inside the block to ``tool_name``."""
+    token = _current_tool.set((tool_name, rate_limit))
+    try:
+        yield
+    finally:
+        _current_tool.reset(token)
+
+
+def current_tool() -> Tuple[Optional[str], Any]:
+    return _current_tool.get()
+
+
+@dataclass
+class _HostBucket:
+    """Token bucket with AIMD rate adaptation for one host."""
+
+    configured_rate: Optional[float]
+    burst: int
+    rate: Optional[float] = None
+    tokens: float = 0.0
+    updated_at: float = field(default_factory=time.monotonic)
+    blocked_until: float = 0.0
+    # End of a Retry-After longer than the limiter's max_wait
+    refused_until: float = 0.0
+    last_penalty: float = 0.0
+    tools: Set[str] = field(default_factory=set)
+    requests: int = 0
+    throttled: int = 0
+    wait_time: float = 0.0
+    rate_limited: int = 0
+    retries: int = 0
+
+    def __post_init__(self):
+        self.rate = self.configured_rate
+        self.tokens = float(self.burst)
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        self.requests += 1
+        wait = max(0.0, self.blocked_until - now)
+        if self.rate:
+            elapsed = max(0.0, now - self.updated_at)
+            self.tokens = min(float(self.burst), self.tokens + elapsed * self.rate)
+            self.updated_at = now
+            self.tokens -= 1.0
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens / self.rate)
+        if wait > 0:
+            self.throttled += 1
+            self.wait_time += wait
+        return wait
+
+
+class HostRateLimiter:
+    """Thread-safe registry of per-host token buckets."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        adaptive_rps: float = 5.0,
+        min_rps: float = 0.1,
+        recovery_window: float = 60.0,
+        max_wait: float = 30.0,
+    ):
+        self.enabled = enabled
+        self.max_wait = max_wait
+        self.adaptive_rps = adaptive_rps
+        self.min_rps = min_rps
+        self.recovery_window = recovery_window
+        self._buckets: Dict[str, _HostBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "HostRateLimiter":
+        return cls(
+            enabled=os.getenv("TOOLUNIVERSE_RATE_LIMIT_ENABLED", "true").lower()
+            in ("true", "1", "yes"),
+            adaptive_rps=float(os.getenv("TOOLUNIVERSE_RATE_LIMIT_ADAPTIVE_RPS", "5")),
+            max_wait=float(os.getenv("TOOLUNIVERSE_RATE_LIMIT_MAX_WAIT", "30")),
+        )
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+    def configure(
+        self, host: str, requests_per_second: float, burst: Optional[int] = None
+    ) -> None:
+        """Set (or replace) the limit of ``host``."""
+        host = host.lower()
+        burst = burst or max(1, int(requests_per_second))
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                self._buckets[host] = _HostBucket(
+                    configured_rate=float(requests_per_second), burst=int(burst)
+                )
+            else:
+                bucket.configured_rate = float(requests_per_second)
+                bucket.rate = bucket.configured_rate
+                bucket.burst = int(burst)
+                bucket.tokens = min(bucket.tokens, float(burst))
+
+    def _bucket(
+        self, host: str, default_limit: Any, tool_name: Optional[str]
+    ) -> _HostBucket:
+        # Caller holds self._lock
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            limit = parse_rate_limit(default_limit)
+            if limit and (not limit["hosts"] or host in limit["hosts"]):
+                bucket = _HostBucket(
+                    configured_rate=limit["requests_per_second"], burst=limit["burst"]
+                )
+            else:
+                bucket = _HostBucket(configured_rate=None, burst=1)
+            self._buckets[host] = bucket
+        elif bucket.configured_rate is None:
+            limit = parse_rate_limit(default_limit)
+            if limit and (not limit["hosts"] or host in limit["hosts"]):
+                bucket.configured_rate = limit["requests_per_second"]
+                bucket.burst = limit["burst"]
+                if bucket.rate is None or bucket.rate > bucket.configured_rate:
+                    bucket.rate = bucket.configured_rate
+                    bucket.tokens = min(bucket.tokens, float(bucket.burst))
+        if tool_name:
+            bucket.tools.add(tool_name)
+        return bucket
+
+    # ------------------------------------------------------------------
+    # Acquire / observe
+    # ------------------------------------------------------------------
+    def reserve(
+        self,
+        host: str,
+        default_limit: Any = None,
+        tool_name: Optional[str] = None,
+    ) -> float:
+        """Reserve a request slot for ``host``; return seconds to wait.
+
+        Raises:
+            RateLimitExceeded: the host asked for a longer ``Retry-After``
+                than ``max_wait`` and it has not passed yet.
+        """
+        if not self.enabled or not host:
+            return 0.0
+        context_tool, context_limit = current_tool()
+        tool_name = tool_name or context_tool
+        if default_limit is None:
+            default_limit = context_limit
+        host = host.lower()
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(host, default_limit, tool_name)
+            if bucket.refused_until > now:
+                raise RateLimitExceeded(host, bucket.refused_until - now)
+            return bucket.reserve(now)
+
+    def acquire(
+        self, host: str, default_limit: Any = None, tool_name: Optional[str] = None
+    ) -> float:
+        """Block until a request to ``host`` may be sent; return the wait."""
+        wait = self.reserve(host, default_limit, tool_name)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(
+        self, host: str, default_limit: Any = None, tool_name: Optional[str] = None
+    ) -> float:
+        """Coroutine variant of :meth:`acquire`."""
+        wait = self.reserve(host, default_limit, tool_name)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def observe(
+        self, host: str, status_code: int, retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """Feed a response status back into the host's bucket.
+
+        Returns:
+            The ``Retry-After`` delay in seconds for 429/503 responses (or the
+            backoff chosen when the header is absent), else ``None``. The host
+            is blocked for at most ``max_wait`` seconds; a longer delay makes
+            requests to it raise :class:`RateLimitExceeded` until it passes.
+        """
+        if not self.enabled or not host:
+            return None
+        host = host.lower()
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = _HostBucket(
+                    configured_rate=None, burst=1
+                )
+
+            if status_code in RATE_LIMITED_STATUSES:
+                bucket.rate_limited += 1
+                bucket.last_penalty = now
+                current = bucket.rate or self.adaptive_rps
+                bucket.rate = max(self.min_rps, current / 2.0)
+                bucket.tokens = min(bucket.tokens, 0.0)
+                bucket.updated_at = now
+                delay = parse_retry_after(retry_after)
+                if delay is None:
+                    delay = 1.0 / bucket.rate
+                if delay > self.max_wait:
+                    bucket.refused_until = max(bucket.refused_until, now + delay)
+                bucket.blocked_until = max(
+                    bucket.blocked_until, now + min(delay, self.max_wait)
+                )
+                return delay
+
+            if bucket.rate is not None and bucket.rate != bucket.configured_rate:
+                ceiling = bucket.configured_rate or self.adaptive_rps
+                bucket.rate = min(ceiling, bucket.rate + ceiling * 0.05)
+                if (
+                    bucket.configured_rate is None
+                    and bucket.rate >= ceiling
+                    and now - bucket.last_penalty > self.recovery_window
+                ):
+                    # Host has been healthy for a while: lift the adaptive cap
+                    bucket.rate = None
+            return None
+
+    def record_retry(self, host: str) -> None:
+        with self._lock:
+            bucket = self._buckets.get(host.lower())
+            if bucket is not None:
+                bucket.retries += 1
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+    def stats(self, tool_name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Per-host counters, optionally restricted to hosts used by a tool."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                host: {
+                    "configured_rate": bucket.configured_rate,
+                    "current_rate": bucket.rate,
+                    "burst": bucket.burst,
+                    "requests": bucket.requests,
+                    "throttled": bucket.throttled,
+                    "wait_time": round(bucket.wait_time, 6),
+                    "rate_limited_responses": bucket.rate_limited,
+                    "retries": bucket.retries,
+                    "blocked_for": max(0.0, bucket.blocked_until - now),
+                    "refused_for": max(0.0, bucket.refused_until - now),
+                    "tools": sorted(bucket.tools),
+                }
+                for host, bucket in self._buckets.items()
+                if tool_name is None or tool_name in bucket.tools
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+_default_limiter: Optional[HostRateLimiter] = None
+_default_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Return the process-wide limiter, creating it from the environment."""
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = HostRateLimiter.from_env()
+        return _default_limiter
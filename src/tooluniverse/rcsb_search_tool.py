@@ -6,6 +6,7 @@ Supports both sequence-based and structure-based similarity search.
 """
 
 import requests
+from .http_transport import http_post
 from typing import Dict, Any, Optional
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -345,7 +346,7 @@ class RCSBSearchTool(BaseTool):
 
         # Make API request
         try:
-            response = requests.post(
+            response = http_post(
                 self.api_url,
                 json=api_query,
                 headers={"Content-Type": "application/json"},
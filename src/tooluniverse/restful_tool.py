@@ -1,11 +1,13 @@
 from .graphql_tool import GraphQLTool
 import requests
+from .http_transport import get_async_http_session, http_get
+from .rate_limiter import get_rate_limiter, host_of
 import copy
 from .tool_registry import register_tool
 
 
 def execute_RESTful_query(endpoint_url, variables=None):
-    response = requests.get(endpoint_url, params=variables)
+    response = http_get(endpoint_url, params=variables)
     try:
         result = response.json()
 
@@ -24,6 +26,46 @@ def execute_RESTful_query(endpoint_url, variables=None):
         print(f"An error occurred: {e}")
 
 
+def _query_params(variables):
+    """Flatten ``variables`` into the query pairs ``requests`` would send."""
+    params = []
+    for key, value in (variables or {}).items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        params.extend((key, str(item)) for item in values if item is not None)
+    return params
+
+
+async def aexecute_RESTful_query(endpoint_url, variables=None):
+    """Asynchronous counterpart of :func:`execute_RESTful_query`."""
+    import aiohttp
+
+    limiter = get_rate_limiter()
+    host = host_of(endpoint_url)
+    try:
+        await limiter.acquire_async(host)
+        session = get_async_http_session()
+        async with session.get(
+            endpoint_url, params=_query_params(variables)
+        ) as response:
+            limiter.observe(host, response.status, response.headers.get("Retry-After"))
+            result = await response.json(content_type=None)
+    except (aiohttp.ContentTypeError, ValueError):
+        print("JSONDecodeError: Could not decode the response as JSON")
+        return False
+    except aiohttp.ClientResponseError as e:
+        print(f"HTTP error occurred: {e}")
+        return None
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return None
+
+    # Check if the response contains errors
+    if isinstance(result, dict) and "error" in result:
+        print("Invalid Query: ", result["error"])
+        return False
+    return result
+
+
 @register_tool("RESTfulTool")
 class RESTfulTool(GraphQLTool):
     def __init__(self, tool_config, endpoint_url):
@@ -35,6 +77,12 @@ class RESTfulTool(GraphQLTool):
             endpoint_url=self.endpoint_url, variables=arguments
         )
 
+    async def arun(self, arguments, **kwargs):
+        arguments = copy.deepcopy(arguments)
+        return await aexecute_RESTful_query(
+            endpoint_url=self.endpoint_url, variables=arguments
+        )
+
 
 @register_tool("Monarch")
 class MonarchTool(RESTfulTool):
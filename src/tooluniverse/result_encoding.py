@@ -0,0 +1,120 @@
+"""
+JSON encoding of tool results for MCP responses.
+
+SMCP returns every tool result as JSON text. Text that a tool (or a worker
+process) has already serialized can be wrapped in :class:`PreSerialized` and
+is then passed through without being parsed again. Containers are encoded
+with ``orjson`` when it is installed and with the standard library otherwise.
+:func:`encode_result_chunks` splits large payloads into several pieces, so a
+response does not need one giant string holding the whole document.
+"""
+
+import json
+from typing import Any, List
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# First characters a JSON document can start with
+_JSON_START = frozenset('{["-0123456789tfn')
+
+
+class PreSerialized(str):
+    """JSON text that is known to be valid and is returned verbatim.
+
+    It is a plain ``str`` everywhere else, so tools can return it wherever a
+    string result is accepted.
+    """
+
+    __slots__ = ()
+
+
+def _orjson_dumps(value: Any) -> bytes:
+    return orjson.dumps(
+        value,
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+
+def dumps(value: Any) -> str:
+    """Serialize ``value`` like ``json.dumps(value, ensure_ascii=False, default=str)``."""
+    if orjson is not None:
+        try:
+            return _orjson_dumps(value).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bits or circular structures
+            pass
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def is_json_text(text: str) -> bool:
+    """Return True if ``text`` is a complete JSON document."""
+    if isinstance(text, PreSerialized):
+        return True
+    stripped = text.lstrip()
+    if not stripped or stripped[0] not in _JSON_START:
+        return False
+    try:
+        if orjson is not None:
+            orjson.loads(text)
+        else:
+            json.loads(text)
+    except ValueError:
+        return False
+    return True
+
+
+def encode_result(result: Any) -> PreSerialized:
+    """Return the JSON text SMCP sends for ``result``.
+
+    Strings that already hold JSON are returned unchanged, other strings and
+    scalars are wrapped as ``{"result": ...}``.
+    """
+    if isinstance(result, PreSerialized):
+        return result
+    if isinstance(result, str):
+        if is_json_text(result):
+            return PreSerialized(result)
+        return PreSerialized(dumps({"result": result}))
+    if isinstance(result, (dict, list)):
+        return PreSerialized(dumps(result))
+    return PreSerialized(dumps({"result": str(result)}))
+
+
+def _split_utf8(data: bytes, chunk_size: int) -> List[str]:
+    chunks = []
+    start = 0
+    while start < len(data):
+        end = min(start + chunk_size, len(data))
+        # Never cut a multi-byte character in half
+        while start < end < len(data) and data[end] & 0xC0 == 0x80:
+            end -= 1
+        if end == start:
+            # chunk_size is smaller than this character; take it whole
+            end += 1
+            while end < len(data) and data[end] & 0xC0 == 0x80:
+                end += 1
+        chunks.append(data[start:end].decode("utf-8"))
+        start = end
+    return chunks
+
+
+def encode_result_chunks(result: Any, chunk_size: int) -> List[str]:
+    """Encode ``result`` into pieces of about ``chunk_size`` characters.
+
+    Joining the pieces gives exactly :func:`encode_result`'s text. Containers
+    are split straight from ``orjson``'s output without building the whole
+    string first.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if orjson is not None and isinstance(result, (dict, list)):
+        try:
+            return _split_utf8(_orjson_dumps(result), chunk_size)
+        except TypeError:
+            pass
+    text = encode_result(result)
+    return [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
@@ -7,6 +7,7 @@ drug name and retrieve all associated names (generic names, brand names, synonym
 """
 
 import requests
+from .http_transport import http_get
 import re
 from typing import Dict, Any, Optional, List
 from .base_tool import BaseTool
@@ -98,7 +99,7 @@ class RxNormTool(BaseTool):
         params = {"name": drug_name}
 
         try:
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = http_get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
 
@@ -147,7 +148,7 @@ class RxNormTool(BaseTool):
         try:
             url = f"{self.base_url}/rxcui/{rxcui}/allProperties.json"
             params = {"prop": "names"}
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = http_get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
 
@@ -174,7 +175,7 @@ class RxNormTool(BaseTool):
         try:
             url = f"{self.base_url}/rxcui/{rxcui}/related.json"
             params = {"rela": "has_tradename"}
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = http_get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
 
@@ -204,7 +205,7 @@ class RxNormTool(BaseTool):
         # Method 3: Get properties to get the main name
         try:
             url = f"{self.base_url}/rxcui/{rxcui}/properties.json"
-            response = requests.get(url, timeout=self.timeout)
+            response = http_get(url, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
 
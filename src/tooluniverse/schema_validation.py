@@ -0,0 +1,242 @@
+"""
+Compiled parameter-schema validators shared by all tools.
+
+``jsonschema.validate`` re-checks the schema against its metaschema and
+builds a new validator on every call. Tools validate their arguments on
+every invocation, so this module compiles each parameter schema once,
+keyed by its fingerprint, and reuses the validator for every tool whose
+schema has the same fingerprint.
+
+Most tool schemas are flat objects of scalar properties. For those a
+precomputed fast path accepts valid arguments with a few ``isinstance``
+checks; anything it cannot decide, including every invalid call, goes
+through the full jsonschema validator so error messages are unchanged.
+
+Validation counts and time per tool are available from
+:func:`get_validation_stats`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Optional
+
+# Keywords that do not constrain a value (annotations only)
+_ANNOTATION_KEYWORDS = {"description", "title", "default", "examples", "format"}
+_FAST_OBJECT_KEYWORDS = _ANNOTATION_KEYWORDS | {
+    "type",
+    "properties",
+    "required",
+    "additionalProperties",
+    "$schema",
+}
+
+# Conservative type checks: values these accept are valid in every draft.
+# Anything else (floats for "integer", tuples, Decimals, ...) falls back to
+# the full validator.
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: type(value) is int,
+    "number": lambda value: type(value) in (int, float),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+}
+
+_MAX_COMPILED = 4096
+
+
+def schema_fingerprint(schema: Any) -> str:
+    """Return a stable fingerprint of a parameter schema."""
+    try:
+        text = json.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        text = repr(schema)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _property_check(prop_schema: Any) -> Optional[Callable[[Any], bool]]:
+    """Build a fast check for a scalar property schema, or None."""
+    if not isinstance(prop_schema, dict) or "type" not in prop_schema:
+        return None
+    if not set(prop_schema) <= _ANNOTATION_KEYWORDS | {"type"}:
+        return None
+    types = prop_schema["type"]
+    if isinstance(types, str):
+        types = [types]
+    if not isinstance(types, list) or not types:
+        return None
+    checks = [_TYPE_CHECKS.get(t) for t in types]
+    if not all(checks):
+        return None
+    if len(checks) == 1:
+        return checks[0]
+    return lambda value: any(check(value) for check in checks)
+
+
+def _build_fast_path(schema: Dict[str, Any]) -> Optional[Callable[[dict], bool]]:
+    """Return ``accepts(arguments)`` for flat object schemas, else None.
+
+    ``accepts`` returning False means "not decided": the caller must run
+    the full validator.
+    """
+    if not set(schema) <= _FAST_OBJECT_KEYWORDS:
+        return None
+    if schema.get("type", "object") != "object":
+        return None
+    properties = schema.get("properties", {})
+    required = schema.get("required", [])
+    additional = schema.get("additionalProperties", True)
+    if not isinstance(properties, dict) or not isinstance(required, list):
+        return None
+    if additional not in (True, False):
+        return None
+
+    # Properties whose schema is not a plain scalar type are left to the
+    # full validator whenever they are present.
+    checks = {name: _property_check(prop) for name, prop in properties.items()}
+    required = tuple(required)
+    allow_extra = additional is True
+
+    def accepts(arguments: dict) -> bool:
+        for name in required:
+            if name not in arguments:
+                return False
+        for name, value in arguments.items():
+            if name in checks:
+                check = checks[name]
+                if check is None or not check(value):
+                    return False
+            elif not allow_extra:
+                return False
+        return True
+
+    return accepts
+
+
+class CompiledSchema:
+    """A parameter schema checked once and compiled into a validator."""
+
+    __slots__ = ("fingerprint", "validator", "fast_path", "schema_error")
+
+    def __init__(self, schema: Dict[str, Any], fingerprint: str):
+        import jsonschema
+
+        self.fingerprint = fingerprint
+        self.validator = None
+        self.fast_path = None
+        self.schema_error: Optional[Exception] = None
+        try:
+            validator_cls = jsonschema.validators.validator_for(schema)
+            validator_cls.check_schema(schema)
+        except jsonschema.SchemaError as e:
+            # Remembered so broken schemas fail the same way on every call
+            self.schema_error = e
+            return
+        self.validator = validator_cls(schema)
+        if isinstance(schema, dict):
+            self.fast_path = _build_fast_path(schema)
+
+    def validate(self, arguments: Dict[str, Any]) -> bool:
+        """Validate ``arguments``; raise like ``jsonschema.validate`` does.
+
+        Returns:
+            True when the fast path accepted the arguments.
+        """
+        if self.schema_error is not None:
+            raise self.schema_error
+        if self.fast_path is not None and self.fast_path(arguments):
+            return True
+
+        import jsonschema
+
+        error = jsonschema.exceptions.best_match(self.validator.iter_errors(arguments))
+        if error is not None:
+            raise error
+        return False
+
+
+_compiled: Dict[str, CompiledSchema] = {}
+_compiled_lock = threading.Lock()
+
+
+def get_compiled_schema(
+    schema: Dict[str, Any], fingerprint: Optional[str] = None
+) -> CompiledSchema:
+    """Return the shared compiled validator for ``schema``."""
+    fingerprint = fingerprint or schema_fingerprint(schema)
+    compiled = _compiled.get(fingerprint)
+    if compiled is None:
+        compiled = CompiledSchema(schema, fingerprint)
+        with _compiled_lock:
+            if len(_compiled) >= _MAX_COMPILED:
+                _compiled.pop(next(iter(_compiled)))
+            compiled = _compiled.setdefault(fingerprint, compiled)
+    return compiled
+
+
+def clear_compiled_schemas() -> None:
+    with _compiled_lock:
+        _compiled.clear()
+
+
+# ----------------------------------------------------------------------
+# Instrumentation
+# ----------------------------------------------------------------------
+_stats: Dict[str, Dict[str, Any]] = {}
+_stats_lock = threading.Lock()
+
+
+def record_validation(
+    tool_name: str, elapsed: float, fast_path: bool, failed: bool
+) -> None:
+    with _stats_lock:
+        entry = _stats.get(tool_name)
+        if entry is None:
+            entry = _stats[tool_name] = {
+                "calls": 0,
+                "fast_path": 0,
+                "failures": 0,
+                "total_time": 0.0,
+            }
+        entry["calls"] += 1
+        entry["fast_path"] += fast_path
+        entry["failures"] += failed
+        entry["total_time"] += elapsed
+
+
+def get_validation_stats(tool_name: Optional[str] = None) -> Dict[str, Any]:
+    """Return validation counters and time (seconds) per tool.
+
+    With ``tool_name`` only that tool's counters are returned; otherwise a
+    ``{"tools": {...}, "total": {...}}`` summary including the number of
+    compiled schemas.
+    """
+    with _stats_lock:
+        tools = {
+            name: dict(entry, avg_time=entry["total_time"] / entry["calls"])
+            for name, entry in _stats.items()
+        }
+    if tool_name is not None:
+        return tools.get(tool_name, {})
+    total_calls = sum(entry["calls"] for entry in tools.values())
+    total_time = sum(entry["total_time"] for entry in tools.values())
+    return {
+        "tools": tools,
+        "total": {
+            "calls": total_calls,
+            "fast_path": sum(entry["fast_path"] for entry in tools.values()),
+            "failures": sum(entry["failures"] for entry in tools.values()),
+            "total_time": total_time,
+            "avg_time": total_time / total_calls if total_calls else 0.0,
+            "compiled_schemas": len(_compiled),
+        },
+    }
+
+
+def reset_validation_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
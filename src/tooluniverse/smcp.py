@@ -92,8 +92,8 @@ AI Agent Interface:
 """
 
 import asyncio
-import functools
 import json
+import os
 import sys
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union, Callable, Literal
@@ -106,6 +106,13 @@ from .execute_function import ToolUniverse
 from .logging_config import (
     get_logger,
 )
+from .result_encoding import PreSerialized, encode_result, encode_result_chunks
+from .smcp_admission import (
+    AdmissionController,
+    AdmissionRejected,
+    parse_concurrency_limit,
+)
+from .smcp_worker_pool import DEFAULT_PROCESS_TOOL_TYPES, ToolWorkerPool
 
 
 class SMCP(FastMCP):
@@ -244,6 +251,49 @@ class SMCP(FastMCP):
         Higher values allow more parallel tool calls but use more resources.
         Recommended: 5-20 depending on server capacity and expected load.
 
+    process_workers : int, default 0
+        Number of warm worker processes for CPU-bound tools. When greater than
+        zero, tools whose type is listed in ``process_tool_types`` run in
+        separate processes (each holding its own preloaded ToolUniverse)
+        instead of on the thread pool, so they no longer stall I/O-bound tools
+        on the GIL. Overridden by ``TOOLUNIVERSE_SMCP_PROCESS_WORKERS``.
+
+    process_tool_types : list of str, optional
+        Tool types routed to the worker processes. Defaults to
+        ``DEFAULT_PROCESS_TOOL_TYPES`` (ADMET-AI, dataset and RDKit molecule
+        tools). Overridden by ``TOOLUNIVERSE_SMCP_PROCESS_TOOL_TYPES``
+        (comma-separated).
+
+    process_max_tasks_per_worker : int, optional
+        Replace the worker processes after about this many calls each to bound
+        memory growth. Overridden by ``TOOLUNIVERSE_SMCP_PROCESS_MAX_TASKS``.
+
+    max_concurrent_calls : int, default 0
+        Tool calls allowed to execute at once across all clients; further
+        calls wait in a bounded queue. ``0`` means no global limit. Each tool's
+        ``batch_max_concurrency`` config entry is enforced as its own limit.
+        Overridden by ``TOOLUNIVERSE_SMCP_MAX_CONCURRENT``.
+
+    max_concurrent_per_client : int, default 0
+        Tool calls one MCP session may execute at once (``0`` = no limit), so a
+        single client cannot take every slot. Overridden by
+        ``TOOLUNIVERSE_SMCP_MAX_CONCURRENT_PER_CLIENT``.
+
+    max_queued_calls : int, default 100
+        Calls allowed to wait for a slot. Beyond that, calls are rejected at
+        once with a ``ServerOverloaded`` error and a ``retry_after`` hint.
+        Overridden by ``TOOLUNIVERSE_SMCP_MAX_QUEUED``.
+
+    max_queue_wait : float, default 30.0
+        Seconds a queued call waits before it is rejected the same way.
+        Overridden by ``TOOLUNIVERSE_SMCP_MAX_QUEUE_WAIT``.
+
+    result_chunk_size : int, default 0
+        Return results longer than this many characters as several consecutive
+        text content blocks that clients concatenate, instead of one giant
+        string. ``0`` disables chunking. Overridden by
+        ``TOOLUNIVERSE_SMCP_RESULT_CHUNK_SIZE``.
+
     hooks_enabled : bool, default False
         Whether to enable output processing hooks for intelligent post-processing
         of tool outputs. When True, hooks can automatically summarize long outputs,
@@ -307,6 +357,14 @@ class SMCP(FastMCP):
         auto_expose_tools: bool = True,
         search_enabled: bool = True,
         max_workers: int = 5,
+        process_workers: int = 0,
+        process_tool_types: Optional[List[str]] = None,
+        process_max_tasks_per_worker: Optional[int] = None,
+        max_concurrent_calls: int = 0,
+        max_concurrent_per_client: int = 0,
+        max_queued_calls: int = 100,
+        max_queue_wait: float = 30.0,
+        result_chunk_size: int = 0,
         hooks_enabled: bool = False,
         hook_config: Optional[Dict[str, Any]] = None,
         hook_type: Optional[str] = None,
@@ -366,6 +424,51 @@ class SMCP(FastMCP):
         # Thread pool for concurrent tool execution
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
 
+        # Admission control in front of the executors
+        self.admission = AdmissionController(
+            max_concurrent=int(
+                os.getenv("TOOLUNIVERSE_SMCP_MAX_CONCURRENT", max_concurrent_calls)
+            ),
+            max_per_client=int(
+                os.getenv(
+                    "TOOLUNIVERSE_SMCP_MAX_CONCURRENT_PER_CLIENT",
+                    max_concurrent_per_client,
+                )
+            ),
+            max_queued=int(os.getenv("TOOLUNIVERSE_SMCP_MAX_QUEUED", max_queued_calls)),
+            max_queue_wait=float(
+                os.getenv("TOOLUNIVERSE_SMCP_MAX_QUEUE_WAIT", max_queue_wait)
+            ),
+        )
+        self._register_stats_route("/stats/admission", self.get_admission_stats)
+
+        # Optional process pool for CPU-bound tool types (created after tool loading)
+        self.process_workers = int(
+            os.getenv("TOOLUNIVERSE_SMCP_PROCESS_WORKERS", process_workers)
+        )
+        env_tool_types = os.getenv("TOOLUNIVERSE_SMCP_PROCESS_TOOL_TYPES")
+        if env_tool_types:
+            process_tool_types = [
+                t.strip() for t in env_tool_types.split(",") if t.strip()
+            ]
+        self.process_tool_types = list(
+            process_tool_types or DEFAULT_PROCESS_TOOL_TYPES
+        )
+        env_max_tasks = os.getenv("TOOLUNIVERSE_SMCP_PROCESS_MAX_TASKS")
+        self.process_max_tasks_per_worker = (
+            int(env_max_tasks) if env_max_tasks else process_max_tasks_per_worker
+        )
+        self.worker_pool: Optional[ToolWorkerPool] = None
+
+        # Result encoding: tool output shorter than result_offload_chars is
+        # encoded inline, anything else in a worker thread
+        self.result_chunk_size = int(
+            os.getenv("TOOLUNIVERSE_SMCP_RESULT_CHUNK_SIZE", result_chunk_size)
+        )
+        self.result_offload_chars = int(
+            os.getenv("TOOLUNIVERSE_SMCP_ENCODE_OFFLOAD_CHARS", "65536")
+        )
+
         # Track exposed tools to avoid duplicates
         self._exposed_tools = set()
 
@@ -379,6 +482,119 @@ class SMCP(FastMCP):
         # Register custom MCP methods
         self._register_custom_mcp_methods()
 
+        if self.process_workers > 0:
+            self._setup_worker_pool()
+
+    def _setup_worker_pool(self):
+        """
+        Create the process pool serving the loaded tools of ``process_tool_types``.
+
+        Workers are spawned when the server starts (or on the first routed call)
+        and each preloads only the routed tools. Pool statistics and a health
+        check are served at ``GET /health/workers`` on HTTP transports.
+        """
+        tool_types = set(self.process_tool_types)
+        tool_configs = [
+            config
+            for config in self.tooluniverse.all_tool_dict.values()
+            if config.get("type") in tool_types
+        ]
+        if not tool_configs:
+            self.logger.info(
+                f"No loaded tools of types {sorted(tool_types)}; process workers disabled"
+            )
+            return
+
+        self.worker_pool = ToolWorkerPool(
+            tool_configs,
+            max_workers=self.process_workers,
+            max_tasks_per_worker=self.process_max_tasks_per_worker,
+            encode_results=True,
+            tooluniverse_kwargs={
+                "hooks_enabled": self.hooks_enabled,
+                "hook_config": self.hook_config,
+                "hook_type": self.hook_type,
+            },
+        )
+        self.logger.info(
+            f"⚙️ {len(tool_configs)} tools routed to {self.process_workers} worker processes"
+        )
+
+        self._register_stats_route(
+            "/health/workers",
+            lambda: self.get_worker_pool_stats(health_check=True),
+            healthy=lambda report: report.get("health", {}).get("healthy", False),
+        )
+
+    def _register_stats_route(
+        self,
+        path: str,
+        producer: Callable[[], Any],
+        healthy: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ):
+        """
+        Serve ``producer()`` as JSON at ``GET path`` on HTTP transports.
+
+        ``producer`` may return a dict or an awaitable of one. When ``healthy``
+        rejects the report, the route answers with status 503.
+        """
+        try:
+            from starlette.responses import JSONResponse
+
+            @self.custom_route(path, methods=["GET"])
+            async def stats_route(request):
+                report = producer()
+                if asyncio.iscoroutine(report):
+                    report = await report
+                ok = healthy is None or healthy(report)
+                return JSONResponse(report, status_code=200 if ok else 503)
+
+        except Exception as e:
+            self.logger.debug(f"Route {path} not registered: {e}")
+
+    def get_admission_stats(self) -> Dict[str, Any]:
+        """
+        Report admission-control state: running and queued calls, rejections,
+        and per-tool queue wait versus execution time.
+        """
+        return self.admission.stats()
+
+    def _client_id(self, ctx: Any = None) -> str:
+        """Identify the calling MCP client for per-client quotas."""
+        if ctx is None:
+            try:
+                from fastmcp.server.dependencies import get_context
+
+                ctx = get_context()
+            except Exception:
+                return "anonymous"
+        for attribute in ("client_id", "session_id"):
+            try:
+                value = getattr(ctx, attribute, None)
+            except Exception:
+                value = None
+            if value:
+                return str(value)
+        return "anonymous"
+
+    async def get_worker_pool_stats(self, health_check: bool = False) -> Dict[str, Any]:
+        """
+        Report queue depth, throughput and recycling counters of the process pool.
+
+        Args:
+            health_check: Also ping every worker (restarting a broken pool).
+
+        Returns:
+            Dict[str, Any]: ``{"enabled": False}`` without process workers,
+            otherwise the pool statistics plus ``health`` when requested.
+        """
+        if self.worker_pool is None:
+            return {"enabled": False}
+        report = {"enabled": True, **self.worker_pool.stats()}
+        if health_check:
+            report["health"] = await asyncio.to_thread(self.worker_pool.health_check)
+        return report
+
     def _load_space_configs(self, space: Union[str, List[str]]):
         """
         Load Space configurations.
@@ -1806,6 +2022,9 @@ class SMCP(FastMCP):
         - Prevents new tasks from being submitted
         - Times out after reasonable wait period to prevent hanging
 
+        **Process Pool Shutdown:**
+        - Stops the worker processes used for CPU-bound tools, if enabled
+
         **Resource Cleanup:**
         - Releases any open file handles or network connections
         - Clears internal caches and temporary data
@@ -1873,6 +2092,11 @@ class SMCP(FastMCP):
             self.executor.shutdown(wait=True)
         except Exception:
             pass
+        try:
+            if getattr(self, "worker_pool", None) is not None:
+                self.worker_pool.shutdown(wait=True)
+        except Exception:
+            pass
 
     def _print_tooluniverse_banner(self):
         """Print ToolUniverse branding banner after FastMCP banner with dynamic information."""
@@ -1957,6 +2181,12 @@ class SMCP(FastMCP):
             time.sleep(1.0)  # Delay to ensure FastMCP banner displays first
             self._print_tooluniverse_banner()
 
+        # Warm the worker processes before the first request arrives
+        if getattr(self, "worker_pool", None) is not None:
+            if not self.worker_pool.started:
+                self.worker_pool.redirect_stdout = transport == "stdio"
+            self.worker_pool.start()
+
         # Start banner thread only on first run
         if not hasattr(self, "_tooluniverse_banner_shown"):
             self._tooluniverse_banner_shown = True
@@ -2151,6 +2381,42 @@ class SMCP(FastMCP):
             # Cleanup
             asyncio.run(self.close())
 
+    async def _encode_tool_result(self, result: Any):
+        """
+        Serialize a tool result for the MCP response without blocking the event loop.
+
+        ``PreSerialized`` text (e.g. from worker processes) and short strings are
+        handled inline; containers and long strings are validated or encoded in
+        a worker thread. With ``result_chunk_size`` set, long payloads become a
+        list of text content blocks whose concatenation is the JSON document.
+        """
+        if isinstance(result, str) and (
+            isinstance(result, PreSerialized) or len(result) < self.result_offload_chars
+        ):
+            text = encode_result(result)
+        elif self.result_chunk_size > 0:
+            chunks = await asyncio.to_thread(
+                encode_result_chunks, result, self.result_chunk_size
+            )
+            return self._as_text_blocks(chunks)
+        else:
+            text = await asyncio.to_thread(encode_result, result)
+
+        if 0 < self.result_chunk_size < len(text):
+            size = self.result_chunk_size
+            return self._as_text_blocks(
+                [text[i : i + size] for i in range(0, len(text), size)]
+            )
+        return text
+
+    @staticmethod
+    def _as_text_blocks(chunks: List[str]):
+        if len(chunks) == 1:
+            return chunks[0]
+        from mcp.types import TextContent
+
+        return [TextContent(type="text", text=chunk) for chunk in chunks]
+
     def _create_mcp_tool_from_tooluniverse(self, tool_config: Dict[str, Any]):
         """Create an MCP tool from a ToolUniverse tool configuration.
 
@@ -2176,6 +2442,9 @@ class SMCP(FastMCP):
             if properties is None:
                 properties = {}
             required_params = parameters.get("required", [])
+            tool_limit = parse_concurrency_limit(
+                tool_config.get("batch_max_concurrency")
+            )
 
             # Handle non-standard schema format where 'required' is set on individual properties
             # instead of at the object level (common in ToolUniverse schemas)
@@ -2331,6 +2600,7 @@ class SMCP(FastMCP):
                 """Execute ToolUniverse tool with provided arguments."""
                 import json
 
+                ticket = None
                 try:
                     # Remove ctx if present (legacy support)
                     ctx = kwargs.pop("ctx", None) if "ctx" in kwargs else None
@@ -2358,6 +2628,14 @@ class SMCP(FastMCP):
 
                     function_call = {"name": tool_name, "arguments": args_dict}
 
+                    # Wait for a slot under the server's concurrency quotas
+                    try:
+                        ticket = await self.admission.acquire(
+                            tool_name, self._client_id(ctx), tool_limit
+                        )
+                    except AdmissionRejected as rejection:
+                        return json.dumps(rejection.to_response(), ensure_ascii=False)
+
                     try:
                         loop = asyncio.get_running_loop()
                     except RuntimeError:
@@ -2399,7 +2677,16 @@ class SMCP(FastMCP):
                     # In stdio mode, capture stdout to prevent pollution of JSON-RPC stream
                     is_stdio_mode = getattr(self, "_transport_type", None) == "stdio"
 
-                    if is_stdio_mode:
+                    if (
+                        self.worker_pool is not None
+                        and stream_callback is None
+                        and self.worker_pool.serves(tool_name)
+                    ):
+                        # CPU-bound tool: run it in a warm worker process. Stream
+                        # callbacks cannot cross processes, so streaming calls
+                        # stay on the thread pool below.
+                        result = await self.worker_pool.arun(function_call)
+                    elif is_stdio_mode:
                         # Wrap tool execution to capture stdout and redirect to stderr
                         def _run_with_stdout_capture():
                             import io
@@ -2429,31 +2716,23 @@ class SMCP(FastMCP):
                             finally:
                                 sys.stdout = old_stdout
 
-                        run_callable = _run_with_stdout_capture
+                        result = await loop.run_in_executor(
+                            self.executor, _run_with_stdout_capture
+                        )
                     else:
-                        # In HTTP/SSE mode, no need to capture stdout
-                        run_callable = functools.partial(
-                            self.tooluniverse.run_one_function,
+                        # In HTTP/SSE mode, no need to capture stdout; native async
+                        # tools stay on the event loop, sync tools use the executor
+                        result = await self.tooluniverse.arun_one_function(
                             function_call,
                             stream_callback=stream_callback,
+                            executor=self.executor,
                         )
 
-                    result = await loop.run_in_executor(self.executor, run_callable)
+                    self.admission.release(ticket)
+                    ticket = None
 
                     # Ensure result is properly serialized to JSON
-                    if isinstance(result, str):
-                        # Try to parse as JSON to validate, if fails wrap it
-                        try:
-                            json.loads(result)
-                            return result
-                        except (json.JSONDecodeError, ValueError):
-                            # Not valid JSON, wrap it
-                            return json.dumps({"result": result}, ensure_ascii=False)
-                    elif isinstance(result, (dict, list)):
-                        return json.dumps(result, ensure_ascii=False, default=str)
-                    else:
-                        # For other types, convert to JSON
-                        return json.dumps({"result": str(result)}, ensure_ascii=False)
+                    return await self._encode_tool_result(result)
 
                 except Exception as e:
                     error_msg = f"Error executing {tool_name}: {str(e)}"
@@ -2464,6 +2743,9 @@ class SMCP(FastMCP):
                         {"error": error_msg, "error_type": type(e).__name__},
                         ensure_ascii=False,
                     )
+                finally:
+                    if ticket is not None:
+                        self.admission.release(ticket)
 
             # Set function metadata
             dynamic_tool_function.__name__ = tool_name
@@ -0,0 +1,277 @@
+"""
+Admission control for SMCP tool calls.
+
+Without it every MCP request is handed straight to the executor, so one
+client flooding a slow tool (``BLAST_protein_search``, agentic tools) holds
+all workers and everyone else waits behind it. :class:`AdmissionController`
+sits in front of the executor and enforces
+
+- a global limit on concurrently executing calls,
+- per-tool limits, taken from the ``batch_max_concurrency`` entry of the
+  tool config (the same knob batch runs honour),
+- a per-client limit, keyed by MCP session,
+- a bounded wait queue: calls beyond ``max_queued`` are rejected at once,
+  and queued calls give up after ``max_queue_wait`` seconds.
+
+Rejections carry a ``retry_after`` hint estimated from recent execution
+times. Queue wait and execution time are tracked per tool.
+
+All methods must be called from the event loop thread running the server.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict
+
+# Bounds of the retry hint in seconds
+MIN_RETRY_AFTER = 1.0
+MAX_RETRY_AFTER = 60.0
+
+
+class AdmissionRejected(Exception):
+    """Raised when a call is refused because the server is overloaded."""
+
+    def __init__(self, tool_name: str, reason: str, retry_after: float):
+        self.tool_name = tool_name
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(
+            f"Server is overloaded ({reason}) for {tool_name}; "
+            f"retry after {retry_after:g} seconds"
+        )
+
+    def to_response(self) -> Dict[str, Any]:
+        return {
+            "error": str(self),
+            "error_type": "ServerOverloaded",
+            "reason": self.reason,
+            "retry_after": self.retry_after,
+        }
+
+
+@dataclass
+class AdmissionTicket:
+    tool_name: str
+    client_id: str
+    queue_wait: float
+    started_at: float
+
+
+@dataclass
+class _Waiter:
+    tool_name: str
+    client_id: str
+    tool_limit: int
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class _ToolStats:
+    running: int = 0
+    queued: int = 0
+    admitted: int = 0
+    completed: int = 0
+    rejected: int = 0
+    queue_wait: float = 0.0
+    max_queue_wait: float = 0.0
+    execution: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "queued": self.queued,
+            "admitted": self.admitted,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_queue_wait_seconds": (
+                self.queue_wait / self.admitted if self.admitted else 0.0
+            ),
+            "max_queue_wait_seconds": self.max_queue_wait,
+            "avg_execution_seconds": (
+                self.execution / self.completed if self.completed else 0.0
+            ),
+        }
+
+
+class AdmissionController:
+    """Bounded, quota-aware admission of tool calls.
+
+    Args:
+        max_concurrent: Calls executing at once across all tools (0 = no limit).
+        max_per_client: Calls executing at once per client (0 = no limit).
+        max_queued: Calls allowed to wait for a slot; more are rejected at once.
+        max_queue_wait: Seconds a call may wait before it is rejected.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 0,
+        max_per_client: int = 0,
+        max_queued: int = 100,
+        max_queue_wait: float = 30.0,
+    ):
+        self.max_concurrent = max(0, int(max_concurrent or 0))
+        self.max_per_client = max(0, int(max_per_client or 0))
+        self.max_queued = max(0, int(max_queued or 0))
+        self.max_queue_wait = max_queue_wait
+        self._running = 0
+        self._client_running: Dict[str, int] = {}
+        self._waiters: Deque[_Waiter] = deque()
+        self._tools: Dict[str, _ToolStats] = {}
+        self._rejections = {"queue_full": 0, "queue_timeout": 0}
+
+    def _tool(self, tool_name: str) -> _ToolStats:
+        stats = self._tools.get(tool_name)
+        if stats is None:
+            stats = self._tools[tool_name] = _ToolStats()
+        return stats
+
+    def _has_capacity(self, tool_name: str, client_id: str, tool_limit: int) -> bool:
+        if self.max_concurrent and self._running >= self.max_concurrent:
+            return False
+        if tool_limit and self._tool(tool_name).running >= tool_limit:
+            return False
+        if (
+            self.max_per_client
+            and self._client_running.get(client_id, 0) >= self.max_per_client
+        ):
+            return False
+        return True
+
+    def _start(self, tool_name: str, client_id: str, queue_wait: float):
+        self._running += 1
+        self._client_running[client_id] = self._client_running.get(client_id, 0) + 1
+        stats = self._tool(tool_name)
+        stats.running += 1
+        stats.admitted += 1
+        stats.queue_wait += queue_wait
+        stats.max_queue_wait = max(stats.max_queue_wait, queue_wait)
+        return AdmissionTicket(tool_name, client_id, queue_wait, time.perf_counter())
+
+    def _retry_after(self, tool_name: str, tool_limit: int) -> float:
+        stats = self._tool(tool_name)
+        if stats.completed:
+            per_call = stats.execution / stats.completed
+        else:
+            completed = sum(s.completed for s in self._tools.values())
+            execution = sum(s.execution for s in self._tools.values())
+            per_call = execution / completed if completed else MIN_RETRY_AFTER
+        slots = tool_limit or self.max_concurrent or max(1, self._running)
+        estimate = per_call * (stats.queued + 1) / slots
+        return round(min(MAX_RETRY_AFTER, max(MIN_RETRY_AFTER, estimate)), 1)
+
+    def _reject(self, tool_name: str, tool_limit: int, reason: str):
+        self._rejections[reason] += 1
+        self._tool(tool_name).rejected += 1
+        return AdmissionRejected(
+            tool_name, reason, self._retry_after(tool_name, tool_limit)
+        )
+
+    async def acquire(
+        self, tool_name: str, client_id: str = "anonymous", tool_limit: int = 0
+    ) -> AdmissionTicket:
+        """Wait for an execution slot.
+
+        Raises:
+            AdmissionRejected: When the queue is full or the wait times out.
+        """
+        if self._has_capacity(tool_name, client_id, tool_limit):
+            return self._start(tool_name, client_id, 0.0)
+        if len(self._waiters) >= self.max_queued:
+            raise self._reject(tool_name, tool_limit, "queue_full")
+
+        waiter = _Waiter(
+            tool_name,
+            client_id,
+            tool_limit,
+            asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+        self._tool(tool_name).queued += 1
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(waiter.future), timeout=self.max_queue_wait
+            )
+        except asyncio.TimeoutError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as the wait ran out
+                return waiter.future.result()
+            waiter.future.cancel()
+            self._remove_waiter(waiter)
+            raise self._reject(tool_name, tool_limit, "queue_timeout") from None
+        except asyncio.CancelledError:
+            # The client went away while queued
+            if waiter.future.done() and not waiter.future.cancelled():
+                self.release(waiter.future.result(), executed=False)
+            else:
+                waiter.future.cancel()
+                self._remove_waiter(waiter)
+            raise
+
+    def _remove_waiter(self, waiter: _Waiter):
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            return
+        self._tool(waiter.tool_name).queued -= 1
+
+    def release(self, ticket: AdmissionTicket, executed: bool = True):
+        """Give back the slot of ``ticket`` and admit queued calls that now fit."""
+        self._running -= 1
+        remaining = self._client_running.get(ticket.client_id, 1) - 1
+        if remaining:
+            self._client_running[ticket.client_id] = remaining
+        else:
+            self._client_running.pop(ticket.client_id, None)
+        stats = self._tool(ticket.tool_name)
+        stats.running -= 1
+        if executed:
+            stats.completed += 1
+            stats.execution += time.perf_counter() - ticket.started_at
+        self._admit_waiters()
+
+    def _admit_waiters(self):
+        # FIFO, but a waiter blocked by its own tool or client quota does not
+        # hold up waiters for other tools and clients behind it
+        now = time.perf_counter()
+        for waiter in list(self._waiters):
+            if waiter.future.done():
+                self._remove_waiter(waiter)
+                continue
+            if self.max_concurrent and self._running >= self.max_concurrent:
+                break
+            if self._has_capacity(
+                waiter.tool_name, waiter.client_id, waiter.tool_limit
+            ):
+                self._remove_waiter(waiter)
+                waiter.future.set_result(
+                    self._start(
+                        waiter.tool_name, waiter.client_id, now - waiter.enqueued_at
+                    )
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._running,
+            "queued": len(self._waiters),
+            "limits": {
+                "max_concurrent": self.max_concurrent,
+                "max_per_client": self.max_per_client,
+                "max_queued": self.max_queued,
+                "max_queue_wait": self.max_queue_wait,
+            },
+            "rejected": dict(self._rejections),
+            "clients": dict(self._client_running),
+            "tools": {name: stats.as_dict() for name, stats in self._tools.items()},
+        }
+
+
+def parse_concurrency_limit(value: Any) -> int:
+    """Normalize a ``batch_max_concurrency`` config entry (0 = unlimited)."""
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return 0
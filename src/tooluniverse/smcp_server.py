@@ -105,6 +105,47 @@ Examples:
         help="Enable compact mode: only expose core tools (4 tools) to prevent context window overflow. All tools are still loaded in background for execute_tool to work.",
     )
 
+    # Process worker options
+    worker_group = parser.add_argument_group("Process Workers")
+    worker_group.add_argument(
+        "--process-workers",
+        type=int,
+        default=0,
+        help="Run CPU-bound tools in this many warm worker processes (default: 0, disabled)",
+    )
+    worker_group.add_argument(
+        "--process-tool-types",
+        nargs="+",
+        metavar="TYPE",
+        help="Tool types routed to the worker processes (default: ADMETAITool DatasetTool Molecule2DTool Molecule3DTool)",
+    )
+    worker_group.add_argument(
+        "--process-max-tasks",
+        type=int,
+        help="Replace worker processes after this many calls each (default: never)",
+    )
+
+    # Admission control options
+    admission_group = parser.add_argument_group("Admission Control")
+    admission_group.add_argument(
+        "--max-concurrent-calls",
+        type=int,
+        default=0,
+        help="Tool calls executing at once across all clients (default: 0, unlimited)",
+    )
+    admission_group.add_argument(
+        "--max-concurrent-per-client",
+        type=int,
+        default=0,
+        help="Tool calls one client session may execute at once (default: 0, unlimited)",
+    )
+    admission_group.add_argument(
+        "--max-queued-calls",
+        type=int,
+        default=100,
+        help="Calls allowed to wait for a slot before new ones are rejected (default: 100)",
+    )
+
     args = parser.parse_args()
 
     try:
@@ -140,6 +181,9 @@ Examples:
         if args.compact_mode:
             print("📦 Compact mode enabled: only core tools will be exposed")
 
+        if args.process_workers > 0:
+            print(f"⚙️  Process workers: {args.process_workers}")
+
         print()
 
         # Create SMCP server with Space support
@@ -149,6 +193,12 @@ Examples:
             auto_expose_tools=True,
             search_enabled=True,
             max_workers=5,
+            process_workers=args.process_workers,
+            process_tool_types=args.process_tool_types,
+            process_max_tasks_per_worker=args.process_max_tasks,
+            max_concurrent_calls=args.max_concurrent_calls,
+            max_concurrent_per_client=args.max_concurrent_per_client,
+            max_queued_calls=args.max_queued_calls,
             hooks_enabled=hooks_enabled,
             hook_config=hook_config,
             hook_type=args.hook_type,
@@ -0,0 +1,311 @@
+"""
+Warm worker processes for CPU-bound SMCP tools.
+
+SMCP normally runs every tool on one thread pool, so CPU-heavy tools (RDKit
+molecule rendering, ADMET-AI predictions, pandas-based dataset tools) hold the
+GIL and stall unrelated I/O-bound calls. :class:`ToolWorkerPool` runs selected
+tools in separate processes instead. Each worker builds its own
+:class:`ToolUniverse` once, with the routed tools already instantiated, so
+calls do not pay import or model-loading costs.
+
+The pool is recycled after a configurable number of calls per worker, which
+bounds memory growth from leaky native libraries, and is rebuilt
+automatically when a worker dies.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Optional
+
+from .logging_config import get_logger
+from .result_encoding import encode_result
+
+# Tool types that are CPU-bound enough to be worth a process hop by default
+DEFAULT_PROCESS_TOOL_TYPES = (
+    "ADMETAITool",
+    "DatasetTool",
+    "Molecule2DTool",
+    "Molecule3DTool",
+)
+
+# ToolUniverse owned by the current worker process
+_worker_tooluniverse = None
+
+
+def _init_worker(tool_configs, tooluniverse_kwargs, redirect_stdout):
+    """Build the worker's ToolUniverse and instantiate its tools up front."""
+    global _worker_tooluniverse
+    if redirect_stdout:
+        # stdout carries JSON-RPC in stdio mode; keep tool prints off it
+        sys.stdout = sys.stderr
+
+    from .execute_function import ToolUniverse
+
+    tooluniverse = ToolUniverse(**tooluniverse_kwargs)
+    for config in tool_configs:
+        tooluniverse.all_tools.append(config)
+        tooluniverse.all_tool_dict[config["name"]] = config
+    for config in tool_configs:
+        tooluniverse._get_tool_instance(config["name"])
+    _worker_tooluniverse = tooluniverse
+
+
+def _run_tool(function_call, encode_results=False):
+    start = time.perf_counter()
+    result = _worker_tooluniverse.run_one_function(function_call)
+    if encode_results:
+        # Serialize here so the server neither re-encodes nor re-parses it
+        result = encode_result(result)
+    return os.getpid(), time.perf_counter() - start, result
+
+
+def _ping():
+    return os.getpid()
+
+
+class ToolWorkerPool:
+    """Run tool calls in warm worker processes.
+
+    Args:
+        tool_configs: Configurations of the tools served by the workers.
+        max_workers: Number of worker processes.
+        max_tasks_per_worker: Replace the workers after about this many calls
+            each. ``None`` or ``0`` keeps them for the pool's lifetime.
+        tooluniverse_kwargs: Keyword arguments for every worker's
+            :class:`ToolUniverse` (e.g. hook settings).
+        redirect_stdout: Send the workers' stdout to stderr (stdio transport).
+        encode_results: Return results as
+            :class:`~tooluniverse.result_encoding.PreSerialized` JSON text
+            encoded inside the worker.
+    """
+
+    def __init__(
+        self,
+        tool_configs: Optional[Iterable[Dict[str, Any]]] = None,
+        max_workers: int = 2,
+        max_tasks_per_worker: Optional[int] = None,
+        tooluniverse_kwargs: Optional[Dict[str, Any]] = None,
+        redirect_stdout: bool = False,
+        encode_results: bool = False,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.tool_configs = {config["name"]: config for config in tool_configs or []}
+        self.max_workers = max_workers
+        self.max_tasks_per_worker = max_tasks_per_worker or None
+        self.tooluniverse_kwargs = dict(tooluniverse_kwargs or {})
+        self.redirect_stdout = redirect_stdout
+        self.encode_results = encode_results
+        self.logger = get_logger("ToolWorkerPool")
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._closed = False
+        self._stale = False
+        self._generation = 0
+        self._tasks_in_generation = 0
+        self._in_flight = 0
+        self._max_queue_depth = 0
+        self._worker_pids = set()
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "recycles": 0,
+            "restarts": 0,
+        }
+        self._execution_seconds = 0.0
+        self._queue_wait_seconds = 0.0
+
+    def serves(self, tool_name: str) -> bool:
+        return tool_name in self.tool_configs
+
+    def add_tool_config(self, config: Dict[str, Any]):
+        """Serve another tool; running workers are replaced on the next call."""
+        with self._lock:
+            self.tool_configs[config["name"]] = config
+            self._stale = self._executor is not None
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> "ToolWorkerPool":
+        """Spawn and warm the workers now instead of on the first call."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ToolWorkerPool is closed")
+            if self._executor is None:
+                self._executor = self._new_executor()
+        return self
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            # Never fork the server: it already runs threads and an event loop
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                list(self.tool_configs.values()),
+                self.tooluniverse_kwargs,
+                self.redirect_stdout,
+            ),
+        )
+        # One ping per worker makes the executor spawn (and so warm) all of them
+        for _ in range(self.max_workers):
+            executor.submit(_ping)
+        self._generation += 1
+        self._tasks_in_generation = 0
+        self._stale = False
+        return executor
+
+    def _replace_executor(self, counter: str):
+        """Swap in fresh workers; calls on the old ones still finish."""
+        old = self._executor
+        self._executor = self._new_executor()
+        self._counters[counter] += 1
+        if old is not None:
+            old.shutdown(wait=False)
+
+    def _acquire_executor(self) -> ProcessPoolExecutor:
+        if self._closed:
+            raise RuntimeError("ToolWorkerPool is closed")
+        if self._executor is None:
+            self._executor = self._new_executor()
+        elif self._stale or (
+            self.max_tasks_per_worker
+            and self._tasks_in_generation
+            >= self.max_tasks_per_worker * self.max_workers
+        ):
+            self._replace_executor("recycles")
+        self._tasks_in_generation += 1
+        return self._executor
+
+    def submit(self, function_call: Dict[str, Any]) -> Future:
+        """Queue ``function_call`` on a worker; the future yields the tool result."""
+        result_future: Future = Future()
+        with self._lock:
+            executor = self._acquire_executor()
+            try:
+                worker_future = executor.submit(
+                    _run_tool, function_call, self.encode_results
+                )
+            except BrokenProcessPool:
+                # The call never reached a worker, so it is safe to resubmit
+                self._replace_executor("restarts")
+                executor = self._executor
+                worker_future = executor.submit(
+                    _run_tool, function_call, self.encode_results
+                )
+            self._counters["submitted"] += 1
+            self._in_flight += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue_depth())
+        submitted_at = time.perf_counter()
+
+        def _done(future: Future):
+            elapsed = time.perf_counter() - submitted_at
+            # Calls still queued when the pool is closed are cancelled
+            error = CancelledError() if future.cancelled() else future.exception()
+            with self._lock:
+                self._in_flight -= 1
+                if error is None:
+                    pid, execution_seconds, result = future.result()
+                    self._counters["completed"] += 1
+                    self._worker_pids.add(pid)
+                    self._execution_seconds += execution_seconds
+                    self._queue_wait_seconds += max(0.0, elapsed - execution_seconds)
+                else:
+                    self._counters["failed"] += 1
+                    if isinstance(error, BrokenProcessPool) and (
+                        self._executor is executor and not self._closed
+                    ):
+                        # Not resubmitted: the call itself may have killed the worker
+                        self.logger.warning(
+                            f"Worker process died running {function_call.get('name')}; restarting pool"
+                        )
+                        self._replace_executor("restarts")
+            if error is None:
+                result_future.set_result(result)
+            else:
+                result_future.set_exception(error)
+
+        worker_future.add_done_callback(_done)
+        return result_future
+
+    def run(self, function_call: Dict[str, Any], timeout: Optional[float] = None):
+        return self.submit(function_call).result(timeout=timeout)
+
+    async def arun(self, function_call: Dict[str, Any]):
+        return await asyncio.wrap_future(self.submit(function_call))
+
+    def _queue_depth(self) -> int:
+        return max(0, self._in_flight - self.max_workers)
+
+    def health_check(self, timeout: float = 10.0) -> Dict[str, Any]:
+        """Ping the workers and restart the pool if it is broken.
+
+        Pings wait behind queued calls, so a timeout means the workers are
+        saturated or stuck rather than dead.
+        """
+        with self._lock:
+            executor = self._executor
+        report = {"healthy": False, "started": executor is not None}
+        if executor is None:
+            return report
+
+        start = time.perf_counter()
+        try:
+            futures = [executor.submit(_ping) for _ in range(self.max_workers)]
+            pids = {future.result(timeout=timeout) for future in futures}
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor and not self._closed:
+                    self._replace_executor("restarts")
+            report["error"] = "worker pool was broken and has been restarted"
+        except FutureTimeoutError:
+            report["error"] = f"workers did not answer within {timeout} seconds"
+        except RuntimeError as e:
+            # The executor was shut down (recycled or closed) meanwhile
+            report["error"] = str(e)
+        else:
+            with self._lock:
+                self._worker_pids.update(pids)
+            report["healthy"] = True
+            report["responding_pids"] = sorted(pids)
+        report["latency_seconds"] = time.perf_counter() - start
+        return report
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            completed = self._counters["completed"]
+            return {
+                "workers": self.max_workers,
+                "started": self._executor is not None,
+                "tools": len(self.tool_configs),
+                "generation": self._generation,
+                "in_flight": self._in_flight,
+                "queue_depth": self._queue_depth(),
+                "max_queue_depth": self._max_queue_depth,
+                **self._counters,
+                "avg_execution_seconds": (
+                    self._execution_seconds / completed if completed else 0.0
+                ),
+                "avg_queue_wait_seconds": (
+                    self._queue_wait_seconds / completed if completed else 0.0
+                ),
+                "worker_pids_seen": len(self._worker_pids),
+            }
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
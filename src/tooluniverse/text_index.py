@@ -0,0 +1,114 @@
+"""
+In-memory text indexes shared by the dataset-backed search tools.
+
+:class:`TextIndex` wraps one column of strings (one per record) and answers
+the two questions those tools ask on every query without scanning the
+column in Python: which records *equal* a value (optionally per
+``|``-separated part) and which records *contain* a substring. Lowercased
+copies, exact-match hash maps and n-gram postings are built on first use
+and reused by every later query.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# Length of the substrings indexed for substring search
+NGRAM = 3
+
+
+class TextIndex:
+    """Exact-match and substring index over a column of strings.
+
+    Args:
+        values: One string per record; positions are the record numbers
+            returned by the lookups.
+        strip: Compare whole values with surrounding whitespace removed in
+            exact lookups (parts of split values are always stripped).
+    """
+
+    def __init__(self, values: Sequence[str], strip: bool = False):
+        self.values = list(values)
+        self.strip = strip
+        self._lower = None
+        self._exact: Dict[Tuple[bool, bool], Dict[str, List[int]]] = {}
+        self._grams: Dict[bool, Dict[str, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.values)
+
+    def texts(self, case_sensitive: bool) -> List[str]:
+        if case_sensitive:
+            return self.values
+        if self._lower is None:
+            self._lower = [value.lower() for value in self.values]
+        return self._lower
+
+    def exact(self, case_sensitive: bool, split: bool = False) -> Dict[str, List[int]]:
+        """Map each value to its records.
+
+        With ``split`` a value containing ``|`` is indexed under each of its
+        stripped parts instead of as a whole.
+        """
+        key = (case_sensitive, split)
+        index = self._exact.get(key)
+        if index is None:
+            with self._lock:
+                index = self._exact.get(key)
+                if index is None:
+                    index = {}
+                    for row, text in enumerate(self.texts(case_sensitive)):
+                        if split and "|" in text:
+                            keys = {part.strip() for part in text.split("|")}
+                        else:
+                            keys = (text.strip() if self.strip else text,)
+                        for value in keys:
+                            index.setdefault(value, []).append(row)
+                    self._exact[key] = index
+        return index
+
+    def grams(self, case_sensitive: bool) -> Dict[str, np.ndarray]:
+        """Map each n-gram to the sorted array of records containing it."""
+        index = self._grams.get(case_sensitive)
+        if index is None:
+            with self._lock:
+                index = self._grams.get(case_sensitive)
+                if index is None:
+                    postings: Dict[str, List[int]] = {}
+                    for row, text in enumerate(self.texts(case_sensitive)):
+                        for gram in {
+                            text[i : i + NGRAM] for i in range(len(text) - NGRAM + 1)
+                        }:
+                            postings.setdefault(gram, []).append(row)
+                    index = {
+                        gram: np.asarray(rows, dtype=np.int32)
+                        for gram, rows in postings.items()
+                    }
+                    self._grams[case_sensitive] = index
+        return index
+
+    def substring(self, query: str, case_sensitive: bool) -> List[int]:
+        """Records whose text contains ``query``, in record order.
+
+        ``query`` must already be lowercased when ``case_sensitive`` is False.
+        """
+        texts = self.texts(case_sensitive)
+        if len(query) < NGRAM:
+            return [row for row, text in enumerate(texts) if query in text]
+        index = self.grams(case_sensitive)
+        postings = []
+        for gram in {query[i : i + NGRAM] for i in range(len(query) - NGRAM + 1)}:
+            rows = index.get(gram)
+            if rows is None:
+                return []
+            postings.append(rows)
+        postings.sort(key=len)
+        candidates = postings[0]
+        for rows in postings[1:]:
+            candidates = np.intersect1d(candidates, rows, assume_unique=True)
+        # n-grams only narrow the candidates; confirm the full substring
+        return [row for row in candidates.tolist() if query in texts[row]]
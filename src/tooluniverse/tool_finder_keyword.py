@@ -7,14 +7,192 @@ scoring for improved relevance ranking. It serves as a robust search method when
 AI-powered search methods are unavailable.
 """
 
+import hashlib
+import heapq
 import json
+import os
 import re
 import math
-from collections import Counter, defaultdict
-from typing import Dict, List
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
+# Bump when tokenization changes so persisted indexes are rebuilt
+_INDEX_FORMAT = 1
+# Persisted indexes kept per cache directory (oldest are removed)
+_MAX_PERSISTED_INDEXES = 5
+
+
+class KeywordIndex:
+    """Inverted index over tool metadata.
+
+    Maps each term (token or phrase) to the tools containing it and how often,
+    so a query only touches the postings of its own terms. Document
+    frequencies and lengths are kept up to date as tools are added and
+    removed, so IDF and BM25 weights never require a rebuild.
+
+    Lowercased names, types and categories are indexed as well (names also
+    by trigram), so the tools an exact-match bonus applies to are found by
+    :meth:`substring_hits` without visiting every tool.
+    """
+
+    # Fields the exact-match bonus compares the query against
+    MATCH_FIELDS = ("name", "type", "category")
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.docs: Dict[str, Dict] = {}
+        # Lowercased field value -> tools having it, per MATCH_FIELDS entry
+        self.fields: Dict[str, Dict[str, Set[str]]] = {
+            field: {} for field in self.MATCH_FIELDS
+        }
+        # Trigram -> lowercased names containing it
+        self.name_grams: Dict[str, Set[str]] = {}
+        # Length -> number of distinct lowercased names that long
+        self.name_lengths: Counter = Counter()
+        self.total_terms = 0
+
+    def __len__(self):
+        return len(self.docs)
+
+    def __contains__(self, name):
+        return name in self.docs
+
+    def add(self, name: str, doc: Dict) -> None:
+        """Index ``doc`` (with ``terms`` Counter and ``total_terms``)."""
+        self.remove(name)
+        self.docs[name] = doc
+        for field in self.MATCH_FIELDS:
+            value = self._field_value(name, doc, field)
+            tools = self.fields[field].setdefault(value, set())
+            if field == "name" and not tools:
+                self.name_lengths[len(value)] += 1
+                for gram in self._trigrams(value):
+                    self.name_grams.setdefault(gram, set()).add(value)
+            tools.add(name)
+        self.total_terms += doc["total_terms"]
+        for term, count in doc["terms"].items():
+            self.postings.setdefault(term, {})[name] = count
+
+    def remove(self, name: str) -> None:
+        doc = self.docs.pop(name, None)
+        if doc is None:
+            return
+        for field in self.MATCH_FIELDS:
+            value = self._field_value(name, doc, field)
+            tools = self.fields[field].get(value)
+            if tools is None:
+                continue
+            tools.discard(name)
+            if tools:
+                continue
+            del self.fields[field][value]
+            if field == "name":
+                self.name_lengths[len(value)] -= 1
+                if not self.name_lengths[len(value)]:
+                    del self.name_lengths[len(value)]
+                for gram in self._trigrams(value):
+                    names = self.name_grams[gram]
+                    names.discard(value)
+                    if not names:
+                        del self.name_grams[gram]
+        self.total_terms -= doc["total_terms"]
+        for term in doc["terms"]:
+            posting = self.postings.get(term)
+            if posting is not None:
+                posting.pop(name, None)
+                if not posting:
+                    del self.postings[term]
+
+    def clear(self) -> None:
+        self.postings.clear()
+        self.docs.clear()
+        for values in self.fields.values():
+            values.clear()
+        self.name_grams.clear()
+        self.name_lengths.clear()
+        self.total_terms = 0
+
+    @staticmethod
+    def _field_value(name: str, doc: Dict, field: str) -> str:
+        return doc.get(field, name.lower() if field == "name" else "")
+
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        return {text[i : i + 3] for i in range(len(text) - 2)}
+
+    def substring_hits(self, query: str) -> Set[str]:
+        """Tools an exact-match bonus applies to for lowercased ``query``.
+
+        That is tools whose name contains or is contained in ``query`` and
+        tools whose type or category contains it. Names containing the query come from the trigram index, names inside
+        the query from looking up its substrings of each indexed name length;
+        types and categories have few distinct values and are checked directly.
+        """
+        names = self.fields["name"]
+        matched: Set[str] = set()
+        if len(query) >= 3:
+            grams = sorted(
+                (self.name_grams.get(gram, set()) for gram in self._trigrams(query)),
+                key=len,
+            )
+            matched.update(value for value in grams[0] if query in value)
+        else:
+            matched.update(value for value in names if query in value)
+        for length in self.name_lengths:
+            for start in range(len(query) - length + 1):
+                if query[start : start + length] in names:
+                    matched.add(query[start : start + length])
+
+        hits: Set[str] = set()
+        for value in matched:
+            hits.update(names[value])
+        for field in ("type", "category"):
+            for value, tools in self.fields[field].items():
+                if query in value:
+                    hits.update(tools)
+        return hits
+
+    def score(
+        self,
+        query_terms: Iterable[str],
+        scoring: str = "tfidf",
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> Dict[str, float]:
+        """Score every tool sharing at least one term with the query.
+
+        ``tfidf`` is ``tf * log(N / df)`` with ``tf`` normalized by the tool's
+        term count; ``bm25`` uses Okapi BM25 term weights. Both weight each
+        query term by ``log(1 + query frequency)``.
+        """
+        total_docs = len(self.docs)
+        if not total_docs:
+            return {}
+        avg_length = self.total_terms / total_docs or 1.0
+        scores: Dict[str, float] = {}
+        for term, query_freq in Counter(query_terms).items():
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            doc_freq = len(posting)
+            query_weight = math.log(1 + query_freq)
+            if scoring == "bm25":
+                idf = math.log(1 + (total_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+                for name, count in posting.items():
+                    length = self.docs[name]["total_terms"]
+                    norm = k1 * (1 - b + b * length / avg_length)
+                    weight = idf * count * (k1 + 1) / (count + norm)
+                    scores[name] = scores.get(name, 0.0) + weight * query_weight
+            else:
+                idf = math.log(total_docs / doc_freq)
+                for name, count in posting.items():
+                    tf = count / self.docs[name]["total_terms"]
+                    scores[name] = scores.get(name, 0.0) + tf * idf * query_weight
+        return scores
+
 
 @register_tool("ToolFinderKeyword")
 class ToolFinderKeyword(BaseTool):
@@ -31,6 +209,11 @@ class ToolFinderKeyword(BaseTool):
     The search operates by parsing user queries to extract key terms, processing them through
     NLP pipelines, and matching against pre-built indices of tool metadata for efficient
     and relevant tool discovery.
+
+    The inverted index (:class:`KeywordIndex`) is updated incrementally as tools are
+    loaded or removed and persisted per tool set under ``index_cache_dir`` (default:
+    the user cache directory), so restarts with the same tools skip tokenization.
+    Set ``"scoring": "bm25"`` in the tool config to rank with BM25 instead of TF-IDF.
     """
 
     # Common English stop words to filter out
@@ -170,10 +353,25 @@ class ToolFinderKeyword(BaseTool):
         self.include_categories = tool_config.get("include_categories", None)
         self.exclude_categories = tool_config.get("exclude_categories", None)
 
-        # Initialize tool index for TF-IDF scoring
-        self._tool_index = None
-        self._document_frequencies = None
-        self._total_documents = 0
+        # Inverted index, re-synced with the loaded tools when they change
+        configs = tool_config.get("configs", {})
+        self.scoring = tool_config.get("scoring", configs.get("scoring", "tfidf"))
+        self.index_cache_dir = tool_config.get(
+            "index_cache_dir", os.getenv("TOOLUNIVERSE_KEYWORD_INDEX_DIR")
+        )
+        self.persist_index = tool_config.get(
+            "persist_index",
+            os.getenv("TOOLUNIVERSE_KEYWORD_INDEX_PERSIST", "true").lower()
+            in ("true", "1", "yes"),
+        )
+        self._index = KeywordIndex()
+        self._index_lock = threading.RLock()
+        # (tools revision, list identity, length) the index was last synced at
+        self._indexed_revision = None
+
+    @property
+    def _total_documents(self) -> int:
+        return len(self._index)
 
     def _tokenize_and_normalize(self, text: str) -> List[str]:
         """
@@ -250,53 +448,180 @@ class ToolFinderKeyword(BaseTool):
 
     def _build_tool_index(self, tools: List[Dict]) -> None:
         """
-        Build TF-IDF index for all tools to enable efficient relevance scoring.
+        Rebuild the inverted index from scratch for the given tools.
 
         Args:
             tools (List[Dict]): List of tool configurations
         """
-        self._tool_index = {}
-        term_doc_count = defaultdict(int)
-        self._total_documents = 0
+        with self._index_lock:
+            self._index.clear()
+            self._sync_index(tools)
+            self._indexed_revision = None
+
+    def _searchable_text(self, tool: Dict) -> str:
+        """Combine the tool metadata that is tokenized for indexing."""
+        return " ".join(
+            [
+                tool.get("name", ""),
+                tool.get("description", ""),
+                tool.get("type", ""),
+                tool.get("category", ""),
+                # Include parameter names and descriptions
+                " ".join(self._extract_parameter_text(tool.get("parameter", {}))),
+            ]
+        )
 
-        for tool in tools:
+    def _make_document(self, tool: Dict, text: str, terms=None) -> Dict:
+        if terms is None:
+            phrases = self._extract_phrases(self._tokenize_and_normalize(text))
+            terms = Counter(phrases)
+        return {
+            "tool": tool,
+            "text": text,
+            "terms": terms,
+            "total_terms": sum(terms.values()),
+            # Lowercased fields for the exact-match bonus
+            "name": tool.get("name", "").lower(),
+            "description": tool.get("description", "").lower(),
+            "type": tool.get("type", "").lower(),
+            "category": tool.get("category", "").lower(),
+        }
+
+    def _sync_index(self, tools: List[Dict]) -> None:
+        """
+        Bring the index in line with ``tools`` incrementally.
+
+        Tools that disappeared are removed and only new or changed tools are
+        tokenized, so tools registered later (``register_custom_tool``, MCP
+        auto-loaders) are picked up by the next search without a rebuild.
+        Each indexed tool records its position in ``tools`` for tie-breaking.
+        Searches call it through :meth:`_refresh_index`, only when the tools
+        changed.
+        """
+        current = {}
+        for position, tool in enumerate(tools):
             tool_name = tool.get("name", "")
-            if tool_name in self.exclude_tools:
-                continue
-
-            # Combine tool metadata for indexing
-            searchable_text = " ".join(
-                [
-                    tool.get("name", ""),
-                    tool.get("description", ""),
-                    tool.get("type", ""),
-                    tool.get("category", ""),
-                    # Include parameter names and descriptions
-                    " ".join(self._extract_parameter_text(tool.get("parameter", {}))),
-                ]
-            )
-
-            # Tokenize and extract phrases
-            tokens = self._tokenize_and_normalize(searchable_text)
-            phrases = self._extract_phrases(tokens)
-
-            # Build term frequency map for this tool
-            term_freq = Counter(phrases)
-            self._tool_index[tool_name] = {
-                "tool": tool,
-                "terms": term_freq,
-                "total_terms": len(phrases),
+            if tool_name not in self.exclude_tools:
+                current[tool_name] = (position, tool)
+
+        index = self._index
+        for tool_name in [name for name in index.docs if name not in current]:
+            index.remove(tool_name)
+
+        pending = {}
+        for tool_name, (position, tool) in current.items():
+            doc = index.docs.get(tool_name)
+            if doc is not None and doc["tool"] is not tool:
+                text = self._searchable_text(tool)
+                if text == doc["text"]:
+                    doc["tool"] = tool
+                else:
+                    doc = None
+            if doc is None:
+                pending[tool_name] = tool
+            else:
+                doc["order"] = position
+        if not pending:
+            return
+
+        persisted = {}
+        cache_path = None
+        if self.persist_index and not index.docs:
+            # Initial build: reuse the term counts of an identical tool set
+            texts = {
+                name: self._searchable_text(tool) for name, tool in pending.items()
             }
+            cache_path = self._index_cache_path(texts)
+            persisted = self._load_persisted_index(cache_path, texts)
+        for tool_name, tool in pending.items():
+            text = self._searchable_text(tool)
+            index.add(
+                tool_name,
+                self._make_document(tool, text, persisted.get(tool_name)),
+            )
+            index.docs[tool_name]["order"] = current[tool_name][0]
+        if cache_path and len(persisted) < len(pending):
+            self._save_persisted_index(cache_path)
 
-            # Count document frequency for each term
-            unique_terms = set(phrases)
-            for term in unique_terms:
-                term_doc_count[term] += 1
-
-            self._total_documents += 1
+    def _refresh_index(self, all_tools: List[Dict]) -> None:
+        """Sync the index if ``all_tools`` changed since the last sync.
 
-        # Calculate document frequencies
-        self._document_frequencies = dict(term_doc_count)
+        ``ToolUniverse`` bumps ``_tools_revision`` when tools are loaded or
+        registered; the list identity and length also catch direct edits such
+        as ``all_tools.append``. Lists that are not the live ``all_tools``
+        (copies from ``return_all_loaded_tools``) are always synced.
+        """
+        live = getattr(self.tooluniverse, "all_tools", None)
+        revision = None
+        if all_tools is live:
+            revision = (
+                getattr(self.tooluniverse, "_tools_revision", None),
+                id(all_tools),
+                len(all_tools),
+            )
+            if revision == self._indexed_revision:
+                return
+        self._sync_index(all_tools)
+        self._indexed_revision = revision
+
+    def _index_cache_path(self, texts: Dict[str, str]) -> Optional[str]:
+        """Path of the persisted index for this exact set of tool texts."""
+        digest = hashlib.sha256(f"v{_INDEX_FORMAT}".encode())
+        for tool_name in sorted(texts):
+            digest.update(tool_name.encode("utf-8") + b"\0")
+            digest.update(texts[tool_name].encode("utf-8") + b"\0")
+        directory = self.index_cache_dir
+        if not directory:
+            from .utils import get_user_cache_dir
+
+            directory = os.path.join(get_user_cache_dir(), "keyword_index")
+        return os.path.join(directory, f"{digest.hexdigest()[:32]}.json")
+
+    def _load_persisted_index(self, path: str, texts: Dict[str, str]) -> Dict:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("format") != _INDEX_FORMAT:
+            return {}
+        return {
+            tool_name: Counter(terms)
+            for tool_name, terms in data.get("terms", {}).items()
+            if tool_name in texts
+        }
+
+    def _save_persisted_index(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "format": _INDEX_FORMAT,
+                        "terms": {
+                            tool_name: doc["terms"]
+                            for tool_name, doc in self._index.docs.items()
+                        },
+                    },
+                    f,
+                )
+            os.replace(tmp_path, path)
+            saved = sorted(
+                (
+                    entry
+                    for entry in os.scandir(directory)
+                    if entry.name.endswith(".json")
+                ),
+                key=lambda entry: entry.stat().st_mtime,
+                reverse=True,
+            )
+            for entry in saved[_MAX_PERSISTED_INDEXES:]:
+                os.remove(entry.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def _extract_parameter_text(self, parameter_schema: Dict) -> List[str]:
         """
@@ -332,29 +657,9 @@ class ToolFinderKeyword(BaseTool):
         Returns
             float: TF-IDF relevance score
         """
-        if tool_name not in self._tool_index:
+        if tool_name not in self._index:
             return 0.0
-
-        tool_data = self._tool_index[tool_name]
-        tool_terms = tool_data["terms"]
-        total_terms = tool_data["total_terms"]
-
-        score = 0.0
-        query_term_freq = Counter(query_terms)
-
-        for term, query_freq in query_term_freq.items():
-            if term in tool_terms:
-                # Term Frequency (TF): frequency of term in tool / total terms in tool
-                tf = tool_terms[term] / total_terms
-
-                # Inverse Document Frequency (IDF): log(total docs / docs containing term)
-                doc_freq = self._document_frequencies.get(term, 1)
-                idf = math.log(self._total_documents / doc_freq)
-
-                # TF-IDF score with query term frequency weighting
-                score += tf * idf * math.log(1 + query_freq)
-
-        return score
+        return self._index.score(query_terms).get(tool_name, 0.0)
 
     def _calculate_exact_match_bonus(self, query: str, tool: Dict) -> float:
         """
@@ -368,9 +673,25 @@ class ToolFinderKeyword(BaseTool):
             float: Exact match bonus score
         """
         query_lower = query.lower()
-        tool_name = tool.get("name", "").lower()
-        tool_desc = tool.get("description", "").lower()
+        return self._exact_match_bonus(
+            query_lower,
+            self._query_phrase(query_lower),
+            tool.get("name", "").lower(),
+            tool.get("description", "").lower(),
+            tool.get("type", "").lower(),
+            tool.get("category", "").lower(),
+        )
+
+    @staticmethod
+    def _query_phrase(query_lower: str) -> Optional[str]:
+        """Whitespace-normalized query, or None for single-word queries."""
+        query_words = query_lower.split()
+        return " ".join(query_words) if len(query_words) > 1 else None
 
+    @staticmethod
+    def _exact_match_bonus(
+        query_lower, query_phrase, tool_name, tool_desc, tool_type, tool_category
+    ) -> float:
         bonus = 0.0
 
         # Exact tool name match
@@ -378,16 +699,10 @@ class ToolFinderKeyword(BaseTool):
             bonus += 2.0
 
         # Exact phrase matches in description
-        query_words = query_lower.split()
-        if len(query_words) > 1:
-            query_phrase = " ".join(query_words)
-            if query_phrase in tool_desc:
-                bonus += 1.5
+        if query_phrase is not None and query_phrase in tool_desc:
+            bonus += 1.5
 
         # Category or type exact matches
-        tool_type = tool.get("type", "").lower()
-        tool_category = tool.get("category", "").lower()
-
         if query_lower in tool_type or query_lower in tool_category:
             bonus += 1.0
 
@@ -542,25 +857,21 @@ class ToolFinderKeyword(BaseTool):
                     indent=2,
                 )
 
-            all_tools = self.tooluniverse.return_all_loaded_tools()
+            # The index keeps references to the tool configs, so read the
+            # live list instead of a deep copy when it is available
+            all_tools = getattr(self.tooluniverse, "all_tools", None)
+            if not isinstance(all_tools, list):
+                all_tools = self.tooluniverse.return_all_loaded_tools()
 
-            # Filter by categories if specified
+            # Restrict candidates by categories if specified
+            allowed_names = None
             if categories:
-                filtered_tools = self.tooluniverse.select_tools(
-                    include_categories=categories
-                )
-            else:
-                filtered_tools = all_tools
-
-            # Build search index if not already built or if tools changed
-            if self._tool_index is None or self._total_documents != len(
-                [
-                    t
-                    for t in filtered_tools
-                    if t.get("name", "") not in self.exclude_tools
-                ]
-            ):
-                self._build_tool_index(filtered_tools)
+                allowed_names = {
+                    tool.get("name", "")
+                    for tool in self.tooluniverse.select_tools(
+                        include_categories=categories
+                    )
+                }
 
             # Process query using NLP techniques
             query_tokens = self._tokenize_and_normalize(query)
@@ -576,58 +887,77 @@ class ToolFinderKeyword(BaseTool):
                     indent=2,
                 )
 
-            # Calculate relevance scores for all tools
-            tool_scores = []
-
-            for tool in filtered_tools:
-                tool_name = tool.get("name", "")
-
-                # Skip excluded tools
-                if tool_name in self.exclude_tools:
-                    continue
-
-                # Apply category filters if specified
-                tool_category = tool.get("category", "unknown")
-                if (
-                    self.include_categories
-                    and tool_category not in self.include_categories
-                ):
-                    continue
-                if self.exclude_categories and tool_category in self.exclude_categories:
-                    continue
-
-                # Calculate TF-IDF score
-                tfidf_score = self._calculate_tfidf_score(query_phrases, tool_name)
-
-                # Calculate exact match bonus
-                exact_bonus = self._calculate_exact_match_bonus(query, tool)
-
-                # Combined relevance score
-                total_score = tfidf_score + exact_bonus
-
-                # Only include tools with positive relevance
-                if total_score > 0:
-                    tool_info = {
-                        "name": tool_name,
-                        "description": tool.get("description", ""),
-                        "type": tool.get("type", ""),
-                        "category": tool_category,
-                        "parameters": tool.get("parameter", {}),
-                        "required": tool.get("required", []),
-                        "relevance_score": round(total_score, 4),
-                        "tfidf_score": round(tfidf_score, 4),
-                        "exact_match_bonus": round(exact_bonus, 4),
-                    }
-                    tool_scores.append(tool_info)
-
-            # Sort by relevance score (highest first) and limit results
-            tool_scores.sort(key=lambda x: x["relevance_score"], reverse=True)
-            matching_tools = tool_scores[:limit]
-
-            # Remove internal scoring details from final output
-            for tool in matching_tools:
-                tool.pop("tfidf_score", None)
-                tool.pop("exact_match_bonus", None)
+            with self._index_lock:
+                # Picks up tools registered or removed since the last search
+                self._refresh_index(all_tools)
+
+                # Only tools sharing a term with the query get a TF-IDF score
+                term_scores = self._index.score(query_phrases, self.scoring)
+
+                # Candidates: the postings hits plus the tools an exact-match
+                # bonus applies to on name, type or category
+                query_lower = query.lower()
+                query_phrase = self._query_phrase(query_lower)
+                candidate_names = set(term_scores)
+                candidate_names.update(self._index.substring_hits(query_lower))
+                candidates = []
+                for tool_name in candidate_names:
+                    doc = self._index.docs[tool_name]
+                    if allowed_names is not None and tool_name not in allowed_names:
+                        continue
+
+                    # Apply category filters if specified
+                    tool_category = doc["tool"].get("category", "unknown")
+                    if (
+                        self.include_categories
+                        and tool_category not in self.include_categories
+                    ):
+                        continue
+                    if (
+                        self.exclude_categories
+                        and tool_category in self.exclude_categories
+                    ):
+                        continue
+
+                    tfidf_score = term_scores.get(tool_name, 0.0)
+                    exact_bonus = self._exact_match_bonus(
+                        query_lower,
+                        query_phrase,
+                        doc["name"],
+                        doc["description"],
+                        doc["type"],
+                        doc["category"],
+                    )
+
+                    # Combined relevance score
+                    total_score = tfidf_score + exact_bonus
+
+                    # Only include tools with positive relevance
+                    if total_score > 0:
+                        candidates.append(
+                            (round(total_score, 4), -doc["order"], tool_name)
+                        )
+
+                # Top-k by relevance; ties keep the loaded tool order
+                if limit is None:
+                    top = sorted(candidates, reverse=True)
+                else:
+                    top = heapq.nlargest(limit, candidates)
+                tool_scores = []
+                for score, _, tool_name in top:
+                    tool = self._index.docs[tool_name]["tool"]
+                    tool_scores.append(
+                        {
+                            "name": tool_name,
+                            "description": tool.get("description", ""),
+                            "type": tool.get("type", ""),
+                            "category": tool.get("category", "unknown"),
+                            "parameters": tool.get("parameter", {}),
+                            "required": tool.get("required", []),
+                            "relevance_score": score,
+                        }
+                    )
+            matching_tools = tool_scores
 
             return json.dumps(
                 {
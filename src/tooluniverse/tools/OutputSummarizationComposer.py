@@ -15,6 +15,8 @@ def OutputSummarizationComposer(
     chunk_size: Optional[int] = 30000,
     focus_areas: Optional[str] = "key_findings_and_results",
     max_summary_length: Optional[int] = 10000,
+    max_concurrency: Optional[int] = 4,
+    merge_fan_in: Optional[int] = 8,
     *,
     stream_callback: Optional[Callable[[str], None]] = None,
     use_cache: bool = False,
@@ -37,6 +39,10 @@ def OutputSummarizationComposer(
         Areas to focus on in summarization
     max_summary_length : int
         Maximum length of final summary
+    max_concurrency : int
+        Number of chunks summarized concurrently
+    merge_fan_in : int
+        Number of summaries merged per call when merging very long outputs hierarchic...
     stream_callback : Callable, optional
         Callback for streaming output
     use_cache : bool, default False
@@ -60,6 +66,8 @@ def OutputSummarizationComposer(
                 "chunk_size": chunk_size,
                 "focus_areas": focus_areas,
                 "max_summary_length": max_summary_length,
+                "max_concurrency": max_concurrency,
+                "merge_fan_in": merge_fan_in,
             },
         },
         stream_callback=stream_callback,
@@ -13,6 +13,13 @@ def ToolGraphGenerationPipeline(
     max_tools: int,
     output_path: str,
     save_intermediate_every: int,
+    prefilter: Optional[bool] = True,
+    similarity_threshold: Optional[float] = 0.35,
+    top_k_neighbors: Optional[int] = 15,
+    embedding_model: Optional[str] = None,
+    batch_size: Optional[int] = 100,
+    max_concurrency: Optional[int] = 4,
+    start_after_tool: Optional[str] = None,
     *,
     stream_callback: Optional[Callable[[str], None]] = None,
     use_cache: bool = False,
@@ -31,6 +38,20 @@ def ToolGraphGenerationPipeline(
         Path for output graph JSON
     save_intermediate_every : int
         Checkpoint every N processed pairs
+    prefilter : bool
+        Skip tool pairs with dissimilar descriptions and incompatible inputs/outputs ...
+    similarity_threshold : float
+        Minimum description similarity (0-1) for a pair to be evaluated
+    top_k_neighbors : int
+        Always evaluate each tool against its K most similar tools
+    embedding_model : str
+        Optional sentence-transformers model for description embeddings (TF-IDF vecto...
+    batch_size : int
+        Number of candidate tools compared in one detector call
+    max_concurrency : int
+        Maximum number of detector calls running at once
+    start_after_tool : str
+        Optional tool name; tools up to and including it are not used as the primary ...
     stream_callback : Callable, optional
         Callback for streaming output
     use_cache : bool, default False
@@ -52,6 +73,13 @@ def ToolGraphGenerationPipeline(
                 "max_tools": max_tools,
                 "output_path": output_path,
                 "save_intermediate_every": save_intermediate_every,
+                "prefilter": prefilter,
+                "similarity_threshold": similarity_threshold,
+                "top_k_neighbors": top_k_neighbors,
+                "embedding_model": embedding_model,
+                "batch_size": batch_size,
+                "max_concurrency": max_concurrency,
+                "start_after_tool": start_after_tool,
             },
         },
         stream_callback=stream_callback,
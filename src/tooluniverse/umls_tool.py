@@ -1,5 +1,6 @@
 import os
 import requests
+from .http_transport import http_get
 from typing import Dict, Any, Optional
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -81,7 +82,7 @@ class UMLSRESTTool(BaseTool):
             pass
 
         try:
-            resp = requests.get(url, params=params, timeout=30)
+            resp = http_get(url, params=params, timeout=30)
             resp.raise_for_status()
             data = resp.json()
             return {
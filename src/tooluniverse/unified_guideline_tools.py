@@ -4,15 +4,75 @@ Unified Guideline Tools
 Consolidated clinical guidelines search tools from multiple sources.
 """
 
+import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from .http_transport import http_get
 import time
 import re
 import xml.etree.ElementTree as ET
 from bs4 import BeautifulSoup
 from markitdown import MarkItDown
 from .base_tool import BaseTool
+from .cache.memory_cache import SizedCache
 from .tool_registry import register_tool
 
+# Detail pages, abstracts and full texts fetched to enrich search results,
+# shared by all guideline tools and keyed by URL or article ID
+_DOCUMENT_CACHE = SizedCache(max_size=2048, max_bytes=64 * 1024 * 1024)
+_DOCUMENT_CACHE_TTL = 24 * 3600
+
+# Fetchers report failures as text instead of raising; those are not cached
+_FAILED_FETCH_PREFIXES = ("Error ", "Content extraction failed")
+
+
+def _get_max_concurrency(tool_config):
+    """Number of detail requests a tool may have in flight at once."""
+    value = tool_config.get("max_concurrency") or os.getenv(
+        "TOOLUNIVERSE_GUIDELINE_CONCURRENCY", "4"
+    )
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return 4
+
+
+def _fetch_concurrently(fetch, items, max_workers):
+    """Return ``[fetch(item) for item in items]`` using a bounded thread pool."""
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [fetch(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fetch, items))
+
+
+def _cached_document(namespace, key, fetch):
+    """Return the cached document for ``key`` or fetch and cache it.
+
+    Empty results and failures reported by the fetcher are returned but not
+    cached, so they are retried on the next search.
+    """
+    value = _get_cached_document(namespace, key)
+    if value is None:
+        value = fetch()
+        _store_document(namespace, key, value)
+    return value
+
+
+def _get_cached_document(namespace, key):
+    return _DOCUMENT_CACHE.get(f"{namespace}:{key}", namespace=namespace)
+
+
+def _store_document(namespace, key, value):
+    text = value.get("content", "") if isinstance(value, dict) else value
+    if text and not str(text).startswith(_FAILED_FETCH_PREFIXES):
+        _DOCUMENT_CACHE.set(
+            f"{namespace}:{key}",
+            value,
+            namespace=namespace,
+            expires_at=time.time() + _DOCUMENT_CACHE_TTL,
+        )
+
 
 def _extract_meaningful_terms(query):
     """Return significant query terms for relevance filtering."""
@@ -58,7 +118,8 @@ class NICEWebScrapingTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = "https://www.nice.org.uk"
         self.search_url = f"{self.base_url}/search"
-        self.session = requests.Session()
+        self.max_concurrency = _get_max_concurrency(tool_config)
+        self.session = self.get_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -75,7 +136,12 @@ class NICEWebScrapingTool(BaseTool):
         return self._search_nice_guidelines_real(query, limit)
 
     def _fetch_guideline_summary(self, url):
-        """Fetch summary from a guideline detail page."""
+        """Fetch summary from a guideline detail page (cached per URL)."""
+        return _cached_document(
+            "nice_summary", url, lambda: self._fetch_guideline_summary_uncached(url)
+        )
+
+    def _fetch_guideline_summary_uncached(self, url):
         try:
             time.sleep(0.5)  # Be respectful
             response = self.session.get(url, timeout=15)
@@ -149,29 +215,40 @@ class NICEWebScrapingTool(BaseTool):
                     "suggestion": "Try different search terms or check if the NICE website is accessible",
                 }
 
+            documents = documents[:limit]
+
+            # Fetch the detail pages of documents without a summary concurrently
+            detail_urls = []
+            for doc in documents:
+                try:
+                    url = self._document_url(doc)
+                    if url and not self._document_summary(doc):
+                        detail_urls.append(url)
+                except Exception:
+                    continue
+            detail_urls = list(dict.fromkeys(detail_urls))
+            detail_summaries = dict(
+                zip(
+                    detail_urls,
+                    _fetch_concurrently(
+                        self._fetch_guideline_summary, detail_urls, self.max_concurrency
+                    ),
+                )
+            )
+
             # Process the documents
             results = []
-            for doc in documents[:limit]:
+            for doc in documents:
                 try:
                     title = doc.get("title", "").replace("<b>", "").replace("</b>", "")
-                    url = doc.get("url", "")
-
-                    # Make URL absolute
-                    if url.startswith("/"):
-                        url = self.base_url + url
+                    url = self._document_url(doc)
 
                     # Extract summary - try multiple fields
-                    summary = (
-                        doc.get("abstract", "")
-                        or doc.get("staticAbstract", "")
-                        or doc.get("metaDescription", "")
-                        or doc.get("teaser", "")
-                        or ""
-                    )
+                    summary = self._document_summary(doc)
 
-                    # If still no summary, try to fetch from the detail page
+                    # If still no summary, use the one from the detail page
                     if not summary and url:
-                        summary = self._fetch_guideline_summary(url)
+                        summary = detail_summaries.get(url, "")
 
                     # Extract date
                     publication_date = doc.get("publicationDate", "")
@@ -238,6 +315,25 @@ class NICEWebScrapingTool(BaseTool):
         except Exception as e:
             return {"error": f"Error parsing NICE response: {str(e)}", "source": "NICE"}
 
+    def _document_url(self, doc):
+        """Absolute URL of a search result document."""
+        url = doc.get("url", "")
+        # Make URL absolute
+        if url.startswith("/"):
+            url = self.base_url + url
+        return url
+
+    @staticmethod
+    def _document_summary(doc):
+        """Summary of a search result document from its listing fields."""
+        return (
+            doc.get("abstract", "")
+            or doc.get("staticAbstract", "")
+            or doc.get("metaDescription", "")
+            or doc.get("teaser", "")
+            or ""
+        )
+
 
 @register_tool()
 class PubMedGuidelinesTool(BaseTool):
@@ -249,7 +345,7 @@ class PubMedGuidelinesTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.session = requests.Session()
+        self.session = self.get_http_session()
 
     def run(self, arguments):
         query = arguments.get("query", "")
@@ -411,7 +507,8 @@ class EuropePMCGuidelinesTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
-        self.session = requests.Session()
+        self.max_concurrency = _get_max_concurrency(tool_config)
+        self.session = self.get_http_session()
 
     def run(self, arguments):
         query = arguments.get("query", "")
@@ -444,143 +541,88 @@ class EuropePMCGuidelinesTool(BaseTool):
             if not results_list:
                 return []
 
-            # Process results with stricter filtering
-            results = []
-            for result in results_list:
-                title = result.get("title", "")
-                pub_type = result.get("pubType", "")
-
-                # Get abstract from detailed API call
-                abstract = self._get_europepmc_abstract(result.get("pmid", ""))
-
-                # If abstract is too short or just a question, try to get more content
-                if len(abstract) < 200 or abstract.endswith("?"):
-                    # Try to get full text or more detailed content
-                    abstract = self._get_europepmc_full_content(
-                        result.get("pmid", ""), result.get("pmcid", "")
-                    )
-
-                # More strict guideline detection
-                title_lower = title.lower()
-                abstract_lower = abstract.lower()
-
-                # Must contain guideline-related keywords in title or abstract
-                guideline_keywords = [
-                    "guideline",
-                    "practice guideline",
-                    "clinical guideline",
-                    "recommendation",
-                    "consensus statement",
-                    "position statement",
-                    "clinical practice",
-                    "best practice",
-                ]
-
-                has_guideline_keywords = any(
-                    keyword in title_lower or keyword in abstract_lower
-                    for keyword in guideline_keywords
-                )
-
-                # Exclude research papers and studies
-                exclude_keywords = [
-                    "study",
-                    "trial",
-                    "analysis",
-                    "evaluation",
-                    "assessment",
-                    "effectiveness",
-                    "efficacy",
-                    "outcome",
-                    "result",
-                    "finding",
-                ]
-
-                is_research = any(
-                    keyword in title_lower for keyword in exclude_keywords
-                )
+            # Hits whose metadata rules them out are never enriched
+            candidates = [
+                result for result in results_list if self._metadata_qualifies(result)
+            ]
 
-                # Publication type must confirm guideline nature
-                pub_type_tokens = []
-                if isinstance(pub_type, str):
-                    pub_type_tokens.append(pub_type.lower())
-
-                pub_type_list = result.get("pubTypeList", {}).get("pubType", [])
-                if isinstance(pub_type_list, str):
-                    pub_type_list = [pub_type_list]
-
-                if isinstance(pub_type_list, list):
-                    for entry in pub_type_list:
-                        if isinstance(entry, str):
-                            pub_type_tokens.append(entry.lower())
-                        elif isinstance(entry, dict):
-                            label = (
-                                entry.get("text")
-                                or entry.get("name")
-                                or entry.get("value")
-                            )
-                            if label:
-                                pub_type_tokens.append(str(label).lower())
-
-                pub_type_combined = " ".join(pub_type_tokens)
-
-                pub_type_has_guideline = any(
-                    term in pub_type_combined
-                    for term in [
+            # Enrich candidates a window at a time and stop once enough
+            # guidelines are found
+            results = []
+            position = 0
+            while position < len(candidates) and len(results) < limit:
+                window_size = max(limit - len(results), self.max_concurrency)
+                window = candidates[position : position + window_size]
+                position += len(window)
+
+                for result, abstract in zip(window, self._enrich_abstracts(window)):
+                    title = result.get("title", "")
+                    pub_type = result.get("pubType", "")
+
+                    # More strict guideline detection
+                    title_lower = title.lower()
+                    abstract_lower = abstract.lower()
+
+                    # Must contain guideline-related keywords in title or abstract
+                    guideline_keywords = [
                         "guideline",
                         "practice guideline",
-                        "consensus",
+                        "clinical guideline",
                         "recommendation",
+                        "consensus statement",
+                        "position statement",
+                        "clinical practice",
+                        "best practice",
                     ]
-                )
 
-                # Determine if it's a guideline
-                is_guideline = (
-                    has_guideline_keywords
-                    and pub_type_has_guideline
-                    and not is_research
-                    and len(title) > 20
-                )
+                    has_guideline_keywords = any(
+                        keyword in title_lower or keyword in abstract_lower
+                        for keyword in guideline_keywords
+                    )
 
-                # Build URL
-                pmid = result.get("pmid", "")
-                pmcid = result.get("pmcid", "")
-                doi = result.get("doi", "")
-
-                url = ""
-                if pmid:
-                    url = f"https://europepmc.org/article/MED/{pmid}"
-                elif pmcid:
-                    url = f"https://europepmc.org/article/{pmcid}"
-                elif doi:
-                    url = f"https://doi.org/{doi}"
-
-                abstract_text = (
-                    abstract[:500] + "..." if len(abstract) > 500 else abstract
-                )
+                    # Determine if it's a guideline (metadata already qualified)
+                    is_guideline = has_guideline_keywords
 
-                # Only add if it's actually a guideline
-                if is_guideline:
-                    guideline_result = {
-                        "title": title,
-                        "pmid": pmid,
-                        "pmcid": pmcid,
-                        "doi": doi,
-                        "authors": result.get("authorString", ""),
-                        "journal": result.get("journalTitle", ""),
-                        "publication_date": result.get("firstPublicationDate", ""),
-                        "publication_type": pub_type,
-                        "abstract": abstract_text,
-                        "content": abstract_text,  # Copy abstract to content field
-                        "is_guideline": is_guideline,
-                        "url": url,
-                        "source": "Europe PMC",
-                    }
+                    # Build URL
+                    pmid = result.get("pmid", "")
+                    pmcid = result.get("pmcid", "")
+                    doi = result.get("doi", "")
 
-                    results.append(guideline_result)
+                    url = ""
+                    if pmid:
+                        url = f"https://europepmc.org/article/MED/{pmid}"
+                    elif pmcid:
+                        url = f"https://europepmc.org/article/{pmcid}"
+                    elif doi:
+                        url = f"https://doi.org/{doi}"
 
-                    # Stop when we have enough guidelines
-                    if len(results) >= limit:
-                        break
+                    abstract_text = (
+                        abstract[:500] + "..." if len(abstract) > 500 else abstract
+                    )
+
+                    # Only add if it's actually a guideline
+                    if is_guideline:
+                        guideline_result = {
+                            "title": title,
+                            "pmid": pmid,
+                            "pmcid": pmcid,
+                            "doi": doi,
+                            "authors": result.get("authorString", ""),
+                            "journal": result.get("journalTitle", ""),
+                            "publication_date": result.get("firstPublicationDate", ""),
+                            "publication_type": pub_type,
+                            "abstract": abstract_text,
+                            "content": abstract_text,  # Copy abstract to content field
+                            "is_guideline": is_guideline,
+                            "url": url,
+                            "source": "Europe PMC",
+                        }
+
+                        results.append(guideline_result)
+
+                        # Stop when we have enough guidelines
+                        if len(results) >= limit:
+                            break
 
             return results
 
@@ -595,17 +637,116 @@ class EuropePMCGuidelinesTool(BaseTool):
                 "source": "Europe PMC",
             }
 
+    @staticmethod
+    def _metadata_qualifies(result):
+        """Check the guideline criteria that do not depend on the abstract."""
+        title = result.get("title", "")
+        pub_type = result.get("pubType", "")
+
+        # Exclude research papers and studies
+        exclude_keywords = [
+            "study",
+            "trial",
+            "analysis",
+            "evaluation",
+            "assessment",
+            "effectiveness",
+            "efficacy",
+            "outcome",
+            "result",
+            "finding",
+        ]
+
+        is_research = any(keyword in title.lower() for keyword in exclude_keywords)
+
+        # Publication type must confirm guideline nature
+        pub_type_tokens = []
+        if isinstance(pub_type, str):
+            pub_type_tokens.append(pub_type.lower())
+
+        pub_type_list = result.get("pubTypeList", {}).get("pubType", [])
+        if isinstance(pub_type_list, str):
+            pub_type_list = [pub_type_list]
+
+        if isinstance(pub_type_list, list):
+            for entry in pub_type_list:
+                if isinstance(entry, str):
+                    pub_type_tokens.append(entry.lower())
+                elif isinstance(entry, dict):
+                    label = entry.get("text") or entry.get("name") or entry.get("value")
+                    if label:
+                        pub_type_tokens.append(str(label).lower())
+
+        pub_type_combined = " ".join(pub_type_tokens)
+
+        pub_type_has_guideline = any(
+            term in pub_type_combined
+            for term in [
+                "guideline",
+                "practice guideline",
+                "consensus",
+                "recommendation",
+            ]
+        )
+
+        return pub_type_has_guideline and not is_research and len(title) > 20
+
+    def _enrich_abstracts(self, results):
+        """Abstracts for search hits, with full-text fallbacks for short ones.
+
+        Abstracts are fetched in one batched request; full texts are fetched
+        concurrently.
+        """
+        abstracts_by_pmid = self._get_europepmc_abstracts(
+            [result.get("pmid", "") for result in results]
+        )
+        abstracts = [
+            abstracts_by_pmid.get(result.get("pmid", ""), "") for result in results
+        ]
+
+        # If abstract is too short or just a question, try to get more content
+        needs_content = [
+            i
+            for i, abstract in enumerate(abstracts)
+            if len(abstract) < 200 or abstract.endswith("?")
+        ]
+        contents = _fetch_concurrently(
+            lambda i: self._get_europepmc_full_content(
+                results[i].get("pmid", ""), results[i].get("pmcid", "")
+            ),
+            needs_content,
+            self.max_concurrency,
+        )
+        for i, content in zip(needs_content, contents):
+            abstracts[i] = content
+        return abstracts
+
     def _get_europepmc_abstract(self, pmid):
         """Get abstract for a specific PMID using PubMed API."""
-        if not pmid:
-            return ""
+        return self._get_europepmc_abstracts([pmid]).get(pmid, "")
+
+    def _get_europepmc_abstracts(self, pmids):
+        """Get abstracts for several PMIDs with one PubMed efetch request.
+
+        Returns a dict keyed by PMID; abstracts are cached per PMID.
+        """
+        abstracts = {}
+        missing = []
+        for pmid in dict.fromkeys(pmid for pmid in pmids if pmid):
+            cached = _get_cached_document("pubmed_abstract", pmid)
+            if cached is None:
+                missing.append(pmid)
+            else:
+                abstracts[pmid] = cached
+        if not missing:
+            return abstracts
 
         try:
             # Use PubMed's E-utilities API
             base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
             params = {
                 "db": "pubmed",
-                "id": pmid,
+                "id": ",".join(missing),
                 "retmode": "xml",
                 "rettype": "abstract",
             }
@@ -613,31 +754,48 @@ class EuropePMCGuidelinesTool(BaseTool):
             response = self.session.get(base_url, params=params, timeout=15)
             response.raise_for_status()
 
-            # Parse XML response
-            import xml.etree.ElementTree as ET
-
+            # Parse XML response, one article element per PMID
             root = ET.fromstring(response.content)
 
-            # Find abstract text
-            abstract_elem = root.find(".//AbstractText")
-            if abstract_elem is not None:
-                return abstract_elem.text or ""
+            for article in root:
+                pmid_elem = article.find(".//PMID")
+                if pmid_elem is None or not pmid_elem.text:
+                    continue
 
-            # Try alternative path
-            abstract_elem = root.find(".//abstract")
-            if abstract_elem is not None:
-                return abstract_elem.text or ""
+                # Find abstract text, then try alternative path
+                abstract_elem = article.find(".//AbstractText")
+                if abstract_elem is None:
+                    abstract_elem = article.find(".//abstract")
+                abstract = ""
+                if abstract_elem is not None:
+                    abstract = abstract_elem.text or ""
 
-            return ""
+                pmid = pmid_elem.text.strip()
+                if pmid in missing:
+                    abstracts[pmid] = abstract
+                    _store_document("pubmed_abstract", pmid, abstract)
+
+            for pmid in missing:
+                abstracts.setdefault(pmid, "")
+            return abstracts
 
         except Exception as e:
-            return f"Error fetching abstract: {str(e)}"
+            error = f"Error fetching abstract: {str(e)}"
+            abstracts.update((pmid, error) for pmid in missing)
+            return abstracts
 
     def _get_europepmc_full_content(self, pmid, pmcid):
-        """Get more detailed content from Europe PMC."""
+        """Get more detailed content from Europe PMC (cached per article)."""
         if not pmid and not pmcid:
             return ""
 
+        return _cached_document(
+            "europepmc_full_content",
+            f"{pmid}:{pmcid}",
+            lambda: self._get_europepmc_full_content_uncached(pmid, pmcid),
+        )
+
+    def _get_europepmc_full_content_uncached(self, pmid, pmcid):
         try:
             # Try to get full text from Europe PMC
             if pmcid:
@@ -701,7 +859,8 @@ class TRIPDatabaseTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.tripdatabase.com/api/search"
-        self.session = requests.Session()
+        self.max_concurrency = _get_max_concurrency(tool_config)
+        self.session = self.get_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
@@ -740,9 +899,26 @@ class TRIPDatabaseTool(BaseTool):
             if not documents:
                 return []
 
+            documents = documents[:limit]
+
+            # Fetch the pages of guideline documents that need them concurrently
+            fetch_urls = list(
+                dict.fromkeys(
+                    url for url in (self._content_url(doc) for doc in documents) if url
+                )
+            )
+            fetched_contents = dict(
+                zip(
+                    fetch_urls,
+                    _fetch_concurrently(
+                        self._fetch_guideline_content, fetch_urls, self.max_concurrency
+                    ),
+                )
+            )
+
             # Process results
             results = []
-            for doc in documents[:limit]:
+            for doc in documents:
                 title_elem = doc.find("title")
                 link_elem = doc.find("link")
                 publication_elem = doc.find("publication")
@@ -757,13 +933,7 @@ class TRIPDatabaseTool(BaseTool):
                 key_recommendations = []
                 evidence_strength = []
 
-                fetched_content = None
-                requires_detailed_fetch = url and any(
-                    domain in url for domain in ["bmj.com/content/", "e-dmj.org"]
-                )
-
-                if (not description_text and url) or requires_detailed_fetch:
-                    fetched_content = self._fetch_guideline_content(url)
+                fetched_content = fetched_contents.get(self._content_url(doc))
 
                 if isinstance(fetched_content, dict):
                     description_text = (
@@ -834,7 +1004,40 @@ class TRIPDatabaseTool(BaseTool):
                 "source": "TRIP Database",
             }
 
+    @staticmethod
+    def _content_url(doc):
+        """URL whose content is fetched for a search result, or None.
+
+        Pages are fetched when the result has no description or comes from a
+        site with a targeted parser, unless its category is not a guideline
+        (such results are skipped anyway).
+        """
+        link_elem = doc.find("link")
+        url = link_elem.text if link_elem is not None else ""
+        if not url:
+            return None
+
+        category_elem = doc.find("category")
+        if category_elem is not None and category_elem.text:
+            if "guideline" not in category_elem.text.lower():
+                return None
+
+        description_elem = doc.find("description")
+        description_text = description_elem.text if description_elem is not None else ""
+        requires_detailed_fetch = any(
+            domain in url for domain in ["bmj.com/content/", "e-dmj.org"]
+        )
+        if not description_text or requires_detailed_fetch:
+            return url
+        return None
+
     def _fetch_guideline_content(self, url):
+        """Extract content from a guideline URL (cached per URL)."""
+        return _cached_document(
+            "trip_content", url, lambda: self._fetch_guideline_content_uncached(url)
+        )
+
+    def _fetch_guideline_content_uncached(self, url):
         """Extract content from a guideline URL using targeted parsers when available."""
         try:
             time.sleep(0.5)  # Be respectful
@@ -1114,7 +1317,8 @@ class WHOGuidelinesTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = "https://www.who.int"
         self.guidelines_url = f"{self.base_url}/publications/who-guidelines"
-        self.session = requests.Session()
+        self.max_concurrency = _get_max_concurrency(tool_config)
+        self.session = self.get_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -1131,7 +1335,14 @@ class WHOGuidelinesTool(BaseTool):
         return self._search_who_guidelines(query, limit)
 
     def _fetch_guideline_description(self, url):
-        """Fetch description from a WHO guideline detail page."""
+        """Fetch description from a WHO guideline detail page (cached per URL)."""
+        return _cached_document(
+            "who_description",
+            url,
+            lambda: self._fetch_guideline_description_uncached(url),
+        )
+
+    def _fetch_guideline_description_uncached(self, url):
         try:
             time.sleep(0.5)  # Be respectful
             response = self.session.get(url, timeout=15)
@@ -1191,11 +1402,11 @@ class WHOGuidelinesTool(BaseTool):
 
             # Find all publication links
             all_links = soup.find_all("a", href=True)
-            guidelines = []
 
             query_lower = query.lower()
             query_terms = _extract_meaningful_terms(query)
 
+            publications = []
             for link in all_links:
                 href = link["href"]
                 text = link.get_text().strip()
@@ -1206,38 +1417,19 @@ class WHOGuidelinesTool(BaseTool):
                     and text
                     and len(text) > 10
                 ):
-                    # Check if query matches the title
-                    if query_lower in text.lower():
-                        full_url = (
-                            href if href.startswith("http") else self.base_url + href
-                        )
-
-                        # Avoid duplicates
-                        if not any(g["url"] == full_url for g in guidelines):
-                            # Fetch description from detail page
-                            description = self._fetch_guideline_description(full_url)
-
-                            searchable_text = (text + " " + (description or "")).lower()
-                            if query_terms and not any(
-                                term in searchable_text for term in query_terms
-                            ):
-                                continue
-
-                            guidelines.append(
-                                {
-                                    "title": text,
-                                    "url": full_url,
-                                    "description": description,
-                                    "content": description,  # Copy description to content field
-                                    "source": "WHO",
-                                    "organization": "World Health Organization",
-                                    "is_guideline": True,
-                                    "official": True,
-                                }
-                            )
-
-                            if len(guidelines) >= limit:
-                                break
+                    full_url = href if href.startswith("http") else self.base_url + href
+                    publications.append((text, full_url))
+
+            # Check if query matches the title
+            guidelines = self._collect_guidelines(
+                [
+                    (text, url)
+                    for text, url in publications
+                    if query_lower in text.lower()
+                ],
+                query_terms,
+                limit,
+            )
 
             # If no results with strict matching, get all WHO guidelines from page
             if len(guidelines) == 0:
@@ -1245,47 +1437,7 @@ class WHOGuidelinesTool(BaseTool):
                     f"No exact matches for '{query}', retrieving latest WHO guidelines..."
                 )
 
-                all_guidelines = []
-                for link in all_links:
-                    href = link["href"]
-                    text = link.get_text().strip()
-
-                    if (
-                        (
-                            "/publications/i/item/" in href
-                            or "/publications/m/item/" in href
-                        )
-                        and text
-                        and len(text) > 10
-                    ):
-                        full_url = (
-                            href if href.startswith("http") else self.base_url + href
-                        )
-
-                        if not any(g["url"] == full_url for g in all_guidelines):
-                            # Fetch description from detail page
-                            description = self._fetch_guideline_description(full_url)
-
-                            searchable_text = (text + " " + (description or "")).lower()
-                            if query_terms and not any(
-                                term in searchable_text for term in query_terms
-                            ):
-                                continue
-
-                            all_guidelines.append(
-                                {
-                                    "title": text,
-                                    "url": full_url,
-                                    "description": description,
-                                    "content": description,  # Copy description to content field
-                                    "source": "WHO",
-                                    "organization": "World Health Organization",
-                                    "is_guideline": True,
-                                    "official": True,
-                                }
-                            )
-
-                guidelines = all_guidelines[:limit]
+                guidelines = self._collect_guidelines(publications, query_terms, limit)
 
             return guidelines
 
@@ -1300,6 +1452,66 @@ class WHOGuidelinesTool(BaseTool):
                 "source": "WHO",
             }
 
+    def _collect_guidelines(self, publications, query_terms, limit):
+        """Build up to ``limit`` guidelines from ``(title, url)`` candidates.
+
+        Descriptions are fetched concurrently a window at a time, and no more
+        pages are fetched once ``limit`` guidelines are found.
+        """
+        guidelines = []
+        seen_urls = set()
+        position = 0
+        while position < len(publications) and len(guidelines) < limit:
+            window_size = max(limit - len(guidelines), self.max_concurrency)
+            window = publications[position : position + window_size]
+            position += len(window)
+
+            fetch_urls = list(
+                dict.fromkeys(url for _, url in window if url not in seen_urls)
+            )
+            descriptions = dict(
+                zip(
+                    fetch_urls,
+                    _fetch_concurrently(
+                        self._fetch_guideline_description,
+                        fetch_urls,
+                        self.max_concurrency,
+                    ),
+                )
+            )
+
+            for text, full_url in window:
+                # Avoid duplicates
+                if full_url in seen_urls:
+                    continue
+
+                description = descriptions[full_url]
+
+                searchable_text = (text + " " + (description or "")).lower()
+                if query_terms and not any(
+                    term in searchable_text for term in query_terms
+                ):
+                    continue
+
+                seen_urls.add(full_url)
+                guidelines.append(
+                    {
+                        "title": text,
+                        "url": full_url,
+                        "description": description,
+                        "content": description,  # Copy description to content field
+                        "source": "WHO",
+                        "organization": "World Health Organization",
+                        "is_guideline": True,
+                        "official": True,
+                    }
+                )
+
+                if len(guidelines) >= limit:
+                    break
+
+        return guidelines
+
 
 @register_tool()
 class OpenAlexGuidelinesTool(BaseTool):
@@ -1353,7 +1565,7 @@ class OpenAlexGuidelinesTool(BaseTool):
             if filters:
                 params["filter"] = ",".join(filters)
 
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = http_get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
 
             data = response.json()
@@ -1544,7 +1756,7 @@ class NICEGuidelineFullTextTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.nice.org.uk"
-        self.session = requests.Session()
+        self.session = self.get_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -1709,7 +1921,7 @@ class WHOGuidelineFullTextTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.who.int"
-        self.session = requests.Session()
+        self.session = self.get_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -1861,7 +2073,7 @@ class GINGuidelinesTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = "https://www.g-i-n.net"
         self.search_url = f"{self.base_url}/library/international-guidelines-library"
-        self.session = requests.Session()
+        self.session = self.get_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -2100,7 +2312,7 @@ class CMAGuidelinesTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = "https://joulecma.ca"
         self.search_url = f"{self.base_url}/infobase"
-        self.session = requests.Session()
+        self.session = self.get_http_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -1,5 +1,6 @@
 import time
 import requests
+from .http_transport import http_get, http_post
 from typing import Any, Dict, Optional
 from .base_tool import BaseTool, ToolError
 from .tool_registry import register_tool
@@ -172,7 +173,7 @@ class UniProtRESTTool(BaseTool):
         url = "https://rest.uniprot.org/uniprotkb/search"
 
         try:
-            resp = requests.get(url, params=params, timeout=self.timeout)
+            resp = http_get(url, params=params, timeout=self.timeout)
             resp.raise_for_status()
             data = resp.json()
 
@@ -267,7 +268,7 @@ class UniProtRESTTool(BaseTool):
         payload = {"ids": ids, "from": from_db_normalized, "to": to_db_normalized}
 
         try:
-            resp = requests.post(submit_url, json=payload, timeout=self.timeout)
+            resp = http_post(submit_url, json=payload, timeout=self.timeout)
             resp.raise_for_status()
             job_data = resp.json()
             job_id = job_data.get("jobId")
@@ -281,12 +282,12 @@ class UniProtRESTTool(BaseTool):
 
             start_time = time.time()
             while time.time() - start_time < max_wait_time:
-                status_resp = requests.get(status_url, timeout=self.timeout)
+                status_resp = http_get(status_url, timeout=self.timeout)
                 status_data = status_resp.json()
 
                 if status_data.get("status") == "FINISHED":
                     # Step 3: Retrieve results
-                    results_resp = requests.get(results_url, timeout=self.timeout)
+                    results_resp = http_get(results_url, timeout=self.timeout)
                     results_data = results_resp.json()
 
                     # Format results
@@ -354,7 +355,7 @@ class UniProtRESTTool(BaseTool):
         # Build URL for standard accession-based queries
         url = self._build_url(arguments)
         try:
-            resp = requests.get(url, timeout=self.timeout)
+            resp = http_get(url, timeout=self.timeout)
             if resp.status_code != 200:
                 return {
                     "error": (f"UniProt API returned status code: {resp.status_code}"),
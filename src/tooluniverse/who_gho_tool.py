@@ -1,4 +1,5 @@
 import requests
+from .http_transport import http_get
 import re
 from typing import Dict, Any, Optional, List
 from .base_tool import BaseTool
@@ -118,7 +119,7 @@ class WHOGHORESTTool(BaseTool):
                 odata_params["$skip"] = params["skip"]
 
         try:
-            resp = requests.get(url, params=odata_params, timeout=30)
+            resp = http_get(url, params=odata_params, timeout=30)
             resp.raise_for_status()
             data = resp.json()
             return {
@@ -342,7 +343,7 @@ class WHOGHORESTTool(BaseTool):
             odata_params["$top"] = params["top"]
 
         try:
-            resp = requests.get(url, params=odata_params, timeout=30)
+            resp = http_get(url, params=odata_params, timeout=30)
             resp.raise_for_status()
             data = resp.json()
             return {"data": data}
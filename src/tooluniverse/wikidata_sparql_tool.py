@@ -1,4 +1,5 @@
 import requests
+from .http_transport import http_get
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -33,7 +34,7 @@ class WikidataSPARQLTool(BaseTool):
             "User-Agent": "ToolUniverse/1.0 (https://github.com)",
         }
         try:
-            resp = requests.get(
+            resp = http_get(
                 self.endpoint,
                 params={"query": sparql, "format": "json"},
                 headers=headers,
@@ -1,4 +1,3 @@
-import requests
 import urllib.parse
 from typing import Any, Dict
 from .base_tool import BaseTool
@@ -10,7 +9,7 @@ class WoRMSRESTTool(BaseTool):
     def __init__(self, tool_config: Dict):
         super().__init__(tool_config)
         self.base_url = "https://www.marinespecies.org/rest"
-        self.session = requests.Session()
+        self.session = self.get_http_session()
         self.session.headers.update({"Accept": "application/json"})
         self.timeout = 30
 
@@ -1,22 +1,112 @@
 # import xml.etree.ElementTree as ET
 from lxml import etree as ET
-from typing import List, Dict, Any, Optional, Set
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import List, Dict, Any, Iterator, Optional, Set
 from .base_tool import BaseTool
-from .utils import download_from_hf
+from .cache.codecs import CacheCodec, CodecError
+from .text_index import TextIndex
+from .utils import download_from_hf, get_user_cache_dir
 from .tool_registry import register_tool
 
+# Bump when the extracted record layout changes so cached records are rebuilt
+_RECORD_CACHE_FORMAT = 1
+
+# record_xpath values that select direct children of the root by tag and
+# can therefore be streamed with iterparse
+_SIMPLE_CHILD_XPATH = re.compile(r"^(?:([\w.-]+):)?([\w.-]+|\*)$")
+
+# Record stores shared by tools with identical dataset settings
+_STORE_CACHE: Dict[str, "XMLRecordStore"] = {}
+_STORE_CACHE_LOCK = threading.Lock()
+
+
+class XMLRecordStore:
+    """Columnar store of the records extracted from an XML dataset.
+
+    Each field is one list with a value per record, which avoids keeping a
+    dict (or the parsed element) alive per record. Records are materialized
+    as dicts only for the rows a query returns.
+    """
+
+    def __init__(self, fields: List[str], root_tag: Optional[str] = None):
+        self.fields = list(fields)
+        self.columns: Dict[str, List[Any]] = {field: [] for field in self.fields}
+        self.root_tag = root_tag
+        self._indexes: Dict[Any, TextIndex] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.columns[self.fields[0]]) if self.fields else 0
+
+    def append(self, data: Dict[str, Any]) -> None:
+        for field in self.fields:
+            self.columns[field].append(data.get(field, ""))
+
+    def row(self, position: int, skip: Set[str] = frozenset()) -> Dict[str, Any]:
+        return {
+            field: self.columns[field][position]
+            for field in self.fields
+            if field not in skip
+        }
+
+    def text_index(self, field: str, joined_attributes: bool = True) -> TextIndex:
+        """Index of ``field`` as strings, built on first use.
+
+        ``_attributes`` is indexed as its space-joined values for search, or
+        as ``str(dict)`` for filters when ``joined_attributes`` is False.
+        """
+        joined = joined_attributes and field == "_attributes"
+        key = (field, joined)
+        index = self._indexes.get(key)
+        if index is None:
+            with self._lock:
+                index = self._indexes.get(key)
+                if index is None:
+                    if joined:
+                        values = [" ".join(v.values()) for v in self.columns[field]]
+                    else:
+                        values = [str(value) for value in self.columns[field]]
+                    index = self._indexes[key] = TextIndex(values, strip=True)
+        return index
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "format": _RECORD_CACHE_FORMAT,
+            "root_tag": self.root_tag,
+            "fields": self.fields,
+            "columns": self.columns,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> Optional["XMLRecordStore"]:
+        if payload.get("format") != _RECORD_CACHE_FORMAT:
+            return None
+        store = cls(payload["fields"], payload.get("root_tag"))
+        store.columns = payload["columns"]
+        return store
+
 
 @register_tool("XMLTool")
 class XMLDatasetTool(BaseTool):
     """
     Tool to search and filter XML datasets that are organized as a collection of searchable records (e.g., dataset of medical subjects or drug descriptions).
     Supports user-friendly queries without requiring XPath knowledge.
+
+    Records are extracted while streaming the file (when ``record_xpath``
+    selects children of the root by tag) into an :class:`XMLRecordStore`,
+    which is shared by tools with the same settings and cached on disk
+    (``record_cache_dir`` setting, default: the user cache directory) so
+    restarts skip XML parsing. Set ``record_cache: false`` in the settings
+    or ``TOOLUNIVERSE_XML_RECORD_CACHE=false`` to disable the disk cache.
     """
 
     def __init__(self, tool_config: Dict[str, Any]):
         super().__init__(tool_config)
-        self.xml_root: Optional[ET.Element] = None
-        self.records: List[ET.Element] = []
+        self.records: Optional[XMLRecordStore] = None
         self.record_xpath: str = tool_config.get("settings").get("record_xpath", ".//*")
         self.namespaces: Dict[str, str] = tool_config.get("settings").get(
             "namespaces", {}
@@ -30,30 +120,159 @@ class XMLDatasetTool(BaseTool):
         self.search_fields: List[str] = tool_config.get("settings").get(
             "search_fields", ["_text"] + list(self.field_mappings.keys())
         )
-        self._record_cache: List[Dict[str, Any]] = []  # Cache extracted data
         self.temporary_record_fields: Set[str] = set()
+        # Field order of an extracted record (see _extract_record_data)
+        self.record_fields: List[str] = ["_tag", "_text", "_attributes"]
+        for field_name, xpath_expr in self.field_mappings.items():
+            self.record_fields.append(field_name)
+            if isinstance(xpath_expr, dict) and "parent_path" in xpath_expr:
+                for sf_name in xpath_expr.get("subfields", {}):
+                    flat_key = f"{field_name}_{sf_name}"
+                    self.record_fields.append(flat_key)
+                    self.temporary_record_fields.add(flat_key)
         self._load_dataset()
 
     def _load_dataset(self) -> None:
-        """Load and parse the XML dataset."""
+        """Load the XML dataset into a record store.
+
+        The store is reused from another tool with the same settings, then
+        from the on-disk record cache, and only then parsed from the XML.
+        """
         try:
             xml_path = self._get_dataset_path()
             if not xml_path:
                 return
 
-            tree = ET.parse(xml_path)
-            self.xml_root = tree.getroot()
-            self.records = self.xml_root.findall(
-                self.record_xpath, namespaces=self.namespaces
-            )
+            cache_key = self._record_cache_key(xml_path)
+            with _STORE_CACHE_LOCK:
+                store = _STORE_CACHE.get(cache_key)
+                if store is None:
+                    store = self._load_cached_records(cache_key)
+                    if store is None:
+                        store = self._parse_records(xml_path)
+                        self._save_cached_records(cache_key, store)
+                    _STORE_CACHE[cache_key] = store
+            self.records = store
 
             print(
-                f"Loaded XML dataset: {len(self.records)} records from root '{self.xml_root.tag}'"
+                f"Loaded XML dataset: {len(self.records)} records from root '{store.root_tag}'"
             )
 
         except Exception as e:
             print(f"Error loading XML dataset: {e}")
-            self.records = []
+            self.records = None
+
+    def _parse_records(self, xml_path: str) -> XMLRecordStore:
+        """Extract every record of ``xml_path`` into a new store."""
+        store = XMLRecordStore(self.record_fields)
+        for record in self._iter_record_elements(xml_path, store):
+            store.append(self._extract_record_data(record))
+        return store
+
+    def _iter_record_elements(
+        self, xml_path: str, store: XMLRecordStore
+    ) -> Iterator[ET.Element]:
+        """Yield record elements, streaming the file when possible.
+
+        For ``record_xpath`` values such as ``db:drug`` (children of the root
+        with a given tag) the file is read with ``iterparse`` and each record
+        is cleared once extracted, so the full tree is never held in memory.
+        Other expressions fall back to parsing the whole document.
+        """
+        tag = self._streamable_record_tag()
+        if tag is None:
+            root = ET.parse(xml_path).getroot()
+            store.root_tag = root.tag
+            yield from root.findall(self.record_xpath, namespaces=self.namespaces)
+            return
+
+        root = None
+        depth = 0
+        for event, element in ET.iterparse(xml_path, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                    store.root_tag = element.tag
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            # A direct child of the root is complete
+            if tag == "*" or element.tag == tag:
+                yield element
+            element.clear()
+            while element.getprevious() is not None:
+                del root[0]
+
+    def _streamable_record_tag(self) -> Optional[str]:
+        """Clark-notation tag selected by a simple ``record_xpath``, else None."""
+        match = _SIMPLE_CHILD_XPATH.match(self.record_xpath)
+        if not match or "" in self.namespaces or None in self.namespaces:
+            return None
+        prefix, local_name = match.groups()
+        if prefix is None or local_name == "*":
+            return local_name if prefix is None else None
+        uri = self.namespaces.get(prefix)
+        return f"{{{uri}}}{local_name}" if uri else None
+
+    def _record_cache_key(self, xml_path: str) -> str:
+        stat = os.stat(xml_path)
+        settings = {
+            "format": _RECORD_CACHE_FORMAT,
+            "path": os.path.abspath(xml_path),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "record_xpath": self.record_xpath,
+            "namespaces": self.namespaces,
+            "field_mappings": self.field_mappings,
+        }
+        text = json.dumps(settings, sort_keys=True, default=str)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+    def _record_cache_path(self, cache_key: str) -> Optional[str]:
+        settings = self.tool_config["settings"]
+        enabled = os.getenv("TOOLUNIVERSE_XML_RECORD_CACHE", "true").lower() in (
+            "true",
+            "1",
+            "yes",
+        )
+        if not settings.get("record_cache", enabled):
+            return None
+        directory = settings.get("record_cache_dir") or os.path.join(
+            get_user_cache_dir(), "xml_records"
+        )
+        return os.path.join(directory, f"{cache_key}.records")
+
+    def _load_cached_records(self, cache_key: str) -> Optional[XMLRecordStore]:
+        path = self._record_cache_path(cache_key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                codec = f.readline().decode("ascii").strip()
+                payload = CacheCodec.decode(f.read(), codec)
+            return XMLRecordStore.from_payload(payload)
+        except (OSError, ValueError, KeyError, CodecError) as e:
+            print(f"Ignoring unreadable XML record cache {path}: {e}")
+            return None
+
+    def _save_cached_records(self, cache_key: str, store: XMLRecordStore) -> None:
+        path = self._record_cache_path(cache_key)
+        if not path or not len(store):
+            return
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            payload, codec = CacheCodec.from_env().encode(store.to_payload())
+            with open(tmp_path, "wb") as f:
+                f.write(codec.encode("ascii") + b"\n")
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not write XML record cache {path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def _get_dataset_path(self) -> Optional[str]:
         """Get the path to the XML dataset."""
@@ -105,8 +324,6 @@ class XMLDatasetTool(BaseTool):
                     data[flat_key] = " | ".join(
                         entry.get(sf_name, "") for entry in structured_list
                     )
-
-                    self.temporary_record_fields.add(flat_key)
             else:
                 # Regular flat field extraction
                 data[field_name] = self._extract_field_value(record_element, xpath_expr)
@@ -149,12 +366,10 @@ class XMLDatasetTool(BaseTool):
             return ""
 
     def _get_all_records_data(self) -> List[Dict[str, Any]]:
-        """Get all records data with caching."""
-        if not self._record_cache:
-            self._record_cache = [
-                self._extract_record_data(record) for record in self.records
-            ]
-        return self._record_cache
+        """Materialize every record as a dict (prefer the record store)."""
+        if not self.records:
+            return []
+        return [self.records.row(i) for i in range(len(self.records))]
 
     def run(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Main entry point for the tool."""
@@ -185,29 +400,35 @@ class XMLDatasetTool(BaseTool):
         search_query = query if case_sensitive else query.lower()
         results = []
 
-        all_records = self._get_all_records_data()
-        total_matches = 0
-        for record_data in all_records:
-            matched_fields = self._find_matches(
-                record_data,
-                search_query,
-                self.search_fields,
-                case_sensitive,
-                exact_match,
-            )
+        # Matching positions per field, answered by the per-field text indexes
+        field_matches = {}
+        for field in self.search_fields:
+            if field not in self.records.columns or field in field_matches:
+                continue
+            index = self.records.text_index(field)
+            if exact_match:
+                positions = index.exact(case_sensitive, split=True).get(
+                    search_query, []
+                )
+            else:
+                positions = index.substring(search_query, case_sensitive)
+            field_matches[field] = set(positions)
 
-            if matched_fields:
-                total_matches += 1
-                if len(results) < limit:
-                    result_record = record_data.copy()
-                    for temp in self.temporary_record_fields:
-                        result_record.pop(temp, None)
-                    result_record["matched_fields"] = matched_fields
-                    results.append(result_record)
+        matched_positions = sorted(set().union(*field_matches.values()))
+        for position in matched_positions[:limit]:
+            result_record = self.records.row(
+                position, skip=self.temporary_record_fields
+            )
+            result_record["matched_fields"] = [
+                field
+                for field in self.search_fields
+                if position in field_matches.get(field, ())
+            ]
+            results.append(result_record)
 
         return {
             "query": query,
-            "total_matches": total_matches,
+            "total_matches": len(matched_positions),
             "total_returned_results": len(results),
             "results": results,
             "search_parameters": {
@@ -217,48 +438,6 @@ class XMLDatasetTool(BaseTool):
             },
         }
 
-    def _find_matches(
-        self,
-        record_data: Dict[str, Any],
-        search_query: str,
-        search_fields: List[str],
-        case_sensitive: bool,
-        exact_match: bool,
-    ) -> List[str]:
-        """Find matching fields in a record."""
-        matched_fields = []
-
-        for field in search_fields:
-            if field not in record_data:
-                continue
-
-            field_value = self._get_searchable_value(record_data, field, case_sensitive)
-
-            if self._is_match(field_value, search_query, exact_match):
-                matched_fields.append(field)
-
-        return matched_fields
-
-    def _get_searchable_value(
-        self, record_data: Dict[str, Any], field: str, case_sensitive: bool
-    ) -> str:
-        """Get searchable string value for a field."""
-        if field == "_attributes":
-            value = " ".join(record_data["_attributes"].values())
-        else:
-            value = str(record_data.get(field, ""))
-
-        return value if case_sensitive else value.lower()
-
-    def _is_match(self, field_value: str, search_query: str, exact_match: bool) -> bool:
-        """Check if field value matches search query."""
-        if exact_match:
-            if "|" in field_value:  # Handle multiple values
-                return search_query in [v.strip() for v in field_value.split("|")]
-            return search_query == field_value.strip()
-
-        return search_query in field_value
-
     def _filter(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Filter records based on field criteria."""
         field = self.filter_field
@@ -273,11 +452,9 @@ class XMLDatasetTool(BaseTool):
         if condition not in ["not_empty", "has_attribute"] and not value:
             return {"error": f"'value' parameter required for condition '{condition}'"}
 
-        all_records = self._get_all_records_data()
-
         # Check if field exists
-        if all_records and field not in all_records[0]:
-            available_fields = sorted(all_records[0].keys())
+        if field not in self.records.columns:
+            available_fields = sorted(self.records.fields)
             return {
                 "error": f"Field '{field}' not found. Available: {available_fields}"
             }
@@ -290,18 +467,14 @@ class XMLDatasetTool(BaseTool):
                 "error": f"Unknown condition '{condition}'. Supported: contains, starts_with, ends_with, exact, not_empty, has_attribute"
             }
 
-        total_matches = 0
-        for record_data in all_records:
-            if field in record_data and filter_func(record_data, field):
-                total_matches += 1
-                if len(filtered_records) < limit:
-                    result_record = record_data.copy()
-                    for temp in self.temporary_record_fields:
-                        result_record.pop(temp, None)
-                    filtered_records.append(result_record)
+        positions = filter_func(field)
+        for position in positions[:limit]:
+            filtered_records.append(
+                self.records.row(position, skip=self.temporary_record_fields)
+            )
 
         return {
-            "total_matches": total_matches,
+            "total_matches": len(positions),
             "total_returned_results": len(filtered_records),
             "results": filtered_records,
             "applied_filter": self._get_filter_description(field, condition, value),
@@ -316,19 +489,41 @@ class XMLDatasetTool(BaseTool):
         }
 
     def _get_filter_function(self, condition: str, value: str):
-        """Get the appropriate filter function for the condition."""
+        """Get the filter function for the condition.
+
+        Filter functions take a field name and return the matching record
+        positions, comparing against ``str()`` of the field value.
+        """
+        value_lower = value.lower()
+
+        def texts(field, case_sensitive=False):
+            index = self.records.text_index(field, joined_attributes=False)
+            return index.texts(case_sensitive)
+
+        def matching(field, predicate):
+            return [i for i, text in enumerate(texts(field)) if predicate(text)]
+
         filter_functions = {
-            "contains": lambda data, field: value.lower() in str(data[field]).lower(),
-            "starts_with": lambda data, field: str(data[field])
-            .lower()
-            .startswith(value.lower()),
-            "ends_with": lambda data, field: str(data[field])
-            .lower()
-            .endswith(value.lower()),
-            "exact": lambda data, field: str(data[field]).lower() == value.lower(),
-            "not_empty": lambda data, field: str(data[field]).strip() != "",
-            "has_attribute": lambda data, field: field == "_attributes"
-            and value in data["_attributes"],
+            "contains": lambda field: self.records.text_index(
+                field, joined_attributes=False
+            ).substring(value_lower, case_sensitive=False),
+            "starts_with": lambda field: matching(
+                field, lambda text: text.startswith(value_lower)
+            ),
+            "ends_with": lambda field: matching(
+                field, lambda text: text.endswith(value_lower)
+            ),
+            "exact": lambda field: matching(field, lambda text: text == value_lower),
+            "not_empty": lambda field: [
+                i
+                for i, text in enumerate(texts(field, case_sensitive=True))
+                if text.strip() != ""
+            ],
+            "has_attribute": lambda field: [
+                i
+                for i, attributes in enumerate(self.records.columns["_attributes"])
+                if field == "_attributes" and value in attributes
+            ],
         }
         return filter_functions.get(condition)
 
@@ -350,14 +545,14 @@ class XMLDatasetTool(BaseTool):
             return {"error": "XML dataset not loaded or contains no records"}
 
         # Get field information from sample records
-        sample_data = self._get_all_records_data()[:5]
+        sample_data = [self.records.row(i) for i in range(min(5, len(self.records)))]
         all_fields = set()
         for record_data in sample_data:
             all_fields.update(record_data.keys())
 
         info = {
             "total_records": len(self.records),
-            "root_element": self.xml_root.tag if self.xml_root else None,
+            "root_element": self.records.root_tag,
             "record_xpath": self.record_xpath,
             "field_mappings": self.field_mappings,
             "available_fields": sorted(all_fields),
@@ -1,4 +1,5 @@
 import requests
+from .http_transport import http_get
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -37,7 +38,7 @@ class ZenodoTool(BaseTool):
             params["communities"] = community
 
         try:
-            resp = requests.get(self.base_url, params=params, timeout=20)
+            resp = http_get(self.base_url, params=params, timeout=20)
             resp.raise_for_status()
             data = resp.json()
         except requests.RequestException as e:
@@ -1,8 +1,14 @@
 import os
+import pickle
+import sqlite3
 import sys
+import threading
 import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import pytest
 
 os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
 
@@ -11,7 +17,11 @@ SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
+from tooluniverse.cache.codecs import CacheCodec, CodecError, is_json_compatible
+from tooluniverse.cache.memory_cache import SizedCache, approx_size
+from tooluniverse.cache.sqlite_backend import PersistentCache
 from tooluniverse.cache.result_cache_manager import ResultCacheManager
+from tooluniverse.cache.redis_backend import RedisCache
 
 
 def test_memory_cache_roundtrip():
@@ -85,3 +95,405 @@ def test_persistent_cache_survives_restart():
         persisted = manager2.get(namespace="tool", version="v1", cache_key="persist")
         assert persisted == {"foo": "bar"}
         manager2.close()
+
+
+def _persistent_manager(cache_path, **kwargs):
+    return ResultCacheManager(
+        memory_size=kwargs.pop("memory_size", 8),
+        persistent_path=cache_path,
+        enabled=True,
+        persistence_enabled=True,
+        singleflight=False,
+        **kwargs,
+    )
+
+
+def test_bulk_get_uses_chunked_queries_and_deferred_hits():
+    with TemporaryDirectory() as tmpdir:
+        cache_path = os.path.join(tmpdir, "cache.sqlite")
+        writer = _persistent_manager(cache_path, async_persist=False)
+        writer.persistent.set_many(
+            [
+                {
+                    "cache_key": writer.compose_key("tool", "v1", f"k{i}"),
+                    "value": i,
+                    "namespace": "tool",
+                    "version": "v1",
+                    "ttl": None,
+                }
+                for i in range(1200)
+            ]
+        )
+        writer.close()
+
+        reader = _persistent_manager(cache_path, async_persist=False)
+        statements = []
+        reader.persistent._conn.set_trace_callback(statements.append)
+
+        requests = [
+            {"namespace": "tool", "version": "v1", "cache_key": f"k{i}"}
+            for i in range(1200)
+        ]
+        requests.append({"namespace": "tool", "version": "v1", "cache_key": "absent"})
+        hits = reader.bulk_get(requests)
+
+        assert len(hits) == 1200
+        assert hits[reader.compose_key("tool", "v1", "k7")] == 7
+        selects = [sql for sql in statements if "SELECT" in sql]
+        assert len(selects) == 3
+        # Hit counts are written in one batched transaction, not per key
+        assert statements.count("BEGIN") == 1
+        first_update = next(i for i, sql in enumerate(statements) if "UPDATE" in sql)
+        assert statements[first_update - 1] == "BEGIN"
+
+        reader.persistent._conn.set_trace_callback(None)
+        hit_counts = {entry["cache_key"]: entry["hit_count"] for entry in reader.dump()}
+        assert hit_counts[reader.compose_key("tool", "v1", "k7")] == 1
+        reader.close()
+
+
+def test_bulk_get_drops_expired_persistent_entries():
+    with TemporaryDirectory() as tmpdir:
+        cache_path = os.path.join(tmpdir, "cache.sqlite")
+        manager = _persistent_manager(cache_path, async_persist=False, memory_size=1)
+        manager.set(namespace="tool", version="v1", cache_key="old", value=1, ttl=1)
+        manager.set(namespace="tool", version="v1", cache_key="new", value=2)
+        manager.memory.clear()
+        time.sleep(1.1)
+
+        hits = manager.bulk_get(
+            [
+                {"namespace": "tool", "version": "v1", "cache_key": "old"},
+                {"namespace": "tool", "version": "v1", "cache_key": "new"},
+            ]
+        )
+
+        assert hits == {manager.compose_key("tool", "v1", "new"): 2}
+        assert manager.persistent.stats()["entries"] == 1
+        manager.close()
+
+
+def test_async_worker_persists_queued_writes_in_batches():
+    with TemporaryDirectory() as tmpdir:
+        cache_path = os.path.join(tmpdir, "cache.sqlite")
+        manager = _persistent_manager(cache_path, async_persist=True)
+        calls = []
+        original = manager.persistent.set_many
+
+        def recording_set_many(entries):
+            calls.append(len(entries))
+            return original(entries)
+
+        manager.persistent.set_many = recording_set_many
+        for i in range(500):
+            manager.set(namespace="tool", version="v1", cache_key=f"k{i}", value=i)
+        manager.flush()
+
+        assert sum(calls) == 500
+        assert manager.persistent.stats()["entries"] == 500
+        manager.close()
+
+
+def test_codec_keeps_types_that_json_would_change():
+    codec = CacheCodec(compression="none")
+    values = [
+        {"results": [{"id": 1, "score": 0.5, "ok": True, "note": None}]},
+        {"pair": (1, 2)},
+        {1: "int key"},
+        float("nan"),
+        {"big": 2**70},
+        {1, 2},
+    ]
+    for value in values:
+        payload, tag = codec.encode(value)
+        decoded = CacheCodec.decode(payload, tag)
+        if value != value:
+            assert decoded != decoded
+        else:
+            assert decoded == value and type(decoded) is type(value)
+
+    assert is_json_compatible(values[0])
+    assert not any(is_json_compatible(value) for value in values[1:])
+    assert codec.encode(values[1])[1] == "pickle"
+
+
+def test_codec_compresses_large_payloads_only():
+    codec = CacheCodec(serializer="json", compression="zlib", compress_threshold=256)
+    small, small_tag = codec.encode({"a": 1})
+    large, large_tag = codec.encode({"rows": ["x" * 20] * 100})
+
+    assert small_tag == "json"
+    assert large_tag == "json+zlib"
+    assert len(large) < 256
+    assert CacheCodec.decode(large, large_tag) == {"rows": ["x" * 20] * 100}
+
+    try:
+        CacheCodec.decode(b"", "unknown+zlib")
+    except CodecError:
+        pass
+    else:
+        raise AssertionError("unknown codec must raise CodecError")
+
+
+def test_persistent_cache_reads_legacy_and_foreign_codec_rows():
+    with TemporaryDirectory() as tmpdir:
+        cache_path = os.path.join(tmpdir, "cache.sqlite")
+        # A database from before codecs existed: no codec column, pickled rows
+        conn = sqlite3.connect(cache_path)
+        conn.execute(
+            """
+            CREATE TABLE cache_entries (
+                cache_key TEXT PRIMARY KEY, namespace TEXT NOT NULL, version TEXT,
+                value BLOB NOT NULL, ttl INTEGER, created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL, expires_at REAL,
+                hit_count INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        now = time.time()
+        conn.execute(
+            "INSERT INTO cache_entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+            (
+                "old",
+                "tool",
+                "v1",
+                pickle.dumps({"legacy": (1, 2)}),
+                None,
+                now,
+                now,
+                None,
+            ),
+        )
+        conn.commit()
+        conn.close()
+
+        cache = PersistentCache(
+            cache_path, codec=CacheCodec(serializer="json", compress_threshold=64)
+        )
+        cache.set(
+            "new", {"rows": list(range(100))}, namespace="tool", version="v1", ttl=None
+        )
+        cache._conn.execute(
+            "INSERT INTO cache_entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?)",
+            ("foreign", "tool", "v1", b"\x00", None, now, now, None, "json+brotli"),
+        )
+
+        assert cache.get("old").value == {"legacy": (1, 2)}
+        assert cache.get("new").value == {"rows": list(range(100))}
+        assert cache.get("foreign") is None
+        assert set(cache.get_many(["old", "new", "foreign"])) == {"old", "new"}
+        assert sorted(entry.key for entry in cache.iter_entries()) == ["new", "old"]
+
+        codecs = cache.stats()["codecs"]
+        assert codecs["pickle"]["entries"] == 1
+        assert codecs["json+zlib"]["entries"] == 1
+        cache.close()
+
+
+def test_sized_cache_enforces_byte_budget():
+    cache = SizedCache(max_size=100, max_bytes=10_000, size_of=len)
+    cache.set("small", "x" * 100)
+    cache.set("big", "y" * 6_000)
+    assert cache.get("small") == "x" * 100
+    cache.set("bigger", "z" * 6_000)
+
+    assert cache.get("big") is None
+    assert cache.get("small") == "x" * 100
+    assert cache.stats()["current_bytes"] == 6_100
+
+    cache.set("huge", "h" * 20_000)
+    assert cache.get("huge") is None
+    assert cache.stats()["rejected"] == 1
+
+
+def test_sized_cache_expires_ttl_entries_proactively():
+    cache = SizedCache(max_size=10)
+    cache.set("short", 1, namespace="tool", expires_at=time.time() + 0.05)
+    cache.set("long", 2, namespace="tool", expires_at=time.time() + 60)
+    time.sleep(0.1)
+    cache.set("other", 3)
+
+    assert len(cache) == 2
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["namespaces"]["tool"]["expirations"] == 1
+
+
+def _scan_survivors(policy):
+    cache = SizedCache(max_size=100, policy=policy)
+    hot = [f"hot{i}" for i in range(20)]
+    for key in hot:
+        cache.set(key, key)
+    for _ in range(3):
+        for key in hot:
+            cache.get(key)
+    for i in range(500):
+        cache.set(f"scan{i}", i)
+    return sum(cache.get(key) is not None for key in hot)
+
+
+def test_scan_resistant_policies_keep_hot_entries():
+    assert _scan_survivors("lru") == 0
+    assert _scan_survivors("slru") == 20
+    assert _scan_survivors("tinylfu") == 20
+
+
+def test_approx_size_grows_with_payload():
+    small = approx_size({"results": [{"id": i} for i in range(10)]})
+    large = approx_size({"results": [{"id": i} for i in range(10_000)]})
+    assert large > 100 * small / 2
+
+
+def test_manager_reports_memory_stats_per_namespace():
+    manager = ResultCacheManager(
+        memory_size=8,
+        persistence_enabled=False,
+        singleflight=False,
+        memory_max_bytes=1_000_000,
+        memory_policy="tinylfu",
+    )
+    manager.set(namespace="alpha", version="v1", cache_key="k", value=[1, 2, 3])
+    manager.get(namespace="alpha", version="v1", cache_key="k")
+    manager.get(namespace="beta", version="v1", cache_key="missing")
+
+    memory = manager.stats()["memory"]
+    assert memory["policy"] == "tinylfu"
+    assert memory["current_bytes"] > 0
+    assert memory["namespaces"]["alpha"]["hits"] == 1
+    assert memory["namespaces"]["alpha"]["entries"] == 1
+    assert memory["namespaces"]["beta"]["misses"] == 1
+
+
+def test_manager_falls_back_to_lru_for_unknown_policy():
+    manager = ResultCacheManager(
+        memory_size=4, persistence_enabled=False, memory_policy="fifo"
+    )
+    assert manager.memory.policy == "lru"
+
+
+def _redis_managers(count, async_persist=False, **kwargs):
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    return [
+        ResultCacheManager(
+            memory_size=8,
+            async_persist=async_persist,
+            backend=RedisCache(fakeredis.FakeRedis(server=server), **kwargs),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_redis_backend_shares_results_between_managers():
+    writer, reader = _redis_managers(2)
+    writer.set(namespace="tool", version="v1", cache_key="a", value={"x": 1})
+    writer.set(namespace="tool", version="v1", cache_key="b", value=[1, 2], ttl=60)
+
+    client = reader.persistent.client
+    calls = []
+    original_mget = client.mget
+    client.mget = lambda keys: calls.append(len(keys)) or original_mget(keys)
+    hits = reader.bulk_get(
+        [
+            {"namespace": "tool", "version": "v1", "cache_key": key}
+            for key in ("a", "b", "missing")
+        ]
+    )
+
+    assert calls == [3]
+    assert hits == {"tool::v1::a": {"x": 1}, "tool::v1::b": [1, 2]}
+    assert 0 < client.ttl(reader.persistent._entry_key("tool::v1::b")) <= 60
+    assert client.ttl(reader.persistent._entry_key("tool::v1::a")) == -1
+    assert reader.stats()["persistent"]["namespaces"] == {"tool": 2}
+
+
+def test_redis_backend_clears_one_namespace():
+    manager, other = _redis_managers(2)
+    for namespace in ("alpha", "beta"):
+        manager.set(namespace=namespace, version="v1", cache_key="k", value=namespace)
+
+    manager.clear(namespace="alpha")
+
+    assert other.get(namespace="alpha", version="v1", cache_key="k") is None
+    assert other.get(namespace="beta", version="v1", cache_key="k") == "beta"
+    assert [entry["namespace"] for entry in other.dump()] == ["beta"]
+    other.clear()
+    assert list(manager.dump()) == []
+
+
+def test_redis_singleflight_computes_once_across_managers():
+    managers = _redis_managers(3, lock_poll_interval=0.01)
+    computed = []
+
+    def lookup(manager):
+        composed = manager.compose_key("tool", "v1", "slow")
+        with manager.singleflight_guard(composed):
+            value = manager.get(namespace="tool", version="v1", cache_key="slow")
+            if value is None:
+                computed.append(1)
+                time.sleep(0.1)
+                value = "result"
+                manager.set(
+                    namespace="tool", version="v1", cache_key="slow", value=value
+                )
+        return value
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda m=m: results.append(lookup(m)))
+        for m in managers
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["result"] * 3
+    assert len(computed) == 1
+    assert not managers[0].persistent.client.keys("*:lock:*")
+
+
+def test_redis_singleflight_waiters_hit_with_async_persistence():
+    managers = _redis_managers(8, async_persist=True, lock_poll_interval=0.001)
+    computed = []
+
+    def lookup(manager):
+        composed = manager.compose_key("tool", "v1", "slow")
+        with manager.singleflight_guard(composed):
+            value = manager.get(namespace="tool", version="v1", cache_key="slow")
+            if value is None:
+                computed.append(1)
+                value = "result"
+                manager.set(
+                    namespace="tool", version="v1", cache_key="slow", value=value
+                )
+        return value
+
+    threads = [threading.Thread(target=lookup, args=(m,)) for m in managers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for manager in managers:
+        manager.close()
+
+    # The winner's write lands before its lock is released
+    assert len(computed) == 1
+
+
+def test_redis_namespace_index_drops_expired_entries():
+    (manager,) = _redis_managers(1)
+    backend = manager.persistent
+    clock = [1000.0]
+    with patch("tooluniverse.cache.redis_backend.time.time", lambda: clock[0]):
+        for i in range(50):
+            manager.set(
+                namespace="tool", version="v1", cache_key=f"k{i}", value=i, ttl=10
+            )
+        manager.set(namespace="tool", version="v1", cache_key="keep", value=1)
+        clock[0] += 20
+        manager.set(namespace="tool", version="v1", cache_key="new", value=2, ttl=10)
+
+        index = backend.client.zrange(backend._namespace_key("tool"), 0, -1)
+        assert sorted(index) == [b"tool::v1::keep", b"tool::v1::new"]
+        assert backend.stats()["namespaces"] == {"tool": 2}
@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+from tooluniverse.database_setup import pipeline
+from tooluniverse.database_setup.sqlite_store import SQLiteStore
+from tooluniverse.database_setup.vector_store import (
+    benchmark_index_types,
+    index_kind,
+    resolve_index_spec,
+)
+
+DIM = 16
+
+
+def _unit_vectors(n, seed=0):
+    rng = np.random.default_rng(seed)
+    v = rng.standard_normal((n, DIM)).astype("float32")
+    return v / np.linalg.norm(v, axis=1, keepdims=True)
+
+
+class HashEmbedder:
+    """Deterministic pseudo-random embeddings keyed by the text."""
+
+    def __init__(self, provider, model, **kwargs):
+        pass
+
+    def embed(self, texts):
+        return np.vstack([_unit_vectors(1, seed=abs(hash(t)) % (2**32)) for t in texts])
+
+
+@pytest.fixture()
+def hash_embedder(monkeypatch, tmp_path):
+    monkeypatch.setenv("TOOLUNIVERSE_TMPDIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(pipeline, "Embedder", HashEmbedder)
+
+
+def _docs(n):
+    return [(f"k{i}", f"document {i}", {}, None) for i in range(n)]
+
+
+def _recorded_index_type(db):
+    store = SQLiteStore(db)
+    row = store.conn.execute("SELECT index_type FROM collections").fetchone()
+    store.close()
+    return row[0]
+
+
+def test_resolve_index_spec_sizes_indexes_from_the_data():
+    assert resolve_index_spec(None, 384, 10) == "IndexFlatIP"
+    assert resolve_index_spec("ivf_flat", 384, 100_000) == "IVF1264,Flat"
+    assert resolve_index_spec("ivf_flat", 384, 10) == "IVF1,Flat"
+    assert resolve_index_spec("ivf_pq", 384, 100_000).endswith(",PQ64x8")
+    assert resolve_index_spec("hnsw", 384, 10) == "HNSW32"
+    assert resolve_index_spec("IVF64,PQ8", 384, 10) == "IVF64,PQ8"
+    with pytest.raises(ValueError):
+        resolve_index_spec("annoy", 384, 10)
+
+
+@pytest.mark.parametrize("index_type", ["ivf_flat", "ivf_pq", "hnsw"])
+def test_build_collection_records_and_searches_ann_index(
+    tmp_path, hash_embedder, index_type
+):
+    db = str(tmp_path / "ann.db")
+    # train_size below the corpus size: the rest is streamed after training
+    metrics = pipeline.build_collection(
+        db,
+        "ann",
+        _docs(600),
+        "fake",
+        "m",
+        batch_size=64,
+        index_type=index_type,
+        train_size=300,
+    )
+    assert metrics["docs_embedded"] == 600
+    assert index_kind(_recorded_index_type(db)) == index_type
+
+    # Incremental builds keep the recorded type
+    pipeline.build_collection(db, "ann", _docs(650), "fake", "m", batch_size=64)
+    assert index_kind(_recorded_index_type(db)) == index_type
+
+    hits = pipeline.search(
+        db,
+        "ann",
+        "document 3",
+        method="embedding",
+        top_k=5,
+        embed_provider="fake",
+        embed_model="m",
+        nprobe=64,
+        ef_search=128,
+    )
+    if index_type != "ivf_pq":
+        assert hits[0]["doc_key"] == "k3"
+    assert len(hits) == 5
+
+
+def test_changing_index_type_requires_overwrite(tmp_path, hash_embedder):
+    db = str(tmp_path / "ann.db")
+    pipeline.build_collection(db, "ann", _docs(50), "fake", "m")
+    with pytest.raises(ValueError):
+        pipeline.build_collection(db, "ann", _docs(50), "fake", "m", index_type="hnsw")
+
+    pipeline.build_collection(
+        db, "ann", _docs(50), "fake", "m", index_type="hnsw", overwrite=True
+    )
+    assert _recorded_index_type(db) == "HNSW32"
+
+
+def test_benchmark_reports_recall_against_flat_index():
+    vectors = _unit_vectors(2000)
+    queries = _unit_vectors(20, seed=1)
+    rows = benchmark_index_types(
+        vectors,
+        queries,
+        index_types=("ivf_flat", "hnsw"),
+        top_k=5,
+        nprobe_values=(1, 1000),
+        ef_search_values=(256,),
+    )
+
+    assert rows[0]["index_type"] == "IndexFlatIP" and rows[0]["recall"] == 1.0
+    ivf = [r for r in rows if r["param"] == "nprobe"]
+    assert ivf[0]["recall"] <= ivf[1]["recall"] == 1.0
+    assert all(r["ms_per_query"] >= 0 for r in rows)
+    assert [r["param"] for r in rows[1:]] == ["nprobe", "nprobe", "efSearch"]
@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+
+from tooluniverse.database_setup import embedding_database
+from tooluniverse.database_setup import search as search_module
+from tooluniverse.database_setup.search import SearchEngine
+from tooluniverse.database_setup.sqlite_store import SQLiteStore
+from tooluniverse.database_setup.vector_store import VectorStore
+
+DIM = 8
+
+
+def _vector(text):
+    rng = np.random.default_rng(abs(hash(text)) % (2**32))
+    v = rng.standard_normal(DIM).astype("float32")
+    return v / np.linalg.norm(v)
+
+
+class HashEmbedder:
+    model = "m"
+
+    def __init__(self, provider=None, model=None, **kwargs):
+        pass
+
+    def embed(self, texts):
+        return np.vstack([_vector(t) for t in texts])
+
+
+@pytest.fixture()
+def collection(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOOLUNIVERSE_TMPDIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(search_module, "Embedder", HashEmbedder)
+    monkeypatch.setattr(search_module, "resolve_provider", lambda: "fake")
+    monkeypatch.setattr(search_module, "resolve_model", lambda prov: "m")
+    db = str(tmp_path / "batch.db")
+    store = SQLiteStore(db)
+    store.upsert_collection("demo", embedding_model="m", embedding_dimensions=DIM)
+    texts = [f"document {i}" for i in range(50)]
+    store.insert_docs("demo", [(f"k{i}", t, {}, None) for i, t in enumerate(texts)])
+    rows = store.fetch_docs("demo", limit=100)
+    vs = VectorStore(db)
+    vs.load_index("demo", DIM, reset=True)
+    vs.add_embeddings(
+        "demo", [r["id"] for r in rows], np.vstack([_vector(r["text"]) for r in rows])
+    )
+    store.close()
+    return db, vs
+
+
+def test_batch_search_matches_single_queries(collection):
+    _, vs = collection
+    queries = np.vstack([_vector(f"document {i}") for i in (3, 7, 11)])
+
+    batch = vs.search_embeddings_batch("demo", queries, top_k=4)
+
+    assert len(batch) == 3
+    for q, hits in zip(queries, batch):
+        assert hits == vs.search_embeddings("demo", q, top_k=4)
+        assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_search_maps_ids_without_per_hit_queries(collection):
+    _, vs = collection
+    statements = []
+    vs.db.set_trace_callback(statements.append)
+    queries = np.vstack([_vector("document 1"), _vector("document 2")])
+
+    vs.search_embeddings_batch("demo", queries, top_k=10)
+    vs.search_embeddings_batch("demo", queries, top_k=10)
+
+    # The faiss_idx -> doc_id array is read once and reused
+    assert len(statements) == 1
+
+
+def test_added_vectors_refresh_the_id_map(collection):
+    db, vs = collection
+    vs.search_embeddings("demo", _vector("document 0"), top_k=1)
+    store = SQLiteStore(db)
+    store.insert_docs("demo", [("new", "brand new", {}, None)])
+    new_id = store.fetch_docs("demo", doc_keys=["new"])[0]["id"]
+    store.close()
+
+    vs.add_embeddings("demo", [new_id], _vector("brand new")[np.newaxis, :])
+
+    assert vs.search_embeddings("demo", _vector("brand new"), top_k=1)[0][0] == new_id
+
+
+def test_search_engine_batch_hydrates_each_query(collection):
+    db, _ = collection
+    engine = SearchEngine(db_path=db)
+
+    results = engine.embedding_search_batch(
+        "demo", ["document 5", "document 9"], top_k=3
+    )
+
+    assert [hits[0]["doc_key"] for hits in results] == ["k5", "k9"]
+    assert all(len(hits) == 3 for hits in results)
+    assert engine.embedding_search("demo", "document 9", top_k=3) == results[1]
+
+
+def test_embedding_database_batch_queries(tmp_path, monkeypatch):
+    monkeypatch.setattr(embedding_database, "Embedder", HashEmbedder)
+    tool = embedding_database.EmbeddingDatabase(
+        {"name": "db", "configs": {"storage_config": {"data_dir": str(tmp_path)}}}
+    )
+    texts = [f"note {i}" for i in range(20)]
+    created = tool.run(
+        {
+            "action": "create_from_docs",
+            "database_name": "notes",
+            "documents": texts,
+            "provider": "local",
+            "model": "m",
+        }
+    )
+    assert created["status"] == "success"
+
+    result = tool.run(
+        {
+            "action": "search",
+            "database_name": "notes",
+            "queries": ["note 4", "note 17"],
+            "top_k": 2,
+            "provider": "local",
+        }
+    )
+
+    # Each document is found by its own text, so ids and vectors are aligned
+    assert [hits[0]["text"] for hits in result["results"]] == ["note 4", "note 17"]
+    assert result["total_found"] == [2, 2]
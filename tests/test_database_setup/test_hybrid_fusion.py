@@ -0,0 +1,190 @@
+import threading
+
+import numpy as np
+import pytest
+
+from tooluniverse.database_setup import search as search_module
+from tooluniverse.database_setup.search import (
+    SearchEngine,
+    benchmark_search,
+    fuse_results,
+)
+from tooluniverse.database_setup.sqlite_store import SQLiteStore
+from tooluniverse.database_setup.vector_store import VectorStore
+
+DIM = 8
+TEXTS = [
+    "aspirin reduces fever",
+    "aspirin aspirin aspirin and headache",
+    "ibuprofen for pain",
+    "paracetamol overdose",
+    "a long note that mentions aspirin once among many other words",
+]
+
+
+def _vector(text):
+    rng = np.random.default_rng(abs(hash(text)) % (2**32))
+    v = rng.standard_normal(DIM).astype("float32")
+    return v / np.linalg.norm(v)
+
+
+class HashEmbedder:
+    model = "m"
+
+    def __init__(self, provider=None, model=None, **kwargs):
+        pass
+
+    def embed(self, texts):
+        return np.vstack([_vector(t) for t in texts])
+
+
+def _hit(doc_id, score, **extra):
+    return {"doc_id": doc_id, "doc_key": f"k{doc_id}", "score": score, **extra}
+
+
+def _build(db, name):
+    store = SQLiteStore(db)
+    store.upsert_collection(name, embedding_model="m", embedding_dimensions=DIM)
+    store.insert_docs(name, [(f"k{i}", t, {}, None) for i, t in enumerate(TEXTS)])
+    rows = store.fetch_docs(name, limit=10)
+    vs = VectorStore(db)
+    vs.load_index(name, DIM, reset=True)
+    vs.add_embeddings(
+        name, [r["id"] for r in rows], np.vstack([_vector(r["text"]) for r in rows])
+    )
+    store.close()
+
+
+@pytest.fixture()
+def db(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOOLUNIVERSE_TMPDIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(search_module, "Embedder", HashEmbedder)
+    monkeypatch.setattr(search_module, "resolve_provider", lambda: "fake")
+    monkeypatch.setattr(search_module, "resolve_model", lambda prov: "m")
+    path = str(tmp_path / "fusion.db")
+    for name in ("drugs", "notes", "more"):
+        _build(path, name)
+    return path
+
+
+def test_rrf_ranks_by_reciprocal_rank():
+    keyword = [_hit(1, 1.0, bm25=-9.0), _hit(2, 1.0, bm25=-1.0)]
+    embedding = [_hit(3, 0.9), _hit(1, 0.2)]
+
+    fused = fuse_results(keyword, embedding, alpha=0.5, fusion="rrf", rrf_k=60)
+
+    assert [h["doc_id"] for h in fused] == [1, 3, 2]
+    assert fused[0]["score"] == pytest.approx(0.5 / 61 + 0.5 / 62)
+    assert (fused[0]["kw_score"], fused[0]["emb_score"]) == (1.0, 0.2)
+    assert (fused[2]["kw_score"], fused[2]["emb_score"]) == (1.0, 0.0)
+
+
+def test_normalized_fusion_puts_legs_on_one_scale():
+    # bm25 is more negative for better matches; cosine scores are tightly packed
+    keyword = [_hit(1, 1.0, bm25=-12.0), _hit(2, 1.0, bm25=-2.0)]
+    embedding = [_hit(2, 0.31), _hit(3, 0.30)]
+
+    minmax = {
+        h["doc_id"]: h["score"]
+        for h in fuse_results(keyword, embedding, fusion="minmax")
+    }
+    assert minmax == pytest.approx({1: 0.5, 2: 0.5, 3: 0.0})
+
+    zscore = {
+        h["doc_id"]: h["score"]
+        for h in fuse_results(keyword, embedding, fusion="zscore")
+    }
+    assert zscore == pytest.approx({1: 0.0, 2: 0.0, 3: -1.0})
+
+    # Raw weighting lets the fixed keyword score of 1.0 swamp the cosine leg
+    weighted = fuse_results(keyword, embedding, fusion="weighted")
+    assert [h["score"] for h in weighted] == pytest.approx([0.655, 0.5, 0.15])
+
+    with pytest.raises(ValueError):
+        fuse_results(keyword, embedding, fusion="borda")
+
+
+def test_keyword_hits_are_ordered_by_bm25(db):
+    engine = SearchEngine(db_path=db)
+    hits = engine.keyword_search("drugs", "aspirin", top_k=5)
+    engine.close()
+
+    assert [h["doc_key"] for h in hits] == ["k1", "k0", "k4"]
+    assert [h["bm25"] for h in hits] == sorted(h["bm25"] for h in hits)
+    assert all(h["score"] == 1.0 for h in hits)
+
+
+@pytest.mark.parametrize("fusion", ["weighted", "rrf", "minmax", "zscore"])
+def test_concurrent_hybrid_matches_sequential(db, fusion, monkeypatch):
+    sequential = SearchEngine(db_path=db, max_workers=1)
+    expected = sequential.hybrid_search("drugs", "aspirin", top_k=4, fusion=fusion)
+    sequential.close()
+
+    threads = set()
+    keyword_search = SearchEngine.keyword_search
+
+    def recording(self, *args, **kwargs):
+        threads.add(threading.current_thread().name)
+        return keyword_search(self, *args, **kwargs)
+
+    monkeypatch.setattr(SearchEngine, "keyword_search", recording)
+    engine = SearchEngine(db_path=db, max_workers=2)
+    got = engine.hybrid_search("drugs", "aspirin", top_k=4, fusion=fusion)
+    engine.close()
+
+    assert got == expected
+    assert threads and threading.current_thread().name not in threads
+
+
+def test_multi_collection_search_runs_collections_in_parallel(db, monkeypatch):
+    sequential = SearchEngine(db_path=db, max_workers=1)
+    expected = sequential.multi_collection_search(
+        "aspirin", top_k=6, fusion="rrf", collections=["drugs", "notes", "more"]
+    )
+    sequential.close()
+
+    engine = SearchEngine(db_path=db, max_workers=3)
+    search_collection = engine.search_collection
+    barrier = threading.Barrier(3, timeout=10)
+
+    def meeting(coll, *args, **kwargs):
+        if coll == "broken":
+            raise RuntimeError("index is corrupt")
+        # Passes only when the three collections are searched at the same time
+        barrier.wait()
+        return search_collection(coll, *args, **kwargs)
+
+    monkeypatch.setattr(engine, "search_collection", meeting)
+    got = engine.multi_collection_search(
+        "aspirin",
+        top_k=6,
+        fusion="rrf",
+        collections=["drugs", "notes", "more", "broken"],
+    )
+    engine.close()
+
+    assert got == expected
+    assert {h["collection"] for h in got} == {"drugs", "notes", "more"}
+
+
+def test_benchmark_search_reports_relevance_and_latency(db):
+    engine = SearchEngine(db_path=db)
+    cases = [
+        {"query": "aspirin", "relevant": ["k0", "k1"]},
+        {"query": "paracetamol", "relevant": ["k3"]},
+    ]
+
+    rows = benchmark_search(engine, "drugs", cases, top_k=3, repeats=2)
+    engine.close()
+
+    assert [(r["method"], r["fusion"]) for r in rows] == [
+        ("keyword", None),
+        ("embedding", None),
+        ("hybrid", "weighted"),
+        ("hybrid", "rrf"),
+        ("hybrid", "minmax"),
+        ("hybrid", "zscore"),
+    ]
+    keyword = rows[0]
+    assert keyword["recall"] == 1.0 and keyword["mrr"] == 1.0
+    assert all(0.0 <= r["recall"] <= 1.0 and r["ms_per_query"] >= 0 for r in rows)
@@ -0,0 +1,172 @@
+import json
+
+import numpy as np
+import pytest
+
+from tooluniverse.database_setup import embedding_database
+from tooluniverse.database_setup import vector_store as vector_store_module
+from tooluniverse.database_setup.sqlite_store import (
+    SQLiteStore,
+    _metadata_filter_sql,
+    matches_filters,
+    normalize_filters,
+)
+from tooluniverse.database_setup.vector_store import VectorStore
+
+DIM = 8
+COUNTRIES = ["DE", "FR", "IT", "ES", "PT", "NL", "BE", "AT", "PL", "SE"]
+
+
+def _vector(text):
+    rng = np.random.default_rng(abs(hash(text)) % (2**32))
+    v = rng.standard_normal(DIM).astype("float32")
+    return v / np.linalg.norm(v)
+
+
+class HashEmbedder:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def embed(self, texts):
+        return np.vstack([_vector(t) for t in texts])
+
+
+def _meta(i):
+    return {
+        "country": COUNTRIES[i % 10],
+        "year": 2000 + i % 25,
+        "tags": ["rare"] if i % 97 == 0 else ["common", "health"],
+    }
+
+
+@pytest.fixture()
+def store(tmp_path):
+    s = SQLiteStore(str(tmp_path / "filters.db"))
+    s.insert_docs("c", [(f"k{i}", f"report {i}", _meta(i), None) for i in range(1000)])
+    yield s
+    s.close()
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"country": "DE"},
+        {"country": {"$in": ["fr", "It"]}, "year": {"$gte": 2020}},
+        {"year": {"$gt": 2003, "$lt": 2006}},
+        {"tags": {"$contains": "rare"}},
+        {"country": {"$contains": "e"}},
+        {"missing": 1},
+        {"year": {"$gte": "2010"}},
+    ],
+)
+def test_filter_doc_ids_matches_python_semantics(store, filters):
+    rows = store.conn.execute("SELECT id, metadata_json FROM docs").fetchall()
+    normalized = normalize_filters(filters)
+    expected = sorted(
+        doc_id for doc_id, meta in rows if matches_filters(json.loads(meta), normalized)
+    )
+
+    assert sorted(store.filter_doc_ids("c", filters)) == expected
+
+
+def _plan(store, filters):
+    where, params, exact = _metadata_filter_sql(filters)
+    assert exact
+    rows = store.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT d.id FROM docs d WHERE d.collection=? AND " + where,
+        ["c", *params],
+    ).fetchall()
+    return " ".join(str(row) for row in rows)
+
+
+def _metadata_indexes(store):
+    return store.conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_docs_meta_%'"
+    ).fetchall()
+
+
+def test_filters_use_metadata_index(store):
+    store.index_metadata_fields(["country"])
+
+    assert "idx_docs_meta_" in _plan(store, {"country": "de"})
+
+
+def test_filtering_never_creates_indexes(store):
+    expected = len(store.filter_doc_ids("c", {"country": "de"}))
+
+    assert expected == 100
+    assert _metadata_indexes(store) == []
+    store.index_metadata_fields(["country"])
+    assert len(_metadata_indexes(store)) == 1
+    assert len(store.filter_doc_ids("c", {"country": "de"})) == expected
+
+
+@pytest.mark.parametrize("exact_max", [4096, 0])
+@pytest.mark.parametrize("index_type", ["IndexFlatIP", "HNSW32", "IVF8,Flat"])
+def test_search_is_restricted_to_candidates(
+    tmp_path, store, monkeypatch, index_type, exact_max
+):
+    # exact_max=0 sends every filtered search through the FAISS ID selector
+    monkeypatch.setattr(vector_store_module, "EXACT_FILTER_MAX", exact_max)
+    docs = store.fetch_docs("c", limit=1000)
+    vs = VectorStore(str(store.path), data_dir=str(tmp_path / "embeddings"))
+    vs.load_index("c", DIM, reset=True, index_type=index_type)
+    vs.add_embeddings(
+        "c", [d["id"] for d in docs], np.vstack([_vector(d["text"]) for d in docs])
+    )
+
+    candidates = store.filter_doc_ids("c", {"country": "se"})
+    hits = vs.search_embeddings("c", _vector("query"), top_k=10, doc_ids=candidates)
+
+    assert len(hits) == 10
+    assert {doc_id for doc_id, _ in hits} <= set(candidates)
+    if exact_max or index_type == "IndexFlatIP":
+        by_id = {d["id"]: d["text"] for d in docs}
+        scores = {i: float(_vector(by_id[i]) @ _vector("query")) for i in candidates}
+        best = sorted(scores, key=scores.get, reverse=True)[:10]
+        assert [doc_id for doc_id, _ in hits] == best
+    assert vs.search_embeddings("c", _vector("query"), top_k=10, doc_ids=[]) == []
+
+
+def test_embedding_database_filters_before_ranking(tmp_path, monkeypatch):
+    monkeypatch.setattr(embedding_database, "Embedder", HashEmbedder)
+    tool = embedding_database.EmbeddingDatabase(
+        {
+            "name": "db",
+            "configs": {
+                "storage_config": {
+                    "data_dir": str(tmp_path),
+                    "metadata_index_fields": ["tags"],
+                }
+            },
+        }
+    )
+    tool.run(
+        {
+            "action": "create_from_docs",
+            "database_name": "reports",
+            "documents": [f"report {i}" for i in range(300)],
+            "metadata": [_meta(i) for i in range(300)],
+            "provider": "local",
+            "model": "m",
+        }
+    )
+
+    result = tool.run(
+        {
+            "action": "search",
+            "database_name": "reports",
+            "query": "report 5",
+            "top_k": 3,
+            "filters": {"tags": {"$contains": "rare"}},
+            "provider": "local",
+        }
+    )
+
+    # Only 4 of 300 docs are tagged "rare"; post-filtering the top 3 would miss them
+    assert result["total_found"] == 3
+    assert all(r["metadata"]["tags"] == ["rare"] for r in result["results"])
+
+    store = SQLiteStore(str(tmp_path / "reports.db"))
+    assert len(_metadata_indexes(store)) == 1
+    store.close()
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from tooluniverse.database_setup import pipeline
+from tooluniverse.database_setup.sqlite_store import SQLiteStore
+
+
+class FakeEmbedder:
+    """Deterministic 4D embeddings; records every text it embeds."""
+
+    calls = []
+    fail_after = None
+
+    def __init__(self, provider, model, **kwargs):
+        pass
+
+    def embed(self, texts):
+        if (
+            FakeEmbedder.fail_after is not None
+            and len(FakeEmbedder.calls) >= FakeEmbedder.fail_after
+        ):
+            raise RuntimeError("embedding service unavailable")
+        FakeEmbedder.calls.append(list(texts))
+        return np.array(
+            [[len(t), t.count("e") + 1, 1.0, 2.0] for t in texts], dtype="float32"
+        )
+
+
+@pytest.fixture()
+def fake_embedder(monkeypatch, tmp_path):
+    monkeypatch.setenv("TOOLUNIVERSE_TMPDIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(pipeline, "Embedder", FakeEmbedder)
+    FakeEmbedder.calls = []
+    FakeEmbedder.fail_after = None
+    return FakeEmbedder
+
+
+def _docs(start, stop):
+    return [
+        (f"k{i}", f"document number {i} about disease {i % 7}", {"n": i}, None)
+        for i in range(start, stop)
+    ]
+
+
+def _embedded_texts(calls):
+    return [t for batch in calls for t in batch if t != "_dim_probe_"]
+
+
+def _vector_rows(db):
+    store = SQLiteStore(db)
+    rows = store.conn.execute(
+        "SELECT doc_id, faiss_idx FROM vectors ORDER BY faiss_idx"
+    ).fetchall()
+    store.close()
+    return rows
+
+
+def test_rebuild_embeds_only_new_docs(tmp_path, fake_embedder):
+    db = str(tmp_path / "demo.db")
+
+    first = pipeline.build_collection(
+        db, "demo", _docs(0, 10), "fake", "m", batch_size=4
+    )
+    assert first["docs_embedded"] == 10
+    assert first["batches"] == 3
+    assert first["docs_per_sec"] > 0 and first["tokens_per_sec"] > 0
+
+    fake_embedder.calls = []
+    second = pipeline.build_collection(
+        db, "demo", _docs(0, 13), "fake", "m", batch_size=4
+    )
+
+    # Dimension comes from the collection metadata; only the 3 new docs are embedded
+    assert second["docs_embedded"] == 3
+    assert _embedded_texts(fake_embedder.calls) == [d[1] for d in _docs(10, 13)]
+    rows = _vector_rows(db)
+    assert [idx for _, idx in rows] == list(range(13))
+    assert len({doc_id for doc_id, _ in rows}) == 13
+
+    hits = pipeline.search(
+        db,
+        "demo",
+        "document",
+        method="embedding",
+        top_k=20,
+        embed_provider="fake",
+        embed_model="m",
+    )
+    assert len(hits) == 13
+
+
+def test_interrupted_build_resumes_from_last_checkpoint(tmp_path, fake_embedder):
+    db = str(tmp_path / "demo.db")
+    # Probe + 2 batches succeed, the third batch fails
+    fake_embedder.fail_after = 3
+    with pytest.raises(RuntimeError):
+        pipeline.build_collection(
+            db, "demo", _docs(0, 10), "fake", "m", batch_size=2, checkpoint_every=4
+        )
+    assert len(_vector_rows(db)) == 4
+
+    fake_embedder.fail_after = None
+    fake_embedder.calls = []
+    resumed = pipeline.build_collection(
+        db, "demo", _docs(0, 10), "fake", "m", batch_size=2
+    )
+
+    assert resumed["docs_embedded"] == 6
+    assert _embedded_texts(fake_embedder.calls) == [d[1] for d in _docs(4, 10)]
+    assert [idx for _, idx in _vector_rows(db)] == list(range(10))
+
+
+def test_overwrite_reembeds_everything_once(tmp_path, fake_embedder):
+    db = str(tmp_path / "demo.db")
+    pipeline.build_collection(db, "demo", _docs(0, 5), "fake", "m")
+    again = pipeline.build_collection(
+        db, "demo", _docs(0, 5), "fake", "m", overwrite=True
+    )
+
+    assert again["docs_embedded"] == 5
+    assert [idx for _, idx in _vector_rows(db)] == list(range(5))
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Tests for the opt-in LLM response cache used by AgenticTool."""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse.agentic_tool import AgenticTool  # noqa: E402
+from tooluniverse.cache import llm_cache  # noqa: E402
+
+
+class FakeClient:
+    """Stands in for an LLM client; counts calls and answers with the prompt."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def infer(self, messages, temperature, **kwargs):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return f"answer to {messages[0]['content']} at {temperature}"
+
+
+@pytest.fixture(autouse=True)
+def llm_cache_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOOLUNIVERSE_LLM_CACHE_PATH", str(tmp_path / "cache.sqlite"))
+    llm_cache.reset_llm_cache()
+    yield
+    llm_cache.reset_llm_cache()
+
+
+def _tool(client, **configs):
+    config = {
+        "name": "Summarize",
+        "prompt": "Summarize: {text}",
+        "input_arguments": ["text"],
+        "parameter": {
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"],
+        },
+        "configs": {"model_id": "test-model", "temperature": 0.1, **configs},
+    }
+    with patch.object(AgenticTool, "_try_initialize_api"):
+        tool = AgenticTool(config)
+    tool._llm_client = client
+    tool._is_available = True
+    return tool
+
+
+@pytest.mark.unit
+def test_identical_prompts_are_served_from_cache():
+    client = FakeClient()
+    tool = _tool(client, llm_cache=True)
+
+    first = tool.run({"text": "abc"})
+    second = _tool(client, llm_cache=True).run({"text": "abc"})
+
+    assert second["result"] == first["result"] == "answer to Summarize: abc at 0.1"
+    assert client.calls == 1
+    assert not first["metadata"]["llm_cache_hit"]
+    assert second["metadata"]["llm_cache_hit"]
+
+    # Anything that changes the completion is part of the key
+    tool.run({"text": "xyz"})
+    _tool(client, llm_cache=True, temperature=0.7).run({"text": "abc"})
+    assert client.calls == 3
+
+    stats = AgenticTool.get_llm_cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 3
+    assert stats["hit_rate"] == 0.25
+    assert stats["estimated_tokens_saved"] > 0
+
+
+@pytest.mark.unit
+def test_concurrent_identical_requests_call_the_model_once():
+    client = FakeClient(delay=0.1)
+    tool = _tool(client, llm_cache=True)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(lambda _: tool.run({"text": "abc"}), range(5)))
+
+    assert client.calls == 1
+    assert len({result["result"] for result in results}) == 1
+    assert AgenticTool.get_llm_cache_stats()["deduplicated"] == 4
+
+
+@pytest.mark.unit
+def test_responses_persist_across_processes():
+    tool = _tool(FakeClient(), llm_cache=True)
+    tool.run({"text": "abc"})
+
+    # A fresh process-wide cache reads the entry back from SQLite
+    llm_cache.reset_llm_cache()
+    client = FakeClient()
+    chunks = []
+    result = _tool(client, llm_cache=True).run(
+        {"text": "abc"}, stream_callback=chunks.append
+    )
+
+    assert client.calls == 0
+    assert result["metadata"]["llm_cache_hit"]
+    assert "".join(chunks) == result["result"]
+
+
+@pytest.mark.unit
+def test_cache_is_opt_in():
+    client = FakeClient()
+    tool = _tool(client)
+
+    tool.run({"text": "abc"})
+    result = tool.run({"text": "abc"})
+
+    assert client.calls == 2
+    assert "llm_cache_hit" not in result["metadata"]
+    assert AgenticTool.get_llm_cache_stats() == {"enabled": False}
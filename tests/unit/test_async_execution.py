@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Tests for the asyncio execution path of ToolUniverse."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+
+
+PARAMETER_SCHEMA = {
+    "type": "object",
+    "properties": {"value": {"type": "integer"}},
+    "required": ["value"],
+}
+
+
+class SyncEchoTool(BaseTool):
+    def run(self, arguments=None, **kwargs):
+        time.sleep(0.01)
+        return {"value": arguments["value"], "thread": threading.get_ident()}
+
+
+class NativeAsyncTool(BaseTool):
+    active = 0
+    max_active = 0
+    calls = 0
+
+    def run(self, arguments=None, **kwargs):
+        raise AssertionError("sync path should not be used")
+
+    async def arun(self, arguments=None, **kwargs):
+        NativeAsyncTool.calls += 1
+        NativeAsyncTool.active += 1
+        NativeAsyncTool.max_active = max(
+            NativeAsyncTool.max_active, NativeAsyncTool.active
+        )
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            NativeAsyncTool.active -= 1
+        return {"value": arguments["value"]}
+
+
+class OverridesRunOnly(NativeAsyncTool):
+    def run(self, arguments=None, **kwargs):
+        return {"value": arguments["value"], "sync": True}
+
+
+def _make_universe(tool_class, name, **extra):
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    config = {
+        "name": name,
+        "type": name,
+        "description": "Async test tool",
+        "parameter": PARAMETER_SCHEMA,
+    }
+    config.update(extra)
+    tu.register_custom_tool(tool_class, tool_name=name, tool_config=config)
+    return tu
+
+
+@pytest.fixture(autouse=True)
+def _reset_counters():
+    NativeAsyncTool.active = 0
+    NativeAsyncTool.max_active = 0
+    NativeAsyncTool.calls = 0
+
+
+@pytest.mark.unit
+def test_supports_native_async_follows_run_override():
+    assert not SyncEchoTool({}).supports_native_async()
+    assert NativeAsyncTool({}).supports_native_async()
+    assert not OverridesRunOnly({}).supports_native_async()
+
+
+@pytest.mark.unit
+def test_arun_one_function_runs_sync_tool_in_thread():
+    tu = _make_universe(SyncEchoTool, "SyncEchoTool")
+
+    result = asyncio.run(
+        tu.arun_one_function({"name": "SyncEchoTool", "arguments": {"value": 3}})
+    )
+
+    assert result["value"] == 3
+    assert result["thread"] != threading.get_ident()
+
+
+@pytest.mark.unit
+def test_arun_one_function_awaits_native_coroutine():
+    tu = _make_universe(NativeAsyncTool, "NativeAsyncTool")
+
+    result = asyncio.run(
+        tu.arun_one_function({"name": "NativeAsyncTool", "arguments": {"value": 7}})
+    )
+
+    assert result == {"value": 7}
+    assert NativeAsyncTool.calls == 1
+
+
+@pytest.mark.unit
+def test_arun_one_function_validates_parameters():
+    tu = _make_universe(NativeAsyncTool, "NativeAsyncTool")
+
+    result = asyncio.run(
+        tu.arun_one_function({"name": "NativeAsyncTool", "arguments": {}})
+    )
+
+    assert "error" in result
+    assert NativeAsyncTool.calls == 0
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(10)
+def test_arun_batch_dedupes_and_respects_per_tool_concurrency():
+    tu = _make_universe(
+        NativeAsyncTool, "NativeAsyncTool", cacheable=False, batch_max_concurrency=4
+    )
+    calls = [
+        {"name": "NativeAsyncTool", "arguments": {"value": i % 10}} for i in range(30)
+    ]
+
+    messages = asyncio.run(tu.arun(calls, use_cache=False))
+
+    assert len(messages) == 31
+    assert NativeAsyncTool.calls == 10
+    assert 1 < NativeAsyncTool.max_active <= 4
+
+
+@pytest.mark.unit
+def test_arun_batch_respects_max_concurrency():
+    tu = _make_universe(NativeAsyncTool, "NativeAsyncTool", cacheable=False)
+    calls = [{"name": "NativeAsyncTool", "arguments": {"value": i}} for i in range(12)]
+
+    asyncio.run(tu.arun(calls, max_concurrency=2))
+
+    assert NativeAsyncTool.max_active == 2
+
+
+@pytest.mark.unit
+def test_arun_one_function_uses_result_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_DIR", str(tmp_path))
+    tu = _make_universe(NativeAsyncTool, "NativeAsyncTool")
+    call = {"name": "NativeAsyncTool", "arguments": {"value": 5}}
+
+    async def run_concurrently():
+        return await asyncio.gather(
+            *(tu.arun_one_function(dict(call), use_cache=True) for _ in range(5))
+        )
+
+    results = asyncio.run(run_concurrently())
+
+    assert all(result == {"value": 5} for result in results)
+    assert NativeAsyncTool.calls == 1
+    tu.close()
+
+
+@pytest.mark.unit
+def test_arun_one_function_keeps_cache_io_off_the_loop(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_DIR", str(tmp_path))
+    tu = _make_universe(NativeAsyncTool, "NativeAsyncTool")
+    call = {"name": "NativeAsyncTool", "arguments": {"value": 3}}
+    threads = []
+
+    def recording(method):
+        def wrapper(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(tu.cache_manager, "get", recording(tu.cache_manager.get))
+    monkeypatch.setattr(tu, "_store_cached_result", recording(tu._store_cached_result))
+
+    async def run_twice():
+        first = await tu.arun_one_function(dict(call), use_cache=True)
+        second = await tu.arun_one_function(dict(call), use_cache=True)
+        return threading.get_ident(), first, second
+
+    loop_thread, first, second = asyncio.run(run_twice())
+    tu.close()
+
+    assert first == second == {"value": 3}
+    assert NativeAsyncTool.calls == 1
+    assert threads and loop_thread not in threads
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Tests for the indexed DatasetTool search and filter paths."""
+
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import dataset_tool  # noqa: E402
+from tooluniverse.dataset_tool import DatasetTool  # noqa: E402
+
+ROWS = [
+    {
+        "DrugBank ID": "DB001",
+        "Common name": "Aspirin",
+        "Synonyms": "ASA | Acetylsalicylic acid",
+    },
+    {"DrugBank ID": "DB002", "Common name": "Insulin glargine", "Synonyms": "Lantus"},
+    {"DrugBank ID": "DB003", "Common name": "Salicylic acid", "Synonyms": ""},
+    {
+        "DrugBank ID": "DB004",
+        "Common name": "Acarbose",
+        "Synonyms": "aspirin | Precose",
+    },
+]
+PARAMETERS = {
+    "properties": {
+        name: {}
+        for name in (
+            "query",
+            "search_fields",
+            "case_sensitive",
+            "exact_match",
+            "limit",
+            "field",
+            "condition",
+            "value",
+        )
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def clean_dataset_cache():
+    dataset_tool._DATASET_CACHE.clear()
+    yield
+    dataset_tool._DATASET_CACHE.clear()
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "vocab.csv"
+    pd.DataFrame(ROWS).to_csv(path, index=False)
+    return str(path)
+
+
+def _tool(path, query_schema=None):
+    return DatasetTool(
+        {
+            "name": "vocab",
+            "type": "DatasetTool",
+            "local_dataset_path": path,
+            "parameter": PARAMETERS,
+            "query_schema": query_schema
+            or {
+                "search_fields": ["Common name", "Synonyms", "DrugBank ID"],
+                "case_sensitive": False,
+                "exact_match": False,
+                "limit": 10,
+            },
+        }
+    )
+
+
+@pytest.mark.unit
+def test_substring_search_reports_matched_fields_in_row_order(csv_path):
+    result = _tool(csv_path).run({"query": "ASPIRIN"})
+
+    assert [row["DrugBank ID"] for row in result["results"]] == ["DB001", "DB004"]
+    assert result["results"][0]["matched_fields"] == ["Common name"]
+    assert result["results"][1]["matched_fields"] == ["Synonyms"]
+
+    acid = _tool(csv_path).run({"query": "acid", "limit": 1})
+    assert acid["total_results"] == 1
+    assert acid["results"][0]["matched_fields"] == ["Synonyms"]
+
+
+@pytest.mark.unit
+def test_exact_search_matches_individual_synonyms(csv_path):
+    tool = _tool(csv_path)
+
+    exact = tool.run({"query": "precose", "exact_match": True})
+    assert [row["DrugBank ID"] for row in exact["results"]] == ["DB004"]
+
+    # Without a "|" the whole synonyms value must match
+    assert tool.run({"query": "lantus", "exact_match": True})["total_results"] == 1
+    assert tool.run({"query": "lant", "exact_match": True})["total_results"] == 0
+
+    sensitive = tool.run({"query": "asa", "exact_match": True, "case_sensitive": True})
+    assert sensitive["total_results"] == 0
+
+
+@pytest.mark.unit
+def test_filter_uses_indexes_and_keeps_pandas_semantics(csv_path):
+    tool = _tool(csv_path, {"field": "Common name", "condition": "contains"})
+
+    contains = tool.run(
+        {"field": "Common name", "condition": "contains", "value": "ACID", "limit": 10}
+    )
+    assert contains["total_matches"] == 1
+    assert contains["results"][0]["DrugBank ID"] == "DB003"
+
+    # Regex patterns are still evaluated by pandas
+    regex = tool.run(
+        {"field": "Common name", "condition": "contains", "value": "^a", "limit": 10}
+    )
+    assert [row["DrugBank ID"] for row in regex["results"]] == ["DB001", "DB004"]
+
+    exact = tool.run(
+        {"field": "Synonyms", "condition": "exact", "value": "Lantus", "limit": 10}
+    )
+    assert exact["total_matches"] == 1
+
+    empty = tool.run({"field": "Synonyms", "condition": "not_empty", "limit": 2})
+    assert empty["total_matches"] == 3
+    assert empty["returned_results"] == 2
+
+
+@pytest.mark.unit
+def test_tools_share_one_loaded_dataset(csv_path):
+    with patch.object(
+        dataset_tool, "_read_table", wraps=dataset_tool._read_table
+    ) as read:
+        first = _tool(csv_path)
+        second = _tool(csv_path, {"field": "CAS", "condition": "not_empty"})
+
+    assert read.call_count == 1
+    assert first.dataset is second.dataset
+    assert first._index is second._index
+
+
+@pytest.mark.unit
+def test_text_datasets_are_cached_as_parquet(csv_path):
+    pytest.importorskip("pyarrow")
+    _tool(csv_path)
+    assert os.path.exists(csv_path + ".parquet")
+
+    dataset_tool._DATASET_CACHE.clear()
+    with patch.dict(dataset_tool._TEXT_READERS, {".csv": None}):
+        tool = _tool(csv_path)
+
+    assert tool.run({"query": "lantus"})["total_results"] == 1
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Tests for the concurrent, cached result enrichment of guideline tools."""
+
+import importlib.util
+import json
+import os
+import sys
+import threading
+import types
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+
+def _markitdown_modules():
+    """Stand in for markitdown, which these tests never exercise, if missing."""
+    if importlib.util.find_spec("markitdown") is not None:
+        return {}
+    fake = types.ModuleType("markitdown")
+
+    class MarkItDown:
+        def convert(self, *args, **kwargs):
+            raise RuntimeError("markitdown is not installed")
+
+    fake.MarkItDown = MarkItDown
+    return {"markitdown": fake}
+
+
+with patch.dict(sys.modules, _markitdown_modules()):
+    from tooluniverse import unified_guideline_tools as guidelines
+
+EuropePMCGuidelinesTool = guidelines.EuropePMCGuidelinesTool
+NICEWebScrapingTool = guidelines.NICEWebScrapingTool
+WHOGuidelinesTool = guidelines.WHOGuidelinesTool
+
+LONG_ABSTRACT = "This guideline provides recommendations for care. " * 6
+
+
+class FakeResponse:
+    def __init__(self, content="", status_code=200):
+        self.content = content.encode("utf-8")
+        self.status_code = status_code
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Serves canned responses by URL and records every request."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        with self._lock:
+            self.calls.append((url, params))
+        route = self.routes.get(url)
+        if callable(route):
+            return route(params)
+        return FakeResponse(route or "", 200 if route else 404)
+
+    def urls(self, prefix=""):
+        return [url for url, _ in self.calls if url.startswith(prefix)]
+
+
+@pytest.fixture(autouse=True)
+def no_sleep_and_clean_cache(monkeypatch):
+    monkeypatch.setattr(guidelines.time, "sleep", lambda seconds: None)
+    guidelines._DOCUMENT_CACHE.clear()
+    yield
+    guidelines._DOCUMENT_CACHE.clear()
+
+
+def _tool(cls, session, **config):
+    tool = cls({"name": cls.__name__, "type": cls.__name__, **config})
+    tool.session = session
+    return tool
+
+
+def _hit(pmid, title="Clinical practice guideline for asthma management"):
+    return {
+        "pmid": pmid,
+        "title": title,
+        "pubType": "practice guideline",
+        "pubTypeList": {"pubType": ["Guideline"]},
+    }
+
+
+def _efetch(params):
+    articles = "".join(
+        f"<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article><Abstract>"
+        f"<AbstractText>{LONG_ABSTRACT if pmid != '3' else 'Short?'}</AbstractText>"
+        "</Abstract></Article></MedlineCitation></PubmedArticle>"
+        for pmid in params["id"].split(",")
+    )
+    return FakeResponse(f"<PubmedArticleSet>{articles}</PubmedArticleSet>")
+
+
+def _europepmc_session(hits):
+    return FakeSession(
+        {
+            "https://www.ebi.ac.uk/europepmc/webservices/rest/search": lambda params: (
+                FakeResponse(json.dumps({"resultList": {"result": hits}}))
+            ),
+            "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi": _efetch,
+        }
+    )
+
+
+@pytest.mark.unit
+def test_europepmc_batches_abstracts_and_skips_unqualified_hits():
+    hits = [
+        _hit("1"),
+        _hit("2", title="A randomized trial of inhaled steroids in asthma"),
+        _hit("3"),
+        _hit("4"),
+    ]
+    session = _europepmc_session(hits)
+    tool = _tool(EuropePMCGuidelinesTool, session)
+
+    results = tool.run({"query": "asthma", "limit": 3})
+
+    assert [result["pmid"] for result in results] == ["1", "3", "4"]
+    efetch_calls = [params for url, params in session.calls if "efetch" in url]
+    # One batched request; the "trial" hit is never enriched
+    assert [params["id"] for params in efetch_calls] == ["1,3,4"]
+    # Only the short abstract falls back to the full text
+    assert session.urls("https://www.ebi.ac.uk/europepmc/webservices/rest/MED/") == [
+        "https://www.ebi.ac.uk/europepmc/webservices/rest/MED/3/fullTextXML"
+    ]
+
+
+@pytest.mark.unit
+def test_europepmc_stops_enriching_once_limit_is_reached():
+    session = _europepmc_session([_hit(str(pmid)) for pmid in range(10, 30)])
+    tool = _tool(EuropePMCGuidelinesTool, session, max_concurrency=2)
+
+    assert len(tool.run({"query": "asthma", "limit": 1})) == 1
+    efetch_calls = [params for url, params in session.calls if "efetch" in url]
+    assert [params["id"] for params in efetch_calls] == ["10,11"]
+
+    # Abstracts are cached per PMID
+    session.calls.clear()
+    tool.run({"query": "asthma", "limit": 1})
+    assert not [url for url, _ in session.calls if "efetch" in url]
+
+
+@pytest.mark.unit
+def test_who_fetches_descriptions_until_limit():
+    links = "".join(
+        f'<a href="/publications/i/item/{i}">Guideline on malaria prevention {i}</a>'
+        for i in range(12)
+    )
+    routes = {
+        "https://www.who.int/publications/who-guidelines": f"<html>{links}</html>",
+    }
+    for i in range(12):
+        routes[f"https://www.who.int/publications/i/item/{i}"] = (
+            '<html><meta name="description" content="Malaria guidance"></html>'
+        )
+    session = FakeSession(routes)
+    tool = _tool(WHOGuidelinesTool, session, max_concurrency=3)
+
+    results = tool.run({"query": "malaria", "limit": 2})
+
+    assert [result["url"][-1] for result in results] == ["0", "1"]
+    assert results[0]["description"] == "Malaria guidance"
+    assert len(session.urls("https://www.who.int/publications/i/item/")) == 3
+
+    # Descriptions come from the per-document cache on the next search
+    session.calls.clear()
+    assert tool.run({"query": "malaria", "limit": 2}) == results
+    assert session.urls("https://www.who.int/publications/i/item/") == []
+
+
+@pytest.mark.unit
+def test_nice_fetches_missing_summaries_once_per_page():
+    documents = [
+        {"title": "Asthma: diagnosis", "url": "/guidance/ng80", "abstract": "Known"},
+        {"title": "Asthma: <b>management</b>", "url": "/guidance/ng245"},
+        {"title": "Asthma (duplicate link)", "url": "/guidance/ng245"},
+    ]
+    search_page = (
+        '<script id="__NEXT_DATA__">'
+        + json.dumps({"props": {"pageProps": {"results": {"documents": documents}}}})
+        + "</script>"
+    )
+    session = FakeSession(
+        {
+            "https://www.nice.org.uk/search": search_page,
+            "https://www.nice.org.uk/guidance/ng245": (
+                '<html><meta name="description" content="Fetched summary"></html>'
+            ),
+        }
+    )
+    tool = _tool(NICEWebScrapingTool, session)
+
+    results = tool.run({"query": "asthma", "limit": 10})
+
+    assert [result["summary"] for result in results] == [
+        "Known",
+        "Fetched summary",
+        "Fetched summary",
+    ]
+    assert results[1]["title"] == "Asthma: management"
+    assert session.urls("https://www.nice.org.uk/guidance/") == [
+        "https://www.nice.org.uk/guidance/ng245"
+    ]
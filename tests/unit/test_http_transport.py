@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Tests for the shared pooled HTTP transport."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from tooluniverse import http_transport
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.http_transport import HTTPTransport, get_http_transport
+
+
+def _fake_response(request):
+    response = requests.Response()
+    response.status_code = 200
+    response.request = request
+    response.url = request.url
+    response._content = b"{}"
+    return response
+
+
+@pytest.mark.unit
+def test_tool_sessions_share_connection_pool_but_not_headers():
+    first = BaseTool({"name": "a"}).get_http_session()
+    second = BaseTool({"name": "b"}).get_http_session()
+    first.headers["X-Tool"] = "a"
+
+    assert first.get_adapter("https://example.org") is second.get_adapter(
+        "https://example.org"
+    )
+    assert first.get_adapter("https://example.org") is get_http_transport().adapter
+    assert "X-Tool" not in second.headers
+
+
+@pytest.mark.unit
+def test_closing_a_tool_session_keeps_shared_pools():
+    transport = HTTPTransport()
+    session = transport.new_session()
+    with patch.object(transport.adapter, "close") as adapter_close:
+        session.close()
+    adapter_close.assert_not_called()
+
+
+@pytest.mark.unit
+def test_default_timeout_applied_only_when_missing():
+    transport = HTTPTransport(timeout=7)
+    sent = []
+
+    def fake_send(self, request, **kwargs):
+        sent.append(kwargs.get("timeout"))
+        return _fake_response(request)
+
+    with patch.object(HTTPAdapter, "send", fake_send):
+        transport.request("GET", "https://example.org/a")
+        transport.request("GET", "https://example.org/b", timeout=2)
+
+    assert sent == [7, 2]
+
+
+@pytest.mark.unit
+def test_http_get_routes_through_default_transport():
+    transport = HTTPTransport()
+    with patch.object(http_transport, "get_http_transport", return_value=transport):
+        with patch.object(transport, "request") as request:
+            http_transport.http_get("https://example.org", params={"q": 1})
+
+    request.assert_called_once_with("GET", "https://example.org", params={"q": 1})
+
+
+@pytest.mark.unit
+def test_from_env_reads_pool_configuration(monkeypatch):
+    monkeypatch.setenv("TOOLUNIVERSE_HTTP_POOL_MAXSIZE", "5")
+    monkeypatch.setenv("TOOLUNIVERSE_HTTP_TIMEOUT", "12.5")
+
+    transport = HTTPTransport.from_env()
+
+    assert transport.pool_maxsize == 5
+    assert transport.timeout == 12.5
+    assert transport.stats()["hosts"] == []
+
+
+@pytest.mark.unit
+def test_async_session_is_shared_per_loop_with_transport_timeout():
+    transport = HTTPTransport(timeout=9, pool_maxsize=4)
+
+    async def two_lookups():
+        first = http_transport.get_async_http_session()
+        second = http_transport.get_async_http_session()
+        assert first.connector.limit_per_host == 4
+        await http_transport.aclose_async_http_session()
+        return first, second
+
+    with patch.object(http_transport, "get_http_transport", return_value=transport):
+        first, second = asyncio.run(two_lookups())
+        other, _ = asyncio.run(two_lookups())
+
+    assert first is second and other is not first
+    assert first.closed and other.closed
+    assert first.timeout.total == 9
+
+
+@pytest.mark.unit
+def test_restful_arun_uses_real_default_transport():
+    from aiohttp import web
+
+    from tooluniverse.restful_tool import aexecute_RESTful_query
+
+    async def handler(request):
+        return web.json_response({"q": request.query.get("q")})
+
+    async def serve_and_query():
+        app = web.Application()
+        app.router.add_get("/api", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            return await asyncio.wait_for(
+                aexecute_RESTful_query(f"http://127.0.0.1:{port}/api", {"q": "x"}),
+                timeout=10,
+            )
+        finally:
+            await http_transport.aclose_async_http_session()
+            await runner.cleanup()
+
+    # A loop thread stuck on a lock never reaches wait_for's timeout, so run
+    # the loop in a thread the test can give up on
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(asyncio.run(serve_and_query())), daemon=True
+    )
+    thread.start()
+    thread.join(timeout=20)
+
+    assert not thread.is_alive(), "async session creation hung"
+    assert results == [{"q": "x"}]
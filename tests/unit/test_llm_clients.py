@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Tests for shared LLM SDK clients, async inference and vLLM batching."""
+
+import asyncio
+import logging
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import llm_clients  # noqa: E402
+from tooluniverse.agentic_tool import AgenticTool  # noqa: E402
+from tooluniverse.llm_clients import (  # noqa: E402
+    AzureOpenAIClient,
+    BaseLLMClient,
+    VLLMClient,
+)
+
+logger = logging.getLogger("test_llm_clients")
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    llm_clients.clear_shared_clients()
+    yield
+    llm_clients.clear_shared_clients()
+
+
+class FakeCompletions:
+    """Completions endpoint answering each prompt, with choices reversed."""
+
+    def __init__(self):
+        self.requests = []
+
+    def create(self, prompt, **kwargs):
+        self.requests.append(list(prompt))
+        choices = [
+            SimpleNamespace(index=i, text=f"done:{p}") for i, p in enumerate(prompt)
+        ]
+        return SimpleNamespace(choices=choices[::-1])
+
+
+class FakeAsyncCompletions(FakeCompletions):
+    async def create(self, prompt, **kwargs):
+        return FakeCompletions.create(self, prompt, **kwargs)
+
+
+class FakeAsyncChat:
+    """Async chat endpoint; tracks how many requests are in flight."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.completions = self
+
+    async def create(self, messages, stream=False, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        content = f"reply:{messages[-1]['content']}"
+        if stream:
+            return self._stream(content)
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    @staticmethod
+    async def _stream(content):
+        for piece in (content[:6], content[6:]):
+            delta = SimpleNamespace(content=piece)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def _vllm(max_batch_size=2):
+    client = VLLMClient("model", "http://localhost:8000", logger)
+    client.max_batch_size = max_batch_size
+    return client
+
+
+@pytest.mark.unit
+def test_clients_with_same_endpoint_and_key_share_sdk_client(monkeypatch):
+    assert _vllm().client is _vllm().client
+    assert VLLMClient("model", "http://other:8000", logger).client is not _vllm().client
+
+    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "key-1")
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+    first = AzureOpenAIClient("gpt-4o", "2024-10-21", logger)
+    second = AzureOpenAIClient("gpt-4o-mini", "2024-10-21", logger)
+    assert first.client is second.client
+    # The key itself never appears in the registry key
+    assert "key-1" not in repr(first._client_key)
+
+    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "key-2")
+    rotated = AzureOpenAIClient("gpt-4o", "2024-10-21", logger)
+    assert rotated.client is not first.client
+
+
+@pytest.mark.unit
+def test_vllm_batches_text_prompts_per_request():
+    client = _vllm(max_batch_size=2)
+    client.client = SimpleNamespace(completions=FakeCompletions())
+
+    results = client.infer_batch(["a", "b", "c"], temperature=0)
+
+    assert results == ["done:a", "done:b", "done:c"]
+    assert client.client.completions.requests == [["a", "b"], ["c"]]
+
+
+@pytest.mark.unit
+def test_vllm_async_batch_mixes_text_and_chat_prompts():
+    client = _vllm(max_batch_size=2)
+    completions = FakeAsyncCompletions()
+    chat = FakeAsyncChat()
+    async_client = SimpleNamespace(completions=completions, chat=chat)
+
+    with patch.object(VLLMClient, "_async_client", return_value=async_client):
+        results = asyncio.run(
+            client.ainfer_batch(
+                ["a", [{"role": "user", "content": "x"}], "b", "c"], temperature=0
+            )
+        )
+
+    assert results == ["done:a", "reply:x", "done:b", "done:c"]
+    assert completions.requests == [["a", "b"], ["c"]]
+
+
+@pytest.mark.unit
+def test_base_client_async_methods_fall_back_to_sync_inference():
+    class SyncOnly(BaseLLMClient):
+        def infer(self, messages, temperature, max_tokens, return_json, **kwargs):
+            return "sync"
+
+    async def collect():
+        client = SyncOnly()
+        chunks = [c async for c in client.ainfer_stream([], None, None, False)]
+        return await client.ainfer([], None, None, False), chunks
+
+    assert asyncio.run(collect()) == ("sync", ["sync"])
+
+
+def _agentic_tool(llm_client):
+    config = {
+        "name": "Echo",
+        "prompt": "Echo: {text}",
+        "input_arguments": ["text"],
+        "parameter": {
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"],
+        },
+        "configs": {"api_type": "VLLM", "model_id": "model"},
+    }
+    with patch.object(AgenticTool, "_try_initialize_api"):
+        tool = AgenticTool(config)
+    tool._llm_client = llm_client
+    tool._is_available = True
+    return tool
+
+
+@pytest.mark.unit
+def test_agentic_tool_runs_natively_async():
+    chat = FakeAsyncChat()
+    client = _vllm()
+    tool = _agentic_tool(client)
+    assert tool.supports_native_async()
+
+    async def run_all():
+        with patch.object(
+            VLLMClient, "_async_client", return_value=SimpleNamespace(chat=chat)
+        ):
+            results = await asyncio.gather(
+                *(tool.arun({"text": str(i)}) for i in range(5))
+            )
+            chunks = []
+            streamed = await tool.arun({"text": "s"}, stream_callback=chunks.append)
+        return results, streamed, chunks
+
+    results, streamed, chunks = asyncio.run(run_all())
+
+    assert [r["result"] for r in results] == [f"reply:Echo: {i}" for i in range(5)]
+    assert chat.peak == 5
+    assert streamed["result"] == "reply:Echo: s"
+    assert chunks == ["reply:", "Echo: s"]
+
+    failed = asyncio.run(tool.arun({}))
+    assert failed["success"] is False
+    assert failed["metadata"]["prompt_used"] == "Failed to format prompt"
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Tests for persistent MCP sessions shared by MCP proxy tools."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import anyio
+import pytest
+
+from tooluniverse import mcp_client_tool
+from tooluniverse.mcp_client_tool import MCPClientTool, MCPProxyTool, MCPSessionPool
+
+
+class FakeSession:
+    instances = []
+
+    def __init__(self, read_stream, write_stream):
+        self.initialized = 0
+        self.calls = []
+        self.fail_next = False
+        self.fail_with = anyio.ClosedResourceError
+        FakeSession.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def initialize(self):
+        self.initialized += 1
+
+    async def send_ping(self):
+        return {}
+
+    async def list_tools(self):
+        if self.fail_next:
+            self.fail_next = False
+            raise self.fail_with()
+        return {"tools": []}
+
+    async def call_tool(self, name, arguments):
+        if self.fail_next:
+            self.fail_next = False
+            self.calls.append((name, arguments))
+            raise self.fail_with()
+        self.calls.append((name, arguments))
+        await asyncio.sleep(0)
+        return {"content": [{"type": "text", "text": f"{name}:{arguments}"}]}
+
+
+@asynccontextmanager
+async def fake_transport(endpoint, timeout=30):
+    yield (None, None, lambda: None)
+
+
+@pytest.fixture
+def pool():
+    FakeSession.instances = []
+    pool = MCPSessionPool()
+    with (
+        patch.object(mcp_client_tool, "streamablehttp_client", fake_transport),
+        patch.object(mcp_client_tool, "ClientSession", FakeSession),
+        patch.object(MCPSessionPool, "get_default", return_value=pool),
+    ):
+        yield pool
+    pool.close()
+
+
+def _proxy(name, target, **extra):
+    config = {
+        "name": name,
+        "server_url": "http://mcp.test:9000",
+        "transport": "http",
+        "target_tool_name": target,
+        "timeout": 5,
+    }
+    config.update(extra)
+    return MCPProxyTool(config)
+
+
+@pytest.mark.unit
+def test_proxy_tools_share_one_handshake(pool):
+    first = _proxy("mcp_a", "tool_a")
+    second = _proxy("mcp_b", "tool_b")
+
+    for i in range(3):
+        assert "content" in first.run({"x": i})
+    assert "content" in second.run({"y": 1})
+
+    assert len(FakeSession.instances) == 1
+    assert FakeSession.instances[0].initialized == 1
+    assert len(FakeSession.instances[0].calls) == 4
+
+    metrics = first.get_session_metrics()
+    assert metrics["pooled"] is True
+    assert metrics["handshakes"] == 1
+    assert metrics["calls"] == 4
+
+
+@pytest.mark.unit
+def test_pooled_session_reconnects_after_dropped_connection(pool):
+    proxy = _proxy("mcp_a", "tool_a")
+    proxy.run({})
+    FakeSession.instances[0].fail_next = True
+
+    result = proxy.run({"retry": True})
+
+    assert "content" in result
+    assert len(FakeSession.instances) == 2
+    stats = pool.stats()["http://mcp.test:9000/mcp/"]
+    assert stats["handshakes"] == 2
+    assert stats["reconnects"] == 1
+
+
+@pytest.mark.unit
+def test_proxy_arun_uses_pool_from_foreign_loop(pool):
+    proxy = _proxy("mcp_a", "tool_a")
+
+    async def fan_out():
+        return await asyncio.gather(*(proxy.arun({"i": i}) for i in range(10)))
+
+    results = asyncio.run(fan_out())
+
+    assert all("content" in result for result in results)
+    assert FakeSession.instances[0].initialized == 1
+
+
+@pytest.mark.unit
+def test_client_tool_is_not_pooled_by_default():
+    client = MCPClientTool(
+        {"name": "client", "server_url": "http://mcp.test:9000", "transport": "http"}
+    )
+    assert client.session_pool is False
+    assert client.get_session_metrics() == {"pooled": False}
+
+
+ENDPOINT = "http://mcp.test:9000/mcp/"
+
+
+@pytest.mark.unit
+def test_only_read_only_methods_are_replayed_after_lost_response(pool):
+    call = {"name": "tool_a", "arguments": {}}
+    asyncio.run(pool.request(ENDPOINT, "tools/list"))
+    session = FakeSession.instances[0]
+    session.fail_next, session.fail_with = True, anyio.EndOfStream
+
+    # The server may have run the tool before the connection dropped
+    with pytest.raises(anyio.EndOfStream):
+        asyncio.run(pool.request(ENDPOINT, "tools/call", call))
+    assert session.calls == [("tool_a", {})]
+
+    session = FakeSession.instances[-1]
+    session.fail_next, session.fail_with = True, anyio.EndOfStream
+    assert asyncio.run(pool.request(ENDPOINT, "tools/list")) == {"tools": []}
+    assert pool.stats()[ENDPOINT]["errors"] == 1
+
+
+@pytest.mark.unit
+def test_sessions_are_keyed_by_timeout_and_concurrency(pool):
+    fast = _proxy("mcp_a", "tool_a", timeout=5, mcp_max_concurrency=2)
+    slow = _proxy("mcp_b", "tool_b", timeout=60)
+
+    fast.run({})
+    slow.run({})
+
+    assert pool.get_session(ENDPOINT, timeout=5, max_concurrency=2).max_concurrency == 2
+    assert pool.get_session(ENDPOINT, timeout=60).timeout == 60
+    assert len(FakeSession.instances) == 2
+    assert fast.get_session_metrics()["calls"] == 2
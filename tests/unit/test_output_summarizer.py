@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Tests for the concurrent map-reduce output summarizer and its hook."""
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse.compose_scripts import output_summarizer  # noqa: E402
+from tooluniverse.output_hook import SummarizationHook  # noqa: E402
+
+
+class FakeSummarizer:
+    """Stands in for call_tool; records calls and their peak concurrency."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, tool_name, arguments):
+        with self._lock:
+            self.calls.append(arguments)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        text = arguments["tool_output"]
+        if arguments["focus_areas"] == "consolidate_and_prioritize":
+            return {"success": True, "result": f"merged({text.count('S:')})"}
+        return {"success": True, "result": f"S:{text[:3]}"}
+
+    def chunk_calls(self):
+        return [
+            c for c in self.calls if c["focus_areas"] != "consolidate_and_prioritize"
+        ]
+
+
+def _output(chunks):
+    # Each chunk is exactly 100 characters ending with a sentence boundary
+    return "".join(f"{i:03d}" + "x" * 96 + "." for i in range(chunks))
+
+
+def _compose(summarizer, chunks, tooluniverse=None, emit_event=None, **arguments):
+    return output_summarizer.compose(
+        {
+            "tool_output": _output(chunks),
+            "query_context": "q",
+            "tool_name": "tool",
+            "chunk_size": 100,
+            **arguments,
+        },
+        tooluniverse or SimpleNamespace(),
+        summarizer,
+        emit_event=emit_event,
+    )
+
+
+@pytest.mark.unit
+def test_chunks_are_summarized_concurrently_in_order():
+    summarizer = FakeSummarizer(delay=0.05)
+    events = []
+
+    result = _compose(
+        summarizer,
+        6,
+        max_concurrency=3,
+        max_summary_length=1000,
+        emit_event=lambda kind, data: events.append((kind, data)),
+    )
+
+    assert result["success"] and result["chunks_processed"] == 6
+    assert result["summary"] == "\n\n".join(f"S:{i:03d}" for i in range(6))
+    assert summarizer.peak == 3
+    streamed = sorted(data["index"] for kind, data in events)
+    assert streamed == list(range(6))
+
+
+@pytest.mark.unit
+def test_chunk_summaries_are_cached_per_tooluniverse():
+    tooluniverse = SimpleNamespace()
+    summarizer = FakeSummarizer()
+    first = _compose(summarizer, 4, tooluniverse=tooluniverse, max_summary_length=1000)
+    assert len(summarizer.chunk_calls()) == 4
+
+    events = []
+    second = _compose(
+        summarizer,
+        4,
+        tooluniverse=tooluniverse,
+        max_summary_length=1000,
+        emit_event=lambda kind, data: events.append(data),
+    )
+    assert second["summary"] == first["summary"]
+    assert len(summarizer.chunk_calls()) == 4
+    assert all(event["cached"] for event in events)
+
+    # A different focus is a different summary
+    _compose(summarizer, 4, tooluniverse=tooluniverse, focus_areas="other")
+    assert len(summarizer.chunk_calls()) == 8
+
+
+@pytest.mark.unit
+def test_long_outputs_are_merged_as_a_tree():
+    summarizer = FakeSummarizer()
+    events = []
+
+    result = _compose(
+        summarizer,
+        20,
+        max_summary_length=15,
+        merge_fan_in=4,
+        emit_event=lambda kind, data: events.append((kind, data)),
+    )
+
+    merges = [c for c in summarizer.calls if c not in summarizer.chunk_calls()]
+    # 20 -> 5 groups of 4 -> 2 groups (4 + 1) -> final merge of 2
+    assert [c["tool_output"].count("\n\n") + 1 for c in merges] == [4] * 5 + [4, 2]
+    assert [data for kind, data in events if kind == "merge_level"] == [
+        {"level": 1, "summaries": 5},
+        {"level": 2, "summaries": 2},
+    ]
+    assert result["summary"].startswith("merged(")
+
+
+@pytest.mark.unit
+def test_hook_forwards_fan_out_and_stream_callback():
+    tooluniverse = MagicMock()
+    tooluniverse.callable_functions = {"OutputSummarizationComposer": MagicMock()}
+    tooluniverse.run_one_function.return_value = {"success": True, "summary": "ok"}
+    hook = SummarizationHook(
+        {"hook_config": {"max_concurrency": 6, "merge_fan_in": 3}}, tooluniverse
+    )
+    callback = MagicMock()
+
+    assert hook.process("x" * 100, "tool", {}, {"stream_callback": callback}) == "ok"
+
+    (call,), kwargs = tooluniverse.run_one_function.call_args
+    assert call["arguments"]["max_concurrency"] == 6
+    assert call["arguments"]["merge_fan_in"] == 3
+    assert kwargs["stream_callback"] is callback
+
+
+@pytest.mark.unit
+def test_hook_timeout_returns_without_waiting_for_composer():
+    tooluniverse = MagicMock()
+    tooluniverse.callable_functions = {"OutputSummarizationComposer": MagicMock()}
+    release = threading.Event()
+    tooluniverse.run_one_function.side_effect = lambda *a, **k: release.wait(5)
+    hook = SummarizationHook({"hook_config": {"composer_timeout_sec": 1}}, tooluniverse)
+
+    start = time.monotonic()
+    try:
+        assert hook.process("long output", "tool") == "long output"
+        assert time.monotonic() - start < 3
+    finally:
+        release.set()
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""Tests for the process-wide per-host rate limiter."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse, http_transport, rate_limiter  # noqa: E402
+from tooluniverse import execute_function  # noqa: E402
+from tooluniverse.base_tool import BaseTool  # noqa: E402
+from tooluniverse.clinvar_tool import ClinVarSearchVariants  # noqa: E402
+from tooluniverse.http_transport import HTTPTransport  # noqa: E402
+from tooluniverse.ncbi_eutils_tool import NCBIEUtilsTool  # noqa: E402
+from tooluniverse.rate_limiter import (  # noqa: E402
+    HostRateLimiter,
+    RateLimitExceeded,
+    parse_rate_limit,
+    parse_retry_after,
+    rate_limit_context,
+)
+
+
+@pytest.fixture
+def limiter():
+    limiter = HostRateLimiter()
+    with (
+        patch.object(rate_limiter, "get_rate_limiter", return_value=limiter),
+        patch.object(http_transport, "get_rate_limiter", return_value=limiter),
+        patch.object(execute_function, "get_rate_limiter", return_value=limiter),
+    ):
+        yield limiter
+
+
+def _response(request, status=200, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.request = request
+    response.url = request.url
+    response.headers.update(headers or {})
+    response._content = b"{}"
+    return response
+
+
+@pytest.mark.unit
+def test_parse_rate_limit_formats():
+    assert parse_rate_limit(2) == {"requests_per_second": 2.0, "burst": 2, "hosts": []}
+    assert parse_rate_limit({"requests_per_second": 0.5, "hosts": "A.org"}) == {
+        "requests_per_second": 0.5,
+        "burst": 1,
+        "hosts": ["a.org"],
+    }
+    assert parse_rate_limit(None) is None
+    assert parse_rate_limit({"burst": 3}) is None
+    assert parse_rate_limit(0) is None
+
+
+@pytest.mark.unit
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.unit
+def test_token_bucket_spaces_requests_after_burst(limiter):
+    limiter.configure("api.test", 2, burst=2)
+
+    waits = [limiter.reserve("api.test") for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.5, abs=0.05)
+    assert waits[3] == pytest.approx(1.0, abs=0.05)
+    assert limiter.stats()["api.test"]["throttled"] == 2
+
+
+@pytest.mark.unit
+def test_unconfigured_hosts_are_not_throttled(limiter):
+    assert all(limiter.reserve("free.test") == 0.0 for _ in range(50))
+
+
+@pytest.mark.unit
+def test_first_configured_limit_wins_and_respects_hosts(limiter):
+    limiter.reserve("a.test", {"requests_per_second": 1, "hosts": ["b.test"]})
+    limiter.reserve("a.test", 4, "tool_a")
+    limiter.reserve("a.test", 1, "tool_b")
+
+    stats = limiter.stats()["a.test"]
+    assert stats["configured_rate"] == 4.0
+    assert stats["tools"] == ["tool_a", "tool_b"]
+
+
+@pytest.mark.unit
+def test_429_halves_rate_and_blocks_until_retry_after(limiter):
+    limiter.configure("api.test", 4, burst=4)
+
+    delay = limiter.observe("api.test", 429, "2")
+
+    assert delay == 2.0
+    assert limiter.reserve("api.test") == pytest.approx(2.0, abs=0.05)
+    stats = limiter.stats()["api.test"]
+    assert stats["current_rate"] == 2.0
+    assert stats["rate_limited_responses"] == 1
+
+
+@pytest.mark.unit
+def test_long_retry_after_is_capped_and_fails_fast(limiter):
+    limiter.max_wait = 5
+    limiter.configure("api.test", 4, burst=4)
+
+    assert limiter.observe("api.test", 429, "3600") == 3600.0
+
+    with pytest.raises(RateLimitExceeded) as excinfo:
+        limiter.reserve("api.test")
+    assert excinfo.value.retry_after == pytest.approx(3600, abs=1)
+    assert isinstance(excinfo.value, requests.exceptions.RequestException)
+    stats = limiter.stats()["api.test"]
+    assert stats["blocked_for"] <= 5
+    assert stats["refused_for"] == pytest.approx(3600, abs=1)
+
+    # Once the server's window is over, requests only wait out the capped block
+    limiter._buckets["api.test"].refused_until = 0.0
+    assert limiter.reserve("api.test") <= 5
+
+
+@pytest.mark.unit
+def test_rate_recovers_after_successful_responses(limiter):
+    limiter.configure("api.test", 4)
+    limiter.observe("api.test", 503)
+
+    for _ in range(40):
+        limiter.observe("api.test", 200)
+
+    assert limiter.stats()["api.test"]["current_rate"] == 4.0
+
+
+@pytest.mark.unit
+def test_adaptive_cap_applies_to_unconfigured_host(limiter):
+    limiter.observe("free.test", 429, "0")
+
+    assert limiter.stats()["free.test"]["current_rate"] == limiter.adaptive_rps / 2
+
+
+@pytest.mark.unit
+def test_disabled_limiter_never_waits():
+    limiter = HostRateLimiter(enabled=False)
+    limiter.configure("api.test", 0.1, burst=1)
+    assert limiter.reserve("api.test") == 0.0
+    assert limiter.reserve("api.test") == 0.0
+    assert limiter.observe("api.test", 429, "5") is None
+
+
+@pytest.mark.unit
+def test_session_retries_429_after_retry_after(limiter):
+    transport = HTTPTransport(rate_limit_retries=2)
+    session = transport.new_session(owner="my_tool")
+    statuses = iter([429, 200])
+
+    def fake_send(self, request, **kwargs):
+        return _response(request, next(statuses), {"Retry-After": "0"})
+
+    with patch.object(HTTPAdapter, "send", fake_send):
+        response = session.get("https://api.test/items")
+
+    assert response.status_code == 200
+    stats = limiter.stats("my_tool")["api.test"]
+    assert stats["requests"] == 2
+    assert stats["retries"] == 1
+    assert stats["rate_limited_responses"] == 1
+
+
+@pytest.mark.unit
+def test_session_returns_429_when_retry_after_too_long(limiter):
+    transport = HTTPTransport(max_retry_after=1)
+    session = transport.new_session()
+
+    def fake_send(self, request, **kwargs):
+        return _response(request, 429, {"Retry-After": "120"})
+
+    with patch.object(HTTPAdapter, "send", fake_send):
+        response = session.get("https://api.test/items")
+
+    assert response.status_code == 429
+    assert limiter.stats()["api.test"]["retries"] == 0
+
+
+@pytest.mark.unit
+def test_context_attributes_stateless_requests_to_tool(limiter):
+    transport = HTTPTransport()
+
+    with patch.object(HTTPAdapter, "send", lambda self, req, **kw: _response(req)):
+        with rate_limit_context("ctx_tool", {"requests_per_second": 7}):
+            transport.request("GET", "https://api.test/x")
+
+    stats = limiter.stats("ctx_tool")["api.test"]
+    assert stats["configured_rate"] == 7.0
+
+
+@pytest.mark.unit
+def test_tool_session_uses_tool_rate_limit(limiter):
+    tool = BaseTool({"name": "limited", "rate_limit": {"requests_per_second": 1}})
+    session = tool.get_http_session()
+
+    with patch.object(HTTPAdapter, "send", lambda self, req, **kw: _response(req)):
+        session.get("https://api.test/a")
+
+    assert limiter.stats("limited")["api.test"]["configured_rate"] == 1.0
+
+
+@pytest.mark.unit
+def test_ncbi_tools_share_default_limit():
+    tool = NCBIEUtilsTool({"name": "ncbi"})
+    limit = tool.get_rate_limit()
+    assert limit["requests_per_second"] == 3
+    assert limit["hosts"] == ["eutils.ncbi.nlm.nih.gov"]
+
+    custom = NCBIEUtilsTool({"name": "ncbi", "rate_limit": 10})
+    assert custom.get_rate_limit()["requests_per_second"] == 10
+
+
+@pytest.mark.unit
+def test_tool_health_reports_rate_limit_counters(limiter):
+    class HttpTool(BaseTool):
+        def run(self, arguments=None):
+            return http_transport.http_get("https://api.test/ping").status_code
+
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    tu.register_custom_tool(
+        HttpTool,
+        tool_name="HttpTool",
+        tool_config={
+            "name": "http_tool",
+            "type": "HttpTool",
+            "rate_limit": {"requests_per_second": 5},
+            "parameter": {"type": "object", "properties": {}},
+        },
+    )
+
+    with patch.object(HTTPAdapter, "send", lambda self, req, **kw: _response(req)):
+        assert tu.run_one_function({"name": "http_tool", "arguments": {}}) == 200
+
+    health = tu.get_tool_health("http_tool")
+    assert health["rate_limits"]["api.test"]["requests"] == 1
+    assert health["rate_limits"]["api.test"]["configured_rate"] == 5.0
+    assert "api.test" in tu.get_tool_health()["rate_limits"]
+
+
+@pytest.mark.unit
+def test_ncbi_429_is_retried_by_the_session_only(limiter):
+    tool = NCBIEUtilsTool({"name": "ncbi"})
+    tool.endpoint = "/esearch.fcgi"
+    sent = []
+
+    def fake_send(self, request, **kwargs):
+        sent.append(request.url)
+        return _response(request, 429, {"Retry-After": "0"})
+
+    with patch.object(HTTPAdapter, "send", fake_send):
+        result = tool.run({"db": "gds"})
+
+    assert result["status"] == "error" and result["status_code"] == 429
+    assert len(sent) == 1 + http_transport.get_http_transport().rate_limit_retries
+
+
+@pytest.mark.unit
+def test_clinvar_429_uses_ncbi_limit_and_session_backoff(limiter, capsys):
+    tool = ClinVarSearchVariants({"name": "clinvar"})
+    sent = []
+
+    def fake_send(self, request, **kwargs):
+        sent.append(request.url)
+        return _response(request, 429, {"Retry-After": "0"})
+
+    with patch.object(HTTPAdapter, "send", fake_send):
+        result = tool._make_request(tool.endpoint, {"db": "clinvar"})
+
+    assert result["status"] == "error" and result["retry_after"] == "0"
+    assert len(sent) == 1 + http_transport.get_http_transport().rate_limit_retries
+    stats = limiter.stats("clinvar")["eutils.ncbi.nlm.nih.gov"]
+    assert stats["configured_rate"] == 3.0
+    assert stats["rate_limited_responses"] == len(sent)
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "config_file, host",
+    [
+        ("fda_drug_labeling_tools.json", "api.fda.gov"),
+        ("fda_drug_adverse_event_tools.json", "api.fda.gov"),
+        ("fda_drug_adverse_event_detail_tools.json", "api.fda.gov"),
+        ("europe_pmc_tools.json", "www.ebi.ac.uk"),
+        ("uniprot_tools.json", "rest.uniprot.org"),
+    ],
+)
+def test_bundled_tool_configs_declare_host_rate_limits(config_file, host):
+    data_dir = os.path.join(os.path.dirname(http_transport.__file__), "data")
+    with open(os.path.join(data_dir, config_file)) as f:
+        configs = json.load(f)
+
+    for config in configs:
+        limit = BaseTool(config).get_rate_limit()
+        assert limit is not None, config["name"]
+        assert limit["hosts"] == [host]
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Tests for the JSON encoding of SMCP tool results."""
+
+import asyncio
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse  # noqa: E402
+from tooluniverse import result_encoding  # noqa: E402
+from tooluniverse.result_encoding import (  # noqa: E402
+    PreSerialized,
+    encode_result,
+    encode_result_chunks,
+)
+from tooluniverse.smcp import SMCP  # noqa: E402
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("fast", [True, False])
+def test_encode_result_matches_previous_smcp_output(fast, monkeypatch):
+    if not fast:
+        monkeypatch.setattr(result_encoding, "orjson", None)
+
+    payload = {"title": "Café", 1: [1.5, None], "when": object}
+    assert json.loads(encode_result(payload)) == json.loads(
+        json.dumps(payload, ensure_ascii=False, default=str)
+    )
+    assert encode_result('{"a": 1}') == '{"a": 1}'
+    assert json.loads(encode_result("plain text")) == {"result": "plain text"}
+    assert json.loads(encode_result("{broken")) == {"result": "{broken"}
+    assert json.loads(encode_result(3)) == {"result": "3"}
+
+
+@pytest.mark.unit
+def test_pre_serialized_text_is_never_parsed():
+    marked = PreSerialized('{"a": 1}')
+    with patch.object(result_encoding, "is_json_text") as check:
+        assert encode_result(marked) is marked
+    check.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1000])
+def test_chunks_join_to_the_encoded_document(chunk_size):
+    payload = {"text": "αβγ" * 20, "items": list(range(30))}
+    chunks = encode_result_chunks(payload, chunk_size)
+
+    assert "".join(chunks) == encode_result(payload)
+    if chunk_size < 1000:
+        assert len(chunks) > 1
+    assert "".join(encode_result_chunks("plain", chunk_size)) == encode_result("plain")
+
+
+def _smcp_with_tool(result, **kwargs):
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    config = {
+        "name": "big_result_tool",
+        "type": "PythonCodeExecutor",
+        "description": "Returns a fixed result",
+        "parameter": {"type": "object", "properties": {}},
+    }
+    tu.all_tools.append(config)
+    tu.all_tool_dict[config["name"]] = config
+    smcp = SMCP(
+        tooluniverse_config=tu,
+        auto_expose_tools=False,
+        search_enabled=False,
+        **kwargs,
+    )
+    smcp._create_mcp_tool_from_tooluniverse(config)
+
+    async def fake_run(function_call, **_):
+        return result
+
+    tu.arun_one_function = fake_run
+    return smcp, config["name"]
+
+
+@pytest.mark.unit
+def test_smcp_returns_large_results_as_text_blocks():
+    payload = {"rows": [{"id": i, "name": f"row-{i}"} for i in range(200)]}
+    smcp, name = _smcp_with_tool(payload, result_chunk_size=512)
+
+    async def run():
+        tool = await smcp._tool_manager.get_tool(name)
+        return await tool.run({})
+
+    result = asyncio.run(run())
+
+    assert len(result.content) > 1
+    assert all(len(block.text) <= 512 for block in result.content)
+    assert json.loads("".join(block.text for block in result.content)) == payload
+
+
+@pytest.mark.unit
+def test_smcp_returns_small_results_as_one_string():
+    smcp, name = _smcp_with_tool([1, 2, 3], result_chunk_size=512)
+
+    async def run():
+        tool = await smcp._tool_manager.get_tool(name)
+        return await tool.fn()
+
+    assert json.loads(asyncio.run(run())) == [1, 2, 3]
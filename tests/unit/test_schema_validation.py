@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Tests for compiled parameter-schema validators."""
+
+import itertools
+from unittest.mock import patch
+
+import jsonschema
+import pytest
+
+from tooluniverse import schema_validation
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.schema_validation import (
+    CompiledSchema,
+    get_compiled_schema,
+    get_validation_stats,
+    reset_validation_stats,
+    schema_fingerprint,
+)
+
+FLAT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "description": "Search text"},
+        "limit": {"type": "integer", "default": 10},
+        "score": {"type": "number"},
+        "exact": {"type": ["boolean", "null"]},
+        "ids": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["query"],
+}
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    schema_validation.clear_compiled_schemas()
+    reset_validation_stats()
+    yield
+    schema_validation.clear_compiled_schemas()
+    reset_validation_stats()
+
+
+def _jsonschema_result(arguments, schema):
+    try:
+        jsonschema.validate(arguments, schema)
+        return None
+    except jsonschema.ValidationError as e:
+        return e.message
+
+
+def _compiled_result(arguments, schema):
+    try:
+        CompiledSchema(schema, schema_fingerprint(schema)).validate(arguments)
+        return None
+    except jsonschema.ValidationError as e:
+        return e.message
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "schema",
+    [
+        FLAT_SCHEMA,
+        dict(FLAT_SCHEMA, additionalProperties=False),
+        {"type": "object", "properties": {"n": {"type": "integer", "minimum": 1}}},
+    ],
+)
+def test_compiled_validator_matches_jsonschema(schema):
+    values = ["x", 3, 3.0, 2.5, True, None, [], ["a"], [1], {}]
+    for key, value in itertools.product(
+        ["query", "limit", "score", "exact", "ids", "n", "other"], values
+    ):
+        for arguments in ({key: value}, {"query": "q", key: value}):
+            assert _compiled_result(arguments, schema) == _jsonschema_result(
+                arguments, schema
+            ), arguments
+
+
+@pytest.mark.unit
+def test_fast_path_accepts_flat_arguments_without_full_validation():
+    compiled = get_compiled_schema(FLAT_SCHEMA)
+
+    with patch.object(
+        jsonschema.exceptions, "best_match", side_effect=AssertionError
+    ) as best_match:
+        assert compiled.validate({"query": "tp53", "limit": 5, "exact": None})
+    best_match.assert_not_called()
+
+    # Properties with nested constraints are left to the full validator
+    assert compiled.validate({"query": "tp53", "ids": ["a"]}) is False
+
+
+@pytest.mark.unit
+def test_validators_are_compiled_once_per_fingerprint():
+    first = BaseTool({"name": "a", "parameter": dict(FLAT_SCHEMA)})
+    second = BaseTool({"name": "b", "parameter": dict(FLAT_SCHEMA)})
+
+    with patch.object(
+        schema_validation, "CompiledSchema", wraps=CompiledSchema
+    ) as compile_schema:
+        for _ in range(3):
+            assert first.validate_parameters({"query": "x"}) is None
+            assert second.validate_parameters({"query": "y"}) is None
+
+    assert compile_schema.call_count == 1
+    assert first.get_schema_fingerprint() == second.get_schema_fingerprint()
+
+
+@pytest.mark.unit
+def test_replaced_schema_is_recompiled():
+    tool = BaseTool({"name": "a", "parameter": dict(FLAT_SCHEMA)})
+    assert tool.validate_parameters({"query": "x"}) is None
+
+    tool.tool_config["parameter"] = {
+        "type": "object",
+        "properties": {"query": {"type": "integer"}},
+    }
+
+    assert tool.validate_parameters({"query": "x"}) is not None
+
+
+@pytest.mark.unit
+def test_invalid_schema_reports_validation_error():
+    tool = BaseTool({"name": "bad", "parameter": {"type": "object", "required": 1}})
+
+    for _ in range(2):
+        error = tool.validate_parameters({})
+        assert error is not None
+        assert "Validation error" in str(error)
+
+
+@pytest.mark.unit
+def test_validation_stats_are_recorded_per_tool():
+    tool = BaseTool({"name": "stats_tool", "parameter": FLAT_SCHEMA})
+    tool.validate_parameters({"query": "x"})
+    tool.validate_parameters({"limit": 1})
+
+    stats = get_validation_stats("stats_tool")
+    assert stats["calls"] == 2
+    assert stats["fast_path"] == 1
+    assert stats["failures"] == 1
+    assert stats["total_time"] > 0
+
+    total = get_validation_stats()["total"]
+    assert total["calls"] == 2
+    assert total["compiled_schemas"] == 1
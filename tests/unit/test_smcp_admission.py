@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Tests for admission control and concurrency quotas in SMCP."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse  # noqa: E402
+from tooluniverse.smcp import SMCP  # noqa: E402
+from tooluniverse.smcp_admission import (  # noqa: E402
+    MAX_RETRY_AFTER,
+    MIN_RETRY_AFTER,
+    AdmissionController,
+    AdmissionRejected,
+)
+
+
+@pytest.mark.unit
+def test_tool_limit_queues_calls_and_tracks_wait_time():
+    controller = AdmissionController()
+
+    async def run():
+        first = await controller.acquire("BLAST", tool_limit=1)
+        waiting = asyncio.create_task(controller.acquire("BLAST", tool_limit=1))
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        assert controller.stats()["queued"] == 1
+        controller.release(first)
+        second = await waiting
+        controller.release(second)
+        return second
+
+    second = asyncio.run(run())
+
+    assert second.queue_wait >= 0.04
+    tool = controller.stats()["tools"]["BLAST"]
+    assert tool["admitted"] == 2
+    assert tool["completed"] == 2
+    assert tool["running"] == tool["queued"] == 0
+    assert tool["max_queue_wait_seconds"] >= 0.04
+
+
+@pytest.mark.unit
+def test_full_queue_and_queue_timeout_are_rejected_with_retry_hints():
+    controller = AdmissionController(
+        max_concurrent=1, max_queued=1, max_queue_wait=0.05
+    )
+
+    async def run():
+        ticket = await controller.acquire("slow")
+        queued = asyncio.create_task(controller.acquire("slow"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as full:
+            await controller.acquire("slow")
+        with pytest.raises(AdmissionRejected) as timed_out:
+            await queued
+        controller.release(ticket)
+        return full.value, timed_out.value
+
+    full, timed_out = asyncio.run(run())
+
+    assert full.reason == "queue_full"
+    assert timed_out.reason == "queue_timeout"
+    assert MIN_RETRY_AFTER <= full.retry_after <= MAX_RETRY_AFTER
+    assert full.to_response()["error_type"] == "ServerOverloaded"
+    stats = controller.stats()
+    assert stats["rejected"] == {"queue_full": 1, "queue_timeout": 1}
+    assert stats["running"] == stats["queued"] == 0
+
+
+@pytest.mark.unit
+def test_client_quota_does_not_block_other_clients():
+    controller = AdmissionController(max_per_client=1)
+
+    async def run():
+        busy = await controller.acquire("tool", client_id="flooder")
+        blocked = asyncio.create_task(controller.acquire("tool", client_id="flooder"))
+        await asyncio.sleep(0)
+        other = await asyncio.wait_for(
+            controller.acquire("tool", client_id="polite"), timeout=1
+        )
+        assert not blocked.done()
+        controller.release(busy)
+        controller.release(await blocked)
+        controller.release(other)
+
+    asyncio.run(run())
+    assert controller.stats()["clients"] == {}
+
+
+@pytest.mark.unit
+def test_smcp_enforces_batch_max_concurrency_from_tool_config():
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    config = {
+        "name": "slow_tool",
+        "type": "PythonCodeExecutor",
+        "description": "Slow tool",
+        "batch_max_concurrency": 1,
+        "parameter": {"type": "object", "properties": {}},
+    }
+    tu.all_tools.append(config)
+    tu.all_tool_dict[config["name"]] = config
+    smcp = SMCP(
+        tooluniverse_config=tu,
+        auto_expose_tools=False,
+        search_enabled=False,
+        max_queued_calls=1,
+    )
+    smcp._create_mcp_tool_from_tooluniverse(config)
+
+    active = []
+    peak = []
+
+    async def fake_run(function_call, **_):
+        active.append(1)
+        peak.append(len(active))
+        await asyncio.sleep(0.05)
+        active.pop()
+        return {"ok": True}
+
+    tu.arun_one_function = fake_run
+
+    async def run():
+        tool = await smcp._tool_manager.get_tool(config["name"])
+        return await asyncio.gather(*(tool.fn() for _ in range(3)))
+
+    results = [json.loads(r) for r in asyncio.run(run())]
+
+    assert max(peak) == 1
+    assert results.count({"ok": True}) == 2
+    rejected = [r for r in results if r != {"ok": True}]
+    assert rejected[0]["error_type"] == "ServerOverloaded"
+    assert rejected[0]["retry_after"] >= MIN_RETRY_AFTER
+    tool_stats = smcp.get_admission_stats()["tools"]["slow_tool"]
+    assert tool_stats["completed"] == 2
+    assert tool_stats["rejected"] == 1
+    assert tool_stats["avg_execution_seconds"] >= 0.04
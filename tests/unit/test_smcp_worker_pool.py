@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Tests for running SMCP tools in warm worker processes."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse  # noqa: E402
+from tooluniverse.smcp import SMCP  # noqa: E402
+from tooluniverse.smcp_worker_pool import ToolWorkerPool  # noqa: E402
+
+CODE_TOOL = {
+    "name": "python_code_executor",
+    "type": "PythonCodeExecutor",
+    "description": "Execute Python code",
+    "parameter": {
+        "type": "object",
+        "properties": {"code": {"type": "string", "description": "Code"}},
+        "required": ["code"],
+    },
+}
+
+
+def _call(code):
+    return {"name": CODE_TOOL["name"], "arguments": {"code": code}}
+
+
+@pytest.mark.unit
+def test_pool_runs_tools_in_other_processes_and_recycles_workers():
+    pool = ToolWorkerPool([CODE_TOOL], max_workers=1, max_tasks_per_worker=2)
+    try:
+        results = [pool.run(_call(f"result = {i} * 7"), timeout=120) for i in range(3)]
+        health = pool.health_check(timeout=120)
+        stats = pool.stats()
+    finally:
+        pool.shutdown()
+
+    assert [r["result"] for r in results] == [0, 7, 14]
+    assert health["healthy"] is True
+    assert os.getpid() not in health["responding_pids"]
+    assert stats["completed"] == 3
+    assert stats["failed"] == 0
+    assert stats["in_flight"] == 0
+    # Two calls per worker, so the third call ran on a fresh generation
+    assert stats["recycles"] == 1
+    assert stats["generation"] == 2
+    assert stats["worker_pids_seen"] == 2
+
+
+@pytest.mark.unit
+def test_pool_reports_unstarted_and_closed_states():
+    pool = ToolWorkerPool([CODE_TOOL], max_workers=1)
+    assert pool.serves("python_code_executor")
+    assert not pool.serves("other_tool")
+    assert pool.health_check() == {"healthy": False, "started": False}
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        pool.submit(_call("result = 1"))
+
+
+@pytest.mark.unit
+def test_smcp_routes_configured_tool_types_to_worker_processes():
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    config = dict(CODE_TOOL)
+    tu.all_tools.append(config)
+    tu.all_tool_dict[config["name"]] = config
+
+    smcp = SMCP(
+        tooluniverse_config=tu,
+        auto_expose_tools=False,
+        search_enabled=False,
+        process_workers=1,
+        process_tool_types=["PythonCodeExecutor"],
+    )
+    assert smcp.worker_pool.serves(config["name"])
+    smcp._create_mcp_tool_from_tooluniverse(config)
+
+    async def run():
+        mcp_tool = await smcp._tool_manager.get_tool(config["name"])
+        result = await mcp_tool.fn(code="result = 6 * 7")
+        stats = await smcp.get_worker_pool_stats(health_check=True)
+        await smcp.close()
+        return result, stats
+
+    result, stats = asyncio.run(run())
+
+    assert json.loads(result)["result"] == 42
+    assert stats["enabled"] is True
+    assert stats["completed"] == 1
+    assert stats["health"]["healthy"] is True
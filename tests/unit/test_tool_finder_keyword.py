@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Tests for the inverted-index keyword tool finder."""
+
+import json
+import math
+import os
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse  # noqa: E402
+from tooluniverse.base_tool import BaseTool  # noqa: E402
+from tooluniverse.tool_finder_keyword import KeywordIndex, ToolFinderKeyword  # noqa: E402
+
+
+class EchoTool(BaseTool):
+    def run(self, arguments=None):
+        return arguments
+
+
+def _register(tu, name, description, category="custom"):
+    tu.register_custom_tool(
+        EchoTool,
+        tool_name="EchoTool",
+        tool_config={
+            "name": name,
+            "type": "EchoTool",
+            "description": description,
+            "category": category,
+            "parameter": {"type": "object", "properties": {}},
+        },
+    )
+
+
+@pytest.fixture
+def tu():
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    _register(tu, "protein_lookup", "Look up protein structures in the PDB")
+    _register(tu, "gene_search", "Search gene expression across tissues")
+    _register(tu, "drug_events", "Adverse events reported for a drug")
+    return tu
+
+
+def _finder(tu, tmp_path, **config):
+    config = {"name": "ToolFinderKeyword", "index_cache_dir": str(tmp_path), **config}
+    return ToolFinderKeyword(config, tooluniverse=tu)
+
+
+def _search(finder, query, limit=10):
+    result = json.loads(finder._run_json_search({"description": query, "limit": limit}))
+    return [tool["name"] for tool in result["tools"]]
+
+
+@pytest.mark.unit
+def test_keyword_index_scores_only_matching_postings():
+    index = KeywordIndex()
+    index.add("a", {"terms": {"protein": 2, "structur": 1}, "total_terms": 3})
+    index.add("b", {"terms": {"gene": 1}, "total_terms": 1})
+    index.add("c", {"terms": {"protein": 1, "gene": 1}, "total_terms": 2})
+
+    scores = index.score(["structur"])
+    assert set(scores) == {"a"}
+    assert index.score(["protein"], scoring="bm25")["a"] > 0
+
+    index.remove("a")
+    assert "structur" not in index.postings
+    assert index.total_terms == 3
+    # tf = 1/2, idf = log(2 docs / 1), query weight = log(1 + 1)
+    assert index.score(["protein"]) == {"c": pytest.approx(0.5 * math.log(2) ** 2)}
+
+
+@pytest.mark.unit
+def test_search_ranks_relevant_tools(tu, tmp_path):
+    finder = _finder(tu, tmp_path)
+
+    assert _search(finder, "protein structures")[0] == "protein_lookup"
+    assert _search(finder, "adverse drug events")[0] == "drug_events"
+    assert _search(finder, "gene expression", limit=1) == ["gene_search"]
+
+
+@pytest.mark.unit
+def test_newly_registered_tools_are_indexed_incrementally(tu, tmp_path):
+    finder = _finder(tu, tmp_path)
+    assert "pathway_browser" not in _search(finder, "pathway")
+
+    _register(tu, "pathway_browser", "Browse signaling pathway diagrams")
+    with patch.object(
+        finder, "_tokenize_and_normalize", wraps=finder._tokenize_and_normalize
+    ) as tokenize:
+        names = _search(finder, "pathway")
+
+    assert names[0] == "pathway_browser"
+    # One call for the query, one for the new tool only
+    assert tokenize.call_count == 2
+    assert finder._total_documents == 4
+
+    tu.all_tools[:] = [t for t in tu.all_tools if t["name"] != "gene_search"]
+    assert "gene_search" not in _search(finder, "gene expression")
+    assert finder._total_documents == 3
+
+
+@pytest.mark.unit
+def test_index_is_persisted_per_tool_set(tu, tmp_path):
+    _search(_finder(tu, tmp_path), "protein")
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    restarted = _finder(tu, tmp_path)
+    with patch.object(
+        restarted, "_tokenize_and_normalize", wraps=restarted._tokenize_and_normalize
+    ) as tokenize:
+        assert _search(restarted, "protein")[0] == "protein_lookup"
+    # Only the query is tokenized; tool terms come from disk
+    assert tokenize.call_count == 1
+
+    _register(tu, "another_tool", "Something else entirely")
+    _search(_finder(tu, tmp_path), "protein")
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+
+@pytest.mark.unit
+def test_bm25_scoring_and_exclusions(tu, tmp_path):
+    finder = _finder(tu, tmp_path, scoring="bm25", persist_index=False)
+
+    assert _search(finder, "drug adverse events")[0] == "drug_events"
+    assert list(tmp_path.iterdir()) == []
+
+    excluding = _finder(tu, tmp_path, exclude_tools=["drug_events"])
+    assert "drug_events" not in _search(excluding, "drug adverse events")
+
+
+@pytest.mark.unit
+def test_search_resyncs_only_after_tools_change(tu, tmp_path):
+    finder = _finder(tu, tmp_path, persist_index=False)
+    _search(finder, "protein")
+
+    with patch.object(finder, "_sync_index", wraps=finder._sync_index) as sync:
+        _search(finder, "gene")
+        _search(finder, "drug")
+        assert sync.call_count == 0
+
+        _register(tu, "pathway_browser", "Browse signaling pathway diagrams")
+        assert _search(finder, "pathway") == ["pathway_browser"]
+        assert sync.call_count == 1
+
+
+@pytest.mark.unit
+def test_only_postings_and_exact_name_hits_are_scored(tu, tmp_path):
+    finder = _finder(tu, tmp_path, persist_index=False)
+    _search(finder, "protein")
+
+    with patch.object(
+        ToolFinderKeyword, "_exact_match_bonus", wraps=finder._exact_match_bonus
+    ) as bonus:
+        names = _search(finder, "please run gene_search")
+
+    assert names == ["gene_search"]
+    # No tool shares a term with the query; only the named one is scored
+    assert bonus.call_count == 1
+
+
+def _full_scan_names(finder, query):
+    """Baseline ranking: every indexed tool gets the exact-match bonus."""
+    query_lower = query.lower()
+    term_scores = finder._index.score(
+        finder._extract_phrases(finder._tokenize_and_normalize(query)), finder.scoring
+    )
+    names = set()
+    for name, doc in finder._index.docs.items():
+        bonus = finder._exact_match_bonus(
+            query_lower,
+            finder._query_phrase(query_lower),
+            doc["name"],
+            doc["description"],
+            doc["type"],
+            doc["category"],
+        )
+        if term_scores.get(name, 0.0) + bonus > 0:
+            names.add(name)
+    return names
+
+
+@pytest.mark.unit
+def test_underscored_names_are_found_by_substring(tu, tmp_path):
+    _register(tu, "UniProt_get_entry_by_accession", "Fetch one entry", "proteins")
+    _register(tu, "EuropePMC_search_articles", "Literature search", "literature")
+    finder = _finder(tu, tmp_path, persist_index=False)
+
+    assert _search(finder, "uniprot") == ["UniProt_get_entry_by_accession"]
+    assert _search(finder, "europepmc")[0] == "EuropePMC_search_articles"
+    # Query containing the whole name, and a category match
+    assert "protein_lookup" in _search(finder, "run protein_lookup now")
+    assert set(_search(finder, "literature")) >= {"EuropePMC_search_articles"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "query", ["uniprot", "europepmc", "ChEMBL", "protein structure", "fda"]
+)
+def test_results_match_full_scan_on_default_tools(tmp_path, query):
+    tu = ToolUniverse()
+    tu.load_tools()
+    finder = _finder(tu, tmp_path, persist_index=False)
+
+    found = set(_search(finder, query, limit=None))
+
+    assert found and found == _full_scan_names(finder, query)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Tests for candidate pruning and incremental runs of the tool graph pipeline."""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse.compose_scripts import tool_graph_generation  # noqa: E402
+
+
+def _tool(name, description, *parameters, return_schema=None):
+    config = {
+        "name": name,
+        "description": description,
+        "type": "RESTTool",
+        "parameter": {
+            "type": "object",
+            "properties": {p: {"type": "string"} for p in parameters},
+        },
+    }
+    if return_schema:
+        config["return_schema"] = return_schema
+    return config
+
+
+TOOLS = [
+    _tool(
+        "Gene_search",
+        "Search genes by symbol and return Ensembl gene identifiers.",
+        "query",
+        return_schema={"properties": {"ensembl_id": {"type": "string"}}},
+    ),
+    _tool(
+        "Gene_expression",
+        "Tissue expression levels for an Ensembl gene.",
+        "ensembl_id",
+    ),
+    _tool("Weather_forecast", "Daily weather forecast for a city.", "city"),
+    _tool("Stock_quote", "Latest stock market price for a ticker.", "ticker"),
+]
+
+
+class FakeDetector:
+    """Stands in for call_tool; reports every A->B pair it is asked about."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.pairs = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, tool_name, arguments):
+        tool_a = json.loads(arguments["tool_a"])["name"]
+        others = [tool["name"] for tool in json.loads(arguments["other_tools"])]
+        with self._lock:
+            self.pairs.extend((tool_a, other) for other in others)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        relationships = [
+            {"tool_b_name": other, "direction": "A->B", "rationale": "r"}
+            for other in others
+        ]
+        return {"result": json.dumps({"relationships": relationships})}
+
+
+def _compose(tools, detector, tmp_path, **arguments):
+    return tool_graph_generation.compose(
+        {
+            "tool_configs": tools,
+            "output_path": str(tmp_path / "graph.json"),
+            **arguments,
+        },
+        None,
+        detector,
+    )
+
+
+@pytest.mark.unit
+def test_prefilter_keeps_similar_and_schema_compatible_pairs(tmp_path):
+    detector = FakeDetector()
+
+    result = _compose(
+        TOOLS, detector, tmp_path, top_k_neighbors=0, similarity_threshold=0.99
+    )
+
+    # Only the search -> expression pair is compatible (ensembl_id flows through)
+    assert detector.pairs == [("Gene_search", "Gene_expression")]
+    stats = result["graph"]["stats"]
+    assert stats["total_pairs"] == 6
+    assert stats["candidate_pairs"] == 1
+
+    unfiltered = FakeDetector()
+    _compose(TOOLS, unfiltered, tmp_path / "all", prefilter=False, batch_size=2)
+    assert len(unfiltered.pairs) == 6
+
+
+@pytest.mark.unit
+def test_detector_batches_run_concurrently_with_ordered_edges(tmp_path):
+    tools = [_tool(f"Tool_{i}", f"Tool number {i}.", "value") for i in range(6)]
+    detector = FakeDetector(delay=0.05)
+
+    result = _compose(
+        tools, detector, tmp_path, prefilter=False, batch_size=1, max_concurrency=3
+    )
+
+    assert detector.peak == 3
+    edges = [(e["source"], e["target"]) for e in result["graph"]["edges"]]
+    assert edges == [
+        (f"Tool_{i}", f"Tool_{j}") for i in range(6) for j in range(i + 1, 6)
+    ]
+    assert result["graph"]["stats"]["llm_calls"] == 15
+
+
+@pytest.mark.unit
+def test_rerun_only_evaluates_new_or_changed_tools(tmp_path):
+    _compose(TOOLS, FakeDetector(), tmp_path, prefilter=False)
+
+    changed = [dict(tool) for tool in TOOLS]
+    changed[2]["description"] = "Hourly weather forecast for a city."
+    changed.append(_tool("Gene_ontology", "GO terms for a gene.", "ensembl_id"))
+    detector = FakeDetector()
+
+    result = _compose(changed, detector, tmp_path, prefilter=False)
+
+    assert all({"Weather_forecast", "Gene_ontology"} & set(p) for p in detector.pairs)
+    assert len(detector.pairs) == 7
+    graph = result["graph"]
+    assert graph["stats"]["tools_reused"] == 3
+    # Every pair still has exactly one edge, reused or new
+    assert len(graph["edges"]) == 10
+    assert len({(e["source"], e["target"]) for e in graph["edges"]}) == 10
+
+
+@pytest.mark.unit
+def test_start_after_tool_skips_earlier_primary_tools(tmp_path):
+    detector = FakeDetector()
+
+    _compose(
+        TOOLS, detector, tmp_path, prefilter=False, start_after_tool="Gene_expression"
+    )
+
+    assert detector.pairs == [("Weather_forecast", "Stock_quote")]
+
+
+@pytest.mark.unit
+def test_input_terms_match_whole_output_words_only():
+    tools = [
+        _tool("Gene_search", "Return Ensembl gene identifiers.", "query"),
+        _tool("Gene_lookup", "Details for a gene.", "gene_id"),
+        _tool("Gene_expression", "Expression levels.", "GeneIdentifiers"),
+    ]
+    tool_map = {tool["name"]: tool for tool in tools}
+
+    pairs = tool_graph_generation._candidate_pairs(
+        list(tool_map), tool_map, {}, similarity_threshold=2.0, top_k=0
+    )
+
+    # "gene id" is a prefix of "gene identifiers" but not a whole-word match
+    assert pairs == {
+        ("Gene_search", "Gene_expression"),
+        ("Gene_expression", "Gene_search"),
+    }
+
+
+class CrashingDetector(FakeDetector):
+    def __init__(self, fail_on_call):
+        super().__init__()
+        self.fail_on_call = fail_on_call
+        self.calls = 0
+
+    def __call__(self, tool_name, arguments):
+        self.calls += 1
+        if self.calls == self.fail_on_call:
+            raise RuntimeError("detector unavailable")
+        return super().__call__(tool_name, arguments)
+
+
+@pytest.mark.unit
+def test_checkpoint_resume_skips_only_finished_tools(tmp_path):
+    # Jobs: (Gene_search x3), (Gene_expression x2), (Weather_forecast x1)
+    with pytest.raises(RuntimeError):
+        _compose(
+            TOOLS,
+            CrashingDetector(fail_on_call=6),
+            tmp_path,
+            prefilter=False,
+            batch_size=1,
+            max_concurrency=1,
+            save_intermediate_every=1,
+        )
+
+    output = tmp_path / "graph.json"
+    checkpoint = json.loads((tmp_path / "graph.json.checkpoint_new.json").read_text())
+    assert len(checkpoint["tool_fingerprints"]) == 4
+    assert checkpoint["completed_tools"] == ["Gene_search", "Gene_expression"]
+    os.replace(
+        tmp_path / "graph.json.checkpoint_new.json",
+        str(output) + ".checkpoint.json",
+    )
+
+    detector = FakeDetector()
+    result = _compose(TOOLS, detector, tmp_path, prefilter=False)
+
+    assert detector.pairs == [("Weather_forecast", "Stock_quote")]
+    assert len({(e["source"], e["target"]) for e in result["graph"]["edges"]}) == 6
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Tests for the streamed, indexed XMLDatasetTool record store."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import xml_tool  # noqa: E402
+from tooluniverse.xml_tool import XMLDatasetTool  # noqa: E402
+
+XML = """<?xml version="1.0"?>
+<drugbank xmlns="http://www.drugbank.ca" version="5.1">
+  <drug type="small molecule">
+    <drugbank-id>DB001</drugbank-id>
+    <name>Aspirin</name>
+    <synonyms><synonym>ASA</synonym><synonym>Acetylsalicylic acid</synonym></synonyms>
+    <categories>
+      <category><category>Analgesics</category><mesh-id>D000700</mesh-id></category>
+    </categories>
+  </drug>
+  <!-- comments between records are skipped -->
+  <drug type="biotech">
+    <drugbank-id>DB002</drugbank-id>
+    <name>Insulin glargine</name>
+    <synonyms><synonym>Lantus</synonym></synonyms>
+  </drug>
+  <drug type="small molecule">
+    <drugbank-id>DB003</drugbank-id>
+    <name>Salicylic acid</name>
+  </drug>
+</drugbank>
+"""
+
+
+@pytest.fixture(autouse=True)
+def clean_store_cache():
+    xml_tool._STORE_CACHE.clear()
+    yield
+    xml_tool._STORE_CACHE.clear()
+
+
+@pytest.fixture
+def xml_path(tmp_path):
+    path = tmp_path / "drugbank.xml"
+    path.write_text(XML)
+    return str(path)
+
+
+def _tool(xml_path, tmp_path, **settings):
+    return XMLDatasetTool(
+        {
+            "name": "drugbank",
+            "type": "XMLDatasetTool",
+            "settings": {
+                "local_dataset_path": xml_path,
+                "record_xpath": "db:drug",
+                "namespaces": {"db": "http://www.drugbank.ca"},
+                "field_mappings": {
+                    "drugbank_id": "db:drugbank-id",
+                    "name": "db:name",
+                    "synonyms": "db:synonyms/db:synonym",
+                    "categories": {
+                        "parent_path": "db:categories/db:category",
+                        "subfields": {
+                            "category": "db:category",
+                            "mesh_id": "db:mesh-id",
+                        },
+                    },
+                },
+                "search_fields": ["name", "synonyms", "categories_category"],
+                "filter_field": "name",
+                "record_cache_dir": str(tmp_path / "records"),
+                **settings,
+            },
+        }
+    )
+
+
+def _ids(result):
+    return [record["drugbank_id"] for record in result["results"]]
+
+
+@pytest.mark.unit
+def test_streamed_records_keep_structured_fields(xml_path, tmp_path):
+    tool = _tool(xml_path, tmp_path)
+
+    assert len(tool.records) == 3
+    info = tool.get_dataset_info()
+    assert info["root_element"] == "{http://www.drugbank.ca}drugbank"
+    assert info["sample_record"]["categories"] == [
+        {"category": "Analgesics", "mesh_id": "D000700"}
+    ]
+    assert info["sample_record"]["_attributes"] == {"type": "small molecule"}
+
+
+@pytest.mark.unit
+def test_search_uses_field_indexes(xml_path, tmp_path):
+    tool = _tool(xml_path, tmp_path)
+
+    result = tool.run({"query": "ACID"})
+    assert _ids(result) == ["DB001", "DB003"]
+    assert result["results"][0]["matched_fields"] == ["synonyms"]
+    assert result["results"][1]["matched_fields"] == ["name"]
+    # Flattened subfields are searchable but not returned
+    assert "categories_category" not in result["results"][0]
+
+    exact = tool.run({"query": "asa", "exact_match": True})
+    assert _ids(exact) == ["DB001"]
+    assert tool.run({"query": "as", "exact_match": True})["total_matches"] == 0
+
+    limited = tool.run({"query": "S", "limit": 1, "case_sensitive": True})
+    assert limited["total_matches"] == 2
+    assert limited["total_returned_results"] == 1
+
+
+@pytest.mark.unit
+def test_filter_conditions(xml_path, tmp_path):
+    tool = _tool(xml_path, tmp_path)
+
+    def run(condition, value=""):
+        return tool.run({"condition": condition, "value": value})
+
+    assert _ids(run("contains", "SALICYLIC")) == ["DB003"]
+    assert _ids(run("starts_with", "insulin")) == ["DB002"]
+    assert _ids(run("ends_with", "acid")) == ["DB003"]
+    assert run("exact", "aspirin")["total_matches"] == 1
+    assert run("not_empty")["total_matches"] == 3
+    assert "error" in run("unknown", "x")
+
+    tool.filter_field = "missing"
+    assert "not found" in run("contains", "x")["error"]
+
+
+@pytest.mark.unit
+def test_records_are_cached_on_disk(xml_path, tmp_path):
+    _tool(xml_path, tmp_path)
+    assert len(list((tmp_path / "records").glob("*.records"))) == 1
+
+    xml_tool._STORE_CACHE.clear()
+    with patch.object(XMLDatasetTool, "_parse_records") as parse:
+        restarted = _tool(xml_path, tmp_path)
+    parse.assert_not_called()
+    assert _ids(restarted.run({"query": "lantus"})) == ["DB002"]
+
+    # Changing the extraction settings invalidates the cache
+    xml_tool._STORE_CACHE.clear()
+    _tool(xml_path, tmp_path, record_xpath=".//db:drug")
+    assert len(list((tmp_path / "records").glob("*.records"))) == 2
+
+
+@pytest.mark.unit
+def test_complex_xpath_falls_back_to_full_parse(xml_path, tmp_path):
+    streamed = _tool(xml_path, tmp_path, record_cache=False)
+    xml_tool._STORE_CACHE.clear()
+    parsed = _tool(xml_path, tmp_path, record_xpath=".//db:drug", record_cache=False)
+
+    assert parsed._streamable_record_tag() is None
+    assert parsed.records.columns == streamed.records.columns
+    assert not (tmp_path / "records").exists()